@@ -8,6 +8,7 @@ from django.urls import re_path, reverse_lazy
 from core_main_app.admin import core_admin_site
 
 from core_composer_app.components.bucket.models import Bucket
+from core_composer_app.components.job.models import Job
 from core_composer_app.components.type.admin_site import CustomTypeAdmin
 from core_composer_app.components.type.models import Type
 from core_composer_app.components.type_version_manager.admin_site import (
@@ -67,6 +68,11 @@ admin_urls = [
         admin_views.manage_type_versions,
         name="core_composer_app_manage_type_versions",
     ),
+    re_path(
+        r"^type/version/(?P<version_id>\w+)/diff/(?P<other_version_id>\w+)$",
+        admin_views.type_version_diff,
+        name="core_composer_app_type_version_diff",
+    ),
     re_path(
         r"^type/buckets/(?P<version_manager_id>\w+)",
         admin_views.manage_type_buckets,
@@ -100,6 +106,7 @@ admin_urls = [
 ]
 
 admin.site.register(Bucket)
+admin.site.register(Job)
 admin.site.register(Type, CustomTypeAdmin)
 admin.site.register(TypeVersionManager, CustomTypeVersionManagerAdmin)
 
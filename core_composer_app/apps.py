@@ -1,8 +1,22 @@
 """Apps file for setting core package when app is ready"""
 
-import sys
-
 from django.apps import AppConfig
+from django.db.models.signals import post_migrate
+
+
+def init_app(sender, **kwargs):
+    """Initialize app, once the database is migrated
+
+    Args:
+        sender:
+        **kwargs:
+
+    Returns:
+
+    """
+    from core_composer_app.permissions import discover
+
+    discover.init_permissions(sender.apps)
 
 
 class ComposerAppConfig(AppConfig):
@@ -17,7 +31,40 @@ class ComposerAppConfig(AppConfig):
         Returns:
 
         """
-        if "migrate" not in sys.argv:
-            from core_composer_app.permissions import discover
+        # no database access here: permissions are initialized after migrate
+        post_migrate.connect(init_app, sender=self)
+        _init_type_signals()
+        _init_catalog_signals()
+
+
+def _init_type_signals():
+    """Initialize type signals
+
+    Returns:
+
+    """
+    from core_composer_app.components.job.executor import register_job_task
+    from core_composer_app.components.type import signals as type_signals
+    from core_composer_app.components.type.constants import (
+        REVALIDATE_DEPENDENTS_JOB,
+        REVALIDATE_DEPENDENTS_TASK,
+    )
+    from core_composer_app.settings import (
+        COMPOSER_REVALIDATE_DEPENDENTS_ON_SET_CURRENT,
+    )
+
+    # the tasks are imported when their first job runs
+    register_job_task(REVALIDATE_DEPENDENTS_JOB, REVALIDATE_DEPENDENTS_TASK)
+    if COMPOSER_REVALIDATE_DEPENDENTS_ON_SET_CURRENT:
+        type_signals.connect()
+
+
+def _init_catalog_signals():
+    """Initialize catalog signals
+
+    Returns:
+
+    """
+    from core_composer_app.components.catalog import signals as catalog_signals
 
-            discover.init_permissions()
+    catalog_signals.connect()
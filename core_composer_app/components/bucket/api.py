@@ -51,6 +51,20 @@ def get_all():
     return Bucket.get_all()
 
 
+def search(search="", order_by="label"):
+    """Return buckets matching a search on their label, with the number of
+    types they contain.
+
+    Args:
+        search:
+        order_by:
+
+    Returns:
+
+    """
+    return Bucket.search(search=search, order_by=order_by)
+
+
 def delete(bucket):
     """Delete a bucket.
 
@@ -2,6 +2,7 @@
 
 from django.core.exceptions import ObjectDoesNotExist
 from django.db import models, IntegrityError
+from django.db.models import Count
 
 from core_main_app.commons import exceptions
 from core_main_app.utils.validation.regex_validation import (
@@ -45,6 +46,23 @@ class Bucket(models.Model):
         """
         return Bucket.objects.all()
 
+    @staticmethod
+    def search(search="", order_by="label"):
+        """Return buckets matching a search on their label, with the number
+        of types they contain.
+
+        Args:
+            search: text to look for in the label, case insensitive
+            order_by:
+
+        Returns:
+
+        """
+        buckets = Bucket.objects.annotate(types_count=Count("types"))
+        if search:
+            buckets = buckets.filter(label__icontains=search)
+        return buckets.order_by(order_by, "pk")
+
     @staticmethod
     def get_colors():
         """Return all colors.
@@ -0,0 +1,165 @@
+"""Cache generation api
+
+Invalidation channel for the caches kept by each process (catalog snapshot,
+compiled schemas, rendered fragments...). A cache registers a namespace and
+compares the generation of the namespace with the generation it was built
+at. Changes bump the generation in the database, after commit, so all
+workers and nodes see them.
+
+Generations read from the database are reused for
+COMPOSER_CACHE_GENERATION_CHECK_INTERVAL seconds, which bounds the
+staleness of the caches in other processes. A process always sees its own
+changes immediately.
+"""
+
+import logging
+import threading
+import time
+
+from django.db import transaction
+from django.db.models import signals as models_signals
+from django.dispatch import Signal
+
+from core_composer_app.components.cache_generation.models import (
+    CacheGeneration,
+)
+from core_composer_app.settings import COMPOSER_CACHE_GENERATION_CHECK_INTERVAL
+
+logger = logging.getLogger(__name__)
+
+generation_changed = Signal()
+""" Sent when a process sees a new generation of a namespace,
+with namespace and generation arguments.
+"""
+
+# namespace -> (generation, time of the last check)
+_generations = {}
+_namespaces = set()
+_lock = threading.Lock()
+
+
+def register_namespace(namespace, on_change=None):
+    """Register a cache namespace.
+
+    Args:
+        namespace:
+        on_change: function called with the namespace and the new generation
+            when a process sees a new generation of the namespace
+
+    Returns:
+
+    """
+    with _lock:
+        _namespaces.add(namespace)
+    if on_change is not None:
+
+        def receiver(sender, **kwargs):
+            if kwargs["namespace"] == namespace:
+                on_change(namespace, kwargs["generation"])
+
+        generation_changed.connect(
+            receiver, weak=False, dispatch_uid=f"{namespace}:{id(on_change)}"
+        )
+
+
+def get_generation(namespace):
+    """Return the generation of a namespace.
+
+    Args:
+        namespace:
+
+    Returns:
+
+    """
+    checked = _generations.get(namespace)
+    if (
+        checked is not None
+        and time.monotonic() - checked[1]
+        < COMPOSER_CACHE_GENERATION_CHECK_INTERVAL
+    ):
+        return checked[0]
+    generation = CacheGeneration.get_generation(namespace)
+    _set_generation(namespace, generation)
+    return generation
+
+
+def invalidate(namespace):
+    """Invalidate the caches of a namespace, once the transaction commits.
+
+    Args:
+        namespace:
+
+    Returns:
+
+    """
+    if namespace not in _namespaces:
+        logger.warning("Invalidating unregistered namespace %s", namespace)
+    transaction.on_commit(lambda: _bump(namespace))
+
+
+def invalidate_on_change(namespace, sender, should_invalidate=None):
+    """Invalidate the caches of a namespace when objects are saved or
+    deleted.
+
+    Args:
+        namespace:
+        sender: model, or through model of a many-to-many relation
+        should_invalidate: function called with the sender and the instance,
+            returning False when the change does not affect the namespace
+
+    Returns:
+
+    """
+
+    def receiver(sender, instance, **kwargs):
+        # many-to-many changes are sent before and after the change
+        if not kwargs.get("action", "post").startswith("post"):
+            return
+        if should_invalidate is None or should_invalidate(sender, instance):
+            invalidate(namespace)
+
+    dispatch_uid = f"{namespace}:{sender._meta.label}"
+    if sender._meta.auto_created:
+        models_signals.m2m_changed.connect(
+            receiver, sender=sender, weak=False, dispatch_uid=dispatch_uid
+        )
+        return
+    models_signals.post_save.connect(
+        receiver, sender=sender, weak=False, dispatch_uid=dispatch_uid
+    )
+    models_signals.post_delete.connect(
+        receiver, sender=sender, weak=False, dispatch_uid=dispatch_uid
+    )
+
+
+def _bump(namespace):
+    """Increment the generation of a namespace.
+
+    Args:
+        namespace:
+
+    Returns:
+
+    """
+    CacheGeneration.bump(namespace)
+    # read back: other processes may have bumped it too
+    _set_generation(namespace, CacheGeneration.get_generation(namespace))
+
+
+def _set_generation(namespace, generation):
+    """Store the generation last seen by this process.
+
+    Args:
+        namespace:
+        generation:
+
+    Returns:
+
+    """
+    with _lock:
+        previous = _generations.get(namespace)
+        _generations[namespace] = (generation, time.monotonic())
+    if previous is not None and previous[0] != generation:
+        generation_changed.send(
+            sender=CacheGeneration, namespace=namespace, generation=generation
+        )
@@ -0,0 +1,79 @@
+"""Cache generation model"""
+
+import secrets
+
+from django.db import IntegrityError, models, transaction
+from django.db.models import F
+
+
+class CacheGeneration(models.Model):
+    """Generation counter of a cache namespace, shared by all processes."""
+
+    namespace = models.CharField(unique=True, max_length=200)
+    generation = models.PositiveBigIntegerField(default=0)
+    last_modification_date = models.DateTimeField(auto_now=True)
+
+    @staticmethod
+    def get_generation(namespace):
+        """Return the generation of a namespace.
+
+        Args:
+            namespace:
+
+        Returns:
+
+        """
+        generation = (
+            CacheGeneration.objects.filter(namespace=namespace)
+            .values_list("generation", flat=True)
+            .first()
+        )
+        if generation is None:
+            generation = CacheGeneration._create(namespace).generation
+        return generation
+
+    @staticmethod
+    def bump(namespace):
+        """Increment the generation of a namespace.
+
+        Args:
+            namespace:
+
+        Returns:
+
+        """
+        # atomic increment, no lost update between processes
+        if not CacheGeneration.objects.filter(namespace=namespace).update(
+            generation=F("generation") + 1
+        ):
+            CacheGeneration._create(namespace)
+
+    @staticmethod
+    def _create(namespace):
+        """Create the generation of a namespace.
+
+        The first generation is random, so it cannot match a generation
+        seen before the counter was lost (e.g. database restored).
+
+        Args:
+            namespace:
+
+        Returns:
+
+        """
+        try:
+            with transaction.atomic():
+                return CacheGeneration.objects.create(
+                    namespace=namespace, generation=secrets.randbits(31)
+                )
+        except IntegrityError:
+            # created concurrently
+            return CacheGeneration.objects.get(namespace=namespace)
+
+    def __str__(self):
+        """Cache generation as string
+
+        Returns:
+
+        """
+        return f"{self.namespace}: {self.generation}"
@@ -0,0 +1,51 @@
+"""Catalog api
+
+The catalog snapshot is shared by all the threads of a process. Readers get
+the current snapshot without locking: it is rebuilt, once, when the
+generation of the catalog namespace has been bumped by a change to a bucket
+or a type of the catalog (see components.catalog.signals).
+"""
+
+import threading
+
+from core_composer_app.components.cache_generation import (
+    api as cache_generation_api,
+)
+from core_composer_app.components.catalog.snapshot import build_snapshot
+
+CATALOG_NAMESPACE = "catalog"
+
+_snapshot = None
+_rebuild_lock = threading.Lock()
+
+
+def get_catalog():
+    """Return a snapshot of the current catalog.
+
+    Returns:
+        CatalogSnapshot
+
+    """
+    generation = cache_generation_api.get_generation(CATALOG_NAMESPACE)
+    snapshot = _snapshot
+    if snapshot is not None and snapshot.generation == generation:
+        return snapshot
+    return _rebuild(generation)
+
+
+def _rebuild(generation):
+    """Rebuild the snapshot of a generation, unless another thread did.
+
+    Args:
+        generation:
+
+    Returns:
+
+    """
+    global _snapshot
+    with _rebuild_lock:
+        snapshot = _snapshot
+        if snapshot is None or snapshot.generation != generation:
+            snapshot = build_snapshot(generation)
+            _snapshot = snapshot
+        return snapshot
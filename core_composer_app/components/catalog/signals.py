@@ -0,0 +1,84 @@
+"""Signals to invalidate the catalog snapshot when the catalog changes."""
+
+import logging
+
+from core_composer_app.components.bucket.models import Bucket
+from core_composer_app.components.cache_generation import (
+    api as cache_generation_api,
+)
+from core_composer_app.components.catalog.api import CATALOG_NAMESPACE
+from core_composer_app.components.type.models import Type
+from core_composer_app.components.type_version_manager.models import (
+    TypeVersionManager,
+)
+from core_main_app.components.template.models import Template
+from core_main_app.components.template_version_manager.models import (
+    TemplateVersionManager,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def connect():
+    """Connect signals invalidating the catalog"""
+    cache_generation_api.register_namespace(CATALOG_NAMESPACE)
+    cache_generation_api.invalidate_on_change(CATALOG_NAMESPACE, Bucket)
+    cache_generation_api.invalidate_on_change(
+        CATALOG_NAMESPACE, Bucket.types.through
+    )
+    # versions and version managers are also updated through core models
+    for sender in [
+        TypeVersionManager,
+        TemplateVersionManager,
+        Type,
+        Template,
+    ]:
+        cache_generation_api.invalidate_on_change(
+            CATALOG_NAMESPACE, sender, should_invalidate=is_in_catalog
+        )
+    logger.info("Registered signals for catalog invalidation")
+
+
+def is_in_catalog(sender, instance):
+    """Check if a version or a version manager is part of the catalog.
+
+    Args:
+        sender:
+        instance:
+
+    Returns:
+
+    """
+    if not _is_type(instance):
+        return False
+    if instance.user is None:
+        return True
+    # user types are only part of the catalog when in a bucket
+    version_manager_id = (
+        instance.pk
+        if issubclass(sender, TemplateVersionManager)
+        else instance.version_manager_id
+    )
+    return (
+        version_manager_id is not None
+        and Bucket.types.through.objects.filter(
+            typeversionmanager_id=version_manager_id
+        ).exists()
+    )
+
+
+def _is_type(instance):
+    """Check if a version or a version manager is a type, also when saved
+    through the core models.
+
+    Args:
+        instance:
+
+    Returns:
+
+    """
+    if isinstance(instance, (Type, TypeVersionManager)):
+        return True
+    if isinstance(instance, TemplateVersionManager):
+        return instance._cls == TypeVersionManager._class_name
+    return instance._cls == Type.class_name
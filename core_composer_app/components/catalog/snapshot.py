@@ -0,0 +1,134 @@
+"""Catalog snapshot
+
+Immutable, in-process copy of the catalog: the buckets, the global type
+version managers and the type version managers in buckets, with their
+current versions.
+"""
+
+from collections import namedtuple
+from types import MappingProxyType
+
+from django.db.models import Q
+
+from core_composer_app.components.bucket.models import Bucket
+from core_composer_app.components.type_version_manager.models import (
+    TypeVersionManager,
+)
+from core_main_app.components.template.models import Template
+
+CatalogType = namedtuple(
+    "CatalogType", ["id", "title", "user", "is_disabled", "current"]
+)
+CatalogBucket = namedtuple("CatalogBucket", ["id", "label", "color", "types"])
+
+
+class CatalogSnapshot:
+    """Catalog snapshot, never modified once built"""
+
+    def __init__(self, generation, buckets, types):
+        """Initialize the snapshot
+
+        Args:
+            generation: generation of the catalog the snapshot was built at
+            buckets: tuple of CatalogBucket, ordered by label
+            types: tuple of CatalogType, ordered by title
+        """
+        self.generation = generation
+        self.buckets = buckets
+        self.types_by_id = MappingProxyType(
+            {catalog_type.id: catalog_type for catalog_type in types}
+        )
+        # global types, types of users only appear in their buckets
+        self.types = tuple(
+            catalog_type for catalog_type in types if catalog_type.user is None
+        )
+        self.bucket_type_ids = frozenset(
+            catalog_type.id
+            for bucket in buckets
+            for catalog_type in bucket.types
+        )
+
+    def get_active_types(self, types=None):
+        """Return the types that are not disabled.
+
+        Args:
+            types: types to filter, all types if None
+
+        Returns:
+
+        """
+        return tuple(
+            catalog_type
+            for catalog_type in (self.types if types is None else types)
+            if not catalog_type.is_disabled
+        )
+
+    def get_no_buckets_types(self):
+        """Return the types that are not in a bucket.
+
+        Returns:
+
+        """
+        return tuple(
+            catalog_type
+            for catalog_type in self.types
+            if catalog_type.id not in self.bucket_type_ids
+        )
+
+
+def build_snapshot(generation):
+    """Build a snapshot of the catalog from the database.
+
+    Args:
+        generation:
+
+    Returns:
+
+    """
+    version_managers = TypeVersionManager.objects.filter(
+        Q(user=None) | Q(bucket__isnull=False)
+    ).distinct()
+    current_versions = dict(
+        Template.objects.filter(
+            version_manager__in=version_managers, is_current=True
+        ).values_list("version_manager_id", "pk")
+    )
+    types = tuple(
+        CatalogType(
+            id=version_manager["pk"],
+            title=version_manager["title"],
+            user=version_manager["user"],
+            is_disabled=version_manager["is_disabled"],
+            current=(
+                str(current_versions[version_manager["pk"]])
+                if version_manager["pk"] in current_versions
+                else None
+            ),
+        )
+        for version_manager in version_managers.order_by("title").values(
+            "pk", "title", "user", "is_disabled"
+        )
+    )
+    types_by_id = {catalog_type.id: catalog_type for catalog_type in types}
+
+    bucket_type_ids = {}
+    for bucket_id, type_id in Bucket.types.through.objects.values_list(
+        "bucket_id", "typeversionmanager_id"
+    ):
+        bucket_type_ids.setdefault(bucket_id, []).append(type_id)
+
+    buckets = tuple(
+        CatalogBucket(
+            id=bucket["pk"],
+            label=bucket["label"],
+            color=bucket["color"],
+            types=tuple(
+                types_by_id[type_id]
+                for type_id in sorted(bucket_type_ids.get(bucket["pk"], []))
+            ),
+        )
+        for bucket in Bucket.objects.order_by("label").values(
+            "pk", "label", "color"
+        )
+    )
+    return CatalogSnapshot(generation, buckets, types)
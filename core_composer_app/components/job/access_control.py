@@ -0,0 +1,63 @@
+"""Job access control"""
+
+from core_main_app.access_control.exceptions import AccessControlError
+from core_main_app.utils.requests_utils.access_control import (
+    get_request_from_args,
+)
+
+from core_composer_app.components.job.models import Job
+
+
+def check_can_access_job(job, user):
+    """Check that a user can access a job: only its owner and superusers can.
+
+    Args:
+        job:
+        user:
+
+    Returns:
+
+    """
+    if user.is_superuser:
+        return
+
+    if user.is_anonymous or job.user is None or job.user != str(user.id):
+        raise AccessControlError("Job: The user doesn't have enough rights.")
+
+
+def can_access_id(func, job_id, request):
+    """Can access job.
+
+    Args:
+        func:
+        job_id:
+        request:
+
+    Returns:
+
+    """
+    job = func(job_id, request=request)
+    check_can_access_job(job, request.user)
+    return job
+
+
+def can_access(func, *args, **kwargs):
+    """Can access job given as argument.
+
+    Args:
+        func:
+        args:
+        kwargs:
+
+    Returns:
+
+    """
+    request = get_request_from_args(*args, **kwargs)
+    job = next(
+        (arg for arg in (*args, *kwargs.values()) if isinstance(arg, Job)),
+        None,
+    )
+    if job is None:
+        raise AccessControlError("Job: No job to check the access of.")
+    check_can_access_job(job, request.user)
+    return func(*args, **kwargs)
@@ -0,0 +1,104 @@
+"""Job api"""
+
+from django.utils import timezone
+
+from core_main_app.access_control.decorators import access_control
+from core_main_app.commons.exceptions import ApiError
+
+from core_composer_app.components.job import executor
+from core_composer_app.components.job.access_control import (
+    can_access,
+    can_access_id,
+)
+from core_composer_app.components.job.models import Job
+
+
+def submit(name, params, request):
+    """Submit a job, run in the background.
+
+    Args:
+        name: name of a registered job task
+        params: dict of parameters given to the task (JSON serializable)
+        request: None for jobs submitted by the system
+
+    Returns:
+
+    """
+    # raises an error if the task is unknown
+    executor.check_job_task(name)
+
+    user = None
+    if request is not None and not request.user.is_anonymous:
+        user = str(request.user.id)
+    job = Job(name=name, params=params, user=user)
+    job.save()
+    executor.submit_job(job)
+    return job
+
+
+@access_control(can_access_id)
+def get_by_id(job_id, request):
+    """Return a job given its id.
+
+    Args:
+        job_id:
+        request:
+
+    Returns:
+
+    """
+    return Job.get_by_id(job_id)
+
+
+def get_all_by_user(request):
+    """Return all jobs of the user.
+
+    Args:
+        request:
+
+    Returns:
+
+    """
+    return Job.get_all_by_user(request.user.id)
+
+
+@access_control(can_access)
+def cancel(job, request):
+    """Cancel a job.
+
+    A pending job is canceled right away, a running job stops at its next
+    cancellation check.
+
+    Args:
+        job:
+        request:
+
+    Returns:
+
+    """
+    if job.is_finished:
+        raise ApiError("Unable to cancel a finished job.")
+
+    Job.objects.filter(pk=job.pk).update(cancel_requested=True)
+    now = timezone.now()
+    Job.objects.filter(pk=job.pk, status=Job.PENDING).update(
+        status=Job.CANCELED, end_date=now, last_modification_date=now
+    )
+    job.refresh_from_db()
+    return job
+
+
+@access_control(can_access)
+def get_result(job, request):
+    """Return the result of a job.
+
+    Args:
+        job:
+        request:
+
+    Returns:
+
+    """
+    if job.status != Job.SUCCESS:
+        raise ApiError(f"The job has no result (status: {job.status}).")
+    return job.result
@@ -0,0 +1,349 @@
+"""In-process executor of jobs
+
+Jobs are stored in the database and run by a thread pool of the server
+process, so no external broker is needed. Job tasks are registered by name
+with `register_job_task`, with the dotted path of their function, imported
+when a job of the task runs. They receive a `JobHandle` to report their
+progress and check for cancellation.
+
+Each process running jobs sends a heartbeat for them. Jobs left running by a
+process which is gone, and pending jobs, are recovered by the
+`recover_composer_jobs` command, to run when the server starts.
+"""
+
+import logging
+import os
+import socket
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
+from django.db import connection, transaction
+from django.utils import timezone
+from django.utils.module_loading import import_string
+
+from core_main_app.commons.exceptions import ApiError
+
+from core_composer_app.components.job.models import Job
+from core_composer_app.settings import (
+    COMPOSER_JOB_HEARTBEAT_INTERVAL,
+    COMPOSER_JOB_MAX_WORKERS,
+    COMPOSER_JOB_INTERRUPTED_TIMEOUT,
+)
+
+logger = logging.getLogger(__name__)
+
+JOB_TASKS = {}
+_executor = None
+_executor_lock = threading.Lock()
+_heartbeat_pid = None
+# distinguishes processes reusing the pid of a previous server process
+_WORKER_TOKEN = uuid.uuid4().hex
+
+
+class JobCanceled(Exception):
+    """Raised by a job task to stop after a cancellation request"""
+
+
+class JobHandle:
+    """Handle given to job tasks to interact with their job"""
+
+    def __init__(self, job_id, user_id=None):
+        """Initialize the handle
+
+        Args:
+            job_id:
+            user_id: id of the user who submitted the job, None for the system
+        """
+        self.job_id = job_id
+        self.user_id = user_id
+
+    def set_progress(self, current, total, partial_result=None):
+        """Report the progress of the job.
+
+        Args:
+            current:
+            total:
+            partial_result: result available so far
+
+        Returns:
+
+        """
+        values = {
+            "progress_current": current,
+            "progress_total": total,
+            "last_modification_date": timezone.now(),
+        }
+        if partial_result is not None:
+            values["result"] = partial_result
+        Job.objects.filter(pk=self.job_id).update(**values)
+
+    def is_cancel_requested(self):
+        """Check if the cancellation of the job has been requested.
+
+        Returns:
+
+        """
+        return Job.objects.filter(
+            pk=self.job_id, cancel_requested=True
+        ).exists()
+
+    def check_canceled(self):
+        """Raise JobCanceled if the cancellation of the job has been requested.
+
+        Returns:
+
+        """
+        if self.is_cancel_requested():
+            raise JobCanceled()
+
+
+def register_job_task(name, task_path):
+    """Register the task of the jobs with the given name.
+
+    Args:
+        name:
+        task_path: dotted path of the function of the task, imported when
+            a job runs
+
+    Returns:
+
+    """
+    JOB_TASKS[name] = task_path
+
+
+def check_job_task(name):
+    """Raise an error if no task is registered with the given name.
+
+    Args:
+        name:
+
+    Returns:
+
+    """
+    if name not in JOB_TASKS:
+        raise ApiError(f"Unknown job: {name}.")
+
+
+def get_job_task(name):
+    """Return the function of the task registered with the given name.
+
+    Args:
+        name:
+
+    Returns:
+
+    """
+    check_job_task(name)
+    task = JOB_TASKS[name]
+    return import_string(task) if isinstance(task, str) else task
+
+
+def submit_job(job):
+    """Run a saved job once the current transaction is committed.
+
+    Args:
+        job:
+
+    Returns:
+
+    """
+    job_id = job.pk
+    transaction.on_commit(
+        lambda: get_executor().submit(_run_job_in_worker, job_id)
+    )
+
+
+def get_executor():
+    """Return the executor of the process.
+
+    Returns:
+
+    """
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=COMPOSER_JOB_MAX_WORKERS,
+                thread_name_prefix="composer-job",
+            )
+        start_heartbeat()
+    return _executor
+
+
+def get_worker_id():
+    """Return the id of the current process, stored on the jobs it runs.
+
+    Returns:
+
+    """
+    return f"{socket.gethostname()}:{os.getpid()}:{_WORKER_TOKEN}"
+
+
+def start_heartbeat():
+    """Start the heartbeat of the running jobs of the current process, if
+    not started yet.
+
+    Returns:
+
+    """
+    global _heartbeat_pid
+    # threads are not inherited by forked processes
+    if _heartbeat_pid == os.getpid():
+        return
+    _heartbeat_pid = os.getpid()
+    threading.Thread(
+        target=_run_heartbeat,
+        args=(get_worker_id(),),
+        name="composer-job-heartbeat",
+        daemon=True,
+    ).start()
+
+
+def send_heartbeat(worker_id):
+    """Tell the running jobs of a worker are still alive.
+
+    Args:
+        worker_id:
+
+    Returns:
+
+    """
+    Job.objects.filter(status=Job.RUNNING, worker=worker_id).update(
+        last_modification_date=timezone.now()
+    )
+
+
+def _run_heartbeat(worker_id):
+    """Send the heartbeat of a worker, until the process ends.
+
+    Args:
+        worker_id:
+
+    Returns:
+
+    """
+    while True:
+        time.sleep(COMPOSER_JOB_HEARTBEAT_INTERVAL)
+        try:
+            send_heartbeat(worker_id)
+        except Exception as exception:
+            logger.error("Unable to send job heartbeat: %s", str(exception))
+        finally:
+            connection.close()
+
+
+def recover_jobs(executor):
+    """Recover the jobs left by server processes which are gone.
+
+    Running jobs without heartbeat for too long have been interrupted and are
+    marked as failed, pending jobs are submitted again.
+
+    Args:
+        executor:
+
+    Returns:
+        tuple: number of interrupted jobs, number of pending jobs.
+
+    """
+    now = timezone.now()
+    interrupted_count = (
+        Job.objects.filter(
+            status=Job.RUNNING,
+            last_modification_date__lt=now
+            - timedelta(seconds=COMPOSER_JOB_INTERRUPTED_TIMEOUT),
+        )
+        .exclude(worker=get_worker_id())
+        .update(
+            status=Job.FAILURE,
+            error="Job interrupted.",
+            end_date=now,
+            last_modification_date=now,
+        )
+    )
+    if interrupted_count:
+        logger.warning(
+            "%s interrupted job(s) marked as failed.", interrupted_count
+        )
+
+    pending_ids = list(
+        Job.get_all_by_status([Job.PENDING]).values_list("pk", flat=True)
+    )
+    for job_id in pending_ids:
+        executor.submit(_run_job_in_worker, job_id)
+    return interrupted_count, len(pending_ids)
+
+
+def run_job(job_id):
+    """Run a pending job and store its result.
+
+    Args:
+        job_id:
+
+    Returns:
+
+    """
+    # claim the job, another process may have started it already
+    if not Job.objects.filter(pk=job_id, status=Job.PENDING).update(
+        status=Job.RUNNING,
+        worker=get_worker_id(),
+        last_modification_date=timezone.now(),
+    ):
+        return
+
+    job = Job.get_by_id(job_id)
+    handle = JobHandle(job_id, user_id=job.user)
+    try:
+        handle.check_canceled()
+        task = get_job_task(job.name)
+        result = task(handle, **job.params)
+        _finish_job(job_id, Job.SUCCESS, result=result)
+    except JobCanceled:
+        _finish_job(job_id, Job.CANCELED)
+    except Exception as exception:
+        logger.error("Job %s failed: %s", job_id, str(exception))
+        _finish_job(job_id, Job.FAILURE, error=str(exception))
+
+
+def _run_job_in_worker(job_id):
+    """Run a job from a worker thread.
+
+    Args:
+        job_id:
+
+    Returns:
+
+    """
+    try:
+        run_job(job_id)
+    except Exception as exception:
+        logger.error("Unable to run job %s: %s", job_id, str(exception))
+    finally:
+        # worker threads have their own database connection
+        connection.close()
+
+
+def _finish_job(job_id, status, result=None, error=""):
+    """Set the final status of a job.
+
+    Args:
+        job_id:
+        status:
+        result:
+        error:
+
+    Returns:
+
+    """
+    now = timezone.now()
+    values = {
+        "status": status,
+        "error": error,
+        "end_date": now,
+        "last_modification_date": now,
+    }
+    if result is not None:
+        values["result"] = result
+    Job.objects.filter(pk=job_id).update(**values)
@@ -0,0 +1,105 @@
+"""Job model"""
+
+from django.core.exceptions import ObjectDoesNotExist
+from django.db import models
+
+from core_main_app.commons import exceptions
+
+
+class Job(models.Model):
+    """Job class to run heavy operations outside of requests."""
+
+    PENDING = "PENDING"
+    RUNNING = "RUNNING"
+    SUCCESS = "SUCCESS"
+    FAILURE = "FAILURE"
+    CANCELED = "CANCELED"
+    STATUS_CHOICES = [
+        (PENDING, "Pending"),
+        (RUNNING, "Running"),
+        (SUCCESS, "Success"),
+        (FAILURE, "Failure"),
+        (CANCELED, "Canceled"),
+    ]
+    FINISHED_STATUSES = [SUCCESS, FAILURE, CANCELED]
+
+    name = models.CharField(max_length=200)
+    user = models.CharField(
+        blank=True, max_length=200, null=True, default=None
+    )
+    params = models.JSONField(blank=True, default=dict)
+    status = models.CharField(
+        max_length=20, choices=STATUS_CHOICES, default=PENDING, db_index=True
+    )
+    progress_current = models.IntegerField(default=0)
+    progress_total = models.IntegerField(default=0)
+    result = models.JSONField(blank=True, null=True, default=None)
+    error = models.TextField(blank=True, default="")
+    cancel_requested = models.BooleanField(default=False)
+    # process running the job
+    worker = models.CharField(
+        blank=True, max_length=200, null=True, default=None
+    )
+    creation_date = models.DateTimeField(auto_now_add=True)
+    # NOTE: also updated on progress and by the heartbeat of the worker,
+    # used to detect interrupted jobs
+    last_modification_date = models.DateTimeField(auto_now=True)
+    end_date = models.DateTimeField(blank=True, null=True, default=None)
+
+    @staticmethod
+    def get_by_id(job_id):
+        """Return a job given its id.
+
+        Args:
+            job_id:
+
+        Returns:
+
+        """
+        try:
+            return Job.objects.get(pk=str(job_id))
+        except ObjectDoesNotExist as exception:
+            raise exceptions.DoesNotExist(str(exception))
+        except Exception as ex:
+            raise exceptions.ModelError(str(ex))
+
+    @staticmethod
+    def get_all_by_user(user_id):
+        """Return all jobs of a user, most recent first.
+
+        Args:
+            user_id:
+
+        Returns:
+
+        """
+        return Job.objects.filter(user=str(user_id)).order_by("-creation_date")
+
+    @staticmethod
+    def get_all_by_status(status_list):
+        """Return all jobs having one of the given statuses.
+
+        Args:
+            status_list:
+
+        Returns:
+
+        """
+        return Job.objects.filter(status__in=status_list).order_by("pk")
+
+    @property
+    def is_finished(self):
+        """Check if the job is finished.
+
+        Returns:
+
+        """
+        return self.status in Job.FINISHED_STATUSES
+
+    def __str__(self):
+        """Job as string
+
+        Returns:
+
+        """
+        return f"{self.name} ({self.status})"
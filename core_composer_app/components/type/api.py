@@ -2,16 +2,39 @@
 Type API
 """
 
+import logging
+
+from django.core.cache import cache
+from django.db.models import Q
+
 from core_main_app.access_control.api import is_superuser
 from core_main_app.access_control.decorators import access_control
+from core_main_app.commons.constants import (
+    TEMPLATE_FILE_EXTENSION_FOR_TEMPLATE_FORMAT,
+)
 from core_main_app.components.template import api as template_api
 from core_main_app.components.template.access_control import (
     can_write,
     can_read_id,
+    check_can_read_template,
+    get_accessible_owners,
 )
+from core_main_app.components.template.models import Template
+from core_main_app.utils.file import get_file_extension
 
 from core_composer_app.components.type.models import Type
-from core_composer_app.utils.xml import check_type_core_support, COMPLEX_TYPE
+from core_composer_app.settings import (
+    COMPOSER_TYPE_DEDUPLICATION,
+    COMPOSER_TYPE_DIFF_CACHE_TIMEOUT,
+)
+from core_composer_app.utils.diff import diff_xsd
+from core_composer_app.utils.xml import (
+    check_type_core_support,
+    get_content_hash,
+    COMPLEX_TYPE,
+)
+
+logger = logging.getLogger(__name__)
 
 
 @access_control(can_write)
@@ -25,6 +48,11 @@ def upsert(type_object, request):
     Returns:
 
     """
+    type_object.content_hash = _get_type_content_hash(type_object)
+    existing_type = _get_identical_type(type_object)
+    if existing_type is not None:
+        # the same content was already validated and stored for this owner
+        return _save_identical_type(type_object, existing_type)
     # Check that the type is supported by the core
     type_definition = check_type_core_support(type_object.content)
     type_object.is_complex = type_definition == COMPLEX_TYPE
@@ -32,6 +60,75 @@ def upsert(type_object, request):
     return template_api.upsert(type_object, request=request)
 
 
+def _get_type_content_hash(type_object):
+    """Return the content hash of an XSD type, empty string if not available.
+
+    Args:
+        type_object:
+
+    Returns:
+
+    """
+    try:
+        if (
+            get_file_extension(type_object.filename)
+            != TEMPLATE_FILE_EXTENSION_FOR_TEMPLATE_FORMAT[Template.XSD]
+        ):
+            return ""
+        return get_content_hash(type_object.content)
+    except Exception as exception:
+        # content is not well-formed: let the regular checks report it
+        logger.debug("Unable to hash type content: %s", str(exception))
+        return ""
+
+
+def _get_identical_type(type_object):
+    """Return a validated type of the same owner with the same canonical
+    content, None if there is none or if deduplication is disabled.
+
+    Args:
+        type_object:
+
+    Returns:
+
+    """
+    if (
+        not COMPOSER_TYPE_DEDUPLICATION
+        or not type_object.content_hash
+        or type_object.pk is not None
+    ):
+        return None
+    return Type.get_by_content_hash(
+        type_object.content_hash, users=Q(user=type_object.user)
+    )
+
+
+def _save_identical_type(type_object, existing_type):
+    """Save a new type in the file of an identical type, reusing its
+    validation and its dependencies.
+
+    The content of the new type is the stored content: re-uploads that only
+    differ by whitespace or comments are not stored again.
+
+    Args:
+        type_object:
+        existing_type:
+
+    Returns:
+
+    """
+    type_object.format = existing_type.format
+    type_object.is_complex = existing_type.is_complex
+    type_object.hash = existing_type.hash
+    type_object.checksum = existing_type.checksum
+    type_object.content = existing_type.content
+    type_object.file = existing_type.file.name
+    type_object._cls = type_object.class_name
+    type_object.save()
+    type_object.dependencies.set(existing_type.dependencies.all())
+    return type_object
+
+
 @access_control(can_read_id)
 def get(type_id, request):
     """Get a type.
@@ -46,6 +143,78 @@ def get(type_id, request):
     return Type.get_by_id(type_id)
 
 
+async def aget(type_id, request):
+    """Get a type, from async code.
+
+    The access decorators are synchronous: the access is checked here, as
+    can_read_id does for get.
+
+    Args:
+        type_id:
+        request:
+
+    Returns:
+
+    """
+    type_object = await Type.aget_by_id(type_id)
+    check_can_read_template(type_object, await request.auser())
+    return type_object
+
+
+def get_all_accessible_by_id_list(type_id_list, request):
+    """Return the types with id in list, the user can read.
+
+    Access control is evaluated once for the list, in the query: types
+    that do not exist or that the user cannot read are not returned.
+
+    Args:
+        type_id_list:
+        request:
+
+    Returns:
+
+    """
+    return Type.get_all_by_id_list(
+        type_id_list, users=get_accessible_owners(request=request)
+    )
+
+
+def get_versions_diff(type_object, other_type_object):
+    """Return the structural differences between two types.
+
+    Args:
+        type_object: old type version, read with get
+        other_type_object: new type version, read with get
+
+    Returns:
+
+    """
+    # type versions are immutable, the diff of a pair can be cached
+    cache_key = "core_composer_app:type_diff:{0}:{1}".format(
+        type_object.pk, other_type_object.pk
+    )
+    diff = cache.get(cache_key)
+    if diff is None:
+        diff = diff_xsd(type_object.content, other_type_object.content)
+        cache.set(cache_key, diff, COMPOSER_TYPE_DIFF_CACHE_TIMEOUT)
+    return diff
+
+
+def get_dependents(type_object, request):
+    """Return the templates and types depending on a type, the user can read.
+
+    Args:
+        type_object:
+        request:
+
+    Returns:
+
+    """
+    return Type.get_dependents(
+        [type_object.pk], users=get_accessible_owners(request=request)
+    )
+
+
 @access_control(is_superuser)
 def get_all(request):
     """List all types.
@@ -0,0 +1,10 @@
+"""
+Type constants
+"""
+
+# name of the job revalidating the dependents of a type
+REVALIDATE_DEPENDENTS_JOB = "revalidate_dependents"
+# path of the task of the job, imported when a job runs
+REVALIDATE_DEPENDENTS_TASK = (
+    "core_composer_app.components.type.tasks.revalidate_dependents_job"
+)
@@ -2,7 +2,9 @@
 Type models
 """
 
+from django.core.exceptions import ObjectDoesNotExist
 from django.db import models
+from django.db.models import Count, Q
 
 from core_main_app.commons import exceptions
 from core_main_app.commons.exceptions import DoesNotExist
@@ -14,6 +16,10 @@ class Type(Template):
 
     class_name = "Type"
     is_complex = models.BooleanField(blank=False, default=False)
+    # NOTE: content_hash is a hash of the canonicalized content (see core_composer_app.utils.xml.get_content_hash)
+    content_hash = models.CharField(
+        max_length=64, blank=True, default="", db_index=True
+    )
 
     @staticmethod
     def get_by_id(type_id):
@@ -32,6 +38,39 @@ class Type(Template):
         except Exception as e:
             raise exceptions.ModelError(str(e))
 
+    @staticmethod
+    async def aget_by_id(type_id):
+        """Return a type given its id, from async code.
+
+        Args:
+            type_id:
+
+        Returns:
+
+        """
+        try:
+            return await Type.objects.aget(pk=str(type_id))
+        except ObjectDoesNotExist as exception:
+            raise exceptions.DoesNotExist(str(exception))
+        except Exception as exception:
+            raise exceptions.ModelError(str(exception))
+
+    @staticmethod
+    def get_all_by_id_list(type_id_list, users=None):
+        """Return the types with id in list.
+
+        Args:
+            type_id_list:
+            users: Q object restricting the owners of the types.
+
+        Returns:
+
+        """
+        type_query = Q(pk__in=type_id_list)
+        if users is not None:
+            type_query &= users
+        return Type.objects.filter(type_query).all()
+
     @staticmethod
     def get_all():
         """Return all types.
@@ -49,3 +88,67 @@ class Type(Template):
 
         """
         return Type.objects.filter(is_complex=True).all()
+
+    @staticmethod
+    def get_by_content_hash(content_hash, users=None):
+        """Return the first validated type having the given content hash.
+
+        Types saved through the API have a hash, set once their content
+        is validated.
+
+        Args:
+            content_hash:
+            users: Q object restricting the owners of the type.
+
+        Returns:
+            Type instance or None.
+
+        """
+        type_query = Q(content_hash=content_hash) & ~Q(_hash="")
+        if users is not None:
+            type_query &= users
+        return Type.objects.filter(type_query).order_by("pk").first()
+
+    @staticmethod
+    def get_dependents(type_ids, users=None):
+        """Return the templates and types depending on the given types.
+
+        The lookup goes through the dependencies relation table, indexed on
+        the target of the relation, so no template content is read.
+
+        Args:
+            type_ids:
+            users: Q object restricting the owners of the dependents.
+
+        Returns:
+
+        """
+        dependents_query = Q(dependencies__in=type_ids)
+        if users is not None:
+            dependents_query &= users
+        return (
+            Template.objects.filter(dependents_query).distinct().order_by("pk")
+        )
+
+    @staticmethod
+    def count_dependents(type_ids, users=None):
+        """Return the number of dependents of each of the given types.
+
+        Args:
+            type_ids:
+            users: Q object restricting the owners of the dependents.
+
+        Returns:
+            dict: type id (str) -> number of dependents.
+
+        """
+        dependents_query = Q(dependencies__in=type_ids)
+        if users is not None:
+            dependents_query &= users
+        return {
+            str(count["dependencies"]): count["count"]
+            for count in Template.objects.filter(dependents_query)
+            .values("dependencies")
+            .annotate(count=Count("pk", distinct=True))
+            .order_by()
+        }
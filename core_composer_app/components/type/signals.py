@@ -0,0 +1,57 @@
+"""Signals to revalidate dependents when a type version changes."""
+
+import logging
+
+from django.db import transaction
+from django.db.models import signals as models_signals
+
+from core_main_app.components.template.models import Template
+
+from core_composer_app.components.job import api as job_api
+from core_composer_app.components.type.constants import (
+    REVALIDATE_DEPENDENTS_JOB,
+)
+from core_composer_app.components.type.models import Type
+
+logger = logging.getLogger(__name__)
+
+
+def connect():
+    """Connect signal for dependents revalidation"""
+    # versions are set as current through the Template model
+    models_signals.pre_save.connect(pre_save_template, sender=Template)
+    models_signals.pre_save.connect(pre_save_template, sender=Type)
+    logger.info("Registered signals for dependents revalidation")
+
+
+def pre_save_template(sender, instance, **kwargs):
+    """Signal triggered before saving a template
+
+    Args:
+        sender:
+        instance:
+        kwargs:
+    """
+    if (
+        instance._cls != Type.class_name
+        or not instance.is_current
+        or instance.pk is None
+        or instance.version_manager_id is None
+    ):
+        return
+
+    # only when the type version becomes current
+    if Template.objects.filter(pk=instance.pk, is_current=True).exists():
+        return
+
+    version_manager_id = str(instance.version_manager_id)
+    logger.debug(
+        "Scheduling revalidation of dependents of %s", version_manager_id
+    )
+    transaction.on_commit(
+        lambda: job_api.submit(
+            REVALIDATE_DEPENDENTS_JOB,
+            {"version_manager_id": version_manager_id},
+            request=None,
+        )
+    )
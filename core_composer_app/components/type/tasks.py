@@ -0,0 +1,349 @@
+"""Type tasks"""
+
+import hashlib
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from types import SimpleNamespace
+from urllib.parse import urlparse
+
+from django.core.cache import cache
+from django.db.models import Q
+
+from core_main_app.commons.exceptions import DoesNotExist
+from core_main_app.components.template.access_control import (
+    get_accessible_owners,
+)
+from core_main_app.components.template.models import Template
+from core_main_app.components.user import api as user_api
+from core_main_app.utils.urls import get_template_download_pattern
+from xml_utils.commons.constants import LXML_SCHEMA_NAMESPACE
+from xml_utils.xsd_tree.xsd_tree import XSDTree
+
+from core_composer_app.components.type.models import Type
+from core_composer_app.components.type_version_manager.models import (
+    TypeVersionManager,
+)
+from core_composer_app.settings import (
+    COMPOSER_REVALIDATION_MAX_WORKERS,
+    COMPOSER_VALIDATION_CACHE_TIMEOUT,
+)
+from core_composer_app.utils.flatten import DEPENDENCY_TAGS, flatten_xsd
+from core_composer_app.utils.validation import validate_schema
+
+logger = logging.getLogger(__name__)
+
+VALID = "valid"
+INVALID = "invalid"
+UNRESOLVED = "unresolved"
+
+
+class UnresolvedDependencyError(Exception):
+    """Raised when a dependency can not be resolved outside of a request"""
+
+
+def revalidate_dependents_job(job, version_manager_id):
+    """Job which revalidates the templates and types depending on a type
+
+    Args:
+        job: JobHandle
+        version_manager_id:
+
+    Return:
+        {"<dependent_id>": {"status": "valid" | "invalid" | "unresolved",
+        "error": <str>}}
+    """
+    return revalidate_dependents(
+        version_manager_id,
+        users=_get_accessible_owners(job.user_id),
+        on_progress=job.set_progress,
+        check_canceled=job.check_canceled,
+    )
+
+
+def revalidate_dependents(
+    version_manager_id, users=None, on_progress=None, check_canceled=None
+):
+    """Revalidate the templates and types depending on a type
+
+    Dependents are walked transitively: a type including the changed type
+    can itself be included by other templates. There is no request to
+    resolve the includes of the dependents over HTTP, so they are inlined
+    from the database, with the access of the owner of each dependent.
+
+    Args:
+        version_manager_id:
+        users: Q object restricting the owners of the dependents reported
+        on_progress: function called with the progress and partial results
+        check_canceled: function raising an exception to stop revalidating
+
+    Return:
+        {"<dependent_id>": {"status": "valid" | "invalid" | "unresolved",
+        "error": <str>}}
+    """
+    results = {}
+    version_manager = TypeVersionManager.get_by_id(version_manager_id)
+    dependents = get_all_dependents(version_manager.versions)
+    if users is not None:
+        readable_ids = set(
+            Template.objects.filter(
+                users, pk__in=[dependent.pk for dependent in dependents]
+            ).values_list("pk", flat=True)
+        )
+        dependents = [
+            dependent
+            for dependent in dependents
+            if dependent.pk in readable_ids
+        ]
+    total_dependents = len(dependents)
+
+    # read the schemas from the database here, only validation runs in
+    # the workers (lxml releases the GIL while compiling schemas)
+    validations = []
+    for dependent in dependents:
+        try:
+            xsd_string = get_standalone_xsd(dependent)
+        except UnresolvedDependencyError as exception:
+            # not validated, the result would not tell if the schema is valid
+            results[str(dependent.pk)] = {
+                "status": UNRESOLVED,
+                "error": str(exception),
+            }
+            continue
+        validations.append(
+            (dependent.pk, xsd_string, get_validation_cache_key(dependent))
+        )
+    if results and on_progress is not None:
+        on_progress(len(results), total_dependents, results)
+    # stops the validations in progress when revalidating is stopped
+    stopped = threading.Event()
+
+    def check_stopped():
+        if stopped.is_set():
+            raise RuntimeError("Revalidation stopped.")
+
+    with ThreadPoolExecutor(
+        max_workers=COMPOSER_REVALIDATION_MAX_WORKERS
+    ) as executor:
+        futures = {
+            executor.submit(
+                validate_schema_with_cache, content, key, check_stopped
+            ): pk
+            for pk, content, key in validations
+        }
+        try:
+            for future in as_completed(futures):
+                try:
+                    error = future.result()
+                except Exception as exception:
+                    error = str(exception)
+                results[str(futures[future])] = {
+                    "status": VALID if error is None else INVALID,
+                    "error": error,
+                }
+                if on_progress is not None:
+                    on_progress(len(results), total_dependents, results)
+                if check_canceled is not None:
+                    check_canceled()
+        except Exception:
+            # do not wait for the remaining validations
+            stopped.set()
+            for future in futures:
+                future.cancel()
+            raise
+
+    invalid = [
+        pk for pk, result in results.items() if result["status"] == INVALID
+    ]
+    if invalid:
+        logger.warning(
+            "Dependents of type version manager %s are not valid: %s",
+            version_manager_id,
+            ", ".join(invalid),
+        )
+    return results
+
+
+def get_all_dependents(type_ids):
+    """Return the templates and types depending, directly or not, on types.
+
+    Args:
+        type_ids:
+
+    Returns:
+        list: dependents, each listed once.
+
+    """
+    dependents = []
+    visited_ids = set(str(type_id) for type_id in type_ids)
+    next_ids = list(visited_ids)
+    while next_ids:
+        new_dependents = [
+            dependent
+            for dependent in Type.get_dependents(next_ids)
+            if str(dependent.pk) not in visited_ids
+        ]
+        dependents.extend(new_dependents)
+        next_ids = [str(dependent.pk) for dependent in new_dependents]
+        visited_ids.update(next_ids)
+    return dependents
+
+
+def get_standalone_xsd(template):
+    """Return the content of a template, with its local dependencies inlined.
+
+    Dependencies are read from the database, if the owner of the template can
+    read them (see `get_dependency_as_owner`).
+
+    Args:
+        template:
+
+    Returns:
+
+    Raises:
+        UnresolvedDependencyError: a local dependency can not be read by the
+            owner of the template, or can only be resolved with a session.
+
+    """
+    # local dependencies read, by id
+    dependencies = {}
+
+    def get_dependency(template_id):
+        dependency = get_dependency_as_owner(template, template_id)
+        dependencies[str(template_id)] = dependency
+        return dependency
+
+    xsd_string = flatten_xsd(template.content, get_dependency)
+    # dependencies declaring another namespace are kept as references,
+    # only global ones can be resolved without a session
+    pattern = get_template_download_pattern()
+    for element in XSDTree.build_tree(xsd_string).getroot():
+        if (
+            not isinstance(element.tag, str)
+            or element.tag.replace(LXML_SCHEMA_NAMESPACE, "")
+            not in DEPENDENCY_TAGS
+        ):
+            continue
+        match = pattern.match(
+            urlparse(element.attrib.get("schemaLocation", "")).path
+        )
+        if not match:
+            continue
+        dependency = dependencies.get(match.group("pk"))
+        if dependency is None or dependency.user is not None:
+            raise UnresolvedDependencyError(
+                f"Dependency {match.group('pk')} can only be resolved by its "
+                "owner."
+            )
+    return xsd_string
+
+
+def get_dependency_as_owner(template, dependency_id):
+    """Return a dependency of a template, if the owner of the template can
+    read it: global templates and templates of the same owner.
+
+    Args:
+        template:
+        dependency_id:
+
+    Returns:
+
+    Raises:
+        UnresolvedDependencyError: the dependency does not exist or can not be
+            read by the owner of the template.
+
+    """
+    try:
+        dependency = Template.get_by_id(dependency_id)
+    except DoesNotExist:
+        raise UnresolvedDependencyError(
+            f"Dependency {dependency_id} does not exist."
+        )
+    if dependency.user is not None and dependency.user != template.user:
+        raise UnresolvedDependencyError(
+            f"Dependency {dependency_id} can not be read by the owner of the "
+            "schema."
+        )
+    return dependency
+
+
+def validate_schema_with_cache(xsd_string, cache_key, check_canceled=None):
+    """Validate a schema, reusing the result of a previous validation.
+
+    Args:
+        xsd_string:
+        cache_key:
+        check_canceled: function raising an exception to stop validating
+
+    Returns:
+        None if no errors, string otherwise
+
+    """
+    cached_result = cache.get(cache_key)
+    if cached_result is not None:
+        return cached_result["error"]
+
+    result = validate_schema(
+        XSDTree.build_tree(xsd_string), check_canceled=check_canceled
+    )
+    if result.is_complete:
+        # a timed out validation can complete later
+        cache.set(
+            cache_key,
+            {"error": result.error},
+            COMPOSER_VALIDATION_CACHE_TIMEOUT,
+        )
+    return result.error
+
+
+def _get_accessible_owners(user_id):
+    """Return the owners of the templates a user can read.
+
+    Args:
+        user_id: None for the system
+
+    Returns:
+        Q object, None if not restricted
+
+    """
+    if user_id is None:
+        return None
+    try:
+        user = user_api.get_user_by_id(user_id)
+    except Exception:
+        # the user was deleted
+        return Q(user__in=[])
+    return get_accessible_owners(SimpleNamespace(user=user))
+
+
+def get_validation_cache_key(template):
+    """Return the validation cache key of a template.
+
+    The result of the validation only depends on the content of the template
+    and of its dependencies, identified by their hash.
+
+    Args:
+        template:
+
+    Returns:
+
+    """
+    hashes = [_get_template_hash(template)] + sorted(
+        _get_template_hash(dependency)
+        for dependency in template.dependencies.all()
+    )
+    return "core_composer_app:validation:{0}".format(
+        hashlib.sha256("|".join(hashes).encode("utf-8")).hexdigest()
+    )
+
+
+def _get_template_hash(template):
+    """Return the hash of a template, its id if no hash is set.
+
+    Args:
+        template:
+
+    Returns:
+
+    """
+    return template.hash or f"pk:{template.pk}"
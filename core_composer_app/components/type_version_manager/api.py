@@ -3,7 +3,13 @@ Type Version Manager API
 """
 
 from core_composer_app.components.bucket import api as bucket_api
+from core_composer_app.components.catalog import api as catalog_api
 from core_composer_app.components.type import api as type_api
+from core_composer_app.components.type.models import Type
+from core_composer_app.components.job import api as job_api
+from core_composer_app.components.type.constants import (
+    REVALIDATE_DEPENDENTS_JOB,
+)
 from core_composer_app.components.type_version_manager.models import (
     TypeVersionManager,
 )
@@ -11,6 +17,9 @@ from core_main_app.access_control.api import is_superuser
 from core_main_app.access_control.decorators import access_control
 from core_main_app.components.template.access_control import can_read_id
 from core_main_app.components.template.access_control import can_read_global
+from core_main_app.components.template.access_control import (
+    get_accessible_owners,
+)
 from core_main_app.components.template_version_manager.access_control import (
     can_write,
 )
@@ -72,6 +81,61 @@ def insert(type_version_manager, type_object, request, list_bucket_ids=None):
         raise exception
 
 
+def get_dependents(version_manager, request):
+    """Return the templates and types depending on any version of a type.
+
+    Dependencies reference a specific version of a type, so templates still
+    including a previous version are returned after a new version is set as
+    current.
+
+    Args:
+        version_manager:
+        request:
+
+    Returns:
+
+    """
+    return Type.get_dependents(
+        version_manager.versions, users=get_accessible_owners(request=request)
+    )
+
+
+def count_dependents_by_version(version_manager, request):
+    """Return the number of dependents of each version of a type.
+
+    Args:
+        version_manager:
+        request:
+
+    Returns:
+        dict: version id -> number of templates and types depending on it.
+
+    """
+    return Type.count_dependents(
+        version_manager.versions, users=get_accessible_owners(request=request)
+    )
+
+
+@access_control(can_write)
+def revalidate_dependents(version_manager, request):
+    """Revalidate the templates and types depending on a type.
+    NB: This action is executed in a job, use the job api to retrieve
+    its status and result
+
+    Args:
+        version_manager:
+        request:
+
+    Returns:
+        Job
+    """
+    return job_api.submit(
+        REVALIDATE_DEPENDENTS_JOB,
+        {"version_manager_id": str(version_manager.id)},
+        request=request,
+    )
+
+
 @access_control(can_read_global)
 def get_global_version_managers(request):
     """Get all global version managers of a type.
@@ -85,6 +149,27 @@ def get_global_version_managers(request):
     return TypeVersionManager.get_global_version_managers()
 
 
+@access_control(can_read_global)
+def search_global_version_managers(
+    request, is_disabled=False, search="", order_by="title"
+):
+    """Get global version managers of a type, matching a search on their
+    title.
+
+    Args:
+        request:
+        is_disabled:
+        search:
+        order_by:
+
+    Returns:
+
+    """
+    return TypeVersionManager.search_global_version_managers(
+        is_disabled=is_disabled, search=search, order_by=order_by
+    )
+
+
 @access_control(can_read_global)
 def get_active_global_version_manager(request):
     """Return all active Version Managers with user set to None.
@@ -127,15 +212,12 @@ def get_no_buckets_types(request):
     Returns:
 
     """
-    # Retrieve IDs of types in buckets.
-    bucket_type_id_list = []
-    for bucket in bucket_api.get_all():
-        bucket_type_id_list += [
-            bucket_type.pk for bucket_type in bucket.types.all()
-        ]
-
-    return get_global_version_managers(request=request).exclude(
-        pk__in=bucket_type_id_list
+    # Retrieve IDs of types in buckets, from the catalog snapshot.
+    bucket_type_ids = catalog_api.get_catalog().bucket_type_ids
+
+    # access to global types already checked
+    return TypeVersionManager.get_global_version_managers().exclude(
+        pk__in=bucket_type_ids
     )
 
 
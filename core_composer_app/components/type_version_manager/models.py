@@ -46,6 +46,31 @@ class TypeVersionManager(TemplateVersionManager):
         """
         return TypeVersionManager.objects.filter(user=None).all()
 
+    @staticmethod
+    def search_global_version_managers(
+        is_disabled=False, search="", order_by="title"
+    ):
+        """Return Type Version Managers with user set to None, matching a
+        search on their title.
+
+        Args:
+            is_disabled:
+            search: text to look for in the title, case insensitive
+            order_by:
+
+        Returns:
+
+        """
+        version_managers = TypeVersionManager.objects.filter(
+            user=None, is_disabled=is_disabled
+        )
+        if search:
+            version_managers = version_managers.filter(title__icontains=search)
+        # buckets are displayed with each type
+        return version_managers.prefetch_related("bucket_set").order_by(
+            order_by, "pk"
+        )
+
     @staticmethod
     def get_active_global_version_manager(_cls=True):
         """Return all active Type Version Managers with user set to None.
@@ -0,0 +1,111 @@
+"""Compress template content command"""
+
+import logging
+from argparse import BooleanOptionalAction
+
+from django.core.management import BaseCommand, CommandError
+
+from core_main_app.components.template.models import Template
+from core_composer_app.components.type.models import Type
+from core_composer_app.utils.storage import CompressedFileSystemStorage
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    """Compress stored template and type content command"""
+
+    help = "Compress the stored content of existing templates and types"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            default=100,
+            type=int,
+            help="Size of the batch",
+        )
+        parser.add_argument(
+            "--types-only",
+            default=False,
+            action=BooleanOptionalAction,
+            help="Only compress the content of types",
+        )
+        parser.add_argument(
+            "--dry-run",
+            default=False,
+            action=BooleanOptionalAction,
+            help="Dry run",
+        )
+
+    def handle(self, *args, **options):
+        """Compress stored content in batches.
+
+        The template storage needs to be a CompressedFileSystemStorage
+        (see CUSTOM_FILE_STORAGE setting). Files already compressed are skipped,
+        so the command can be interrupted and run again.
+
+        Parameters:
+            "batch-size": integer,
+            "types-only": boolean,
+            "dry-run": boolean
+
+        Examples:
+            compress_template_content
+            compress_template_content --types-only --batch-size 500
+            compress_template_content --dry-run
+
+        Args:
+            args:
+            options:
+
+        """
+        batch_size = options["batch_size"]
+        dry_run = options["dry_run"]
+        model = Type if options["types_only"] else Template
+
+        storage = Template._meta.get_field("file").storage
+        if not isinstance(storage, CompressedFileSystemStorage):
+            raise CommandError(
+                "Template storage is not compressed: set CUSTOM_FILE_STORAGE "
+                "to use CompressedFileSystemStorage for the template model."
+            )
+        if batch_size < 1:
+            raise CommandError("Batch size should be a positive integer.")
+        if dry_run:
+            self.stdout.write("Dry run: no content will be compressed.")
+
+        compressed = skipped = errors = 0
+        last_pk = None
+        while True:
+            # iterate on primary keys to keep memory bounded
+            queryset = model.objects.order_by("pk")
+            if last_pk is not None:
+                queryset = queryset.filter(pk__gt=last_pk)
+            batch = list(queryset.values_list("pk", "file")[:batch_size])
+            if not batch:
+                break
+
+            for pk, file_name in batch:
+                try:
+                    if not file_name or storage.is_compressed(file_name):
+                        skipped += 1
+                    elif dry_run or storage.compress(file_name):
+                        compressed += 1
+                    else:
+                        skipped += 1
+                except Exception as exception:
+                    errors += 1
+                    self.stderr.write(
+                        f"ERROR: Unable to compress {pk} ({file_name}): {str(exception)}"
+                    )
+            last_pk = batch[-1][0]
+            self.stdout.write(
+                f"Processed up to id {last_pk}: {compressed} compressed, "
+                f"{skipped} skipped, {errors} errors."
+            )
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Done: {compressed} compressed, {skipped} skipped, {errors} errors."
+            )
+        )
@@ -0,0 +1,44 @@
+"""Recover composer jobs command"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+from django.core.management import BaseCommand
+
+from core_composer_app.components.job import executor
+from core_composer_app.settings import COMPOSER_JOB_MAX_WORKERS
+
+
+class Command(BaseCommand):
+    """Recover composer jobs command"""
+
+    help = (
+        "Mark the jobs of stopped server processes as failed and run the "
+        "pending jobs"
+    )
+
+    def handle(self, *args, **options):
+        """Recover the jobs, waiting for the pending jobs to finish.
+
+        Examples:
+            recover_composer_jobs
+
+        Args:
+            args:
+            options:
+
+        """
+        executor.start_heartbeat()
+        with ThreadPoolExecutor(
+            max_workers=COMPOSER_JOB_MAX_WORKERS,
+            thread_name_prefix="composer-job",
+        ) as job_executor:
+            interrupted_count, pending_count = executor.recover_jobs(
+                job_executor
+            )
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{interrupted_count} interrupted job(s) marked as failed, "
+                f"{pending_count} pending job(s) run."
+            )
+        )
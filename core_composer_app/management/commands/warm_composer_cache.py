@@ -0,0 +1,75 @@
+"""Warm composer cache command"""
+
+from argparse import BooleanOptionalAction
+
+from django.core.management import BaseCommand, CommandError
+
+from core_composer_app.utils.warm_up import DEFAULT_LIMIT, warm_up_cache
+
+
+class Command(BaseCommand):
+    """Warm composer cache command"""
+
+    help = "Preload the composer caches for the most used templates and types"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--limit",
+            default=DEFAULT_LIMIT,
+            type=int,
+            help="Number of most used templates and types to preload",
+        )
+        parser.add_argument(
+            "--shared",
+            default=True,
+            action=BooleanOptionalAction,
+            help="Preload the shared cache (validation, flattened schemas)",
+        )
+
+    def handle(self, *args, **options):
+        """Preload the composer caches and report the duration of each phase.
+
+        Parameters:
+            "limit": integer,
+            "shared": boolean
+
+        Examples:
+            warm_composer_cache
+            warm_composer_cache --limit 200
+            warm_composer_cache --no-shared
+
+        Args:
+            args:
+            options:
+
+        """
+        limit = options["limit"]
+        if limit < 0:
+            raise CommandError("Limit should be a positive integer.")
+
+        reports = warm_up_cache(
+            limit=limit,
+            include_shared=options["shared"],
+            on_phase=self._write_report,
+        )
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                "Done in {0:.2f}s.".format(
+                    sum(report["duration"] for report in reports)
+                )
+            )
+        )
+
+    def _write_report(self, report):
+        """Write the report of a phase.
+
+        Args:
+            report:
+
+        """
+        self.stdout.write(
+            "{name}: {count} loaded, {errors} errors in {duration:.2f}s.".format(
+                **report
+            )
+        )
@@ -0,0 +1,21 @@
+# Generated by Django 5.2.18 on 2026-10-19 13:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    """Migration"""
+
+    dependencies = [
+        ("core_composer_app", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="type",
+            name="content_hash",
+            field=models.CharField(
+                blank=True, db_index=True, default="", max_length=64
+            ),
+        ),
+    ]
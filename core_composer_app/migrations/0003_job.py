@@ -0,0 +1,68 @@
+# Generated by Django 5.2.18 on 2026-10-19 13:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    """Migration"""
+
+    dependencies = [
+        ("core_composer_app", "0002_type_content_hash"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="Job",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("name", models.CharField(max_length=200)),
+                (
+                    "user",
+                    models.CharField(
+                        blank=True, default=None, max_length=200, null=True
+                    ),
+                ),
+                ("params", models.JSONField(blank=True, default=dict)),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("PENDING", "Pending"),
+                            ("RUNNING", "Running"),
+                            ("SUCCESS", "Success"),
+                            ("FAILURE", "Failure"),
+                            ("CANCELED", "Canceled"),
+                        ],
+                        db_index=True,
+                        default="PENDING",
+                        max_length=20,
+                    ),
+                ),
+                ("progress_current", models.IntegerField(default=0)),
+                ("progress_total", models.IntegerField(default=0)),
+                (
+                    "result",
+                    models.JSONField(blank=True, default=None, null=True),
+                ),
+                ("error", models.TextField(blank=True, default="")),
+                ("cancel_requested", models.BooleanField(default=False)),
+                ("creation_date", models.DateTimeField(auto_now_add=True)),
+                (
+                    "last_modification_date",
+                    models.DateTimeField(auto_now=True),
+                ),
+                (
+                    "end_date",
+                    models.DateTimeField(blank=True, default=None, null=True),
+                ),
+            ],
+        ),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 5.2.18 on 2026-10-19 13:53
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    """Migration"""
+
+    dependencies = [
+        ("core_composer_app", "0003_job"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="CacheGeneration",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("namespace", models.CharField(max_length=200, unique=True)),
+                ("generation", models.PositiveBigIntegerField(default=0)),
+                (
+                    "last_modification_date",
+                    models.DateTimeField(auto_now=True),
+                ),
+            ],
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 5.2.18 on 2026-10-19 16:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    """Migration"""
+
+    dependencies = [
+        ("core_composer_app", "0004_cache_generation"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="job",
+            name="worker",
+            field=models.CharField(
+                blank=True, default=None, max_length=200, null=True
+            ),
+        ),
+    ]
@@ -2,30 +2,38 @@
 
 import logging
 
-from django.contrib.auth.models import Permission, Group
-
 from core_main_app.permissions import rights as main_rights
 from core_composer_app.permissions import rights as composer_rights
 
 logger = logging.getLogger(__name__)
 
 
-def init_permissions():
-    """Initialization of groups and permissions."""
+def init_permissions(apps):
+    """Initialization of groups and permissions.
+
+    Args:
+        apps: application registry
+
+    Returns:
+
+    """
     try:
+        group_model = apps.get_model("auth", "Group")
+        permission_model = apps.get_model("auth", "Permission")
+
         # Get or Create the default group
-        default_group, created = Group.objects.get_or_create(
+        default_group, created = group_model.objects.get_or_create(
             name=main_rights.DEFAULT_GROUP
         )
 
         # Get composer permissions
-        composer_access_perm = Permission.objects.get(
+        composer_access_perm = permission_model.objects.get(
             codename=composer_rights.COMPOSER_ACCESS
         )
-        composer_save_template_perm = Permission.objects.get(
+        composer_save_template_perm = permission_model.objects.get(
             codename=composer_rights.COMPOSER_SAVE_TEMPLATE
         )
-        composer_save_type_perm = Permission.objects.get(
+        composer_save_type_perm = permission_model.objects.get(
             codename=composer_rights.COMPOSER_SAVE_TYPE
         )
 
@@ -0,0 +1,90 @@
+"""Serializers used throughout the Composition Rest API"""
+
+from rest_framework.exceptions import ValidationError
+from rest_framework.fields import CharField, ChoiceField
+from rest_framework.serializers import Serializer
+
+from core_composer_app.utils import composition
+
+SAVE_AS_TEMPLATE = "template"
+SAVE_AS_TYPE = "type"
+
+# parameters required by each operation
+OPERATION_REQUIRED_FIELDS = {
+    composition.INSERT_ELEMENT: ("xpath",),
+    composition.RENAME_ELEMENT: ("xpath", "name"),
+    composition.DELETE_ELEMENT: ("xpath",),
+    composition.CHANGE_ELEMENT_TYPE: ("xpath", "type"),
+    composition.SET_ELEMENT_OCCURRENCES: (
+        "xpath",
+        "min_occurs",
+        "max_occurs",
+    ),
+    composition.RENAME_ROOT_TYPE: ("name",),
+}
+
+
+class CompositionOperationSerializer(Serializer):
+    """
+    Composition operation serializer
+    """
+
+    operation = ChoiceField(choices=composition.OPERATIONS)
+    xpath = CharField(required=False)
+    name = CharField(required=False)
+    type = CharField(required=False)
+    type_version_manager = CharField(required=False)
+    min_occurs = CharField(required=False)
+    max_occurs = CharField(required=False)
+
+    def validate(self, attrs):
+        """Check that the parameters of the operation are given.
+
+        Args:
+            attrs:
+
+        Returns:
+
+        """
+        missing_fields = [
+            field
+            for field in OPERATION_REQUIRED_FIELDS[attrs["operation"]]
+            if field not in attrs
+        ]
+        if missing_fields:
+            raise ValidationError(
+                {field: "This field is required." for field in missing_fields}
+            )
+        if attrs["operation"] == composition.INSERT_ELEMENT and (
+            ("type" in attrs) == ("type_version_manager" in attrs)
+        ):
+            raise ValidationError(
+                "Either type or type_version_manager is required."
+            )
+        return attrs
+
+
+class CompositionSerializer(Serializer):
+    """
+    Composition serializer
+    """
+
+    template_id = CharField(default="new")
+    operations = CompositionOperationSerializer(many=True)
+    save_as = ChoiceField(
+        choices=(SAVE_AS_TEMPLATE, SAVE_AS_TYPE), required=False
+    )
+    title = CharField(required=False)
+
+    def validate(self, attrs):
+        """Check that a title is given to save the result.
+
+        Args:
+            attrs:
+
+        Returns:
+
+        """
+        if "save_as" in attrs and "title" not in attrs:
+            raise ValidationError({"title": "This field is required."})
+        return attrs
@@ -0,0 +1,247 @@
+"""Views for the Composition REST API"""
+
+from os.path import join
+
+from django.contrib.staticfiles import finders
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import extend_schema, OpenApiResponse
+from rest_framework import status
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from core_composer_app.components.type import api as type_api
+from core_composer_app.components.type_version_manager import (
+    api as type_version_manager_api,
+)
+from core_composer_app.permissions import rights
+from core_composer_app.rest.composition.serializers import (
+    CompositionSerializer,
+    SAVE_AS_TEMPLATE,
+    SAVE_AS_TYPE,
+)
+from core_composer_app.utils import save as save_utils
+from core_composer_app.utils.composition import compose_schema
+from core_main_app.access_control.exceptions import AccessControlError
+from core_main_app.commons.exceptions import (
+    ApiError,
+    DoesNotExist,
+    NotUniqueError,
+    XMLError,
+)
+from core_main_app.components.template import api as template_api
+from core_main_app.components.template.models import Template
+from core_main_app.utils.file import read_file_content
+
+
+@extend_schema(
+    tags=["Composition"],
+    description="Compose a template from types",
+)
+class Compose(APIView):
+    """Compose a template from types"""
+
+    permission_classes = (IsAuthenticated,)
+
+    @extend_schema(
+        summary="Compose a template",
+        description="Apply a list of composer operations to a base template "
+        "(or a new one), validate the result once, and optionally save it "
+        "as a template or a type",
+        request=CompositionSerializer,
+        responses={
+            200: OpenApiTypes.OBJECT,
+            201: OpenApiTypes.OBJECT,
+            400: OpenApiResponse(description="Validation error"),
+            403: OpenApiResponse(description="Access Forbidden"),
+            404: OpenApiResponse(description="Object was not found"),
+            500: OpenApiResponse(description="Internal server error"),
+        },
+    )
+    def post(self, request):
+        """Compose a template
+
+        Parameters:
+
+            {
+                "template_id": "new",
+                "operations": [
+                    {
+                        "operation": "insert_element",
+                        "xpath": "xsd:complexType/xsd:sequence",
+                        "type_version_manager": "1",
+                        "name": "element"
+                    }
+                ],
+                "save_as": "template",
+                "title": "template"
+            }
+
+        Args:
+            request: HTTP request
+
+        Returns:
+            - code: 200
+              content: Composed schema
+            - code: 201
+              content: Composed schema and id of the saved template or type
+            - code: 400
+              content: Validation error
+            - code: 403
+              content: Access Forbidden
+            - code: 404
+              content: Object was not found
+            - code: 500
+              content: Internal server error
+        """
+        try:
+            serializer = CompositionSerializer(data=request.data)
+            if not serializer.is_valid():
+                content = {"message": serializer.errors}
+                return Response(content, status=status.HTTP_400_BAD_REQUEST)
+            save_as = serializer.validated_data.get("save_as")
+            if not _has_composer_perm(
+                request.user, rights.COMPOSER_ACCESS
+            ) or (
+                save_as == SAVE_AS_TEMPLATE
+                and not _has_composer_perm(
+                    request.user, rights.COMPOSER_SAVE_TEMPLATE
+                )
+                or save_as == SAVE_AS_TYPE
+                and not _has_composer_perm(
+                    request.user, rights.COMPOSER_SAVE_TYPE
+                )
+            ):
+                content = {"message": "Access Forbidden."}
+                return Response(content, status=status.HTTP_403_FORBIDDEN)
+
+            template_id = serializer.validated_data["template_id"]
+            if save_as == SAVE_AS_TYPE:
+                # can save as type if new type or from existing type
+                save_utils.check_can_save_as_type(template_id, request)
+
+            # apply the operations to the base template
+            document = compose_schema(
+                _get_base_template_content(template_id, request),
+                serializer.validated_data["operations"],
+                lambda version_manager_id: _get_current_type(
+                    version_manager_id, request
+                ),
+            )
+            if save_as == SAVE_AS_TYPE:
+                # types have no root element
+                document.remove_single_root_element()
+
+            # validate the result once
+            result = document.validate(request=request)
+            if not result.is_valid:
+                content = {
+                    "message": (
+                        "This is not a valid XML schema. " + result.error
+                        if result.is_complete
+                        else result.error
+                    )
+                }
+                return Response(content, status=status.HTTP_400_BAD_REQUEST)
+
+            content = {"content": document.tostring()}
+            if save_as is None:
+                return Response(content, status=status.HTTP_200_OK)
+
+            dependencies = save_utils.get_dependencies(
+                document.get_dependency_locations(), request=request
+            )
+            if save_as == SAVE_AS_TEMPLATE:
+                saved_object = save_utils.save_template(
+                    serializer.validated_data["title"],
+                    content["content"],
+                    dependencies,
+                    request,
+                )
+            else:
+                saved_object = save_utils.save_type(
+                    serializer.validated_data["title"],
+                    content["content"],
+                    dependencies,
+                    request,
+                )
+            content["id"] = str(saved_object.id)
+            return Response(content, status=status.HTTP_201_CREATED)
+        except ApiError as api_error:
+            content = {"message": str(api_error)}
+            return Response(content, status=status.HTTP_400_BAD_REQUEST)
+        except AccessControlError as access_error:
+            content = {"message": str(access_error)}
+            return Response(content, status=status.HTTP_403_FORBIDDEN)
+        except DoesNotExist:
+            content = {"message": "Template or type not found."}
+            return Response(content, status=status.HTTP_404_NOT_FOUND)
+        except XMLError as xml_error:
+            content = {"message": str(xml_error)}
+            return Response(content, status=status.HTTP_400_BAD_REQUEST)
+        except NotUniqueError:
+            content = {
+                "message": "A template or type with the same title already exists."
+            }
+            return Response(content, status=status.HTTP_400_BAD_REQUEST)
+        except Exception as api_exception:
+            content = {"message": str(api_exception)}
+            return Response(
+                content, status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+
+
+def _has_composer_perm(user, permission):
+    """Return True if the user has a permission of the composer.
+
+    Args:
+        user:
+        permission:
+
+    Returns:
+
+    """
+    return user.has_perm(f"{rights.COMPOSER_CONTENT_TYPE}.{permission}")
+
+
+def _get_base_template_content(template_id, request):
+    """Return the content of the template to compose from.
+
+    Args:
+        template_id: id of the template, "new" for a new template
+        request:
+
+    Returns:
+
+    """
+    if template_id == "new":
+        return read_file_content(
+            finders.find(
+                join(
+                    "core_composer_app",
+                    "user",
+                    "xsd",
+                    "new_base_template.xsd",
+                )
+            )
+        )
+    template = template_api.get_by_id(template_id, request=request)
+    if template.format != Template.XSD:
+        raise XMLError("Template format not supported.")
+    return template.content
+
+
+def _get_current_type(version_manager_id, request):
+    """Return the current type of a type version manager.
+
+    Args:
+        version_manager_id:
+        request:
+
+    Returns:
+
+    """
+    version_manager = type_version_manager_api.get_by_id(
+        version_manager_id, request=request
+    )
+    return type_api.get(version_manager.current, request=request)
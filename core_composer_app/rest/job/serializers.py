@@ -0,0 +1,31 @@
+"""Serializers used throughout the Job Rest API"""
+
+from rest_framework.serializers import ModelSerializer
+
+from core_composer_app.components.job.models import Job
+
+
+class JobSerializer(ModelSerializer):
+    """
+    Job serializer
+    """
+
+    class Meta:
+        """Meta"""
+
+        model = Job
+        fields = [
+            "id",
+            "name",
+            "user",
+            "params",
+            "status",
+            "progress_current",
+            "progress_total",
+            "error",
+            "cancel_requested",
+            "creation_date",
+            "last_modification_date",
+            "end_date",
+        ]
+        read_only_fields = fields
@@ -0,0 +1,231 @@
+"""Views for the Job REST API"""
+
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import (
+    extend_schema,
+    OpenApiParameter,
+    OpenApiResponse,
+)
+from rest_framework import status
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from core_composer_app.components.job import api as job_api
+from core_composer_app.rest.job.serializers import JobSerializer
+from core_main_app.access_control.exceptions import AccessControlError
+from core_main_app.commons.exceptions import ApiError, DoesNotExist
+
+JOB_ID_PARAMETER = OpenApiParameter(
+    name="pk",
+    type=OpenApiTypes.STR,
+    location=OpenApiParameter.PATH,
+    description="Job ID",
+)
+
+
+@extend_schema(
+    tags=["Job"],
+    description="List the jobs of the user",
+)
+class JobList(APIView):
+    """List the jobs of the user"""
+
+    permission_classes = (IsAuthenticated,)
+
+    @extend_schema(
+        summary="Get the jobs of the user",
+        description="Get the jobs of the user, most recent first",
+        responses={
+            200: JobSerializer(many=True),
+            500: OpenApiResponse(description="Internal server error"),
+        },
+    )
+    def get(self, request):
+        """Get the jobs of the user
+
+        Args:
+            request: HTTP request
+
+        Returns:
+            - code: 200
+              content: List of jobs
+            - code: 500
+              content: Internal server error
+        """
+        try:
+            jobs = job_api.get_all_by_user(request=request)
+            serializer = JobSerializer(jobs, many=True)
+            return Response(serializer.data, status=status.HTTP_200_OK)
+        except Exception as api_exception:
+            content = {"message": str(api_exception)}
+            return Response(
+                content, status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+
+
+class AbstractJobView(APIView):
+    """Base view to act on a job"""
+
+    permission_classes = (IsAuthenticated,)
+
+    def handle_job(self, request, pk, job_action):
+        """Get a job and return the response of an action on it
+
+        Args:
+            request: HTTP request
+            pk: ObjectId
+            job_action: function returning the response for the job
+
+        Returns:
+
+        """
+        try:
+            job = job_api.get_by_id(pk, request=request)
+            return job_action(job)
+        except AccessControlError as access_error:
+            content = {"message": str(access_error)}
+            return Response(content, status=status.HTTP_403_FORBIDDEN)
+        except DoesNotExist:
+            content = {"message": "Job not found."}
+            return Response(content, status=status.HTTP_404_NOT_FOUND)
+        except ApiError as api_error:
+            content = {"message": str(api_error)}
+            return Response(content, status=status.HTTP_400_BAD_REQUEST)
+        except Exception as api_exception:
+            content = {"message": str(api_exception)}
+            return Response(
+                content, status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+
+
+@extend_schema(
+    tags=["Job"],
+    description="Retrieve the status of a job",
+)
+class JobDetail(AbstractJobView):
+    """Retrieve the status of a job"""
+
+    @extend_schema(
+        summary="Get the status of a job",
+        description="Get the status and progress of a job",
+        parameters=[JOB_ID_PARAMETER],
+        responses={
+            200: JobSerializer,
+            403: OpenApiResponse(description="Access Forbidden"),
+            404: OpenApiResponse(description="Object was not found"),
+            500: OpenApiResponse(description="Internal server error"),
+        },
+    )
+    def get(self, request, pk):
+        """Get the status of a job
+
+        Args:
+            request: HTTP request
+            pk: ObjectId
+
+        Returns:
+            - code: 200
+              content: Job
+            - code: 403
+              content: Access Forbidden
+            - code: 404
+              content: Object was not found
+            - code: 500
+              content: Internal server error
+        """
+        return self.handle_job(
+            request, pk, lambda job: Response(JobSerializer(job).data)
+        )
+
+
+@extend_schema(
+    tags=["Job"],
+    description="Cancel a job",
+)
+class JobCancel(AbstractJobView):
+    """Cancel a job"""
+
+    @extend_schema(
+        summary="Cancel a job",
+        description="Cancel a pending job, or stop a running job",
+        parameters=[JOB_ID_PARAMETER],
+        responses={
+            200: JobSerializer,
+            400: OpenApiResponse(description="Job already finished"),
+            403: OpenApiResponse(description="Access Forbidden"),
+            404: OpenApiResponse(description="Object was not found"),
+            500: OpenApiResponse(description="Internal server error"),
+        },
+    )
+    def post(self, request, pk):
+        """Cancel a job
+
+        Args:
+            request: HTTP request
+            pk: ObjectId
+
+        Returns:
+            - code: 200
+              content: Job
+            - code: 400
+              content: Job already finished
+            - code: 403
+              content: Access Forbidden
+            - code: 404
+              content: Object was not found
+            - code: 500
+              content: Internal server error
+        """
+        return self.handle_job(
+            request,
+            pk,
+            lambda job: Response(
+                JobSerializer(job_api.cancel(job, request=request)).data
+            ),
+        )
+
+
+@extend_schema(
+    tags=["Job"],
+    description="Retrieve the result of a job",
+)
+class JobResult(AbstractJobView):
+    """Retrieve the result of a job"""
+
+    @extend_schema(
+        summary="Get the result of a job",
+        description="Get the result of a successful job",
+        parameters=[JOB_ID_PARAMETER],
+        responses={
+            200: OpenApiTypes.OBJECT,
+            400: OpenApiResponse(description="Job has no result"),
+            403: OpenApiResponse(description="Access Forbidden"),
+            404: OpenApiResponse(description="Object was not found"),
+            500: OpenApiResponse(description="Internal server error"),
+        },
+    )
+    def get(self, request, pk):
+        """Get the result of a job
+
+        Args:
+            request: HTTP request
+            pk: ObjectId
+
+        Returns:
+            - code: 200
+              content: Result
+            - code: 400
+              content: Job has no result
+            - code: 403
+              content: Access Forbidden
+            - code: 404
+              content: Object was not found
+            - code: 500
+              content: Internal server error
+        """
+        return self.handle_job(
+            request,
+            pk,
+            lambda job: Response(job_api.get_result(job, request=request)),
+        )
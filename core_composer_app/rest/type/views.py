@@ -0,0 +1,175 @@
+"""Views for the Type REST API"""
+
+from django.http import Http404
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import (
+    extend_schema,
+    OpenApiParameter,
+    OpenApiResponse,
+)
+from rest_framework import status
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from core_composer_app.components.type import api as type_api
+from core_composer_app.utils.download import get_streaming_file_response
+from core_main_app.access_control.exceptions import AccessControlError
+from core_main_app.commons.exceptions import DoesNotExist
+from core_main_app.rest.template.views import TemplateDownload
+from core_main_app.utils.boolean import to_bool
+
+
+@extend_schema(
+    tags=["Type"],
+    description="Get the structural changes between two type versions",
+)
+class TypeVersionDiff(APIView):
+    """Get the structural changes between two type versions"""
+
+    @extend_schema(
+        summary="Get the changes between two type versions",
+        description="Get the elements and types added, removed or renamed, "
+        "and the occurrences and types changed, from a type version to another",
+        parameters=[
+            OpenApiParameter(
+                name="pk",
+                type=OpenApiTypes.STR,
+                location=OpenApiParameter.PATH,
+                description="Type ID (old version)",
+            ),
+            OpenApiParameter(
+                name="other_pk",
+                type=OpenApiTypes.STR,
+                location=OpenApiParameter.PATH,
+                description="Type ID (new version)",
+            ),
+        ],
+        responses={
+            200: OpenApiTypes.OBJECT,
+            403: OpenApiResponse(description="Access Forbidden"),
+            404: OpenApiResponse(description="Object was not found"),
+            500: OpenApiResponse(description="Internal server error"),
+        },
+    )
+    def get(self, request, pk, other_pk):
+        """Get the changes between two type versions
+
+        Args:
+            request: HTTP request
+            pk: ObjectId
+            other_pk: ObjectId
+
+        Returns:
+            - code: 200
+              content: Changes
+            - code: 403
+              content: Access Forbidden
+            - code: 404
+              content: Object was not found
+            - code: 500
+              content: Internal server error
+        """
+        try:
+            diff = type_api.get_versions_diff(
+                type_api.get(pk, request=request),
+                type_api.get(other_pk, request=request),
+            )
+            return Response(diff, status=status.HTTP_200_OK)
+        except AccessControlError as access_error:
+            content = {"message": str(access_error)}
+            return Response(content, status=status.HTTP_403_FORBIDDEN)
+        except DoesNotExist:
+            content = {"message": "Type not found."}
+            return Response(content, status=status.HTTP_404_NOT_FOUND)
+        except Exception as api_exception:
+            content = {"message": str(api_exception)}
+            return Response(
+                content, status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+
+
+@extend_schema(
+    tags=["Type"],
+    description="Download a type",
+)
+class TypeDownload(TemplateDownload):
+    """Download a type"""
+
+    @extend_schema(
+        summary="Download the XSD file from a Type",
+        description="Stream the XSD file from a Type. Single byte ranges and "
+        "conditional requests on the ETag of the content are supported.",
+        parameters=[
+            OpenApiParameter(
+                name="id",
+                type=OpenApiTypes.STR,
+                location=OpenApiParameter.PATH,
+                description="Type ID",
+            ),
+            OpenApiParameter(
+                name="pretty_print",
+                type=OpenApiTypes.BOOL,
+                location=OpenApiParameter.QUERY,
+                description="Pretty print the content (not streamed)",
+            ),
+        ],
+        responses={
+            200: OpenApiResponse(response={"application/xsd": {}}),
+            206: OpenApiResponse(description="Partial content"),
+            304: OpenApiResponse(description="Not modified"),
+            403: OpenApiResponse(description="Access Forbidden"),
+            404: OpenApiResponse(description="Object was not found"),
+            416: OpenApiResponse(description="Range not satisfiable"),
+            500: OpenApiResponse(description="Internal server error"),
+        },
+    )
+    def get(self, request, pk):
+        """Download the XSD file from a Type
+
+        Args:
+            request: HTTP request
+            pk: ObjectId
+
+        Examples:
+            ../type/[type_id]/download
+            ../type/[type_id]/download?pretty_print=true
+
+        Returns:
+            - code: 200
+              content: XSD file
+            - code: 206
+              content: Part of the XSD file
+            - code: 304
+              content: None
+            - code: 403
+              content: Access Forbidden
+            - code: 404
+              content: Object was not found
+            - code: 416
+              content: None
+            - code: 500
+              content: Internal server error
+        """
+        if to_bool(request.query_params.get("pretty_print", False)):
+            # formatting needs the whole content
+            return super().get(request, pk)
+        try:
+            type_object = self.get_object(pk, request=request)
+            return get_streaming_file_response(
+                request,
+                type_object.file.storage.open(type_object.file.name, "rb"),
+                type_object.filename,
+                content_type="application/xsd",
+                etag=type_object.checksum or type_object.hash,
+            )
+        except AccessControlError as access_error:
+            content = {"message": str(access_error)}
+            return Response(content, status=status.HTTP_403_FORBIDDEN)
+        except Http404:
+            content = {"message": "Type not found."}
+            return Response(content, status=status.HTTP_404_NOT_FOUND)
+        except Exception as api_exception:
+            content = {"message": str(api_exception)}
+            return Response(
+                content, status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
@@ -1,8 +1,12 @@
 """Serializers used throughout the Rest API"""
 
+from rest_framework.fields import CharField
+from rest_framework.serializers import ModelSerializer
+
 from core_main_app.components.template.api import (
     init_template_with_dependencies,
 )
+from core_main_app.components.template.models import Template
 from core_main_app.rest.template.serializers import TemplateSerializer
 from core_main_app.rest.template_version_manager.serializers import (
     TemplateVersionManagerSerializer,
@@ -87,3 +91,25 @@ class CreateTypeSerializer(TemplateSerializer):
         raise NotImplementedError(
             "Type Version Manager should only be updated using specialized APIs."
         )
+
+
+class DependentSerializer(ModelSerializer):
+    """
+    Template or type depending on a type serializer
+    """
+
+    class_name = CharField(source="_cls", read_only=True)
+
+    class Meta:
+        """Meta"""
+
+        model = Template
+        fields = [
+            "id",
+            "user",
+            "filename",
+            "display_name",
+            "version_manager",
+            "class_name",
+        ]
+        read_only_fields = fields
@@ -9,7 +9,10 @@ from drf_spectacular.utils import (
     OpenApiExample,
     OpenApiResponse,
 )
+from rest_framework import status
 from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.views import APIView
 
 from core_composer_app.components.type_version_manager import (
     api as type_version_manager_api,
@@ -20,7 +23,10 @@ from core_composer_app.rest.type_version_manager.abstract_views import (
 from core_composer_app.rest.type_version_manager.serializers import (
     TypeVersionManagerSerializer,
     CreateTypeSerializer,
+    DependentSerializer,
 )
+from core_main_app.access_control.exceptions import AccessControlError
+from core_main_app.commons.exceptions import DoesNotExist
 from core_main_app.rest.template_version_manager.views import (
     AbstractTemplateVersionManagerList,
 )
@@ -229,3 +235,136 @@ class GlobalTypeList(AbstractTypeList):
     def get_user(self):
         """None for global type"""
         return None
+
+
+@extend_schema(
+    tags=["Type Version Manager"],
+    description="List the templates and types depending on a type",
+)
+class TypeVersionManagerDependents(APIView):
+    """List the templates and types depending on a type"""
+
+    @extend_schema(
+        summary="Get the dependents of a type",
+        description="Retrieve the templates and types including any version "
+        "of a type",
+        parameters=[
+            OpenApiParameter(
+                name="pk",
+                type=OpenApiTypes.STR,
+                location=OpenApiParameter.PATH,
+                description="Type Version Manager ID",
+            ),
+        ],
+        responses={
+            200: DependentSerializer(many=True),
+            403: OpenApiResponse(description="Access Forbidden"),
+            404: OpenApiResponse(description="Object was not found"),
+            500: OpenApiResponse(description="Internal server error"),
+        },
+    )
+    def get(self, request, pk):
+        """Get the templates and types depending on a type
+
+        Args:
+            request: HTTP request
+            pk: ObjectId
+
+        Returns:
+            - code: 200
+              content: List of templates and types
+            - code: 403
+              content: Access Forbidden
+            - code: 404
+              content: Object was not found
+            - code: 500
+              content: Internal server error
+        """
+        try:
+            version_manager = type_version_manager_api.get_by_id(
+                pk, request=request
+            )
+            dependents = type_version_manager_api.get_dependents(
+                version_manager, request=request
+            )
+            serializer = DependentSerializer(dependents, many=True)
+            return Response(serializer.data, status=status.HTTP_200_OK)
+        except AccessControlError as access_error:
+            content = {"message": str(access_error)}
+            return Response(content, status=status.HTTP_403_FORBIDDEN)
+        except DoesNotExist:
+            content = {"message": "Type Version Manager not found."}
+            return Response(content, status=status.HTTP_404_NOT_FOUND)
+        except Exception as api_exception:
+            content = {"message": str(api_exception)}
+            return Response(
+                content, status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+
+
+@extend_schema(
+    tags=["Type Version Manager"],
+    description="Revalidate the templates and types depending on a type",
+)
+class RevalidateTypeDependents(APIView):
+    """Revalidate the templates and types depending on a type"""
+
+    permission_classes = (IsAuthenticated,)
+
+    @extend_schema(
+        summary="Revalidate the dependents of a type",
+        description="Start a job revalidating the templates and types "
+        "including any version of a type",
+        parameters=[
+            OpenApiParameter(
+                name="pk",
+                type=OpenApiTypes.STR,
+                location=OpenApiParameter.PATH,
+                description="Type Version Manager ID",
+            ),
+        ],
+        responses={
+            202: OpenApiResponse(description="Job id"),
+            403: OpenApiResponse(description="Access Forbidden"),
+            404: OpenApiResponse(description="Object was not found"),
+            500: OpenApiResponse(description="Internal server error"),
+        },
+    )
+    def post(self, request, pk):
+        """Start the revalidation of the dependents of a type
+
+        Args:
+            request: HTTP request
+            pk: ObjectId
+
+        Returns:
+            - code: 202
+              content: Job id
+            - code: 403
+              content: Access Forbidden
+            - code: 404
+              content: Object was not found
+            - code: 500
+              content: Internal server error
+        """
+        try:
+            version_manager = type_version_manager_api.get_by_id(
+                pk, request=request
+            )
+            job = type_version_manager_api.revalidate_dependents(
+                version_manager, request=request
+            )
+            return Response(
+                {"job_id": job.id}, status=status.HTTP_202_ACCEPTED
+            )
+        except AccessControlError as access_error:
+            content = {"message": str(access_error)}
+            return Response(content, status=status.HTTP_403_FORBIDDEN)
+        except DoesNotExist:
+            content = {"message": "Type Version Manager not found."}
+            return Response(content, status=status.HTTP_404_NOT_FOUND)
+        except Exception as api_exception:
+            content = {"message": str(api_exception)}
+            return Response(
+                content, status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
@@ -7,6 +7,9 @@ from core_main_app.rest.template_version_manager import (
     views as template_version_manager_views,
 )
 from core_composer_app.rest.bucket import views as bucket_views
+from core_composer_app.rest.composition import views as composition_views
+from core_composer_app.rest.job import views as job_views
+from core_composer_app.rest.type import views as type_views
 from core_composer_app.rest.type_version_manager import (
     views as type_version_manager_views,
 )
@@ -27,6 +30,16 @@ urlpatterns = [
         template_version_manager_views.TemplateVersionManagerDetail.as_view(),
         name="core_composer_app_rest_type_version_manager_detail",
     ),
+    re_path(
+        r"^type-version-manager/(?P<pk>\w+)/dependents/$",
+        type_version_manager_views.TypeVersionManagerDependents.as_view(),
+        name="core_composer_app_rest_type_version_manager_dependents",
+    ),
+    re_path(
+        r"^type-version-manager/(?P<pk>\w+)/revalidate-dependents/$",
+        type_version_manager_views.RevalidateTypeDependents.as_view(),
+        name="core_composer_app_rest_type_version_manager_revalidate_dependents",
+    ),
     re_path(
         r"^type-version-manager/(?P<pk>\w+)/disable/$",
         template_version_manager_views.DisableTemplateVersionManager.as_view(),
@@ -47,6 +60,11 @@ urlpatterns = [
         template_version_manager_views.DisableTemplateVersion.as_view(),
         name="core_composer_app_rest_type_version_disable",
     ),
+    re_path(
+        r"^type/version/(?P<pk>\w+)/diff/(?P<other_pk>\w+)/$",
+        type_views.TypeVersionDiff.as_view(),
+        name="core_composer_app_rest_type_version_diff",
+    ),
     re_path(
         r"^type/global/$",
         type_version_manager_views.GlobalTypeList.as_view(),
@@ -64,7 +82,7 @@ urlpatterns = [
     ),
     re_path(
         r"^type/(?P<pk>\w+)/download/$",
-        template_views.TemplateDownload.as_view(),
+        type_views.TypeDownload.as_view(),
         name="core_composer_app_rest_type_download",
     ),
     re_path(
@@ -87,4 +105,29 @@ urlpatterns = [
         bucket_views.TypeVersionManagerBuckets.as_view(),
         name="core_composer_app_rest_type_version_manger_buckets",
     ),
+    re_path(
+        r"^job/$",
+        job_views.JobList.as_view(),
+        name="core_composer_app_rest_job_list",
+    ),
+    re_path(
+        r"^job/(?P<pk>\w+)/$",
+        job_views.JobDetail.as_view(),
+        name="core_composer_app_rest_job_detail",
+    ),
+    re_path(
+        r"^job/(?P<pk>\w+)/cancel/$",
+        job_views.JobCancel.as_view(),
+        name="core_composer_app_rest_job_cancel",
+    ),
+    re_path(
+        r"^job/(?P<pk>\w+)/result/$",
+        job_views.JobResult.as_view(),
+        name="core_composer_app_rest_job_result",
+    ),
+    re_path(
+        r"^compose/$",
+        composition_views.Compose.as_view(),
+        name="core_composer_app_rest_compose",
+    ),
 ]
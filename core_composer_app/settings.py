@@ -1,6 +1,140 @@
-"""Core Composer App Settings"""
+"""Core Composer App Settings
+
+Settings with the following syntax can be overwritten at the project level:
+SETTING_NAME = getattr(settings, "SETTING_NAME", "Default Value")
+"""
 
 from django.conf import settings
 
 if not settings.configured:
     settings.configure()
+
+COMPOSER_TYPE_DEDUPLICATION = getattr(
+    settings, "COMPOSER_TYPE_DEDUPLICATION", False
+)
+""" :py:class:`bool`: Save a type whose canonical content (without blank text and comments) matches a validated type of the same owner in the file of that type, reusing its validation and dependencies instead of validating and writing the content again.
+"""
+
+COMPOSER_TYPE_DIFF_CACHE_TIMEOUT = getattr(
+    settings, "COMPOSER_TYPE_DIFF_CACHE_TIMEOUT", None
+)
+""" :py:class:`int`: Number of seconds diffs between type versions are cached (None: never expire, type versions being immutable).
+"""
+
+COMPOSER_REVALIDATE_DEPENDENTS_ON_SET_CURRENT = getattr(
+    settings, "COMPOSER_REVALIDATE_DEPENDENTS_ON_SET_CURRENT", False
+)
+""" :py:class:`bool`: Revalidate the templates and types including a type in a background task when a new current version of the type is set.
+"""
+
+COMPOSER_REVALIDATION_MAX_WORKERS = getattr(
+    settings, "COMPOSER_REVALIDATION_MAX_WORKERS", 4
+)
+""" :py:class:`int`: Maximum number of schemas validated concurrently when revalidating dependents.
+"""
+
+COMPOSER_VALIDATION_CACHE_TIMEOUT = getattr(
+    settings, "COMPOSER_VALIDATION_CACHE_TIMEOUT", None
+)
+""" :py:class:`int`: Number of seconds validation results are cached, keyed by the hashes of a schema and of its dependencies (None: never expire).
+"""
+
+COMPOSER_JOB_MAX_WORKERS = getattr(settings, "COMPOSER_JOB_MAX_WORKERS", 2)
+""" :py:class:`int`: Maximum number of jobs run concurrently by each server process.
+"""
+
+COMPOSER_JOB_INTERRUPTED_TIMEOUT = getattr(
+    settings, "COMPOSER_JOB_INTERRUPTED_TIMEOUT", 3600
+)
+""" :py:class:`int`: Number of seconds without heartbeat after which the worker of a running job is considered gone (e.g. server restart) and the job marked as failed by the recovery.
+"""
+
+COMPOSER_JOB_HEARTBEAT_INTERVAL = getattr(
+    settings, "COMPOSER_JOB_HEARTBEAT_INTERVAL", 60
+)
+""" :py:class:`int`: Number of seconds between two heartbeats of the running jobs of a server process. Should be lower than COMPOSER_JOB_INTERRUPTED_TIMEOUT.
+"""
+
+COMPOSER_FLATTENED_XSD_CACHE_TIMEOUT = getattr(
+    settings, "COMPOSER_FLATTENED_XSD_CACHE_TIMEOUT", None
+)
+""" :py:class:`int`: Number of seconds flattened schemas are cached, keyed by the hash of the root schema (None: never expire).
+"""
+
+COMPOSER_DOWNLOAD_CHUNK_SIZE = getattr(
+    settings, "COMPOSER_DOWNLOAD_CHUNK_SIZE", 64 * 1024
+)
+""" :py:class:`int`: Number of bytes read at a time when streaming a type download.
+"""
+
+COMPOSER_CACHE_GENERATION_CHECK_INTERVAL = getattr(
+    settings, "COMPOSER_CACHE_GENERATION_CHECK_INTERVAL", 2
+)
+""" :py:class:`int`: Number of seconds a process reuses the cache generations read from the database, bounding how long its caches can miss changes made by other processes (0: check on every read).
+"""
+
+COMPOSER_ADMIN_RESULTS_PER_PAGE = getattr(
+    settings, "COMPOSER_ADMIN_RESULTS_PER_PAGE", 20
+)
+""" :py:class:`int`: Number of types and buckets per page in the admin lists.
+"""
+
+COMPOSER_STATE_WAIT_TIMEOUT = getattr(
+    settings, "COMPOSER_STATE_WAIT_TIMEOUT", 5
+)
+""" :py:class:`int`: Number of seconds an edit of the composer waits for the edit of the same session in progress, and for the edits sent before it by the page, before being rejected.
+"""
+
+COMPOSER_ASYNC_VIEWS = getattr(settings, "COMPOSER_ASYNC_VIEWS", False)
+""" :py:class:`bool`: Serve the composer edit views with async views, for deployments running under ASGI.
+"""
+
+COMPOSER_XML_MAX_WORKERS = getattr(settings, "COMPOSER_XML_MAX_WORKERS", 4)
+""" :py:class:`int`: Number of threads of each process running the XML processing of the async composer views.
+"""
+
+COMPOSER_VALIDATION_PROCESSES = getattr(
+    settings, "COMPOSER_VALIDATION_PROCESSES", 2
+)
+""" :py:class:`int`: Number of worker processes of each process validating schemas (0: validate in the calling thread, without time and memory budget).
+"""
+
+COMPOSER_VALIDATION_TIMEOUT = getattr(
+    settings, "COMPOSER_VALIDATION_TIMEOUT", 30
+)
+""" :py:class:`int`: Number of seconds after which the validation of a schema is stopped and reported as timed out (0: no timeout).
+"""
+
+COMPOSER_VALIDATION_MEMORY_LIMIT = getattr(
+    settings, "COMPOSER_VALIDATION_MEMORY_LIMIT", 1024
+)
+""" :py:class:`int`: Memory, in MiB, of each worker process validating schemas (0: not limited).
+"""
+
+COMPOSER_DEFERRED_VALIDATION = getattr(
+    settings, "COMPOSER_DEFERRED_VALIDATION", False
+)
+""" :py:class:`bool`: Only run local checks of the edited element on each edit of the composer, and validate the whole schema on save, download, or when requested.
+"""
+
+COMPOSER_STATELESS = getattr(settings, "COMPOSER_STATELESS", False)
+""" :py:class:`bool`: Have the client carry the composer state in a signed token sent with each request, instead of storing it in the session. States whose token exceeds COMPOSER_STATE_TOKEN_MAX_SIZE, and the states of anonymous users, are stored in the session.
+"""
+
+COMPOSER_STATE_TOKEN_MAX_SIZE = getattr(
+    settings, "COMPOSER_STATE_TOKEN_MAX_SIZE", 256 * 1024
+)
+""" :py:class:`int`: Maximum size, in characters, of a composer state token.
+"""
+
+COMPOSER_STATE_TOKEN_MAX_AGE = getattr(
+    settings, "COMPOSER_STATE_TOKEN_MAX_AGE", 24 * 60 * 60
+)
+""" :py:class:`int`: Number of seconds a composer state token is accepted after it was issued.
+"""
+
+COMPOSER_STATE_TOKEN_ENCRYPTION = getattr(
+    settings, "COMPOSER_STATE_TOKEN_ENCRYPTION", False
+)
+""" :py:class:`bool`: Encrypt the composer state tokens, so clients can not read the schema from them (requires the cryptography package).
+"""
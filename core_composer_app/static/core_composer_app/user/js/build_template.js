@@ -7,8 +7,197 @@ $(document).ready(function() {
 	if ($templateID.html() == "new"){
         displayNewTemplateDialog();
     }
+	composerRevision = parseInt($("#composerRevision").html());
+	composerNextRevision = composerRevision;
+	composerStateless = $("#composerStateToken").length > 0;
+	composerStateToken = $("#composerStateToken").text() || null;
 });
 
+/**
+ * Last revision of the composer state returned by an edit
+ */
+var composerRevision = null;
+
+/**
+ * Revision the next edit applies to: edits are numbered when sent, each one
+ * creates the next revision
+ */
+var composerNextRevision = null;
+
+/**
+ * True if the state is carried by the page: each edit needs the token
+ * returned by the previous one
+ */
+var composerStateless = false;
+
+/**
+ * Token carrying the state of the composer, null if the state is stored in
+ * the session
+ */
+var composerStateToken = null;
+
+/**
+ * Completes once the requests sent so far have completed
+ */
+var composerQueue = $.Deferred().resolve().promise();
+
+/**
+ * Returns true if the url edits the composer state
+ * @param url
+ */
+var isComposerEditUrl = function(url){
+    return [
+        insertElementSequenceUrl,
+        changeXsdTypeUrl,
+        renameElementUrl,
+        deleteElementUrl,
+        setElementOccurrencesUrl,
+        changeRootTypeNameUrl
+    ].indexOf(url) >= 0;
+};
+
+/**
+ * AJAX call reading or editing the composer state.
+ *
+ * Edits of a state stored in the session are sent right away, numbered with
+ * the revision they apply to: the server applies them in the order they
+ * were sent. Their changes of the tree that the xpaths of the next edits
+ * depend on are made when they are sent (beforeSend). The other requests
+ * (reads, edits of a state carried by the page) are sent once the previous
+ * requests have completed. The data can be a function, called when the
+ * request is sent.
+ * @param settings settings of the request, as for $.ajax
+ * @returns promise of the request
+ */
+var composerAjax = function(settings){
+    var isEdit = isComposerEditUrl(settings.url);
+    var send = function(){
+        var data = $.extend(
+            {},
+            typeof settings.data === "function" ? settings.data() : settings.data
+        );
+        if (isEdit && composerStateless){
+            data.revision = composerRevision;
+        }else if (isEdit){
+            data.revision = composerNextRevision;
+            composerNextRevision += 1;
+        }
+        if (composerStateToken !== null){
+            data.composerState = composerStateToken;
+        }
+        return $.ajax($.extend({}, settings, {
+            data: data,
+            success: function(data){
+                updateComposerState(settings.url, data);
+                if (settings.success){
+                    settings.success.apply(this, arguments);
+                }
+            },
+            error: function(xhr){
+                if (isEdit && xhr.status == 409){
+                    showComposerConflict(xhr);
+                }else if (settings.error){
+                    settings.error.apply(this, arguments);
+                }
+            }
+        }));
+    };
+    var request = isEdit && !composerStateless ? send() : composerQueue.then(send);
+    // the next requests wait for this one, whether it fails or not
+    composerQueue = $.when(composerQueue, request.then(null, function(){
+        return $.Deferred().resolve();
+    }));
+    return request;
+};
+
+/**
+ * Keep the revision returned by an edit, and the state token returned by a
+ * request
+ * @param url
+ * @param data
+ */
+var updateComposerState = function(url, data){
+    if (data && data.state !== undefined){
+        composerStateToken = data.state;
+    }
+    if (isComposerEditUrl(url) && data && data.revision !== undefined){
+        // the responses of pipelined edits can arrive in any order
+        composerRevision = Math.max(composerRevision, data.revision);
+        // edits only run local checks when the validation is deferred
+        setValidated(false);
+    }
+};
+
+/**
+ * Edit rejected: the template was modified from another page
+ * @param xhr
+ */
+var showComposerConflict = function(xhr){
+    var message = xhr.responseJSON && xhr.responseJSON.message
+        ? xhr.responseJSON.message
+        : "The template was modified from another page.";
+    $( "#validate-error" ).text(message + " Reload the page to continue editing.");
+    $( "#error-modal" ).modal("show");
+};
+
+/**
+ * Edit failed after the tree was changed for it
+ * @param xhr
+ */
+var showComposerEditError = function(xhr){
+    $( "#validate-error" ).html(xhr.responseText + " Reload the page to continue editing.");
+    $( "#error-modal" ).modal("show");
+};
+
+/**
+ * Download the composed template, posting the state token if the state is
+ * carried by the page
+ * @param event
+ */
+var downloadTemplate = function(event){
+    if (composerStateToken === null){
+        return;
+    }
+    event.preventDefault();
+    var url = $(this).attr("href");
+    // download the state once the pending edits are done
+    composerQueue.then(function(){
+        var $composerDownloadForm = $("#composerDownloadForm");
+        $composerDownloadForm.attr("action", url);
+        $composerDownloadForm.find("input[name=composerState]").val(composerStateToken);
+        $composerDownloadForm.submit();
+    });
+};
+
+/**
+ * Show whether the template was validated since the last change
+ * @param isValidated
+ */
+var setValidated = function(isValidated){
+    var $composerValidation = $("#composerValidation");
+    $composerValidation.find(".validated").toggle(isValidated);
+    $composerValidation.find(".not-validated").toggle(!isValidated);
+};
+
+/**
+ * AJAX call, validates the composed template
+ */
+var validateTemplate = function(){
+    composerAjax({
+        url : validateTemplateUrl,
+        type : "POST",
+        dataType: "json",
+        success: function(data){
+            // not validated if the template was changed in the meantime
+            setValidated(data.validated && data.revision == composerRevision);
+        },
+        error: function(data){
+            $( "#validate-error" ).html(data.responseText);
+            $( "#error-modal" ).modal("show");
+        }
+    });
+};
+
 /**
  * Save a composed template
  */
@@ -24,7 +213,7 @@ var save_template = function(){
     var templateName = $("#newTemplateName").val();
 
     if (templateName.length > 0){
-        $.ajax({
+        composerAjax({
             url : saveTemplateUrl,
             type : "POST",
             dataType: "json",
@@ -60,7 +249,7 @@ var save_type = function(){
     var typeName = $("#newTypeName").val();
     var templateID = $("#templateID").html();
     if (typeName.length > 0){
-        $.ajax({
+        composerAjax({
             url : saveTypeUrl,
             type : "POST",
             dataType: "json",
@@ -116,7 +305,7 @@ var changeRootTypeName = function(){
  * @param typeName name of the root type
  */
 var change_root_type_name = function(typeName){
-    $.ajax({
+    composerAjax({
         url : changeRootTypeNameUrl,
         type : "POST",
         dataType: "json",
@@ -131,6 +320,8 @@ var change_root_type_name = function(typeName){
 };
 
 
+$(document).on('click', '.btn.download-template', downloadTemplate);
+$(document).on('click', '.btn.validate-template', validateTemplate);
 $(document).on('click', '.btn.save-template', saveTemplate);
 $(document).on('click', '.btn.save-type', saveType);
 
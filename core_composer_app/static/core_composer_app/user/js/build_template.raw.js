@@ -4,6 +4,7 @@ var renameElementUrl = "{% url 'core_composer_rename_element' %}";
 var deleteElementUrl = "{% url 'core_composer_delete_element' %}";
 var getElementOccurrencesUrl = "{% url 'core_composer_get_element_occurrences' %}";
 var setElementOccurrencesUrl = "{% url 'core_composer_set_element_occurrences' %}";
+var validateTemplateUrl = "{% url 'core_composer_validate_template' %}";
 var saveTemplateUrl = "{% url 'core_composer_save_template' %}";
 var saveTypeUrl = "{% url 'core_composer_save_type' %}";
 var changeRootTypeNameUrl = "{% url 'core_composer_change_root_type_name' %}";
@@ -92,8 +92,10 @@ var displayInsertElementSequenceDialog = function()
  * @param event
  */
 var insertElementSequence = function(event){
+    // the selected element can change before the edit is sent
+    var element = target;
     // change the sequence style
-    var parent = $(target).parent();
+    var parent = $(element).parent();
     if ($(parent).attr('class') == "element"){
         $(parent).before("<span class='collapse'/>");
         $(parent).after("<ul></ul>");
@@ -103,35 +105,50 @@ var insertElementSequence = function(event){
     var insertButton = event.target;
     var typeName = $(insertButton).parent().siblings(':first').text();
     var typeID = $(insertButton).parent().siblings(':first').attr('templateid');
-    var namespace = $(target).text().split(":")[0];
-
-    // get element's value xpath
-    var path = namespace + ":element";
-    var nbElement = $(parent).parent().children("ul").children().length;
-    if (nbElement > 0){
-        path = namespace + ":element[" + String(nbElement + 1) + "]";
-    }
-
-    // get xpath to element
-    var xpath = getXPath(target);
+    var namespace = $(element).text().split(":")[0];
     $("#insert-element-modal").modal("hide");
 
-	$.ajax({
+    // element shown until the response of the server
+    var $pendingElement = $("<li class='pending-element'>" +
+        "<div class='element-wrapper'><span class='path'></span>" +
+        "<i class='fas fa-spinner fa-spin'></i></div></li>");
+
+	composerAjax({
         url : insertElementSequenceUrl,
         type : "POST",
         dataType: "json",
-        data:{
-        	typeID: typeID,
-        	xpath: xpath,
-        	typeName: typeName,
-            namespace: namespace,
-            path: path
+        // computed once the previous edits updated the tree
+        data: function(){
+            // get element's value xpath
+            var path = namespace + ":element";
+            var nbElement = $(parent).parent().children("ul").children().length;
+            if (nbElement > 0){
+                path = namespace + ":element[" + String(nbElement + 1) + "]";
+            }
+            $pendingElement.find(".path").text(path);
+            return {
+                typeID: typeID,
+                xpath: getXPath(element),
+                typeName: typeName,
+                namespace: namespace,
+                path: path
+            };
+        },
+        beforeSend: function(){
+            // the next insertions are numbered after this element
+            $(parent).parent().children("ul").append($pendingElement);
         },
         success: function(data){
-            // add the new element to the html tree
-            $(parent).parent().children("ul").append(data.new_element);
+            // add the new element to the html tree, at the position of the
+            // pending element, updated by the deletions sent since
+            var $newElement = $(data.new_element);
+            $newElement.find(".path").first().text($pendingElement.find(".path").text());
+            $pendingElement.replaceWith($newElement);
         },
         error: function(data){
+            var $list = $pendingElement.parent();
+            $pendingElement.remove();
+            renumberXPaths($list, namespace);
             $( "#validate-error" ).html(data.responseText);
             $( "#error-modal" ).modal("show");
         }
@@ -152,19 +169,21 @@ var displayDeleteElementDialog = function()
  * AJAX call, deletes an element
  */
 var delete_element = function(){
-    var xpath = getXPath(target);
-    $.ajax({
+    var element = target;
+    $("#delete-element-modal").modal("hide");
+    composerAjax({
         url : deleteElementUrl,
         type : "POST",
         dataType: "json",
-        data:{
-        	xpath: xpath
+        data: function(){
+            return {xpath: getXPath(element)};
         },
-        success: function(data){
-            manageXPath(target);
-            $(target).parent().parent().parent().remove();
-            $("#delete-element-modal").modal("hide");
-        }
+        beforeSend: function(){
+            // the xpaths of the next edits are computed without the element
+            manageXPath(element);
+            $(element).parent().parent().parent().remove();
+        },
+        error: showComposerEditError
     });
 };
 
@@ -184,26 +203,30 @@ var displayChangeTypeDialog = function()
  */
 var change_xsd_type = function(){
     var newType = $("#newXSDtype").val();
-    var xpath = getXPath(target);
+    var element = target;
+    $("#change-element-type-modal").modal("hide");
 
-    $.ajax({
+    composerAjax({
         url : changeXsdTypeUrl,
         type : "POST",
         dataType: "json",
-        data:{
-        	xpath: xpath,
-        	newType: newType
+        data: function(){
+            return {
+                xpath: getXPath(element),
+                newType: newType
+            };
         },
-        success: function(data){
+        beforeSend: function(){
+            // the xpaths of the next edits are computed with the new type
             // get value of type to change
-            var oldType = $(target).text().split(":")[1];
+            var oldType = $(element).text().split(":")[1];
             // update html text
-            $(target).html($(target).html().replace(oldType, newType));
+            $(element).html($(element).html().replace(oldType, newType));
             // update xpath value
-            var path = $(target).parent().siblings(".path");
+            var path = $(element).parent().siblings(".path");
             path.html(path.html().replace(oldType, newType));
-            $("#change-element-type-modal").modal("hide");
-        }
+        },
+        error: showComposerEditError
     });
 };
 
@@ -227,18 +250,20 @@ var displayRenameElementDialog = function()
 var rename_element = function(){
     var newName = $("#newElementName").val();
     if (newName.length > 0){
-        var xpath = getXPath(target);
-        $.ajax({
+        var element = target;
+        composerAjax({
             url : renameElementUrl,
             type : "POST",
             dataType: "json",
-            data:{
-                xpath: xpath,
-                newName: newName
+            data: function(){
+                return {
+                    xpath: getXPath(element),
+                    newName: newName
+                };
             },
             success: function(data){
                 // set new name in html tree
-                $(target).parent().siblings('.name').html(newName);
+                $(element).parent().siblings('.name').html(newName);
                 $("#element-name-modal").modal("hide");
             },
             error: function(data){
@@ -281,8 +306,7 @@ var displayOccurrencesElementDialog = function()
     // reset errors
     $( "#manage-occurrences-error" ).html("");
     // set occurrences
-    var xpath = getXPath(target);
-    get_occurrences(xpath);
+    get_occurrences(target);
     // show modal
     $( "#occurrences-modal" ).modal("show");
 };
@@ -290,15 +314,15 @@ var displayOccurrencesElementDialog = function()
 
 /**
  * AJAX call, gets element occurrences from the server
- * @param xpath
+ * @param element element of the tree
  */
-var get_occurrences = function(xpath){
-    $.ajax({
+var get_occurrences = function(element){
+    composerAjax({
         url : getElementOccurrencesUrl,
         type : "POST",
         dataType: "json",
-        data:{
-        	xpath: xpath
+        data: function(){
+            return {xpath: getXPath(element)};
         },
         success: function(data){
             var $minOccurrences = $("#minOccurrences");
@@ -325,7 +349,7 @@ var get_occurrences = function(xpath){
  * Set element occurrences
  */
 var setOccurrences = function () {
-    var xpath = getXPath(target);
+    var element = target;
     var minOccurs = $("#minOccurrences").val();
     var maxOccurs = $("#maxOccurrences").val();
 
@@ -353,7 +377,7 @@ var setOccurrences = function () {
     }
 
     if (errors == ""){
-        set_occurrences(xpath, minOccurs, maxOccurs);
+        set_occurrences(element, minOccurs, maxOccurs);
         $("#occurrences-modal").modal("hide");
     }else{
         $( "#manage-occurrences-error" ).html(errors);
@@ -363,19 +387,21 @@ var setOccurrences = function () {
 
 /**
  * AJAX call, sets the occurrences of an element
- * @param xpath xpath of the element
+ * @param element element of the tree
  * @param minOccurs minimum occurrences
  * @param maxOccurs maximum occurrences
  */
-var set_occurrences = function(xpath, minOccurs, maxOccurs){
-    $.ajax({
+var set_occurrences = function(element, minOccurs, maxOccurs){
+    composerAjax({
         url : setElementOccurrencesUrl,
         type : "POST",
         dataType: "json",
-        data:{
-        	xpath: xpath,
-        	minOccurs: minOccurs,
-        	maxOccurs: maxOccurs
+        data: function(){
+            return {
+                xpath: getXPath(element),
+                minOccurs: minOccurs,
+                maxOccurs: maxOccurs
+            };
         },
         success: function(data){
             var occursStr = "( " + minOccurs + " , ";
@@ -385,7 +411,7 @@ var set_occurrences = function(xpath, minOccurs, maxOccurs){
                 occursStr += maxOccurs;
             }
             occursStr += " )";
-            $(target).parent().siblings(".occurs").html(occursStr);
+            $(element).parent().siblings(".occurs").html(occursStr);
         }
     });
 };
@@ -34,4 +34,14 @@ var manageXPath = function(target){
             i += 1;
         }
 	})
-};
\ No newline at end of file
+};
+/**
+ * Numbers the xpaths of the elements of a list after a change
+ * @param $list list of elements
+ * @param namespace
+ */
+var renumberXPaths = function($list, namespace){
+    $list.children().each(function(index){
+        $(this).find(".path").first().html(namespace + ":element[" + (index + 1) + "]");
+    });
+};
@@ -4,8 +4,14 @@ from django.conf import settings
 from django.conf.urls import include
 from django.urls import re_path
 
+from core_composer_app.settings import COMPOSER_ASYNC_VIEWS
 from core_composer_app.views.user import views as user_views, ajax as user_ajax
 
+if COMPOSER_ASYNC_VIEWS:
+    from core_composer_app.views.user import async_ajax as user_edit_ajax
+else:
+    user_edit_ajax = user_ajax
+
 parser_url = []
 if "core_parser_app" in settings.INSTALLED_APPS:
     from core_parser_app.views.common import views as common_parser_views
@@ -32,46 +38,66 @@ urlpatterns = [
         user_views.download_xsd,
         name="core_composer_download_xsd",
     ),
+    re_path(
+        r"^download-xsd-bundle$",
+        user_views.download_xsd_bundle,
+        name="core_composer_download_xsd_bundle",
+    ),
+    re_path(
+        r"^download-xsd-flattened$",
+        user_views.download_xsd_flattened,
+        name="core_composer_download_xsd_flattened",
+    ),
     re_path(
         r"^type/versions/(?P<version_manager_id>\w+)",
         user_views.manage_type_versions,
         name="core_composer_app_manage_type_versions",
     ),
+    re_path(
+        r"^type/version/(?P<version_id>\w+)/diff/(?P<other_version_id>\w+)$",
+        user_views.type_version_diff,
+        name="core_composer_app_type_version_diff",
+    ),
     re_path(
         r"^change-xsd-type$",
-        user_ajax.change_xsd_type,
+        user_edit_ajax.change_xsd_type,
         name="core_composer_change_xsd_type",
     ),
     re_path(
         r"^change-root-type-name$",
-        user_ajax.change_root_type_name,
+        user_edit_ajax.change_root_type_name,
         name="core_composer_change_root_type_name",
     ),
     re_path(
         r"^insert-element-sequence$",
-        user_ajax.insert_element_sequence,
+        user_edit_ajax.insert_element_sequence,
         name="core_composer_insert_element_sequence",
     ),
     re_path(
         r"^rename-element$",
-        user_ajax.rename_element,
+        user_edit_ajax.rename_element,
         name="core_composer_rename_element",
     ),
     re_path(
         r"^delete-element$",
-        user_ajax.delete_element,
+        user_edit_ajax.delete_element,
         name="core_composer_delete_element",
     ),
     re_path(
         r"^get-element-occurrences$",
-        user_ajax.get_element_occurrences,
+        user_edit_ajax.get_element_occurrences,
         name="core_composer_get_element_occurrences",
     ),
     re_path(
         r"^set-element-occurrences$",
-        user_ajax.set_element_occurrences,
+        user_edit_ajax.set_element_occurrences,
         name="core_composer_set_element_occurrences",
     ),
+    re_path(
+        r"^validate-template$",
+        user_ajax.validate_template,
+        name="core_composer_validate_template",
+    ),
     re_path(
         r"^save-template$",
         user_ajax.save_template,
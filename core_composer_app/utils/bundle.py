@@ -0,0 +1,186 @@
+"""Bundle utils for Composer app
+
+A bundle is a zip archive containing a schema and all the local schemas it
+includes or imports, directly or not, with schema locations rewritten to
+relative paths so the archive can be used offline. The schemas are read
+before the archive is built, and the archive is compressed as it is sent.
+"""
+
+import os
+import re
+import zipfile
+from collections import deque
+from urllib.parse import urlparse
+
+from core_main_app.utils.urls import get_template_download_pattern
+from xml_utils.commons.constants import LXML_SCHEMA_NAMESPACE
+from xml_utils.xsd_tree.xsd_tree import XSDTree
+
+DEPENDENCY_TAGS = ["include", "import"]
+
+
+def get_bundle_files(xsd_string, get_template, root_filename="schema.xsd"):
+    """Return the files of the bundle of a schema.
+
+    All the dependencies are read, and their access checked, when the
+    files are returned: a dependency that can not be read raises an error
+    before the archive is sent.
+
+    Args:
+        xsd_string: root schema
+        get_template: function returning a template given its id, raising
+            an error if the template can not be read
+        root_filename: name of the root schema in the bundle
+
+    Returns:
+        list of (filename, content as bytes)
+
+    """
+    pattern = get_template_download_pattern()
+    # template id -> filename in the bundle
+    filenames = {}
+    used_filenames = {root_filename}
+    pending = deque([(root_filename, xsd_string)])
+    files = []
+    while pending:
+        filename, content = pending.popleft()
+        xsd_tree = XSDTree.build_tree(content)
+        for element in _get_dependency_elements(xsd_tree):
+            template_id = _get_local_template_id(
+                element.attrib["schemaLocation"], pattern
+            )
+            if template_id is None:
+                # external schema, keep its location
+                continue
+            if template_id not in filenames:
+                template = get_template(template_id)
+                filenames[template_id] = _get_unique_filename(
+                    template.filename, template_id, used_filenames
+                )
+                pending.append((filenames[template_id], template.content))
+            element.attrib["schemaLocation"] = filenames[template_id]
+        files.append((filename, XSDTree.tostring(xsd_tree).encode("utf-8")))
+    return files
+
+
+def stream_zip(files):
+    """Stream a zip archive of files.
+
+    Each file is compressed and sent before the next one is read.
+
+    Args:
+        files: iterable of (filename, content as bytes)
+
+    Returns:
+        generator of bytes
+
+    """
+    stream = _ZipStream()
+    with zipfile.ZipFile(
+        stream, mode="w", compression=zipfile.ZIP_DEFLATED
+    ) as zip_file:
+        for filename, content in files:
+            with zip_file.open(filename, mode="w") as zip_entry:
+                zip_entry.write(content)
+            yield stream.pop()
+    # central directory
+    yield stream.pop()
+
+
+class _ZipStream:
+    """Write-only, non-seekable file buffering the zip archive output"""
+
+    def __init__(self):
+        """Initialize the stream"""
+        self._buffer = bytearray()
+        self._position = 0
+
+    def write(self, data):
+        """Write data to the buffer.
+
+        Args:
+            data:
+
+        Returns:
+
+        """
+        self._buffer.extend(data)
+        self._position += len(data)
+        return len(data)
+
+    def tell(self):
+        """Return the number of bytes written.
+
+        Returns:
+
+        """
+        return self._position
+
+    def flush(self):
+        """Flush (no-op).
+
+        Returns:
+
+        """
+
+    def pop(self):
+        """Return and clear the buffered data.
+
+        Returns:
+
+        """
+        data = bytes(self._buffer)
+        self._buffer.clear()
+        return data
+
+
+def _get_dependency_elements(xsd_tree):
+    """Return the include and import elements having a schema location.
+
+    Args:
+        xsd_tree:
+
+    Returns:
+
+    """
+    return [
+        element
+        for tag in DEPENDENCY_TAGS
+        for element in xsd_tree.findall(f"{LXML_SCHEMA_NAMESPACE}{tag}")
+        if "schemaLocation" in element.attrib
+    ]
+
+
+def _get_local_template_id(schema_location, pattern):
+    """Return the id of the template at a schema location, None if external.
+
+    Args:
+        schema_location:
+        pattern:
+
+    Returns:
+
+    """
+    match = pattern.match(urlparse(schema_location).path)
+    return match.group("pk") if match else None
+
+
+def _get_unique_filename(filename, template_id, used_filenames):
+    """Return a filename not used yet in the bundle.
+
+    Args:
+        filename:
+        template_id:
+        used_filenames:
+
+    Returns:
+
+    """
+    name = os.path.splitext(os.path.basename(filename or ""))[0]
+    # keep names portable once extracted
+    name = re.sub(r"[^\w.-]", "_", name) or "schema"
+    unique_filename = f"{name}.xsd"
+    if unique_filename in used_filenames:
+        unique_filename = f"{name}_{template_id}.xsd"
+    used_filenames.add(unique_filename)
+    return unique_filename
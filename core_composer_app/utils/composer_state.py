@@ -0,0 +1,965 @@
+"""Composer state utils
+
+The schema being composed is stored in the session, with the schemas it
+includes and a revision. Each edit of the composer state increments the
+revision. Edit requests can send the revision they were made from: the edit
+is rejected if the state has changed since, instead of overwriting a
+concurrent edit, so clients can send edits without waiting for the previous
+ones to complete.
+
+The state also records the names of the types defined by the included
+schemas, so the includes no element references anymore can be removed.
+
+The state also records the last revision whose schema was fully validated,
+so the composer can tell whether the schema was validated since the last
+edit when validation is deferred.
+
+The composer page numbers its edits: each edit is sent with the revision it
+applies to, without waiting for the response of the previous one, and always
+creates the next revision, even if it fails. Edits of the state of a session
+are serialized with a lock in the Django cache, shared by all the processes
+when the cache is (e.g. Redis, Memcached). An edit waits, for at most
+COMPOSER_STATE_WAIT_TIMEOUT seconds, for the lock and for the edits of the
+previous revisions, which may be served by other threads or processes, so
+the edits of a page are applied in the order they were sent.
+
+The state is read from and saved to the session store under the lock, and
+copied to the session of the request, so the session middleware does not
+write the state loaded at the beginning of the request over the edit.
+
+When COMPOSER_STATELESS is set, the state is instead carried by the client:
+it is sent with each request in a compressed token, signed (and optionally
+encrypted) with the secret key, and each edit returns the token of the new
+state, so any process can serve any request without reading the session.
+States whose token would exceed COMPOSER_STATE_TOKEN_MAX_SIZE are stored in
+the session, and the client sends no token until the state is small enough
+again. Each edit needs the token returned by the previous one, so the page
+sends its edits one at a time in this mode.
+"""
+
+import asyncio
+import base64
+import hashlib
+import time
+import uuid
+from contextlib import asynccontextmanager, contextmanager
+
+from django.conf import settings
+from django.contrib.sessions.backends.base import SessionBase
+from django.contrib.sessions.backends.signed_cookies import (
+    SessionStore as SignedCookiesSessionStore,
+)
+from django.core import signing
+from django.core.cache import cache
+from django.core.exceptions import ImproperlyConfigured
+
+from core_composer_app.settings import (
+    COMPOSER_STATE_TOKEN_ENCRYPTION,
+    COMPOSER_STATE_TOKEN_MAX_AGE,
+    COMPOSER_STATE_TOKEN_MAX_SIZE,
+    COMPOSER_STATE_WAIT_TIMEOUT,
+    COMPOSER_STATELESS,
+)
+
+try:
+    from cryptography.fernet import Fernet, InvalidToken
+except ImportError:
+    # state tokens can not be encrypted
+    Fernet = InvalidToken = None
+
+XSD_SESSION_KEY = "newXmlTemplateCompose"
+INCLUDED_TYPES_SESSION_KEY = "includedTypesCompose"
+INCLUDED_TYPE_NAMES_SESSION_KEY = "includedTypeNamesCompose"
+REVISION_SESSION_KEY = "revisionCompose"
+VALIDATED_REVISION_SESSION_KEY = "validatedRevisionCompose"
+# keys of the composer state in the session
+STATE_SESSION_KEYS = (
+    XSD_SESSION_KEY,
+    INCLUDED_TYPES_SESSION_KEY,
+    INCLUDED_TYPE_NAMES_SESSION_KEY,
+    REVISION_SESSION_KEY,
+    VALIDATED_REVISION_SESSION_KEY,
+)
+REVISION_PARAMETER = "revision"
+STATE_PARAMETER = "composerState"
+STATE_TOKEN_SALT = "core_composer_app.composer_state"
+
+# seconds before the lock of a request that did not release it expires
+LOCK_EXPIRY = 60
+# seconds between two attempts to lock the state
+LOCK_RETRY_DELAY = 0.01
+
+
+class RevisionConflictError(Exception):
+    """Exception raised when the composer state does not have the expected
+    revision."""
+
+    def __init__(self, message, revision):
+        super().__init__(message)
+        self.message = message
+        self.revision = revision
+
+
+class StateTokenError(Exception):
+    """Exception raised when a composer state token is not valid."""
+
+
+class ComposerState:
+    """Composer state of a session"""
+
+    def __init__(
+        self,
+        xsd_string,
+        included_types,
+        revision,
+        included_type_names=None,
+        validated_revision=None,
+    ):
+        """Initialize the state
+
+        Args:
+            xsd_string: schema being composed
+            included_types: locations of the schemas included
+            revision:
+            included_type_names: names of the types defined by the schemas
+                included, by location
+            validated_revision: last revision whose schema was fully
+                validated
+        """
+        self._xsd_string = xsd_string
+        self.included_types = list(included_types)
+        self.included_type_names = dict(included_type_names or {})
+        self.revision = revision
+        self.validated_revision = validated_revision
+        self.is_modified = False
+        # token carrying the state, None if the state is stored in the
+        # session
+        self.token = None
+
+    @property
+    def xsd_string(self):
+        """Schema being composed
+
+        Returns:
+
+        """
+        return self._xsd_string
+
+    @xsd_string.setter
+    def xsd_string(self, xsd_string):
+        """Set the schema being composed
+
+        Args:
+            xsd_string:
+
+        Returns:
+
+        """
+        self._xsd_string = xsd_string
+        self.is_modified = True
+
+    def add_included_type(self, include_url, type_names=None):
+        """Add the location of an included schema, if not already present.
+
+        Args:
+            include_url:
+            type_names: names of the types defined by the schema
+
+        Returns:
+
+        """
+        if include_url not in self.included_types:
+            self.included_types.append(include_url)
+            self.is_modified = True
+        if type_names is not None and include_url not in (
+            self.included_type_names
+        ):
+            self.included_type_names[include_url] = list(type_names)
+            self.is_modified = True
+
+    def remove_included_types(self, include_urls):
+        """Remove the locations of schemas no longer included.
+
+        Args:
+            include_urls:
+
+        Returns:
+
+        """
+        for include_url in include_urls:
+            if include_url in self.included_types:
+                self.included_types.remove(include_url)
+                self.is_modified = True
+            if self.included_type_names.pop(include_url, None) is not None:
+                self.is_modified = True
+
+
+def init_composer_state(request, xsd_string, included_types):
+    """Start composing a schema.
+
+    The revision keeps increasing, so edits sent from a previous composer
+    page are rejected.
+
+    Args:
+        request:
+        xsd_string:
+        included_types:
+
+    Returns:
+        revision of the state.
+
+    """
+    with _lock_session(
+        request.session, time.monotonic() + COMPOSER_STATE_WAIT_TIMEOUT
+    ):
+        session = _get_stored_session(request.session)
+        revision = session.get(REVISION_SESSION_KEY, 0) + 1
+        session[XSD_SESSION_KEY] = xsd_string
+        session[INCLUDED_TYPES_SESSION_KEY] = list(included_types)
+        session[INCLUDED_TYPE_NAMES_SESSION_KEY] = {}
+        session[REVISION_SESSION_KEY] = revision
+        # the schema was validated when it was saved
+        session[VALIDATED_REVISION_SESSION_KEY] = revision
+        _save_session(session, request.session)
+    return revision
+
+
+def init_state_token(request, xsd_string, included_types):
+    """Start composing a schema, with a state carried by the client.
+
+    Args:
+        request:
+        xsd_string:
+        included_types:
+
+    Returns:
+        ComposerState, without token if the state is too large to be
+        carried by the client.
+
+    """
+    # the schema was validated when it was saved
+    state = ComposerState(xsd_string, included_types, 1, validated_revision=1)
+    state.token = _encode_state_token(state, _get_user_id(request.user))
+    return state
+
+
+def get_composer_state(request):
+    """Return the composer state, from the token sent by the request or
+    from the session.
+
+    Args:
+        request:
+
+    Returns:
+        ComposerState
+
+    """
+    token = _get_request_token(request)
+    if token is not None:
+        return _decode_state_token(token, _get_user_id(request.user))
+    return _get_state(request.session)
+
+
+async def aget_composer_state(request):
+    """Return the composer state, from async code.
+
+    See get_composer_state.
+
+    Args:
+        request:
+
+    Returns:
+        ComposerState
+
+    """
+    token = _get_request_token(request)
+    if token is not None:
+        user = await request.auser()
+        return _decode_state_token(token, _get_user_id(user))
+    xsd_string = await request.session.aget(XSD_SESSION_KEY)
+    if xsd_string is None:
+        raise KeyError(XSD_SESSION_KEY)
+    return ComposerState(
+        xsd_string,
+        await request.session.aget(INCLUDED_TYPES_SESSION_KEY, []),
+        await request.session.aget(REVISION_SESSION_KEY, 0),
+        await request.session.aget(INCLUDED_TYPE_NAMES_SESSION_KEY),
+        await request.session.aget(VALIDATED_REVISION_SESSION_KEY),
+    )
+
+
+def get_revision(request):
+    """Return the revision of the composer state.
+
+    Args:
+        request:
+
+    Returns:
+
+    """
+    return request.session.get(REVISION_SESSION_KEY, 0)
+
+
+def is_validated(request):
+    """Return True if the schema was fully validated since the last edit.
+
+    Args:
+        request:
+
+    Returns:
+
+    """
+    token = _get_request_token(request)
+    if token is not None:
+        state = _decode_state_token(token, _get_user_id(request.user))
+        return state.validated_revision == state.revision
+    return request.session.get(VALIDATED_REVISION_SESSION_KEY) == get_revision(
+        request
+    )
+
+
+def set_validated(request, revision, state=None):
+    """Record that the schema of a revision was fully validated.
+
+    Nothing is recorded if the state was edited since the revision, or is
+    being edited.
+
+    Args:
+        request:
+        revision: revision of the validated schema
+        state: composer state read from the request, if carried by the
+            client: the state gets the token of the validated state
+
+    Returns:
+        bool: True if the revision is the revision of the state.
+
+    """
+    if state is not None and state.token is not None:
+        if state.revision != revision:
+            return False
+        state.validated_revision = revision
+        _save_client_state(request, state, _get_user_id(request.user))
+        return True
+
+    try:
+        with _lock_session(request.session):
+            session = _get_stored_session(request.session)
+            if session.get(REVISION_SESSION_KEY, 0) != revision:
+                return False
+            session[VALIDATED_REVISION_SESSION_KEY] = revision
+            _save_session(session, request.session)
+    except RevisionConflictError:
+        return False
+    return True
+
+
+@contextmanager
+def edit_composer_state(request):
+    """Edit the composer state of the session.
+
+    The state is locked during the edit, and read from the session store
+    once locked. If the request sends a revision, the edit is applied to the
+    state of this revision: it waits for the edits of the previous revisions
+    sent before it by the page, and is rejected if the state has changed
+    since. An edit sent with a revision always creates the next revision,
+    even if it fails or does not change the state, so the page can send its
+    edits without waiting for the previous ones to complete. Without a
+    revision, the state is saved with a new revision only if it was
+    modified.
+
+    If the request sends a state token, the state is read from the token,
+    and the modified state gets the token of the new state.
+
+    Args:
+        request:
+
+    Returns:
+        ComposerState
+
+    """
+    expected_revision = request.POST.get(REVISION_PARAMETER)
+    user_id = _get_user_id(request.user)
+    token = _get_request_token(request)
+    if token is not None:
+        state = _decode_state_token(token, user_id)
+        _check_revision(state, expected_revision)
+
+        yield state
+
+        if state.is_modified:
+            state.revision += 1
+            _save_client_state(request, state, user_id)
+        return
+
+    deadline = time.monotonic() + COMPOSER_STATE_WAIT_TIMEOUT
+    while True:
+        with _lock_session(request.session, deadline):
+            session = _get_stored_session(request.session)
+            if not _must_wait(session, expected_revision, deadline):
+                state = _get_state(session, expected_revision)
+                try:
+                    yield state
+                except Exception:
+                    if _is_numbered(expected_revision):
+                        _skip_revision(session, state)
+                        _save_session(session, request.session)
+                    raise
+
+                if state.is_modified:
+                    state.revision += 1
+                    if COMPOSER_STATELESS:
+                        state.token = _encode_state_token(state, user_id)
+                    if state.token is None:
+                        _set_state(session, state)
+                        _save_session(session, request.session)
+                elif _is_numbered(expected_revision):
+                    _skip_revision(session, state)
+                    _save_session(session, request.session)
+                return
+        # the edits of the previous revisions are not applied yet
+        time.sleep(LOCK_RETRY_DELAY)
+
+
+@asynccontextmanager
+async def aedit_composer_state(request):
+    """Edit the composer state of the session, from async code.
+
+    See edit_composer_state.
+
+    Args:
+        request:
+
+    Returns:
+        ComposerState
+
+    """
+    expected_revision = request.POST.get(REVISION_PARAMETER)
+    user_id = _get_user_id(await request.auser())
+    token = _get_request_token(request)
+    if token is not None:
+        state = _decode_state_token(token, user_id)
+        _check_revision(state, expected_revision)
+
+        yield state
+
+        if state.is_modified:
+            state.revision += 1
+            state.token = _encode_state_token(state, user_id)
+            if state.token is None:
+                # too large to be carried by the client
+                async with _alock_session(
+                    request.session,
+                    time.monotonic() + COMPOSER_STATE_WAIT_TIMEOUT,
+                ):
+                    session = await _aget_stored_session(request.session)
+                    _set_state(session, state)
+                    await _asave_session(session, request.session)
+        return
+
+    deadline = time.monotonic() + COMPOSER_STATE_WAIT_TIMEOUT
+    while True:
+        async with _alock_session(request.session, deadline):
+            session = await _aget_stored_session(request.session)
+            if not _must_wait(session, expected_revision, deadline):
+                state = _get_state(session, expected_revision)
+                try:
+                    yield state
+                except Exception:
+                    if _is_numbered(expected_revision):
+                        _skip_revision(session, state)
+                        await _asave_session(session, request.session)
+                    raise
+
+                if state.is_modified:
+                    state.revision += 1
+                    if COMPOSER_STATELESS:
+                        state.token = _encode_state_token(state, user_id)
+                    if state.token is None:
+                        _set_state(session, state)
+                        await _asave_session(session, request.session)
+                elif _is_numbered(expected_revision):
+                    _skip_revision(session, state)
+                    await _asave_session(session, request.session)
+                return
+        await asyncio.sleep(LOCK_RETRY_DELAY)
+
+
+def _is_numbered(expected_revision):
+    """Return True if an edit is sent with the revision it applies to.
+
+    Args:
+        expected_revision: revision sent by the request, None if not sent
+
+    Returns:
+
+    """
+    return expected_revision not in (None, "")
+
+
+def _must_wait(session, expected_revision, deadline):
+    """Return True if an edit has to wait for the edits of the previous
+    revisions, sent before it by the page but not applied yet.
+
+    Args:
+        session: session read from the session store
+        expected_revision: revision sent by the request, None if not sent
+        deadline: time after which the edit is rejected instead
+
+    Returns:
+
+    """
+    if not _is_numbered(expected_revision):
+        return False
+    try:
+        expected_revision = int(expected_revision)
+    except ValueError:
+        return False
+    return (
+        session.get(REVISION_SESSION_KEY, 0) < expected_revision
+        and time.monotonic() < deadline
+    )
+
+
+def _skip_revision(session, state):
+    """Create the next revision of a state left unchanged by an edit.
+
+    Args:
+        session: session read from the session store
+        state: state read from the session, gets the new revision
+
+    Returns:
+
+    """
+    revision = session.get(REVISION_SESSION_KEY, 0)
+    if session.get(VALIDATED_REVISION_SESSION_KEY) == revision:
+        # the schema is the one validated
+        session[VALIDATED_REVISION_SESSION_KEY] = revision + 1
+    session[REVISION_SESSION_KEY] = revision + 1
+    state.revision = revision + 1
+    state.validated_revision = session.get(VALIDATED_REVISION_SESSION_KEY)
+
+
+def _get_state(session, expected_revision=None):
+    """Return the composer state of a session, checking its revision.
+
+    Args:
+        session:
+        expected_revision: revision sent by the request, None if not sent
+
+    Returns:
+
+    """
+    state = ComposerState(
+        session[XSD_SESSION_KEY],
+        session.get(INCLUDED_TYPES_SESSION_KEY, []),
+        session.get(REVISION_SESSION_KEY, 0),
+        session.get(INCLUDED_TYPE_NAMES_SESSION_KEY),
+        session.get(VALIDATED_REVISION_SESSION_KEY),
+    )
+    _check_revision(state, expected_revision)
+    return state
+
+
+def _check_revision(state, expected_revision):
+    """Check that a composer state has the revision sent by the request.
+
+    Args:
+        state:
+        expected_revision: revision sent by the request, None if not sent
+
+    Returns:
+
+    """
+    if expected_revision not in (None, "") and str(expected_revision) != str(
+        state.revision
+    ):
+        raise RevisionConflictError(
+            f"The template was modified since revision {expected_revision}.",
+            state.revision,
+        )
+
+
+def _set_state(session, state):
+    """Store a modified composer state in a session.
+
+    Args:
+        session:
+        state:
+
+    Returns:
+
+    """
+    session[XSD_SESSION_KEY] = state.xsd_string
+    session[INCLUDED_TYPES_SESSION_KEY] = state.included_types
+    session[INCLUDED_TYPE_NAMES_SESSION_KEY] = state.included_type_names
+    session[REVISION_SESSION_KEY] = state.revision
+    session[VALIDATED_REVISION_SESSION_KEY] = state.validated_revision
+
+
+def _save_client_state(request, state, user_id):
+    """Save a modified composer state carried by the client: in a new
+    token, in the session if the token is too large.
+
+    Args:
+        request:
+        state:
+        user_id:
+
+    Returns:
+
+    """
+    state.token = _encode_state_token(state, user_id)
+    if state.token is None:
+        with _lock_session(
+            request.session, time.monotonic() + COMPOSER_STATE_WAIT_TIMEOUT
+        ):
+            session = _get_stored_session(request.session)
+            _set_state(session, state)
+            _save_session(session, request.session)
+
+
+def _get_request_token(request):
+    """Return the state token sent by a request, None if not sent or if
+    the composer is not stateless.
+
+    Args:
+        request:
+
+    Returns:
+
+    """
+    if not COMPOSER_STATELESS:
+        return None
+    return request.POST.get(STATE_PARAMETER) or None
+
+
+def _encode_state_token(state, user_id):
+    """Return the token carrying a composer state.
+
+    Args:
+        state:
+        user_id: id of the user the token is issued to
+
+    Returns:
+        token, None if larger than COMPOSER_STATE_TOKEN_MAX_SIZE or if the
+        user is anonymous.
+
+    """
+    if user_id is None:
+        # anonymous users share the same salt: their state stays in the
+        # session
+        return None
+    token = signing.dumps(
+        {
+            "xsd": state.xsd_string,
+            "types": state.included_types,
+            "typeNames": state.included_type_names,
+            "revision": state.revision,
+            "validated": state.validated_revision,
+        },
+        salt=_get_token_salt(user_id),
+        compress=True,
+    )
+    if len(token) > COMPOSER_STATE_TOKEN_MAX_SIZE:
+        return None
+    if COMPOSER_STATE_TOKEN_ENCRYPTION:
+        token = _get_fernet().encrypt(token.encode()).decode()
+        if len(token) > COMPOSER_STATE_TOKEN_MAX_SIZE:
+            return None
+    return token
+
+
+def _decode_state_token(token, user_id):
+    """Return the composer state carried by a token.
+
+    Args:
+        token:
+        user_id: id of the user sending the token
+
+    Returns:
+        ComposerState
+
+    """
+    error = StateTokenError(
+        "The state of the composer is not valid or has expired. Reload the "
+        "page to continue editing."
+    )
+    if user_id is None:
+        # no token is issued to anonymous users
+        raise error
+    if COMPOSER_STATE_TOKEN_ENCRYPTION:
+        fernet = _get_fernet()
+        try:
+            signed_token = fernet.decrypt(token.encode()).decode()
+        except InvalidToken:
+            raise error
+    else:
+        signed_token = token
+    try:
+        data = signing.loads(
+            signed_token,
+            salt=_get_token_salt(user_id),
+            max_age=COMPOSER_STATE_TOKEN_MAX_AGE,
+        )
+    except signing.BadSignature:
+        raise error
+    state = ComposerState(
+        data["xsd"],
+        data["types"],
+        data["revision"],
+        data["typeNames"],
+        data["validated"],
+    )
+    state.token = token
+    return state
+
+
+def _get_token_salt(user_id):
+    """Return the salt of the state tokens of a user, so the tokens of a
+    user are not accepted for another.
+
+    Args:
+        user_id:
+
+    Returns:
+
+    """
+    return f"{STATE_TOKEN_SALT}:{user_id}"
+
+
+def _get_user_id(user):
+    """Return the id of a user, None for anonymous users.
+
+    Args:
+        user:
+
+    Returns:
+
+    """
+    return getattr(user, "id", None)
+
+
+def _get_fernet():
+    """Return the cipher of the state tokens.
+
+    Returns:
+
+    """
+    if Fernet is None:
+        raise ImproperlyConfigured(
+            "COMPOSER_STATE_TOKEN_ENCRYPTION requires the cryptography "
+            "package."
+        )
+    key = hashlib.sha256(
+        f"{STATE_TOKEN_SALT}:{settings.SECRET_KEY}".encode()
+    ).digest()
+    return Fernet(base64.urlsafe_b64encode(key))
+
+
+@contextmanager
+def _lock_session(session, deadline=None):
+    """Lock the composer state of a session.
+
+    Args:
+        session:
+        deadline: time until which the lock is waited for, None to not wait
+
+    Returns:
+
+    Raises:
+        RevisionConflictError: the state stays locked by another request.
+
+    """
+    lock_key = _get_lock_key(session)
+    if lock_key is None:
+        # nothing stored yet, no concurrent request can share the state
+        yield
+        return
+
+    token = uuid.uuid4().hex
+    # the lock expires, so a crashed request does not lock the session
+    while not cache.add(lock_key, token, LOCK_EXPIRY):
+        if deadline is None or time.monotonic() > deadline:
+            raise _get_lock_error(session.get(REVISION_SESSION_KEY, 0))
+        time.sleep(LOCK_RETRY_DELAY)
+    try:
+        yield
+    finally:
+        if cache.get(lock_key) == token:
+            cache.delete(lock_key)
+
+
+@asynccontextmanager
+async def _alock_session(session, deadline=None):
+    """Lock the composer state of a session, from async code.
+
+    Args:
+        session:
+        deadline: time until which the lock is waited for, None to not wait
+
+    Returns:
+
+    Raises:
+        RevisionConflictError: the state stays locked by another request.
+
+    """
+    lock_key = _get_lock_key(session)
+    if lock_key is None:
+        yield
+        return
+
+    token = uuid.uuid4().hex
+    while not await cache.aadd(lock_key, token, LOCK_EXPIRY):
+        if deadline is None or time.monotonic() > deadline:
+            raise _get_lock_error(await session.aget(REVISION_SESSION_KEY, 0))
+        await asyncio.sleep(LOCK_RETRY_DELAY)
+    try:
+        yield
+    finally:
+        if await cache.aget(lock_key) == token:
+            await cache.adelete(lock_key)
+
+
+def _get_lock_key(session):
+    """Return the cache key of the lock of a session, None if the session is
+    not stored yet.
+
+    Args:
+        session:
+
+    Returns:
+
+    """
+    session_key = getattr(session, "session_key", None)
+    if session_key is None:
+        return None
+    return f"core_composer_app:composer_state_lock:{session_key}"
+
+
+def _get_lock_error(revision):
+    """Return the error raised when the state of a session stays locked.
+
+    Args:
+        revision: revision of the state loaded by the request
+
+    Returns:
+
+    """
+    return RevisionConflictError(
+        "The template is being modified by another request.", revision
+    )
+
+
+def _get_stored_session(session):
+    """Return the session as stored in the session store, instead of the
+    data loaded at the beginning of the request.
+
+    Args:
+        session:
+
+    Returns:
+        new session object, the session itself if not stored on the server
+        side.
+
+    """
+    if not _is_stored(session):
+        return session
+    return session.__class__(session_key=session.session_key)
+
+
+async def _aget_stored_session(session):
+    """Return the session as stored in the session store, from async code.
+
+    Args:
+        session:
+
+    Returns:
+
+    """
+    if not _is_stored(session):
+        return session
+    stored_session = session.__class__(session_key=session.session_key)
+    # load the data now, the state is then read and written synchronously
+    await stored_session.akeys()
+    return stored_session
+
+
+def _save_session(session, request_session):
+    """Save a session read from the session store while it is locked, and
+    copy the composer state to the session of the request.
+
+    The session middleware saves the session of the request at the end of
+    the request if it was modified, or on every request with
+    SESSION_SAVE_EVERY_REQUEST: the session of the request holds the saved
+    state, so it is not written back over the edit. Sessions not stored on
+    the server side are saved by the middleware.
+
+    Args:
+        session: session read from the session store
+        request_session: session of the request
+
+    Returns:
+
+    """
+    if _is_stored(session):
+        session.save()
+        _update_request_session(session, request_session)
+
+
+async def _asave_session(session, request_session):
+    """Save a session read from the session store, from async code.
+
+    See _save_session.
+
+    Args:
+        session: session read from the session store
+        request_session: session of the request
+
+    Returns:
+
+    """
+    if _is_stored(session):
+        await session.asave()
+        # the data of the request session is loaded before being modified
+        await request_session.akeys()
+        _update_request_session(session, request_session)
+
+
+def _update_request_session(session, request_session):
+    """Copy the composer state of a saved session to the session of the
+    request, without marking the session of the request as modified.
+
+    Args:
+        session: saved session
+        request_session: session of the request
+
+    Returns:
+
+    """
+    if session is request_session:
+        return
+    modified = request_session.modified
+    for key in STATE_SESSION_KEYS:
+        if key in session:
+            request_session[key] = session[key]
+    # the state is already saved: the middleware saves the session of the
+    # request only if it was modified by something else
+    request_session.modified = modified
+
+
+def _is_stored(session):
+    """Return True if the session is stored on the server side.
+
+    Sessions stored in cookies are only saved by the session middleware.
+
+    Args:
+        session:
+
+    Returns:
+
+    """
+    return (
+        isinstance(session, SessionBase)
+        and not isinstance(session, SignedCookiesSessionStore)
+        and session.session_key is not None
+    )
@@ -0,0 +1,154 @@
+"""Composition utils for Composer app
+
+Apply a list of composer operations to a schema in one pass: the schema is
+parsed once, each operation edits its tree in place with the local checks of
+the edited element, and the result is validated once by the caller, instead
+of after each edit as in the composer page.
+"""
+
+from core_main_app.access_control.exceptions import AccessControlError
+from core_main_app.commons.exceptions import DoesNotExist, XMLError
+from core_main_app.utils import xml as main_xml_utils
+from xml_utils.xsd_tree.xsd_tree import XSDTree
+
+from core_composer_app.utils.xml import (
+    ComposerDocument,
+    check_xsd_element,
+    get_type_names,
+)
+
+INSERT_ELEMENT = "insert_element"
+RENAME_ELEMENT = "rename_element"
+DELETE_ELEMENT = "delete_element"
+CHANGE_ELEMENT_TYPE = "change_element_type"
+SET_ELEMENT_OCCURRENCES = "set_element_occurrences"
+RENAME_ROOT_TYPE = "rename_root_type"
+OPERATIONS = (
+    INSERT_ELEMENT,
+    RENAME_ELEMENT,
+    DELETE_ELEMENT,
+    CHANGE_ELEMENT_TYPE,
+    SET_ELEMENT_OCCURRENCES,
+    RENAME_ROOT_TYPE,
+)
+
+
+def compose_schema(xsd_string, operations, get_type):
+    """Apply composer operations to a schema.
+
+    Operations are dicts with the name of the operation and its parameters:
+        - insert_element: xpath, type (built-in type) or type_version_manager
+          (id of the version manager of a type, its current version is
+          inserted), name (optional)
+        - rename_element: xpath, name
+        - delete_element: xpath
+        - change_element_type: xpath, type (sequence, choice, all)
+        - set_element_occurrences: xpath, min_occurs, max_occurs
+        - rename_root_type: name
+
+    Args:
+        xsd_string: base schema
+        operations: list of operations
+        get_type: function returning the current type of a type version
+            manager, from its id
+
+    Returns:
+        ComposerDocument
+
+    """
+    document = ComposerDocument.from_string(xsd_string)
+    # names of the types of the schemas included by the operations
+    included_type_names = {}
+    for index, operation in enumerate(operations):
+        try:
+            _apply_operation(
+                document, operation, get_type, included_type_names
+            )
+        except (AccessControlError, DoesNotExist):
+            # the type can not be read
+            raise
+        except Exception as exception:
+            raise XMLError(
+                f"Operation {index} ({operation.get('operation')}) failed: "
+                f"{exception}"
+            )
+    return document
+
+
+def _apply_operation(document, operation, get_type, included_type_names):
+    """Apply a composer operation to a schema.
+
+    Args:
+        document: ComposerDocument
+        operation:
+        get_type:
+        included_type_names: names of the types of the schemas included,
+            by location
+
+    Returns:
+
+    """
+    operation_name = operation.get("operation")
+    if operation_name == INSERT_ELEMENT:
+        _insert_element(document, operation, get_type, included_type_names)
+    elif operation_name == RENAME_ELEMENT:
+        document.rename_element(
+            operation["xpath"], operation["name"], check=True
+        )
+    elif operation_name == DELETE_ELEMENT:
+        document.delete_element(operation["xpath"])
+        document.remove_unused_dependencies(included_type_names)
+    elif operation_name == CHANGE_ELEMENT_TYPE:
+        document.change_element_type(operation["xpath"], operation["type"])
+    elif operation_name == SET_ELEMENT_OCCURRENCES:
+        document.set_element_occurrences(
+            operation["xpath"],
+            str(operation["min_occurs"]),
+            str(operation["max_occurs"]),
+        )
+    elif operation_name == RENAME_ROOT_TYPE:
+        document.rename_single_root_type(operation["name"])
+    else:
+        raise XMLError(f"Unknown operation: {operation_name}.")
+
+
+def _insert_element(document, operation, get_type, included_type_names):
+    """Insert an element of a built-in type, or of the current version of a
+    type.
+
+    Args:
+        document: ComposerDocument
+        operation:
+        get_type:
+        included_type_names:
+
+    Returns:
+
+    """
+    type_version_manager_id = operation.get("type_version_manager")
+    if type_version_manager_id is None:
+        element = document.insert_element_built_in_type(
+            operation["xpath"], operation["type"]
+        )
+        if operation.get("name"):
+            document.name_index.rename(element, operation["name"])
+        type_trees = []
+    else:
+        type_object = get_type(type_version_manager_id)
+        type_tree = XSDTree.build_tree(type_object.content)
+        type_names = get_type_names(type_object.content)
+        include_url = main_xml_utils._get_schema_location_uri(
+            str(type_object.id)
+        )
+        element = document.insert_element_type(
+            operation["xpath"],
+            type_tree,
+            operation.get("name") or type_names[0],
+            include_url,
+        )
+        included_type_names[include_url] = type_names
+        type_trees = [type_tree]
+
+    check_xsd_element(
+        element, type_trees=type_trees, name_index=document.name_index
+    )
@@ -0,0 +1,86 @@
+"""Composer decorators"""
+
+from functools import wraps
+from urllib.parse import urlparse
+
+from django.conf import settings
+from django.contrib.auth import REDIRECT_FIELD_NAME
+from django.contrib.auth.models import Group
+from django.contrib.auth.views import redirect_to_login
+from django.core.exceptions import PermissionDenied
+from django.db.models import Q
+from django.shortcuts import resolve_url
+
+from core_main_app.permissions import rights as main_rights
+
+
+def async_permission_required(
+    content_type,
+    permission,
+    login_url=None,
+    raise_exception=False,
+    redirect_field_name=REDIRECT_FIELD_NAME,
+):
+    """Check, from an async view, that the user has a permission.
+
+    Async counterpart of core_main_app.utils.decorators.permission_required:
+    redirects to the login page when the permission is missing, unless
+    raise_exception is set.
+
+    Args:
+        content_type:
+        permission:
+        login_url:
+        raise_exception:
+        redirect_field_name:
+
+    Returns:
+
+    """
+
+    def _check_group(view_func):
+        @wraps(view_func)
+        async def wrapper(request, *args, **kwargs):
+            """
+
+            Args:
+                request:
+                *args:
+                **kwargs:
+
+            Returns:
+
+            """
+            user = await request.auser()
+            if user.is_anonymous:
+                # Check in the ANONYMOUS_GROUP
+                access = await Group.objects.filter(
+                    Q(name=main_rights.ANONYMOUS_GROUP)
+                    & Q(permissions__codename=permission)
+                ).aexists()
+            else:
+                # Check the permission for the current user
+                access = await user.ahas_perm(f"{content_type}.{permission}")
+
+            if access:
+                return await view_func(request, *args, **kwargs)
+            # In case the 403 handler should be called raise the exception
+            if raise_exception:
+                raise PermissionDenied
+            path = request.build_absolute_uri()
+            resolved_login_url = resolve_url(login_url or settings.LOGIN_URL)
+            # If the login url is the same scheme and net location then just
+            # use the path as the "next" url.
+            login_scheme, login_netloc = urlparse(resolved_login_url)[:2]
+            current_scheme, current_netloc = urlparse(path)[:2]
+            if (not login_scheme or login_scheme == current_scheme) and (
+                not login_netloc or login_netloc == current_netloc
+            ):
+                path = request.get_full_path()
+            return redirect_to_login(
+                path, resolved_login_url, redirect_field_name
+            )
+
+        return wrapper
+
+    return _check_group
@@ -0,0 +1,208 @@
+"""Structural diff of XML schemas for Composer app"""
+
+from xml_utils.commons.constants import LXML_SCHEMA_NAMESPACE
+from xml_utils.xsd_tree.xsd_tree import XSDTree
+
+# tags of the named schema components used to build paths
+NAMED_COMPONENTS = ["element", "attribute", "complexType", "simpleType"]
+# tags holding the base type of a type definition
+DERIVATION_TAGS = ["restriction", "extension"]
+DEFAULT_OCCURS = "1"
+
+
+def diff_xsd(old_xsd_string, new_xsd_string):
+    """Return the structural differences between two xsd strings.
+
+    Args:
+        old_xsd_string:
+        new_xsd_string:
+
+    Returns:
+        dict: added, removed, renamed, occurrences and types changes.
+
+    """
+    return diff_xsd_trees(
+        XSDTree.build_tree(old_xsd_string), XSDTree.build_tree(new_xsd_string)
+    )
+
+
+def diff_xsd_trees(old_xsd_tree, new_xsd_tree):
+    """Return the structural differences between two xsd trees.
+
+    Components are indexed by path in a single pass over each tree, so the
+    comparison is linear in the size of the schemas.
+
+    Args:
+        old_xsd_tree:
+        new_xsd_tree:
+
+    Returns:
+        dict: added, removed, renamed, occurrences and types changes.
+
+    """
+    old_index = _index_components(old_xsd_tree)
+    new_index = _index_components(new_xsd_tree)
+
+    # candidates for renames: new components not found at the same path
+    rename_candidates = {}
+    for path, component in new_index.items():
+        if path not in old_index:
+            rename_candidates.setdefault(
+                _get_rename_key(component, component["parent"]), []
+            ).append(path)
+
+    diff = {
+        "added": [],
+        "removed": [],
+        "renamed": [],
+        "occurrences": [],
+        "types": [],
+    }
+    # old path -> new path, parents are indexed (and mapped) before children
+    path_map = {}
+    matched_paths = set()
+    for path, component in old_index.items():
+        new_parent = path_map.get(component["parent"], component["parent"])
+        parent_length = len(component["parent"])
+        new_path = new_parent + path[parent_length:]
+        if new_path not in new_index or new_path in matched_paths:
+            new_path = _pop_rename_candidate(
+                rename_candidates,
+                _get_rename_key(component, new_parent),
+                matched_paths,
+            )
+            if new_path is None:
+                diff["removed"].append(_get_component_summary(path, component))
+                continue
+            diff["renamed"].append({"from": path, "to": new_path})
+        path_map[path] = new_path
+        matched_paths.add(new_path)
+
+        new_component = new_index[new_path]
+        if component["type"] != new_component["type"]:
+            diff["types"].append(
+                {
+                    "path": new_path,
+                    "old": component["type"],
+                    "new": new_component["type"],
+                }
+            )
+        if component["occurs"] != new_component["occurs"]:
+            diff["occurrences"].append(
+                {
+                    "path": new_path,
+                    "old": component["occurs"],
+                    "new": new_component["occurs"],
+                }
+            )
+
+    diff["added"] = [
+        _get_component_summary(path, component)
+        for path, component in new_index.items()
+        if path not in matched_paths
+    ]
+    return diff
+
+
+def has_changes(diff):
+    """Check if a diff contains changes.
+
+    Args:
+        diff:
+
+    Returns:
+
+    """
+    return any(len(changes) > 0 for changes in diff.values())
+
+
+def _index_components(xsd_tree):
+    """Index named components of a schema by path.
+
+    Args:
+        xsd_tree:
+
+    Returns:
+        dict: path -> component information, in document order.
+
+    """
+    index = {}
+    root = xsd_tree.getroot() if hasattr(xsd_tree, "getroot") else xsd_tree
+    # stack of (element, parent path), children pushed in reverse order
+    stack = [(child, "") for child in reversed(root)]
+    while stack:
+        element, parent_path = stack.pop()
+        if not isinstance(element.tag, str):
+            # skip comments and processing instructions
+            continue
+        tag = element.tag.replace(LXML_SCHEMA_NAMESPACE, "")
+        path = parent_path
+        if tag in NAMED_COMPONENTS:
+            name = element.attrib.get("name", element.attrib.get("ref"))
+            if name is not None:
+                path = f"{parent_path}/{tag}[{name}]"
+                index[path] = {
+                    "name": name,
+                    "tag": tag,
+                    "parent": parent_path,
+                    "type": element.attrib.get("type"),
+                    "occurs": [
+                        element.attrib.get("minOccurs", DEFAULT_OCCURS),
+                        element.attrib.get("maxOccurs", DEFAULT_OCCURS),
+                    ],
+                }
+        elif tag in DERIVATION_TAGS and parent_path in index:
+            # the base of a derivation is the type of the enclosing component
+            index[parent_path]["type"] = element.attrib.get("base")
+        stack.extend((child, path) for child in reversed(element))
+    return index
+
+
+def _pop_rename_candidate(rename_candidates, rename_key, matched_paths):
+    """Return and remove the first unmatched candidate for the key, None otherwise.
+
+    Args:
+        rename_candidates:
+        rename_key:
+        matched_paths:
+
+    Returns:
+
+    """
+    paths = rename_candidates.get(rename_key, [])
+    while paths:
+        path = paths.pop(0)
+        if path not in matched_paths:
+            return path
+    return None
+
+
+def _get_rename_key(component, parent_path):
+    """Return the key identifying a component regardless of its name.
+
+    Args:
+        component:
+        parent_path:
+
+    Returns:
+
+    """
+    return (
+        parent_path,
+        component["tag"],
+        component["type"],
+        tuple(component["occurs"]),
+    )
+
+
+def _get_component_summary(path, component):
+    """Return the summary of an added or removed component.
+
+    Args:
+        path:
+        component:
+
+    Returns:
+
+    """
+    return {"path": path, "type": component["type"]}
@@ -0,0 +1,186 @@
+"""Download utils for Composer app
+
+Files are streamed in chunks so memory use does not depend on their size.
+Single byte ranges (Range/If-Range) and conditional requests (If-None-Match)
+are supported so clients can resume downloads and revalidate their copies.
+"""
+
+import re
+
+from django.http import HttpResponse, StreamingHttpResponse
+
+from core_composer_app.settings import COMPOSER_DOWNLOAD_CHUNK_SIZE
+
+RANGE_PATTERN = re.compile(r"^bytes=(?P<start>\d*)-(?P<end>\d*)$")
+
+
+def get_streaming_file_response(
+    request, file, file_name, content_type, etag=None
+):
+    """Return a response streaming a file.
+
+    Args:
+        request:
+        file: opened file, closed once the response is sent
+        file_name:
+        content_type:
+        etag: strong entity tag of the file content, not quoted
+
+    Returns:
+
+    """
+    size = file.size
+    quoted_etag = f'"{etag}"' if etag else None
+
+    if quoted_etag and _match_etag(
+        request.headers.get("If-None-Match"), quoted_etag
+    ):
+        file.close()
+        response = HttpResponse(status=304)
+        response["ETag"] = quoted_etag
+        return response
+
+    byte_range = None
+    range_header = request.headers.get("Range")
+    if range_header and _match_if_range(
+        request.headers.get("If-Range"), quoted_etag
+    ):
+        try:
+            byte_range = parse_range(range_header, size)
+        except ValueError:
+            file.close()
+            response = HttpResponse(status=416)
+            response["Content-Range"] = f"bytes */{size}"
+            return response
+
+    if byte_range is None:
+        start, end = 0, size - 1
+        response = StreamingHttpResponse(
+            FileRangeIterator(file, start, end), content_type=content_type
+        )
+    else:
+        start, end = byte_range
+        response = StreamingHttpResponse(
+            FileRangeIterator(file, start, end),
+            content_type=content_type,
+            status=206,
+        )
+        response["Content-Range"] = f"bytes {start}-{end}/{size}"
+
+    response["Content-Length"] = str(max(end - start + 1, 0))
+    response["Accept-Ranges"] = "bytes"
+    response["Content-Disposition"] = f'attachment; filename="{file_name}"'
+    if quoted_etag:
+        response["ETag"] = quoted_etag
+    return response
+
+
+def parse_range(range_header, size):
+    """Parse a Range header.
+
+    Only single byte ranges are supported, other ranges are ignored. A
+    ValueError is raised if the range cannot be satisfied.
+
+    Args:
+        range_header:
+        size: size of the file
+
+    Returns:
+        (first byte, last byte) tuple, None if the range is not supported.
+
+    """
+    match = RANGE_PATTERN.match(range_header.strip())
+    if not match or (not match.group("start") and not match.group("end")):
+        return None
+    if not match.group("start"):
+        # suffix range: last bytes of the file
+        suffix_length = int(match.group("end"))
+        if suffix_length == 0 or size == 0:
+            raise ValueError("Range not satisfiable.")
+        return max(size - suffix_length, 0), size - 1
+    start = int(match.group("start"))
+    end = int(match.group("end")) if match.group("end") else size - 1
+    if start >= size or end < start:
+        raise ValueError("Range not satisfiable.")
+    return start, min(end, size - 1)
+
+
+class FileRangeIterator:
+    """Iterator over the bytes of a file between two positions.
+
+    The response closes the iterator, and the file, once sent, even if it
+    has not been read.
+    """
+
+    def __init__(self, file, start, end):
+        """Initialize the iterator
+
+        Args:
+            file:
+            start: first byte
+            end: last byte
+        """
+        self.file = file
+        self.start = start
+        self.end = end
+
+    def __iter__(self):
+        """Yield the chunks of the range.
+
+        Returns:
+
+        """
+        self.file.seek(self.start)
+        remaining = self.end - self.start + 1
+        while remaining > 0:
+            chunk = self.file.read(
+                min(COMPOSER_DOWNLOAD_CHUNK_SIZE, remaining)
+            )
+            if not chunk:
+                break
+            remaining -= len(chunk)
+            yield chunk
+
+    def close(self):
+        """Close the file.
+
+        Returns:
+
+        """
+        self.file.close()
+
+
+def _match_etag(if_none_match, quoted_etag):
+    """Check if an If-None-Match header matches an entity tag.
+
+    Args:
+        if_none_match:
+        quoted_etag:
+
+    Returns:
+
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    # weak comparison
+    return quoted_etag in [
+        re.sub(r"^W/", "", etag.strip()) for etag in if_none_match.split(",")
+    ]
+
+
+def _match_if_range(if_range, quoted_etag):
+    """Check if the range of a request applies to the current content.
+
+    Args:
+        if_range:
+        quoted_etag:
+
+    Returns:
+
+    """
+    if not if_range:
+        return True
+    # dates are not strong validators for stored files
+    return quoted_etag is not None and if_range.strip() == quoted_etag
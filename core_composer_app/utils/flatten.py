@@ -0,0 +1,175 @@
+"""Flatten utils for Composer app
+
+A flattened schema is a single schema in which the definitions of the local
+schemas it includes, directly or not, have been inlined, so it can be used
+without resolving any schema location.
+"""
+
+import hashlib
+from collections import deque
+from urllib.parse import urlparse
+
+from django.core.cache import cache
+from lxml import etree
+
+from core_composer_app.settings import COMPOSER_FLATTENED_XSD_CACHE_TIMEOUT
+from core_main_app.utils.urls import get_template_download_pattern
+from xml_utils.commons.constants import LXML_SCHEMA_NAMESPACE
+from xml_utils.xsd_tree.xsd_tree import XSDTree
+
+DEPENDENCY_TAGS = ["include", "import"]
+# tags that have to appear before the definitions of a schema
+HEADER_TAGS = DEPENDENCY_TAGS + ["redefine", "override"]
+
+
+def get_flattened_xsd(xsd_string, get_template):
+    """Return the flattened schema, from the cache if already computed.
+
+    Schema locations point to immutable template versions, so the flattened
+    schema only depends on the content of the root schema. The cache is
+    shared by all users: the ids of the inlined dependencies are cached with
+    the flattened schema, and read again with `get_template` on each hit so
+    its access checks still apply.
+
+    Args:
+        xsd_string: root schema
+        get_template: function returning a template given its id, raising an
+            error if it can not be read
+
+    Returns:
+
+    """
+    cache_key = "core_composer_app:flattened_schema:{0}".format(
+        hashlib.sha256(xsd_string.encode("utf-8")).hexdigest()
+    )
+    cached_value = cache.get(cache_key)
+    if cached_value is not None:
+        for template_id in cached_value["dependency_ids"]:
+            get_template(template_id)
+        return cached_value["content"]
+
+    dependency_ids = []
+
+    def get_dependency(template_id):
+        dependency_ids.append(template_id)
+        return get_template(template_id)
+
+    flattened_xsd = flatten_xsd(xsd_string, get_dependency)
+    cache.set(
+        cache_key,
+        {"content": flattened_xsd, "dependency_ids": dependency_ids},
+        COMPOSER_FLATTENED_XSD_CACHE_TIMEOUT,
+    )
+    return flattened_xsd
+
+
+def flatten_xsd(xsd_string, get_template):
+    """Inline the local dependencies of a schema.
+
+    Definitions are deduplicated by tag and name, the first definition found
+    (root schema first, then breadth-first) being kept. Namespace prefixes
+    declared by inlined schemas are added to the root element. Dependencies
+    declaring another target namespace cannot be merged into the same schema
+    and are kept as references, as are external schema locations.
+
+    Args:
+        xsd_string: root schema
+        get_template: function returning a template given its id
+
+    Returns:
+
+    """
+    pattern = get_template_download_pattern()
+    root = XSDTree.build_tree(xsd_string).getroot()
+    target_namespace = root.attrib.get("targetNamespace")
+
+    header = []
+    definitions = []
+    definition_keys = set()
+    nsmap = dict(root.nsmap)
+    visited_ids = set()
+    pending = deque([root])
+    while pending:
+        schema = pending.popleft()
+        for prefix, namespace in schema.nsmap.items():
+            nsmap.setdefault(prefix, namespace)
+        for element in schema:
+            if not isinstance(element.tag, str):
+                # skip comments and processing instructions
+                continue
+            tag = element.tag.replace(LXML_SCHEMA_NAMESPACE, "")
+            if tag in DEPENDENCY_TAGS:
+                dependency = _get_local_dependency(
+                    element, pattern, get_template, visited_ids
+                )
+                if dependency is False:
+                    continue
+                if dependency is None or (
+                    dependency.attrib.get("targetNamespace", target_namespace)
+                    != target_namespace
+                ):
+                    element_key = _get_element_key(element, tag)
+                    if element_key not in definition_keys:
+                        definition_keys.add(element_key)
+                        header.append(element)
+                else:
+                    pending.append(dependency)
+            elif tag in HEADER_TAGS:
+                header.append(element)
+            else:
+                element_key = _get_element_key(element, tag)
+                if element_key is not None:
+                    if element_key in definition_keys:
+                        continue
+                    definition_keys.add(element_key)
+                definitions.append(element)
+
+    flattened_root = etree.Element(root.tag, attrib=root.attrib, nsmap=nsmap)
+    flattened_root.extend(header + definitions)
+    return XSDTree.tostring(flattened_root)
+
+
+def _get_local_dependency(element, pattern, get_template, visited_ids):
+    """Return the root of a local dependency.
+
+    Args:
+        element: include or import element
+        pattern: template download pattern
+        get_template:
+        visited_ids: ids of the dependencies already loaded
+
+    Returns:
+        root element, None if external, False if already loaded.
+
+    """
+    schema_location = element.attrib.get("schemaLocation")
+    if schema_location is None:
+        return None
+    match = pattern.match(urlparse(schema_location).path)
+    if not match:
+        return None
+    template_id = match.group("pk")
+    if template_id in visited_ids:
+        return False
+    visited_ids.add(template_id)
+    return XSDTree.build_tree(get_template(template_id).content).getroot()
+
+
+def _get_element_key(element, tag):
+    """Return the key identifying a top level element, None if anonymous.
+
+    Args:
+        element:
+        tag:
+
+    Returns:
+
+    """
+    if tag in DEPENDENCY_TAGS:
+        return (
+            tag,
+            element.attrib.get("namespace"),
+            element.attrib.get("schemaLocation"),
+        )
+    name = element.attrib.get("name")
+    return (tag, name) if name is not None else None
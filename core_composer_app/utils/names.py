@@ -0,0 +1,210 @@
+"""Name utils for Composer app
+
+Renaming or inserting an element only changes the names of one content
+model: the complex type or group declaring the element, or the schema for a
+global element. The name is checked against an index of the names of this
+content model, instead of validating the whole schema.
+"""
+
+from lxml import etree
+
+from core_main_app.commons.exceptions import XMLError
+from xml_utils.commons.constants import LXML_SCHEMA_NAMESPACE
+
+# components whose element declarations form a content model
+CONTENT_MODEL_TAGS = (
+    f"{LXML_SCHEMA_NAMESPACE}schema",
+    f"{LXML_SCHEMA_NAMESPACE}complexType",
+    f"{LXML_SCHEMA_NAMESPACE}group",
+)
+ELEMENT_TAG = f"{LXML_SCHEMA_NAMESPACE}element"
+
+
+def check_name(name):
+    """Check that a name can be the name of an element.
+
+    Args:
+        name:
+
+    Returns:
+
+    """
+    try:
+        # NCName: valid first and next characters
+        local_name = etree.QName(None, name).localname
+    except (TypeError, ValueError):
+        raise XMLError(f"{name} is not a valid element name.")
+    # no prefix, and no namespace in Clark notation ({namespace}name)
+    if ":" in name or local_name != name:
+        raise XMLError(f"{name} is not a valid element name.")
+    if name.lower().startswith("xml"):
+        raise XMLError(
+            f"{name} is not a valid element name: names starting with xml "
+            "are reserved."
+        )
+
+
+def get_content_model(element):
+    """Return the component whose content model declares an element.
+
+    Args:
+        element: element declaration
+
+    Returns:
+
+    """
+    parent = element.getparent()
+    while parent is not None and parent.tag not in CONTENT_MODEL_TAGS:
+        parent = parent.getparent()
+    return parent
+
+
+class ElementNameIndex:
+    """Index of the element declarations of content models, by name.
+
+    Content models are indexed when first checked.
+    """
+
+    def __init__(self):
+        """Initialize the index"""
+        self._content_models = {}
+
+    def get_elements(self, content_model, name):
+        """Return the element declarations of a content model with a name.
+
+        Args:
+            content_model:
+            name:
+
+        Returns:
+
+        """
+        return self._get_names(content_model).get(name, [])
+
+    def check_element(self, element, name=None):
+        """Check the name of an element declaration, and that it does not
+        collide with the names of its content model.
+
+        A global element can not have the name of another global element.
+        A local element can not have the name of an element of its content
+        model with another type.
+
+        Args:
+            element: element declaration
+            name: name to check, the name of the element if not given
+
+        Returns:
+
+        """
+        if name is None:
+            name = element.attrib.get("name", "")
+        check_name(name)
+
+        content_model = get_content_model(element)
+        if content_model is None:
+            return
+        is_global = content_model.tag == CONTENT_MODEL_TAGS[0]
+        type_name = element.attrib.get("type")
+        for other_element in self.get_elements(content_model, name):
+            if other_element is element:
+                continue
+            if is_global:
+                raise XMLError(
+                    f"A global element named {name} is already declared."
+                )
+            if other_element.attrib.get("type") != type_name:
+                raise XMLError(
+                    f"An element named {name} with another type is already "
+                    "declared."
+                )
+
+    def add(self, element):
+        """Add an element declaration to the index.
+
+        Args:
+            element:
+
+        Returns:
+
+        """
+        names = self._content_models.get(get_content_model(element))
+        if names is not None:
+            names.setdefault(element.attrib.get("name"), []).append(element)
+
+    def rename(self, element, name):
+        """Rename an element declaration, updating the index.
+
+        Args:
+            element:
+            name:
+
+        Returns:
+
+        """
+        names = self._content_models.get(get_content_model(element))
+        if names is not None:
+            elements = names.get(element.attrib.get("name"), [])
+            if element in elements:
+                elements.remove(element)
+            names.setdefault(name, []).append(element)
+        element.attrib["name"] = name
+
+    def remove(self, element):
+        """Remove an element declaration, and the declarations it contains,
+        from the index.
+
+        Args:
+            element:
+
+        Returns:
+
+        """
+        names = self._content_models.get(get_content_model(element))
+        if names is not None:
+            elements = names.get(element.attrib.get("name"), [])
+            if element in elements:
+                elements.remove(element)
+        # the content models declared inside the element are removed with it
+        for content_model in element.iter(*CONTENT_MODEL_TAGS):
+            self._content_models.pop(content_model, None)
+
+    def _get_names(self, content_model):
+        """Return the element declarations of a content model, by name.
+
+        Args:
+            content_model:
+
+        Returns:
+
+        """
+        names = self._content_models.get(content_model)
+        if names is None:
+            names = {}
+            for element in _iter_element_declarations(content_model):
+                names.setdefault(element.attrib.get("name"), []).append(
+                    element
+                )
+            self._content_models[content_model] = names
+        return names
+
+
+def _iter_element_declarations(content_model):
+    """Iterate over the element declarations of a content model, without
+    the declarations of the content models it contains.
+
+    Args:
+        content_model:
+
+    Returns:
+
+    """
+    children = list(content_model)
+    while children:
+        child = children.pop()
+        if not isinstance(child.tag, str):
+            # comments, processing instructions
+            continue
+        if child.tag == ELEMENT_TAG:
+            yield child
+        elif child.tag not in CONTENT_MODEL_TAGS:
+            children.extend(child)
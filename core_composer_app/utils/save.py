@@ -0,0 +1,175 @@
+"""Save utils for Composer app
+
+Save a composed schema as a new template or a new type, with the types it
+includes as dependencies. Used by the composer page and by the composition
+REST API.
+"""
+
+import logging
+from urllib.parse import urlparse
+
+from core_main_app.commons.exceptions import ApiError
+from core_main_app.components.template.models import Template
+from core_main_app.components.template_version_manager import (
+    api as template_version_manager_api,
+)
+from core_main_app.components.template_version_manager.models import (
+    TemplateVersionManager,
+)
+from core_main_app.utils.urls import get_template_download_pattern
+
+from core_composer_app.components.type import api as type_api
+from core_composer_app.components.type.models import Type
+from core_composer_app.components.type_version_manager import (
+    api as type_version_manager_api,
+)
+from core_composer_app.components.type_version_manager.models import (
+    TypeVersionManager,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def get_dependencies(list_dependencies, request):
+    """Return the types the user can read from a list of dependencies.
+
+    Args:
+        list_dependencies: locations of the dependencies
+        request:
+
+    Returns:
+
+    """
+    # declare list of type ids
+    object_ids = []
+    # get pattern to match a template download
+    pattern = get_template_download_pattern()
+    # get all type ids
+    for uri in list_dependencies:
+        # parse dependency url
+        url = urlparse(uri)
+        try:
+            # get object id from url, raises if not a valid id
+            object_id = pattern.match(url.path).group("pk")
+            object_ids.append(str(int(object_id)))
+        except Exception as exception:
+            # not a type url, don't add it to list of dependencies
+            logger.warning(
+                "get_dependencies threw an exception: %s", str(exception)
+            )
+
+    # get all types the user can read at once
+    types_by_id = {
+        str(type_object.pk): type_object
+        for type_object in type_api.get_all_accessible_by_id_list(
+            object_ids, request=request
+        )
+    }
+    dependencies = []
+    for object_id in object_ids:
+        if object_id not in types_by_id:
+            # id not found, don't add it to list of dependencies
+            logger.warning("get_dependencies: type %s not found", object_id)
+            continue
+        # add type to list of internal dependencies
+        dependencies.append(types_by_id[object_id])
+
+    return dependencies
+
+
+def check_can_save_as_type(template_id, request):
+    """Check that a schema can be saved as a type: the schema is new, or is
+    an existing type.
+
+    Args:
+        template_id: id of the edited schema, "new" for a new schema
+        request:
+
+    Returns:
+
+    """
+    if template_id == "new":
+        return
+    try:
+        # check if the type exists, raises exception otherwise
+        type_api.get(template_id, request=request)
+    except Exception as exception:
+        # the type does not exist
+        logger.warning(
+            "check_can_save_as_type threw an exception: %s", str(exception)
+        )
+        raise ApiError("Unable to save an existing template as a type.")
+
+
+def save_template(title, xsd_string, dependencies, request):
+    """Save a schema as a new template.
+
+    Args:
+        title:
+        xsd_string:
+        dependencies: types included by the schema
+        request:
+
+    Returns:
+        Template
+
+    """
+    # create template version manager
+    template_version_manager = TemplateVersionManager(
+        title=title, user=str(request.user.id)
+    )
+    # create template
+    template = Template(
+        filename=_get_filename(title),
+        content=xsd_string,
+        user=str(request.user.id),
+    )
+    # save template in database
+    template_version_manager_api.insert(
+        template_version_manager, template, request=request
+    )
+    template.dependencies.set(dependencies)
+    return template
+
+
+def save_type(title, xsd_string, dependencies, request):
+    """Save a schema as a new type.
+
+    Args:
+        title:
+        xsd_string:
+        dependencies: types included by the schema
+        request:
+
+    Returns:
+        Type
+
+    """
+    # create type version manager
+    type_version_manager = TypeVersionManager(
+        title=title, user=str(request.user.id)
+    )
+    # create type
+    type_object = Type(
+        filename=_get_filename(title),
+        content=xsd_string,
+        user=str(request.user.id),
+    )
+    # save type in database
+    type_version_manager_api.insert(
+        type_version_manager, type_object, request=request
+    )
+    type_object.dependencies.set(dependencies)
+    return type_object
+
+
+def _get_filename(title):
+    """Return the filename of a schema from its title.
+
+    Args:
+        title:
+
+    Returns:
+
+    """
+    return title if title.endswith(".xsd") else title + ".xsd"
@@ -0,0 +1,279 @@
+"""Storage utils for Composer app
+
+The compressed storage keeps template and type content compressed at rest.
+It is enabled at the project level by selecting it for the template model:
+
+    from core_composer_app.utils.storage import CompressedFileSystemStorage
+
+    CUSTOM_FILE_STORAGE = {"template": CompressedFileSystemStorage()}
+
+Files written before the storage was enabled are still read as-is, and can be
+converted with the `compress_template_content` management command. Compressed
+files are decompressed as they are read, so they can be streamed without
+being loaded in memory.
+"""
+
+import os
+import zlib
+
+from django.core.files.base import ContentFile, File
+from django.core.files.storage import FileSystemStorage
+from django.utils.deconstruct import deconstructible
+
+COMPRESSED_CONTENT_HEADER = b"CZLIB1\n"
+DEFAULT_COMPRESSION_LEVEL = 6
+# number of bytes read or decompressed at once
+READ_CHUNK_SIZE = 64 * 1024
+
+
+def is_compressed_content(content):
+    """Check if the content has been compressed by the storage.
+
+    Args:
+        content: bytes
+
+    Returns:
+
+    """
+    return content.startswith(COMPRESSED_CONTENT_HEADER)
+
+
+def compress_content(content, compression_level=DEFAULT_COMPRESSION_LEVEL):
+    """Compress content.
+
+    Args:
+        content: bytes
+        compression_level:
+
+    Returns:
+
+    """
+    return COMPRESSED_CONTENT_HEADER + zlib.compress(
+        content, compression_level
+    )
+
+
+def decompress_content(content):
+    """Decompress content, return content unchanged if not compressed.
+
+    Args:
+        content: bytes
+
+    Returns:
+
+    """
+    if not is_compressed_content(content):
+        return content
+    header_length = len(COMPRESSED_CONTENT_HEADER)
+    return zlib.decompress(content[header_length:])
+
+
+@deconstructible(
+    path="core_composer_app.utils.storage.CompressedFileSystemStorage"
+)
+class CompressedFileSystemStorage(FileSystemStorage):
+    """File system storage compressing files at rest"""
+
+    def __init__(self, compression_level=DEFAULT_COMPRESSION_LEVEL, **kwargs):
+        """Initialize the storage
+
+        Args:
+            compression_level: zlib compression level (0-9)
+            **kwargs: FileSystemStorage parameters
+        """
+        super().__init__(**kwargs)
+        self.compression_level = compression_level
+
+    def _open(self, name, mode="rb"):
+        """Open a file, decompressed as it is read if compressed.
+
+        Args:
+            name:
+            mode:
+
+        Returns:
+
+        """
+        stored_file = super()._open(name, "rb")
+        header = stored_file.read(len(COMPRESSED_CONTENT_HEADER))
+        if is_compressed_content(header):
+            return CompressedFile(stored_file, name=name)
+        stored_file.seek(0)
+        return stored_file
+
+    def _save(self, name, content):
+        """Compress and save a file.
+
+        Args:
+            name:
+            content:
+
+        Returns:
+
+        """
+        content.seek(0)
+        data = content.read()
+        if isinstance(data, str):
+            data = data.encode("utf-8")
+        return super()._save(
+            name,
+            ContentFile(compress_content(data, self.compression_level)),
+        )
+
+    def is_compressed(self, name):
+        """Check if a stored file is compressed.
+
+        Args:
+            name:
+
+        Returns:
+
+        """
+        with super()._open(name, "rb") as stored_file:
+            return is_compressed_content(
+                stored_file.read(len(COMPRESSED_CONTENT_HEADER))
+            )
+
+    def compress(self, name):
+        """Compress a stored file in place.
+
+        Args:
+            name:
+
+        Returns:
+            True if the file has been compressed, False if already compressed.
+
+        """
+        path = self.path(name)
+        with open(path, "rb") as stored_file:
+            content = stored_file.read()
+        if is_compressed_content(content):
+            return False
+
+        # write to a temporary file first so readers never see a partial file
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "wb") as tmp_file:
+            tmp_file.write(compress_content(content, self.compression_level))
+        os.replace(tmp_path, path)
+        return True
+
+
+class CompressedFile(File):
+    """Compressed stored file, decompressed as it is read.
+
+    Seeking backward restarts the decompression, seeking forward
+    decompresses and drops the skipped content. The size of the content is
+    computed on first use by decompressing the file without keeping it.
+    """
+
+    def __init__(self, file, name=None):
+        """Initialize the file
+
+        Args:
+            file: stored file, opened in binary mode
+            name:
+        """
+        super().__init__(file, name=name)
+        self._size = None
+        self._rewind()
+
+    @property
+    def size(self):
+        """Size of the decompressed content
+
+        Returns:
+
+        """
+        if self._size is None:
+            position = self.file.tell()
+            self.file.seek(len(COMPRESSED_CONTENT_HEADER))
+            decompressor = zlib.decompressobj()
+            size = 0
+            for data in iter(lambda: self.file.read(READ_CHUNK_SIZE), b""):
+                while data:
+                    size += len(decompressor.decompress(data, READ_CHUNK_SIZE))
+                    data = decompressor.unconsumed_tail
+            size += len(decompressor.flush())
+            self.file.seek(position)
+            self._size = size
+        return self._size
+
+    def read(self, size=-1):
+        """Read decompressed content.
+
+        Args:
+            size: number of bytes to read, all the remaining content if
+                negative or None
+
+        Returns:
+
+        """
+        remaining = size if size is not None and size >= 0 else None
+        chunks = []
+        while remaining is None or remaining > 0:
+            chunk = self._decompress(remaining or READ_CHUNK_SIZE)
+            if chunk is None:
+                break
+            chunks.append(chunk)
+            self._position += len(chunk)
+            if remaining is not None:
+                remaining -= len(chunk)
+        return b"".join(chunks)
+
+    def seek(self, offset, whence=os.SEEK_SET):
+        """Move to a position of the decompressed content.
+
+        Args:
+            offset:
+            whence:
+
+        Returns:
+
+        """
+        if whence == os.SEEK_CUR:
+            offset += self._position
+        elif whence == os.SEEK_END:
+            offset += self.size
+        if offset < 0:
+            raise ValueError("Negative seek position.")
+        if offset < self._position:
+            self._rewind()
+        while self._position < offset:
+            if not self.read(min(offset - self._position, READ_CHUNK_SIZE)):
+                break
+        return self._position
+
+    def tell(self):
+        """Return the position in the decompressed content.
+
+        Returns:
+
+        """
+        return self._position
+
+    def _rewind(self):
+        """Restart the decompression from the beginning of the file.
+
+        Returns:
+
+        """
+        self.file.seek(len(COMPRESSED_CONTENT_HEADER))
+        self._decompressor = zlib.decompressobj()
+        self._position = 0
+
+    def _decompress(self, max_length):
+        """Return at most max_length bytes of decompressed content, None at
+        the end of the content.
+
+        Args:
+            max_length:
+
+        Returns:
+
+        """
+        data = self._decompressor.unconsumed_tail
+        if not data:
+            data = self.file.read(READ_CHUNK_SIZE)
+        if data:
+            return self._decompressor.decompress(data, max_length)
+        return self._decompressor.flush() or None
@@ -0,0 +1,336 @@
+"""Validation utils
+
+Validating a pathological schema (deep include chain, huge content model)
+can take minutes. Schemas are validated in a pool of worker processes, with
+a time and memory budget for each validation: a validation exceeding its
+time budget, or canceled, is stopped by killing its worker, and the caller
+gets a result telling the validation did not complete instead of waiting
+for it.
+"""
+
+import logging
+import multiprocessing
+import threading
+import time
+from types import SimpleNamespace
+
+from core_main_app.utils.xml import validate_xml_schema
+from xml_utils.xsd_tree.xsd_tree import XSDTree
+
+from core_composer_app.settings import (
+    COMPOSER_VALIDATION_MEMORY_LIMIT,
+    COMPOSER_VALIDATION_PROCESSES,
+    COMPOSER_VALIDATION_TIMEOUT,
+)
+
+try:
+    import resource
+except ImportError:
+    # not available on Windows: validations are not limited in memory
+    resource = None
+
+logger = logging.getLogger(__name__)
+
+VALID = "valid"
+INVALID = "invalid"
+TIMED_OUT = "timed_out"
+FAILED = "failed"
+
+# seconds between two checks of the deadline and of the cancellation
+POLL_INTERVAL = 0.05
+
+
+class ValidationResult:
+    """Result of the validation of a schema"""
+
+    def __init__(self, status, error=None):
+        """Initialize the result
+
+        Args:
+            status: VALID, INVALID, TIMED_OUT or FAILED
+            error: validation error of an invalid schema, reason of the
+                failure otherwise
+        """
+        self.status = status
+        self.error = error
+
+    @property
+    def is_valid(self):
+        """Return True if the schema is valid.
+
+        Returns:
+
+        """
+        return self.status == VALID
+
+    @property
+    def is_complete(self):
+        """Return True if the validation ran to completion, False if it
+        timed out or failed.
+
+        Returns:
+
+        """
+        return self.status in (VALID, INVALID)
+
+
+def validate_schema(xsd_tree, request=None, timeout=None, check_canceled=None):
+    """Validate a schema, in the validation pool.
+
+    Args:
+        xsd_tree:
+        request: request, used to resolve the includes of the schema
+        timeout: seconds before the validation is stopped, defaults to
+            COMPOSER_VALIDATION_TIMEOUT (0: no timeout)
+        check_canceled: function raising an exception to stop validating
+
+    Returns:
+        ValidationResult
+
+    """
+    if timeout is None:
+        timeout = COMPOSER_VALIDATION_TIMEOUT
+    xsd_string = XSDTree.tostring(xsd_tree)
+    session_id = _get_session_id(request)
+    if COMPOSER_VALIDATION_PROCESSES <= 0:
+        return _validate(xsd_string, session_id)
+    return get_validation_pool().validate(
+        xsd_string, session_id, timeout, check_canceled
+    )
+
+
+class ValidationPool:
+    """Pool of validation worker processes"""
+
+    def __init__(self, processes, memory_limit):
+        """Initialize the pool, workers are started when needed.
+
+        Args:
+            processes: maximum number of workers
+            memory_limit: memory of a worker, in MiB (0: not limited)
+        """
+        self.memory_limit = memory_limit
+        self._semaphore = threading.BoundedSemaphore(processes)
+        self._idle_workers = []
+        self._lock = threading.Lock()
+
+    def validate(self, xsd_string, session_id, timeout, check_canceled=None):
+        """Validate a schema in a worker, waiting for a worker to be idle.
+
+        Args:
+            xsd_string:
+            session_id:
+            timeout:
+            check_canceled:
+
+        Returns:
+            ValidationResult
+
+        """
+        with self._semaphore:
+            worker = self._get_worker()
+            try:
+                result = worker.validate(
+                    xsd_string, session_id, timeout, check_canceled
+                )
+            except BaseException:
+                worker.stop()
+                raise
+            if worker.is_alive():
+                with self._lock:
+                    self._idle_workers.append(worker)
+            return result
+
+    def _get_worker(self):
+        """Return an idle worker, a new worker if none is running.
+
+        Returns:
+
+        """
+        with self._lock:
+            while self._idle_workers:
+                worker = self._idle_workers.pop()
+                if worker.is_alive():
+                    return worker
+                worker.stop()
+        return _ValidationWorker(self.memory_limit)
+
+    def close(self):
+        """Stop the idle workers.
+
+        Returns:
+
+        """
+        with self._lock:
+            workers, self._idle_workers = self._idle_workers, []
+        for worker in workers:
+            worker.stop()
+
+
+_validation_pool = None
+_validation_pool_lock = threading.Lock()
+
+
+def get_validation_pool():
+    """Return the validation pool of the process.
+
+    Returns:
+
+    """
+    global _validation_pool
+    with _validation_pool_lock:
+        if _validation_pool is None:
+            _validation_pool = ValidationPool(
+                COMPOSER_VALIDATION_PROCESSES, COMPOSER_VALIDATION_MEMORY_LIMIT
+            )
+    return _validation_pool
+
+
+class _ValidationWorker:
+    """Validation worker process"""
+
+    def __init__(self, memory_limit):
+        """Start the worker process.
+
+        Args:
+            memory_limit:
+        """
+        # forked, the worker does not need to set Django up again
+        context = multiprocessing.get_context("fork")
+        self._connection, worker_connection = context.Pipe()
+        self._process = context.Process(
+            target=_run_worker,
+            args=(worker_connection, self._connection, memory_limit),
+            daemon=True,
+        )
+        self._process.start()
+        worker_connection.close()
+
+    def validate(self, xsd_string, session_id, timeout, check_canceled=None):
+        """Validate a schema, stopping the worker if the validation times
+        out.
+
+        Args:
+            xsd_string:
+            session_id:
+            timeout:
+            check_canceled:
+
+        Returns:
+            ValidationResult
+
+        """
+        self._connection.send((xsd_string, session_id))
+        deadline = time.monotonic() + timeout if timeout else None
+        # the connection is readable when the result is sent, or when the
+        # worker ended
+        while not self._connection.poll(POLL_INTERVAL):
+            if check_canceled is not None:
+                check_canceled()
+            if deadline is not None and time.monotonic() > deadline:
+                self.stop()
+                logger.warning("Validation timed out after %s s.", timeout)
+                return ValidationResult(
+                    TIMED_OUT, f"Validation timed out after {timeout} seconds."
+                )
+        try:
+            status, error = self._connection.recv()
+        except EOFError:
+            self.stop()
+            logger.warning("Validation worker ended unexpectedly.")
+            return ValidationResult(
+                FAILED,
+                "Validation ended unexpectedly. The schema may be "
+                "too large to be validated.",
+            )
+        return ValidationResult(status, error)
+
+    def is_alive(self):
+        """Return True if the worker is running.
+
+        Returns:
+
+        """
+        return self._process.is_alive()
+
+    def stop(self):
+        """Stop the worker, interrupting the validation in progress.
+
+        Returns:
+
+        """
+        self._connection.close()
+        if self._process.is_alive():
+            self._process.kill()
+        self._process.join()
+
+
+def _run_worker(connection, parent_connection, memory_limit):
+    """Validate the schemas received, until the connection is closed.
+
+    Args:
+        connection:
+        parent_connection: end of the pool, inherited from the fork
+        memory_limit:
+
+    Returns:
+
+    """
+    parent_connection.close()
+    if memory_limit and resource is not None:
+        limit = memory_limit * 1024 * 1024
+        resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+    while True:
+        try:
+            xsd_string, session_id = connection.recv()
+        except EOFError:
+            return
+        try:
+            result = _validate(xsd_string, session_id)
+        except MemoryError:
+            result = ValidationResult(
+                FAILED, "Validation exceeded its memory budget."
+            )
+        connection.send((result.status, result.error))
+
+
+def _validate(xsd_string, session_id):
+    """Validate a schema.
+
+    Args:
+        xsd_string:
+        session_id: session used to resolve the includes of the schema
+
+    Returns:
+        ValidationResult
+
+    """
+    try:
+        # the resolver of the includes only needs the session
+        error = validate_xml_schema(
+            XSDTree.build_tree(xsd_string),
+            request=SimpleNamespace(
+                session=SimpleNamespace(session_key=session_id)
+            ),
+        )
+    except MemoryError:
+        raise
+    except Exception as exception:
+        error = str(exception)
+    return ValidationResult(VALID if error is None else INVALID, error)
+
+
+def _get_session_id(request):
+    """Return the session key of a request, None if not available.
+
+    Args:
+        request:
+
+    Returns:
+
+    """
+    session_key = getattr(
+        getattr(request, "session", None), "session_key", None
+    )
+    # sent to the worker process
+    return session_key if isinstance(session_key, str) else None
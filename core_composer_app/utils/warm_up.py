@@ -0,0 +1,215 @@
+"""Cache warm-up utils for Composer app
+
+Preload the artifacts computed on first use by the composer, so the first
+users after a deploy do not pay for them. The warm-up can run from the
+`warm_composer_cache` management command, or at worker start, e.g. from a
+gunicorn `post_fork` hook:
+
+    from core_composer_app.utils.warm_up import warm_up_cache
+
+    def post_fork(server, worker):
+        warm_up_cache(include_shared=False)
+
+The compiled XSLT and the catalog snapshot are kept in memory by each
+process, while validation results and flattened schemas are stored in the
+shared Django cache and only need to be computed once for all workers.
+"""
+
+import logging
+import time
+
+from django.db.models import Count
+
+from core_composer_app.components.catalog import api as catalog_api
+from core_composer_app.components.type.models import Type
+from core_composer_app.components.type.tasks import (
+    get_dependency_as_owner,
+    get_standalone_xsd,
+    get_validation_cache_key,
+    validate_schema_with_cache,
+)
+from core_composer_app.utils.flatten import get_flattened_xsd
+from core_composer_app.utils.xml import get_xsd_to_html_transform
+from core_main_app.components.data.models import Data
+from core_main_app.components.template.models import Template
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_LIMIT = 50
+
+
+def warm_up_cache(limit=DEFAULT_LIMIT, include_shared=True, on_phase=None):
+    """Preload the composer caches.
+
+    Args:
+        limit: number of most used types and templates to preload
+        include_shared: preload the shared cache (validation, flattening),
+            not only the caches of the process (XSLT, catalog)
+        on_phase: function called with the report of each phase once done
+
+    Returns:
+        list of phase reports: name, count, errors and duration (seconds).
+
+    """
+    phases = [("xslt", _warm_up_xslt), ("catalog", _warm_up_catalog)]
+    if include_shared:
+        phases += [
+            ("types", lambda: _warm_up_types(get_most_used_types(limit))),
+            (
+                "templates",
+                lambda: _warm_up_templates(get_most_used_templates(limit)),
+            ),
+        ]
+
+    reports = []
+    for name, warm_up in phases:
+        start = time.perf_counter()
+        count, errors = warm_up()
+        report = {
+            "name": name,
+            "count": count,
+            "errors": errors,
+            "duration": time.perf_counter() - start,
+        }
+        reports.append(report)
+        if on_phase is not None:
+            on_phase(report)
+    return reports
+
+
+def get_most_used_types(limit):
+    """Return the types included by the most templates and types.
+
+    Args:
+        limit:
+
+    Returns:
+
+    """
+    dependencies_model = Template.dependencies.through
+    type_ids = (
+        dependencies_model.objects.filter(to_template__type__isnull=False)
+        .values("to_template")
+        .annotate(count=Count("from_template"))
+        .order_by("-count", "to_template")
+        .values_list("to_template", flat=True)[:limit]
+    )
+    types_by_id = Type.objects.in_bulk(list(type_ids))
+    return [types_by_id[type_id] for type_id in type_ids]
+
+
+def get_most_used_templates(limit):
+    """Return the XSD templates with the most data.
+
+    Args:
+        limit:
+
+    Returns:
+
+    """
+    template_ids = (
+        Data.objects.filter(
+            template__type__isnull=True,
+            template__format=Template.XSD,
+        )
+        .values("template")
+        .annotate(count=Count("pk"))
+        .order_by("-count", "template")
+        .values_list("template", flat=True)[:limit]
+    )
+    templates_by_id = Template.objects.in_bulk(list(template_ids))
+    return [templates_by_id[template_id] for template_id in template_ids]
+
+
+def _warm_up_xslt():
+    """Compile the XSLT rendering schemas in the composer.
+
+    Returns:
+
+    """
+    get_xsd_to_html_transform()
+    return 1, 0
+
+
+def _warm_up_catalog():
+    """Build the catalog snapshot of the process.
+
+    Returns:
+
+    """
+    catalog = catalog_api.get_catalog()
+    return len(catalog.types_by_id), 0
+
+
+def _warm_up_types(types):
+    """Read and validate types.
+
+    Args:
+        types:
+
+    Returns:
+
+    """
+    return _warm_up_each(types, _validate)
+
+
+def _warm_up_templates(templates):
+    """Read, validate and flatten templates.
+
+    Args:
+        templates:
+
+    Returns:
+
+    """
+
+    def warm_up_template(template):
+        _validate(template)
+        # no request: the dependencies are read with the access of the owner
+        get_flattened_xsd(
+            template.content,
+            lambda template_id: get_dependency_as_owner(template, template_id),
+        )
+
+    return _warm_up_each(templates, warm_up_template)
+
+
+def _validate(template):
+    """Validate a template, caching the result as the revalidation of
+    dependents does.
+
+    Args:
+        template:
+
+    Returns:
+
+    """
+    validate_schema_with_cache(
+        get_standalone_xsd(template), get_validation_cache_key(template)
+    )
+
+
+def _warm_up_each(templates, warm_up):
+    """Warm up templates one by one, skipping the ones failing.
+
+    Args:
+        templates:
+        warm_up:
+
+    Returns:
+        number of templates warmed up, number of errors.
+
+    """
+    count = errors = 0
+    for template in templates:
+        try:
+            warm_up(template)
+            count += 1
+        except Exception as exception:
+            errors += 1
+            logger.warning(
+                "Unable to warm up template %s: %s",
+                template.pk,
+                str(exception),
+            )
+    return count, errors
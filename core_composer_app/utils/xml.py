@@ -1,18 +1,50 @@
 """XML utils for Composer app"""
 
+import hashlib
+from collections import Counter
+from functools import lru_cache
+from os.path import join
+
+from django.contrib.staticfiles import finders
+from lxml import etree
+
 from core_main_app.commons.exceptions import CoreError, XMLError
-from core_main_app.utils.xml import is_well_formed_xml, validate_xml_schema
+from core_main_app.utils.file import read_file_content
+from core_main_app.utils.xml import is_well_formed_xml
 
-from xml_utils.commons.constants import LXML_SCHEMA_NAMESPACE
+from xml_utils.commons.constants import (
+    LXML_SCHEMA_NAMESPACE,
+    SCHEMA_NAMESPACE,
+    XML_NAMESPACE,
+)
 from xml_utils.xsd_tree.operations.namespaces import (
-    get_namespaces,
     get_default_prefix,
     get_target_namespace,
 )
 from xml_utils.xsd_tree.xsd_tree import XSDTree
+from xml_utils.xsd_types.xsd_types import get_xsd_types
+
+from core_composer_app.utils.names import ElementNameIndex
+from core_composer_app.utils.namespaces import NamespaceRegistry
+from core_composer_app.utils.validation import validate_schema
 
 COMPLEX_TYPE = "complexType"
 SIMPLE_TYPE = "simpleType"
+# attributes of the schema components referencing types
+TYPE_REFERENCE_ATTRIBUTES = ("type", "base", "itemType", "memberTypes")
+# attributes of the schema components referencing other components
+COMPONENT_REFERENCE_ATTRIBUTES = (
+    "ref",
+    "substitutionGroup",
+    "refer",
+    "defaultAttributes",
+    "notQName",
+)
+# components that can be referenced by name from anywhere in the schema
+IDENTITY_CONSTRAINTS = ("key", "keyref", "unique")
+XSD_TO_HTML_XSLT_PATH = join(
+    "core_composer_app", "user", "xsl", "xsd2html.xsl"
+)
 
 
 def check_type_core_support(xsd_string):
@@ -70,6 +102,581 @@ def check_type_core_support(xsd_string):
     return type_definition
 
 
+def get_content_hash(xsd_string):
+    """Return a hash of the canonicalized xsd string.
+
+    Blank text and comments are ignored, so documents differing only by
+    whitespace or comments share the same hash.
+
+    Args:
+        xsd_string:
+
+    Returns:
+
+    """
+    parser = etree.XMLParser(remove_blank_text=True, remove_comments=True)
+    xsd_tree = XSDTree.build_tree(xsd_string, parser=parser)
+    canonical_content = etree.tostring(xsd_tree, method="c14n")
+    return hashlib.sha256(canonical_content).hexdigest()
+
+
+@lru_cache(maxsize=None)
+def get_xsd_to_html_transform():
+    """Return the XSLT rendering a schema in the composer, compiled once per
+    process.
+
+    Returns:
+
+    """
+    xslt_string = read_file_content(finders.find(XSD_TO_HTML_XSLT_PATH))
+    return XSDTree.transform_to_xslt(XSDTree.build_tree(xslt_string))
+
+
+def transform_xsd_to_html(xsd_tree):
+    """Render a schema in the composer.
+
+    Args:
+        xsd_tree:
+
+    Returns:
+
+    """
+    try:
+        return str(get_xsd_to_html_transform()(xsd_tree))
+    except Exception:
+        raise CoreError(
+            "An unexpected exception happened while transforming the XML"
+        )
+
+
+class ComposerDocument:
+    """Schema being composed, parsed once.
+
+    The document holds the tree of the schema with its namespaces, default
+    prefix and target namespace, so that composer operations can be chained
+    without parsing and serializing the schema between them. Operations
+    modify the tree in place, and the schema is only serialized by tostring.
+    """
+
+    def __init__(self, xsd_tree):
+        """Initialize the document
+
+        Args:
+            xsd_tree: tree of the schema
+        """
+        self.xsd_tree = xsd_tree
+        self.namespace_registry = NamespaceRegistry(xsd_tree)
+        self.name_index = ElementNameIndex()
+        self._update_namespaces()
+
+    @classmethod
+    def from_string(cls, xsd_string):
+        """Parse a schema.
+
+        Args:
+            xsd_string:
+
+        Returns:
+            ComposerDocument
+
+        """
+        return cls(XSDTree.build_tree(xsd_string))
+
+    def _update_namespaces(self):
+        """Compute the namespace context of the schema.
+
+        Returns:
+
+        """
+        self.namespaces = {
+            "xml": XML_NAMESPACE,
+            **self.namespace_registry.namespaces,
+        }
+        self.default_prefix = get_default_prefix(self.namespaces)
+        (
+            self.target_namespace,
+            self.target_namespace_prefix,
+        ) = get_target_namespace(self.xsd_tree, self.namespaces)
+
+    def tostring(self):
+        """Serialize the schema.
+
+        Returns:
+
+        """
+        return XSDTree.tostring(self.xsd_tree)
+
+    def validate(self, request=None):
+        """Validate the whole schema.
+
+        Args:
+            request:
+
+        Returns:
+            ValidationResult
+
+        """
+        return validate_schema(self.xsd_tree, request=request)
+
+    def find(self, xpath):
+        """Return the element at an xpath of the composer.
+
+        Args:
+            xpath: xpath using the default prefix of the schema
+
+        Returns:
+
+        """
+        return self.xsd_tree.find(
+            xpath.replace(self.default_prefix + ":", LXML_SCHEMA_NAMESPACE)
+        )
+
+    def remove_single_root_element(self):
+        """Remove the root element.
+
+        Returns:
+            removed element, None if there is no root element.
+
+        """
+        # find the root element
+        root = self.xsd_tree.find("{}element".format(LXML_SCHEMA_NAMESPACE))
+        if root is not None:
+            # remove root element from parent (schema)
+            self.name_index.remove(root)
+            root.getparent().remove(root)
+        return root
+
+    def rename_single_root_type(self, type_name):
+        """Rename the type of the single root element.
+
+        Args:
+            type_name:
+
+        Returns:
+
+        """
+        # change the root type name in the xsd tree
+        self.xsd_tree.find(LXML_SCHEMA_NAMESPACE + "element").attrib[
+            "type"
+        ] = type_name
+        self.xsd_tree.find(LXML_SCHEMA_NAMESPACE + "complexType").attrib[
+            "name"
+        ] = type_name
+
+    def delete_element(self, xpath):
+        """Delete element from tree.
+
+        Args:
+            xpath:
+
+        Returns:
+
+        """
+        # get element to remove from tree
+        element_to_remove = self.find(xpath)
+        # remove element from tree
+        self.name_index.remove(element_to_remove)
+        element_to_remove.getparent().remove(element_to_remove)
+
+    def change_element_type(self, xpath, type_name):
+        """Change the type of an element (e.g. sequence -> choice).
+
+        Args:
+            xpath:
+            type_name:
+
+        Returns:
+
+        """
+        self.find(xpath).tag = LXML_SCHEMA_NAMESPACE + type_name
+
+    def set_element_occurrences(self, xpath, min_occurs, max_occurs):
+        """Set occurrences of element.
+
+        Args:
+            xpath:
+            min_occurs:
+            max_occurs:
+
+        Returns:
+
+        """
+        element = self.find(xpath)
+        element.attrib["minOccurs"] = min_occurs
+        element.attrib["maxOccurs"] = max_occurs
+
+    def get_element_occurrences(self, xpath):
+        """Get the min and max occurrences of the element.
+
+        Args:
+            xpath:
+
+        Returns:
+
+        """
+        element = self.find(xpath)
+        return (
+            element.attrib.get("minOccurs", "1"),
+            element.attrib.get("maxOccurs", "1"),
+        )
+
+    def rename_element(self, xpath, new_name, check=False):
+        """Rename xsd element.
+
+        Args:
+            xpath:
+            new_name:
+            check: check the new name against the names of the content
+                model of the element, the element is not renamed if the
+                check fails
+
+        Returns:
+
+        """
+        element = self.find(xpath)
+        if check:
+            self.name_index.check_element(element, new_name)
+        self.name_index.rename(element, new_name)
+
+    def insert_element_built_in_type(self, xpath, element_type_name):
+        """Insert element with a builtin type.
+
+        Args:
+            xpath: xpath where to insert the element
+            element_type_name: name of the type to insert
+
+        Returns:
+            inserted element
+
+        """
+        type_name = self.default_prefix + ":" + element_type_name
+        element = XSDTree.create_element(
+            "{}element".format(LXML_SCHEMA_NAMESPACE),
+            attrib={"type": type_name, "name": element_type_name},
+        )
+        self.find(xpath).append(element)
+        self.name_index.add(element)
+        return element
+
+    def insert_element_type(
+        self, xpath, type_xsd_tree, element_type_name, include_url
+    ):
+        """Insert an element of given type, including the schema of the type.
+
+        Args:
+            xpath: xpath where to insert the element
+            type_xsd_tree: tree of the schema of the type to insert
+            element_type_name: name of the type
+            include_url: url used to reference the type in schemaLocation
+
+        Returns:
+            inserted element
+
+        """
+        target_namespace = self.target_namespace
+        target_namespace_prefix = self.target_namespace_prefix
+        # get target namespace information for the type
+        type_target_namespace, type_target_namespace_prefix = (
+            get_target_namespace(
+                type_xsd_tree, _get_tree_namespaces(type_xsd_tree)
+            )
+        )
+
+        # get the type from the included/imported file
+        # If there is a complex type
+        element_type = type_xsd_tree.find(
+            "{}complexType".format(LXML_SCHEMA_NAMESPACE)
+        )
+        if element_type is None:
+            # If there is a simple type
+            element_type = type_xsd_tree.find(
+                "{}simpleType".format(LXML_SCHEMA_NAMESPACE)
+            )
+        type_name = element_type.attrib["name"]
+
+        # format type name to avoid forbidden xml characters
+        element_type_name = _get_valid_xml_name(element_type_name)
+
+        # variable that indicates if namespaces map needs to be updated
+        update_ns_map = False
+
+        # Schema without target namespace
+        if target_namespace is None:
+            # Type without target namespace
+            if type_target_namespace is None:
+                # create type name with namespace
+                ns_type_name = type_name
+                # create include element
+                dependency_tag = "include"
+                dependency_attrib = {"schemaLocation": include_url}
+            # Type with target namespace
+            else:
+                # create type name with namespace
+                import_prefix = self.namespace_registry.allocate_prefix(
+                    type_target_namespace, type_target_namespace_prefix
+                )
+                ns_type_name = _get_ns_type_name(import_prefix, type_name)
+                # create import element
+                dependency_tag = "import"
+                dependency_attrib = {
+                    "schemaLocation": include_url,
+                    "namespace": type_target_namespace,
+                }
+                update_ns_map = True
+
+        # Schema with target namespace
+        else:
+            # Type without target namespace
+            if type_target_namespace is None:
+                # create type name with namespace
+                ns_type_name = _get_ns_type_name(
+                    target_namespace_prefix, type_name
+                )
+                # create include element
+                dependency_tag = "include"
+                dependency_attrib = {"schemaLocation": include_url}
+            # Type with target namespace
+            else:
+                # Same target namespace as base template
+                if target_namespace == type_target_namespace:
+                    # create type name with namespace
+                    ns_type_name = _get_ns_type_name(
+                        target_namespace_prefix, type_name
+                    )
+                    # create include element
+                    dependency_tag = "include"
+                    dependency_attrib = {"schemaLocation": include_url}
+                # Different target namespace as base template
+                else:
+                    # create type name with namespace
+                    import_prefix = self.namespace_registry.allocate_prefix(
+                        type_target_namespace, type_target_namespace_prefix
+                    )
+                    ns_type_name = _get_ns_type_name(import_prefix, type_name)
+                    # create import element
+                    dependency_tag = "import"
+                    dependency_attrib = {
+                        "schemaLocation": include_url,
+                        "namespace": type_target_namespace,
+                    }
+                    update_ns_map = True
+
+        # create dependency element
+        dependency_element = _create_xsd_element(
+            dependency_tag, dependency_attrib
+        )
+        # create xsd element
+        xsd_element = _create_xsd_element(
+            "element", attrib={"name": element_type_name, "type": ns_type_name}
+        )
+        # check if dependency element (include/import) is already present
+        dependency_tag = "{0}[@schemaLocation='{1}']".format(
+            dependency_element.tag,
+            dependency_element.attrib["schemaLocation"],
+        )
+        dependency_present = self.xsd_tree.find(dependency_tag) is not None
+
+        if not dependency_present:
+            # add dependency element (include/import)
+            self.xsd_tree.getroot().insert(0, dependency_element)
+
+        # add xsd element
+        self.find(xpath).append(xsd_element)
+        self.name_index.add(xsd_element)
+
+        # declare the namespace of the imported type, if not declared yet
+        if update_ns_map:
+            self.namespace_registry.declare(
+                import_prefix, type_target_namespace
+            )
+            self._update_namespaces()
+
+        return xsd_element
+
+    def get_dependency_references(self, included_type_names=None):
+        """Count the references to each dependency (include/import) added by
+        the composer.
+
+        Only the dependencies whose types are known, the ones added by the
+        composer, are counted: the other dependencies are always kept. A
+        reference to an imported schema is a reference to a component of its
+        namespace. A reference to an included schema is a reference to one
+        of its types, or to a component of the target namespace that is not
+        declared by the schema itself.
+
+        Args:
+            included_type_names: names of the types defined by the
+                dependencies, by location
+
+        Returns:
+            dict: number of references, by location of the dependency.
+
+        """
+        included_type_names = included_type_names or {}
+        type_references = Counter(
+            self._iter_references(TYPE_REFERENCE_ATTRIBUTES)
+        )
+        component_references = Counter(
+            self._iter_references(COMPONENT_REFERENCE_ATTRIBUTES)
+        )
+        declared_names = self._get_declared_names()
+        dependency_references = {}
+        for dependency in self._get_dependencies():
+            location = dependency.attrib.get("schemaLocation")
+            type_names = included_type_names.get(location)
+            if location is None or type_names is None:
+                continue
+            if dependency.tag == LXML_SCHEMA_NAMESPACE + "import":
+                namespace = dependency.attrib.get("namespace")
+                dependency_references[location] = sum(
+                    count
+                    for (reference_namespace, _), count in (
+                        type_references + component_references
+                    ).items()
+                    if reference_namespace == namespace
+                )
+            else:
+                dependency_references[location] = sum(
+                    count
+                    for (reference_namespace, type_name), count in (
+                        type_references.items()
+                    )
+                    if reference_namespace == self.target_namespace
+                    and type_name in type_names
+                ) + sum(
+                    count
+                    for (reference_namespace, name), count in (
+                        component_references.items()
+                    )
+                    if reference_namespace == self.target_namespace
+                    and name not in declared_names
+                )
+        return dependency_references
+
+    def remove_unused_dependencies(self, included_type_names=None):
+        """Remove the dependencies (include/import) added by the composer
+        that are no longer referenced, and the declarations of the
+        namespaces they imported.
+
+        Args:
+            included_type_names: names of the types defined by the
+                dependencies, by location
+
+        Returns:
+            list: locations of the removed dependencies.
+
+        """
+        unused_locations = [
+            location
+            for location, count in self.get_dependency_references(
+                included_type_names
+            ).items()
+            if count == 0
+        ]
+        removed_namespaces = set()
+        for dependency in self._get_dependencies():
+            if dependency.attrib.get("schemaLocation") in unused_locations:
+                if dependency.tag == LXML_SCHEMA_NAMESPACE + "import":
+                    removed_namespaces.add(dependency.attrib.get("namespace"))
+                dependency.getparent().remove(dependency)
+
+        # remove the declarations of the namespaces no longer imported
+        removed_namespaces -= {
+            dependency.attrib.get("namespace")
+            for dependency in self._get_dependencies()
+        }
+        # declarations used by the names of elements and attributes are
+        # kept by the registry
+        removed_namespaces -= {
+            namespace
+            for namespace, _ in self._iter_references(
+                TYPE_REFERENCE_ATTRIBUTES + COMPONENT_REFERENCE_ATTRIBUTES
+            )
+        }
+        if removed_namespaces:
+            for namespace in removed_namespaces:
+                self.namespace_registry.remove(namespace)
+            self._update_namespaces()
+
+        return unused_locations
+
+    def get_dependency_locations(self):
+        """Return the locations of the dependencies (include/import) of the
+        schema.
+
+        Returns:
+
+        """
+        return [
+            dependency.attrib["schemaLocation"]
+            for dependency in self._get_dependencies()
+            if "schemaLocation" in dependency.attrib
+        ]
+
+    def _get_dependencies(self):
+        """Return the include and import elements of the schema.
+
+        Returns:
+
+        """
+        return [
+            element
+            for element in self.xsd_tree.getroot()
+            if element.tag
+            in (
+                LXML_SCHEMA_NAMESPACE + "include",
+                LXML_SCHEMA_NAMESPACE + "import",
+            )
+        ]
+
+    def _get_declared_names(self):
+        """Return the names of the components declared by the schema that
+        can be referenced.
+
+        Returns:
+
+        """
+        root = self.xsd_tree.getroot()
+        declared_names = {
+            element.attrib["name"]
+            for element in root
+            if "name" in element.attrib
+        }
+        for constraint in IDENTITY_CONSTRAINTS:
+            declared_names.update(
+                element.attrib["name"]
+                for element in root.iter(LXML_SCHEMA_NAMESPACE + constraint)
+                if "name" in element.attrib
+            )
+        return declared_names
+
+    def _iter_references(self, attributes):
+        """Iterate over the components referenced by the schema.
+
+        Args:
+            attributes: names of the QName-valued attributes to read
+
+        Returns:
+            namespace and name of each reference.
+
+        """
+        for element in self.xsd_tree.getroot().iter(
+            LXML_SCHEMA_NAMESPACE + "*"
+        ):
+            for attribute in attributes:
+                for qname in element.attrib.get(attribute, "").split():
+                    if qname.startswith("##"):
+                        # keywords of notQName (##defined, ##definedSibling)
+                        continue
+                    prefix, _, local_name = qname.rpartition(":")
+                    namespace = (
+                        XML_NAMESPACE
+                        if prefix == "xml"
+                        else element.nsmap.get(prefix or None)
+                    )
+                    yield namespace, local_name
+
+
 def remove_single_root_element(xsd_string):
     """Remove root element from the xsd string.
 
@@ -79,17 +686,10 @@ def remove_single_root_element(xsd_string):
     Returns:
 
     """
-    # Build xsd tree
-    xsd_tree = XSDTree.build_tree(xsd_string)
-    # find the root element
-    root = xsd_tree.find("{}element".format(LXML_SCHEMA_NAMESPACE))
-    if root is not None:
-        # remove root element from parent (schema)
-        root.getparent().remove(root)
-        # convert the tree to back string
-        xsd_string = XSDTree.tostring(xsd_tree)
-    # return xsd string
-    return xsd_string
+    document = ComposerDocument.from_string(xsd_string)
+    if document.remove_single_root_element() is None:
+        return xsd_string
+    return document.tostring()
 
 
 def rename_single_root_type(xsd_string, type_name):
@@ -102,19 +702,9 @@ def rename_single_root_type(xsd_string, type_name):
     Returns:
 
     """
-    # build xsd tree
-    xsd_tree = XSDTree.build_tree(xsd_string)
-    # xpath to the single root element
-    xpath_root = LXML_SCHEMA_NAMESPACE + "element"
-    # xpath to the single root type
-    xpath_root_type = LXML_SCHEMA_NAMESPACE + "complexType"
-    # change the root type name in the xsd tree
-    xsd_tree.find(xpath_root).attrib["type"] = type_name
-    xsd_tree.find(xpath_root_type).attrib["name"] = type_name
-    # rebuild xsd string
-    xsd_string = XSDTree.tostring(xsd_tree)
-    # return xsd string
-    return xsd_string
+    document = ComposerDocument.from_string(xsd_string)
+    document.rename_single_root_type(type_name)
+    return document.tostring()
 
 
 def delete_xsd_element(xsd_string, xpath):
@@ -127,23 +717,9 @@ def delete_xsd_element(xsd_string, xpath):
     Returns:
 
     """
-    # build xsd tree
-    xsd_tree = XSDTree.build_tree(xsd_string)
-    # get xsd namespaces
-    namespaces = get_namespaces(xsd_string)
-    # get default prefix
-    default_prefix = get_default_prefix(namespaces)
-    # set the element namespace
-    xpath = xpath.replace(default_prefix + ":", LXML_SCHEMA_NAMESPACE)
-    # get element to remove from tree
-    element_to_remove = xsd_tree.find(xpath)
-    # remove element from tree
-    element_to_remove.getparent().remove(element_to_remove)
-
-    # rebuild xsd string
-    xsd_string = XSDTree.tostring(xsd_tree)
-    # return xsd string
-    return xsd_string
+    document = ComposerDocument.from_string(xsd_string)
+    document.delete_element(xpath)
+    return document.tostring()
 
 
 def change_xsd_element_type(xsd_string, xpath, type_name):
@@ -157,19 +733,9 @@ def change_xsd_element_type(xsd_string, xpath, type_name):
     Returns:
 
     """
-    xsd_tree = XSDTree.build_tree(xsd_string)
-    namespaces = get_namespaces(xsd_string)
-    default_prefix = get_default_prefix(namespaces)
-
-    # set the element namespace
-    xpath = xpath.replace(default_prefix + ":", LXML_SCHEMA_NAMESPACE)
-    xsd_tree.find(xpath).tag = LXML_SCHEMA_NAMESPACE + type_name
-
-    # rebuild xsd string
-    xsd_string = XSDTree.tostring(xsd_tree)
-
-    # return xsd string
-    return xsd_string
+    document = ComposerDocument.from_string(xsd_string)
+    document.change_element_type(xpath, type_name)
+    return document.tostring()
 
 
 def set_xsd_element_occurrences(xsd_string, xpath, min_occurs, max_occurs):
@@ -184,91 +750,89 @@ def set_xsd_element_occurrences(xsd_string, xpath, min_occurs, max_occurs):
     Returns:
 
     """
-    # build xsd tree
-    xsd_tree = XSDTree.build_tree(xsd_string)
-    # get namespaces
-    namespaces = get_namespaces(xsd_string)
-    # get default prefix
-    default_prefix = get_default_prefix(namespaces)
+    document = ComposerDocument.from_string(xsd_string)
+    document.set_element_occurrences(xpath, min_occurs, max_occurs)
+    return document.tostring()
 
-    # set the element namespace
-    xpath = xpath.replace(default_prefix + ":", LXML_SCHEMA_NAMESPACE)
-    # add the element to the sequence
-    element = xsd_tree.find(xpath)
-    element.attrib["minOccurs"] = min_occurs
-    element.attrib["maxOccurs"] = max_occurs
 
-    # save the tree in the session
-    xsd_string = XSDTree.tostring(xsd_tree)
+def get_xsd_element_occurrences(xsd_string, xpath):
+    """Get the min and max occurrences of the element.
 
-    # return xsd string
-    return xsd_string
+    Args:
+        xsd_string:
+        xpath:
 
+    Returns:
 
-def get_xsd_element_occurrences(xsd_string, xpath):
-    """Get the min and max occurrences of the element.
+    """
+    return ComposerDocument.from_string(xsd_string).get_element_occurrences(
+        xpath
+    )
+
+
+def delete_xsd_element_and_dependencies(
+    xsd_string, xpath, included_type_names=None
+):
+    """Delete element from tree, and the dependencies (include/import) it
+    was the last to reference.
 
     Args:
         xsd_string:
         xpath:
+        included_type_names: names of the types defined by the
+            dependencies, by location
 
     Returns:
+        xsd string, locations of the removed dependencies.
 
     """
-    # build the xsd tree
-    xsd_tree = XSDTree.build_tree(xsd_string)
-    # get the namespaces
-    namespaces = get_namespaces(xsd_string)
-    # get the default prefix
-    default_prefix = get_default_prefix(namespaces)
-
-    # set the element namespace
-    xpath = xpath.replace(default_prefix + ":", LXML_SCHEMA_NAMESPACE)
-    # add the element to the sequence
-    element = xsd_tree.find(xpath)
-
-    if "minOccurs" in element.attrib:
-        min_occurs = element.attrib["minOccurs"]
-    else:
-        min_occurs = "1"
-    if "maxOccurs" in element.attrib:
-        max_occurs = element.attrib["maxOccurs"]
-    else:
-        max_occurs = "1"
+    document = ComposerDocument.from_string(xsd_string)
+    document.delete_element(xpath)
+    removed_locations = document.remove_unused_dependencies(
+        included_type_names
+    )
+    return document.tostring(), removed_locations
 
-    return min_occurs, max_occurs
 
+def get_type_names(type_content):
+    """Return the names of the types defined by a schema.
+
+    Args:
+        type_content:
+
+    Returns:
 
-def rename_xsd_element(xsd_string, xpath, new_name):
+    """
+    return [
+        element.attrib["name"]
+        for element in XSDTree.build_tree(type_content).getroot()
+        if element.tag
+        in (
+            LXML_SCHEMA_NAMESPACE + COMPLEX_TYPE,
+            LXML_SCHEMA_NAMESPACE + SIMPLE_TYPE,
+        )
+        and "name" in element.attrib
+    ]
+
+
+def rename_xsd_element(xsd_string, xpath, new_name, check=False):
     """Rename xsd element.
 
     Args:
         xsd_string:
         xpath:
         new_name:
+        check: check the new name against the names of the content model
+            of the element
 
     Returns:
 
     """
-    # build the xsd tree
-    xsd_tree = XSDTree.build_tree(xsd_string)
-    # get the namespaces
-    namespaces = get_namespaces(xsd_string)
-    # get the default prefix
-    default_prefix = get_default_prefix(namespaces)
-
-    # set the element namespace
-    xpath = xpath.replace(default_prefix + ":", LXML_SCHEMA_NAMESPACE)
-    # rename element
-    xsd_tree.find(xpath).attrib["name"] = new_name
+    document = ComposerDocument.from_string(xsd_string)
+    document.rename_element(xpath, new_name, check=check)
+    return document.tostring()
 
-    # rebuild xsd string
-    xsd_string = XSDTree.tostring(xsd_tree)
-    # return xsd string
-    return xsd_string
 
-
-# TODO: refactor more
 def _insert_element_type(
     xsd_string, xpath, type_content, element_type_name, include_url
 ):
@@ -284,155 +848,24 @@ def _insert_element_type(
     Returns:
 
     """
-    # build the dom tree of the schema being built
-    xsd_tree = XSDTree.build_tree(xsd_string)
-    # get namespaces information for the schema
-    namespaces = get_namespaces(xsd_string)
-    # get the default namespace
-    default_prefix = get_default_prefix(namespaces)
-    # get target namespace information
-    target_namespace, target_namespace_prefix = get_target_namespace(
-        xsd_tree, namespaces
-    )
-    # build xpath to element
-    xpath = xpath.replace(default_prefix + ":", LXML_SCHEMA_NAMESPACE)
-    # build xsd tree
-    type_xsd_tree = XSDTree.build_tree(type_content)
-    # get namespaces information for the type
-    type_namespaces = get_namespaces(type_content)
-    # get target namespace information
-    type_target_namespace, type_target_namespace_prefix = get_target_namespace(
-        type_xsd_tree, type_namespaces
+    document = ComposerDocument.from_string(xsd_string)
+    document.insert_element_type(
+        xpath,
+        XSDTree.build_tree(type_content),
+        element_type_name,
+        include_url,
     )
-
-    # get the type from the included/imported file
-    # If there is a complex type
-    element_type = type_xsd_tree.find(
-        "{}complexType".format(LXML_SCHEMA_NAMESPACE)
-    )
-    if element_type is None:
-        # If there is a simple type
-        element_type = type_xsd_tree.find(
-            "{}simpleType".format(LXML_SCHEMA_NAMESPACE)
-        )
-    type_name = element_type.attrib["name"]
-
-    # format type name to avoid forbidden xml characters
-    element_type_name = _get_valid_xml_name(element_type_name)
-
-    # variable that indicates if namespaces map needs to be updated
-    update_ns_map = False
-
-    # Schema without target namespace
-    if target_namespace is None:
-        # Type without target namespace
-        if type_target_namespace is None:
-            # create type name with namespace
-            ns_type_name = type_name
-            # create include element
-            dependency_tag = "include"
-            dependency_attrib = {"schemaLocation": include_url}
-        # Type with target namespace
-        else:
-            # create type name with namespace
-            ns_type_name = _get_ns_type_name(
-                type_target_namespace_prefix, type_name, prefix_required=True
-            )
-            # create import element
-            dependency_tag = "import"
-            dependency_attrib = {
-                "schemaLocation": include_url,
-                "namespace": type_target_namespace,
-            }
-            update_ns_map = True
-
-    # Schema with target namespace
-    else:
-        # Type without target namespace
-        if type_target_namespace is None:
-            # create type name with namespace
-            ns_type_name = _get_ns_type_name(
-                target_namespace_prefix, type_name
-            )
-            # create include element
-            dependency_tag = "include"
-            dependency_attrib = {"schemaLocation": include_url}
-        # Type with target namespace
-        else:
-            # Same target namespace as base template
-            if target_namespace == type_target_namespace:
-                # create type name with namespace
-                ns_type_name = _get_ns_type_name(
-                    target_namespace_prefix, type_name
-                )
-                # create include element
-                dependency_tag = "include"
-                dependency_attrib = {"schemaLocation": include_url}
-            # Different target namespace as base template
-            else:
-                # create type name with namespace
-                ns_type_name = _get_ns_type_name(
-                    type_target_namespace_prefix,
-                    type_name,
-                    prefix_required=True,
-                )
-                # create import element
-                dependency_tag = "import"
-                dependency_attrib = {
-                    "schemaLocation": include_url,
-                    "namespace": type_target_namespace,
-                }
-                update_ns_map = True
-
-    # create dependency element
-    dependency_element = _create_xsd_element(dependency_tag, dependency_attrib)
-    # create xsd element
-    xsd_element = _create_xsd_element(
-        "element", attrib={"name": element_type_name, "type": ns_type_name}
-    )
-    # check if dependency element (include/import) is already present
-    dependency_tag = "{0}[@schemaLocation='{1}']".format(
-        dependency_element.tag, dependency_element.attrib["schemaLocation"]
-    )
-    dependency_present = xsd_tree.find(dependency_tag) is not None
-
-    if not dependency_present:
-        # add dependency element (include/import)
-        xsd_tree.getroot().insert(0, dependency_element)
-
-    # add xsd element
-    xsd_tree.find(xpath).append(xsd_element)
-
-    # if namespace map of the schema needs to be updated
-    if not dependency_present and update_ns_map:
-        root = xsd_tree.getroot()
-        root_ns_map = root.nsmap
-
-        if (
-            type_target_namespace_prefix in list(root_ns_map.keys())
-            and root_ns_map[type_target_namespace_prefix]
-            != type_target_namespace
-        ):
-            raise CoreError(
-                "The namespace prefix is already declared for a different namespace."
-            )
-        else:
-            root_ns_map[type_target_namespace_prefix] = type_target_namespace
-            new_root = XSDTree.create_element(
-                root.tag, nsmap=root_ns_map, attrib=root.attrib
-            )
-            new_root[:] = root[:]
-
-            # return result tree
-            return new_root
-
-    else:
-        # return result tree
-        return xsd_tree
+    return document.xsd_tree
 
 
 def insert_element_type(
-    xsd_string, xpath, type_content, element_type_name, include_url, request
+    xsd_string,
+    xpath,
+    type_content,
+    element_type_name,
+    include_url,
+    request,
+    validate=True,
 ):
     """Insert an element of given type in xsd string, and validates result.
 
@@ -443,27 +876,25 @@ def insert_element_type(
         element_type_name: name of the type
         include_url: url used to reference the type in schemaLocation
         request: request
+        validate: validate the whole schema, only run the local checks of
+            the inserted element otherwise
 
     Returns:
 
     """
-
-    new_xsd_tree = _insert_element_type(
-        xsd_string, xpath, type_content, element_type_name, include_url
+    document = ComposerDocument.from_string(xsd_string)
+    type_xsd_tree = XSDTree.build_tree(type_content)
+    element = document.insert_element_type(
+        xpath, type_xsd_tree, element_type_name, include_url
     )
-    error = validate_xml_schema(new_xsd_tree, request=request)
-
-    # if errors, raise exception
-    if error is not None:
-        raise XMLError(error)
-
-    new_xsd_string = XSDTree.tostring(new_xsd_tree)
-
-    return new_xsd_string
+    _check_edit(
+        document, element, request, validate, type_trees=[type_xsd_tree]
+    )
+    return document.tostring()
 
 
 def insert_element_built_in_type(
-    xsd_string, xpath, element_type_name, request
+    xsd_string, xpath, element_type_name, request, validate=True
 ):
     """Insert element with a builtin type in xsd string.
 
@@ -472,34 +903,87 @@ def insert_element_built_in_type(
         xpath: xpath where to insert the element
         element_type_name: name of the type to insert
         request: request
+        validate: validate the whole schema, only run the local checks of
+            the inserted element otherwise
 
     Returns:
 
     """
-    # build the dom tree of the schema being built
-    xsd_tree = XSDTree.build_tree(xsd_string)
-    # get namespaces information for the schema
-    namespaces = get_namespaces(xsd_string)
-    # get the default namespace
-    default_prefix = get_default_prefix(namespaces)
-    # build xpath to element
-    xpath = xpath.replace(default_prefix + ":", LXML_SCHEMA_NAMESPACE)
-
-    type_name = default_prefix + ":" + element_type_name
-    xsd_tree.find(xpath).append(
-        XSDTree.create_element(
-            "{}element".format(LXML_SCHEMA_NAMESPACE),
-            attrib={"type": type_name, "name": element_type_name},
+    document = ComposerDocument.from_string(xsd_string)
+    element = document.insert_element_built_in_type(xpath, element_type_name)
+    _check_edit(document, element, request, validate, type_trees=[])
+    return document.tostring()
+
+
+def _check_edit(document, element, request, validate, type_trees):
+    """Validate the schema after an edit, or only run the local checks of the
+    edited element.
+
+    Args:
+        document: edited ComposerDocument
+        element: edited element
+        request:
+        validate: validate the whole schema
+        type_trees: trees of the schemas included by the schema
+
+    Returns:
+
+    """
+    if validate:
+        result = document.validate(request=request)
+
+        # if errors, raise exception
+        if not result.is_valid:
+            raise XMLError(result.error)
+    else:
+        check_xsd_element(
+            element, type_trees=type_trees, name_index=document.name_index
         )
-    )
-    # validate XML schema
-    error = validate_xml_schema(xsd_tree, request=request)
 
-    # if errors, raise exception
-    if error is not None:
-        raise XMLError(error)
 
-    return XSDTree.tostring(xsd_tree)
+def check_xsd_element(element, type_trees=None, name_index=None):
+    """Run local checks on an element declaration of a schema, a cheap
+    alternative to validating the whole schema after an edit.
+
+    Checks that the name of the element is valid and does not collide with
+    the names of its content model and, if type_trees is given, that the
+    type of the element is a built-in type, or is defined in the schema or
+    in one of type_trees.
+
+    Args:
+        element: element declaration
+        type_trees: trees of the schemas included by the schema
+        name_index: ElementNameIndex of the schema, if already built
+
+    Returns:
+
+    """
+    if name_index is None:
+        name_index = ElementNameIndex()
+    name_index.check_element(element)
+
+    type_name = element.attrib.get("type")
+    if type_trees is None or type_name is None:
+        return
+    prefix, _, local_name = type_name.rpartition(":")
+    namespace = element.nsmap.get(prefix or None)
+    if prefix and namespace is None:
+        raise XMLError(f"The prefix of type {type_name} is not declared.")
+    if namespace == SCHEMA_NAMESPACE:
+        is_defined = local_name in get_xsd_types()
+    else:
+        type_paths = [
+            f"{LXML_SCHEMA_NAMESPACE}{tag}[@name='{local_name}']"
+            for tag in (COMPLEX_TYPE, SIMPLE_TYPE)
+        ]
+        schemas = [element.getroottree()] + list(type_trees)
+        is_defined = any(
+            schema.find(type_path) is not None
+            for schema in schemas
+            for type_path in type_paths
+        )
+    if not is_defined:
+        raise XMLError(f"Type {type_name} is not defined.")
 
 
 def _get_ns_type_name(prefix, type_name, prefix_required=False):
@@ -575,3 +1059,20 @@ def _create_xsd_element(tag, attrib):
     )
 
     return xsd_element
+
+
+def _get_tree_namespaces(xsd_tree):
+    """Return the prefixes and namespaces declared by the root of a tree,
+    as get_namespaces returns them from a string.
+
+    Args:
+        xsd_tree:
+
+    Returns:
+
+    """
+    namespaces = {"xml": XML_NAMESPACE}
+    for prefix, namespace in xsd_tree.getroot().nsmap.items():
+        if prefix and namespace:
+            namespaces[prefix] = namespace
+    return namespaces
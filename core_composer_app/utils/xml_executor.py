@@ -0,0 +1,71 @@
+"""XML executor utils
+
+XML processing (parsing, transformation and validation of schemas) is CPU
+bound and blocks the thread running it. Async views run it in a thread pool
+of bounded size, shared by the process, so the event loop keeps serving
+other requests while it runs. lxml releases the GIL during most of its
+work, so the threads of the pool run in parallel.
+"""
+
+import asyncio
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from django.db import close_old_connections
+
+from core_composer_app.settings import COMPOSER_XML_MAX_WORKERS
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def get_executor():
+    """Return the XML executor of the process.
+
+    Returns:
+
+    """
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=COMPOSER_XML_MAX_WORKERS,
+                thread_name_prefix="composer-xml",
+            )
+    return _executor
+
+
+async def run_xml_task(func, *args, **kwargs):
+    """Run a function of the XML executor and wait for its result.
+
+    Args:
+        func:
+        *args:
+        **kwargs:
+
+    Returns:
+
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        get_executor(), functools.partial(_run_task, func, args, kwargs)
+    )
+
+
+def _run_task(func, args, kwargs):
+    """Run a function in a thread of the executor.
+
+    Args:
+        func:
+        args:
+        kwargs:
+
+    Returns:
+
+    """
+    try:
+        return func(*args, **kwargs)
+    finally:
+        # the function may have used the database (e.g. resolving includes)
+        close_old_connections()
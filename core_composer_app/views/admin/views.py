@@ -4,6 +4,7 @@ import logging
 
 from django.conf import settings
 from django.contrib.admin.views.decorators import staff_member_required
+from django.core.paginator import Paginator
 from django.http.response import HttpResponseRedirect
 from django.shortcuts import redirect
 from django.template import loader
@@ -31,6 +32,7 @@ from core_composer_app.components.type_version_manager import (
 from core_composer_app.components.type_version_manager.models import (
     TypeVersionManager,
 )
+from core_composer_app.settings import COMPOSER_ADMIN_RESULTS_PER_PAGE
 from core_composer_app.views.admin.ajax import EditBucketView
 from core_composer_app.views.admin.forms import (
     BucketForm,
@@ -38,9 +40,16 @@ from core_composer_app.views.admin.forms import (
     EditTypeBucketsForm,
 )
 from core_composer_app.views.user.ajax import EditTypeVersionManagerView
+from core_composer_app.views.user.views import (
+    get_context_type_version_diff,
+    set_versions_dependents_count,
+)
 
 logger = logging.getLogger(__name__)
 
+TYPES_SORT_FIELDS = ("title", "-title")
+BUCKETS_SORT_FIELDS = ("label", "-label", "types_count", "-types_count")
+
 
 @staff_member_required
 def manage_types(request):
@@ -52,23 +61,29 @@ def manage_types(request):
     Returns:
 
     """
-    # get all types
-    type_version_managers = (
-        type_version_manager_api.get_global_version_managers(request=request)
-    )
+    search, sort = _get_search_parameters(request, TYPES_SORT_FIELDS)
 
     context = {
         "object_name": "Type",
-        "available": [
-            type_version_manager
-            for type_version_manager in type_version_managers
-            if not type_version_manager.is_disabled
-        ],
-        "disabled": [
-            type_version_manager
-            for type_version_manager in type_version_managers
-            if type_version_manager.is_disabled
-        ],
+        "search": search,
+        "sort": sort,
+        "sort_query_string": _get_query_string(
+            request, "sort", "page", "disabled_page"
+        ),
+        "available": _paginate(
+            request,
+            type_version_manager_api.search_global_version_managers(
+                request=request, search=search, order_by=sort
+            ),
+            "page",
+        ),
+        "disabled": _paginate(
+            request,
+            type_version_manager_api.search_global_version_managers(
+                request=request, is_disabled=True, search=search, order_by=sort
+            ),
+            "disabled_page",
+        ),
     }
 
     assets = {
@@ -117,6 +132,8 @@ def manage_type_versions(request, version_manager_id):
             version_manager_id, request=request
         )
         context = get_context_manage_template_versions(version_manager, "Type")
+        # impact of disabling a version
+        set_versions_dependents_count(context, request=request)
 
         # updating context regarding the installed apps
         # default back_url initialization
@@ -165,6 +182,35 @@ def manage_type_versions(request, version_manager_id):
         )
 
 
+@staff_member_required
+def type_version_diff(request, version_id, other_version_id):
+    """View that shows the changes between two type versions.
+
+    Args:
+        request:
+        version_id:
+        other_version_id:
+
+    Returns:
+
+    """
+    try:
+        context = get_context_type_version_diff(
+            version_id, other_version_id, request=request
+        )
+        return admin_render(
+            request,
+            "core_composer_app/admin/types/diff.html",
+            context=context,
+        )
+    except Exception as exception:
+        return admin_render(
+            request,
+            "core_main_app/common/commons/error.html",
+            context={"error": str(exception)},
+        )
+
+
 @staff_member_required
 def upload_type(request):
     """Upload type.
@@ -294,6 +340,59 @@ def _handle_xsd_errors(
     return _upload_type_response(request, assets, context)
 
 
+def _get_search_parameters(request, sort_fields):
+    """Return the search and the sort of an admin list.
+
+    Args:
+        request:
+        sort_fields: allowed sorts, the first one is the default
+
+    Returns:
+
+    """
+    search = request.GET.get("search", "").strip()
+    sort = request.GET.get("sort", "")
+    if sort not in sort_fields:
+        sort = sort_fields[0]
+    return search, sort
+
+
+def _paginate(request, queryset, page_parameter):
+    """Return a page of an admin list, and what is needed to link to other
+    pages.
+
+    Args:
+        request:
+        queryset:
+        page_parameter: name of the query parameter holding the page number
+
+    Returns:
+
+    """
+    paginator = Paginator(queryset, COMPOSER_ADMIN_RESULTS_PER_PAGE)
+    return {
+        "page": paginator.get_page(request.GET.get(page_parameter)),
+        "page_parameter": page_parameter,
+        "query_string": _get_query_string(request, page_parameter),
+    }
+
+
+def _get_query_string(request, *excluded_parameters):
+    """Return the query string of the request without some parameters.
+
+    Args:
+        request:
+        *excluded_parameters:
+
+    Returns:
+
+    """
+    query = request.GET.copy()
+    for parameter in excluded_parameters:
+        query.pop(parameter, None)
+    return query.urlencode()
+
+
 def _get_dependency_resolver_html(
     imports, includes, xsd_data, filename, request
 ):
@@ -470,7 +569,19 @@ def manage_buckets(request):
 
     """
 
-    context = {"object_name": "Bucket", "buckets": bucket_api.get_all()}
+    search, sort = _get_search_parameters(request, BUCKETS_SORT_FIELDS)
+
+    context = {
+        "object_name": "Bucket",
+        "search": search,
+        "sort": sort,
+        "sort_query_string": _get_query_string(request, "sort", "page"),
+        "buckets": _paginate(
+            request,
+            bucket_api.search(search=search, order_by=sort),
+            "page",
+        ),
+    }
 
     assets = {
         "js": [
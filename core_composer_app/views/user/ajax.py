@@ -1,8 +1,6 @@
 """AJAX user views of composer application"""
 
 import json
-import logging
-from urllib.parse import urlparse
 
 from django.contrib import messages
 from django.contrib.auth.decorators import login_required
@@ -13,32 +11,25 @@ from django.utils.html import escape
 from django.core.exceptions import ValidationError
 
 from core_main_app.commons import exceptions
-from core_main_app.components.template.models import Template
-from core_main_app.components.template_version_manager import (
-    api as template_version_manager_api,
-)
-from core_main_app.components.template_version_manager.models import (
-    TemplateVersionManager,
-)
 from core_main_app.utils import decorators as decorators
 from core_main_app.utils import xml as main_xml_utils
-from core_main_app.utils.urls import get_template_download_pattern
 from core_main_app.views.common.ajax import EditTemplateVersionManagerView
 from xml_utils.xsd_tree.xsd_tree import XSDTree
 
 from core_composer_app.components.type import api as type_api
-from core_composer_app.components.type.models import Type
-from core_composer_app.components.type_version_manager import (
-    api as type_version_manager_api,
-)
 from core_composer_app.components.type_version_manager.models import (
     TypeVersionManager,
 )
 from core_composer_app.permissions import rights
+from core_composer_app.settings import (
+    COMPOSER_DEFERRED_VALIDATION,
+    COMPOSER_STATELESS,
+)
+from core_composer_app.utils import composer_state
+from core_composer_app.utils import save as save_utils
+from core_composer_app.utils import validation as validation_utils
 from core_composer_app.utils import xml as composer_xml_utils
 
-logger = logging.getLogger(__name__)
-
 
 @decorators.permission_required(
     content_type=rights.COMPOSER_CONTENT_TYPE,
@@ -61,34 +52,42 @@ def insert_element_sequence(request):
         namespace = request.POST["namespace"]
         path = request.POST["path"]
 
-        # get link to the type to include
-        xsd_string = request.session["newXmlTemplateCompose"]
-
-        if type_id == "built_in_type":
-            # insert built-in type into xsd string
-            new_xsd_str = composer_xml_utils.insert_element_built_in_type(
-                xsd_string, xpath, type_name, request=request
-            )
-        else:
-            # get type from database
-            type_object = type_api.get(type_id, request=request)
-            # generate include url
-            include_url = main_xml_utils._get_schema_location_uri(str(type_id))
-            # insert element in xsd string
-            new_xsd_str = composer_xml_utils.insert_element_type(
-                xsd_string,
-                xpath,
-                type_object.content,
-                type_name,
-                include_url,
-                request=request,
-            )
-            # add the id of the type if not already present
-            if include_url not in request.session["includedTypesCompose"]:
-                request.session["includedTypesCompose"].append(include_url)
+        with composer_state.edit_composer_state(request) as state:
+            if type_id == "built_in_type":
+                # insert built-in type into xsd string
+                new_xsd_str = composer_xml_utils.insert_element_built_in_type(
+                    state.xsd_string,
+                    xpath,
+                    type_name,
+                    request=request,
+                    validate=not COMPOSER_DEFERRED_VALIDATION,
+                )
+            else:
+                # get type from database
+                type_object = type_api.get(type_id, request=request)
+                # generate include url
+                include_url = main_xml_utils._get_schema_location_uri(
+                    str(type_id)
+                )
+                # insert element in xsd string
+                new_xsd_str = composer_xml_utils.insert_element_type(
+                    state.xsd_string,
+                    xpath,
+                    type_object.content,
+                    type_name,
+                    include_url,
+                    request=request,
+                    validate=not COMPOSER_DEFERRED_VALIDATION,
+                )
+                # add the id of the type if not already present, with the
+                # types it defines to track their references
+                state.add_included_type(
+                    include_url,
+                    composer_xml_utils.get_type_names(type_object.content),
+                )
 
-        # save the tree in the session
-        request.session["newXmlTemplateCompose"] = new_xsd_str
+            # save the tree in the session
+            state.xsd_string = new_xsd_str
 
         template = loader.get_template(
             "core_composer_app/user/builder/new_element.html"
@@ -100,9 +99,13 @@ def insert_element_sequence(request):
         }
         new_element_html = template.render(context)
         return HttpResponse(
-            json.dumps({"new_element": new_element_html}),
+            json.dumps(
+                {"new_element": new_element_html, **_get_state_dict(state)}
+            ),
             content_type="application/json",
         )
+    except composer_state.RevisionConflictError as exception:
+        return _conflict_response(exception)
     except Exception as exception:
         return HttpResponseBadRequest(
             escape(str(exception)), content_type="application/javascript"
@@ -126,18 +129,16 @@ def change_xsd_type(request):
     try:
         xpath = request.POST["xpath"]
         new_type = request.POST["newType"]
-        xsd_string = request.session["newXmlTemplateCompose"]
 
-        # change type
-        xsd_string = composer_xml_utils.change_xsd_element_type(
-            xsd_string, xpath, new_type
-        )
+        with composer_state.edit_composer_state(request) as state:
+            # change type
+            state.xsd_string = composer_xml_utils.change_xsd_element_type(
+                state.xsd_string, xpath, new_type
+            )
 
-        # save the tree in the session
-        request.session["newXmlTemplateCompose"] = xsd_string
-        return HttpResponse(
-            json.dumps({}), content_type="application/javascript"
-        )
+        return _state_response(state)
+    except composer_state.RevisionConflictError as exception:
+        return _conflict_response(exception)
     except Exception as exception:
         return HttpResponseBadRequest(
             escape(str(exception)), content_type="application/javascript"
@@ -160,17 +161,16 @@ def change_root_type_name(request):
     """
     try:
         type_name = request.POST["typeName"]
-        xsd_string = request.session["newXmlTemplateCompose"]
 
-        # rename root type
-        xsd_string = composer_xml_utils.rename_single_root_type(
-            xsd_string, type_name
-        )
+        with composer_state.edit_composer_state(request) as state:
+            # rename root type
+            state.xsd_string = composer_xml_utils.rename_single_root_type(
+                state.xsd_string, type_name
+            )
 
-        request.session["newXmlTemplateCompose"] = xsd_string
-        return HttpResponse(
-            json.dumps({}), content_type="application/javascript"
-        )
+        return _state_response(state)
+    except composer_state.RevisionConflictError as exception:
+        return _conflict_response(exception)
     except Exception as exception:
         return HttpResponseBadRequest(
             escape(str(exception)), content_type="application/javascript"
@@ -194,27 +194,24 @@ def rename_element(request):
     try:
         xpath = request.POST["xpath"]
         new_name = request.POST["newName"]
-        xsd_string = request.session["newXmlTemplateCompose"]
-
-        # rename element
-        xsd_string = composer_xml_utils.rename_xsd_element(
-            xsd_string, xpath, new_name
-        )
-
-        # build xsd tree
-        xsd_tree = XSDTree.build_tree(xsd_string)
-        # validate the schema
-        error = main_xml_utils.validate_xml_schema(xsd_tree, request=request)
-
-        if error is not None:
-            return _error_response("This is not a valid name.")
 
-        # save the tree in the session
-        request.session["newXmlTemplateCompose"] = xsd_string
-
-        return HttpResponse(
-            json.dumps({}), content_type="application/javascript"
-        )
+        with composer_state.edit_composer_state(request) as state:
+            document = composer_xml_utils.ComposerDocument.from_string(
+                state.xsd_string
+            )
+            try:
+                # rename element, checking the new name against the names of
+                # its content model: the schema is validated when saved
+                document.rename_element(xpath, new_name, check=True)
+            except exceptions.XMLError as exception:
+                return _error_response(escape(str(exception)))
+
+            # save the tree in the session
+            state.xsd_string = document.tostring()
+
+        return _state_response(state)
+    except composer_state.RevisionConflictError as exception:
+        return _conflict_response(exception)
     except Exception as exception:
         return HttpResponseBadRequest(
             escape(str(exception)), content_type="application/javascript"
@@ -237,17 +234,21 @@ def delete_element(request):
     """
     try:
         xpath = request.POST["xpath"]
-        xsd_string = request.session["newXmlTemplateCompose"]
-
-        # delete element from string
-        xsd_string = composer_xml_utils.delete_xsd_element(xsd_string, xpath)
 
-        # save the tree in the session
-        request.session["newXmlTemplateCompose"] = xsd_string
+        with composer_state.edit_composer_state(request) as state:
+            # delete element from string, with the dependencies it was the
+            # last to reference
+            (
+                state.xsd_string,
+                removed_types,
+            ) = composer_xml_utils.delete_xsd_element_and_dependencies(
+                state.xsd_string, xpath, state.included_type_names
+            )
+            state.remove_included_types(removed_types)
 
-        return HttpResponse(
-            json.dumps({}), content_type="application/javascript"
-        )
+        return _state_response(state)
+    except composer_state.RevisionConflictError as exception:
+        return _conflict_response(exception)
     except Exception as exception:
         return HttpResponseBadRequest(
             escape(str(exception)), content_type="application/javascript"
@@ -270,7 +271,7 @@ def get_element_occurrences(request):
     """
     try:
         xpath = request.POST["xpath"]
-        xsd_string = request.session["newXmlTemplateCompose"]
+        xsd_string = composer_state.get_composer_state(request).xsd_string
 
         # get occurrences of xsd element
         (
@@ -306,17 +307,52 @@ def set_element_occurrences(request):
         xpath = request.POST["xpath"]
         min_occurs = request.POST["minOccurs"]
         max_occurs = request.POST["maxOccurs"]
-        xsd_string = request.session["newXmlTemplateCompose"]
 
-        # set element occurrences
-        xsd_string = composer_xml_utils.set_xsd_element_occurrences(
-            xsd_string, xpath, min_occurs, max_occurs
+        with composer_state.edit_composer_state(request) as state:
+            # set element occurrences
+            state.xsd_string = composer_xml_utils.set_xsd_element_occurrences(
+                state.xsd_string, xpath, min_occurs, max_occurs
+            )
+
+        return _state_response(state)
+    except composer_state.RevisionConflictError as exception:
+        return _conflict_response(exception)
+    except Exception as exception:
+        return HttpResponseBadRequest(
+            escape(str(exception)), content_type="application/javascript"
+        )
+
+
+@decorators.permission_required(
+    content_type=rights.COMPOSER_CONTENT_TYPE,
+    permission=rights.COMPOSER_ACCESS,
+    raise_exception=True,
+)
+def validate_template(request):
+    """Validate the whole schema being composed.
+
+    Args:
+        request:
+
+    Returns:
+
+    """
+    try:
+        state = composer_state.get_composer_state(request)
+        revision = state.revision
+
+        # validate the schema
+        result = validation_utils.validate_schema(
+            XSDTree.build_tree(state.xsd_string), request=request
         )
+        if not result.is_valid:
+            return _validation_error_response(result)
 
-        # save the tree in the session
-        request.session["newXmlTemplateCompose"] = xsd_string
+        # not validated if the schema was edited during the validation
+        is_validated = composer_state.set_validated(request, revision, state)
         return HttpResponse(
-            json.dumps({}), content_type="application/javascript"
+            json.dumps({**_get_state_dict(state), "validated": is_validated}),
+            content_type="application/json",
         )
     except Exception as exception:
         return HttpResponseBadRequest(
@@ -340,7 +376,8 @@ def save_template(request):
     """
     try:
         template_name = request.POST["templateName"]
-        xsd_string = request.session["newXmlTemplateCompose"]
+        state = composer_state.get_composer_state(request)
+        xsd_string = state.xsd_string
 
         response_dict = {}
 
@@ -349,44 +386,27 @@ def save_template(request):
             xsd_tree = XSDTree.build_tree(xsd_string)
 
             # validate the schema
-            error = main_xml_utils.validate_xml_schema(
+            result = validation_utils.validate_schema(
                 xsd_tree, request=request
             )
 
-            if error is not None:
-                return _error_response(
-                    "This is not a valid XML schema. " + error
-                )
+            if not result.is_valid:
+                return _validation_error_response(result)
         except Exception as exception:
             return _error_response(
                 "This is not a valid XML schema. " + escape(str(exception))
             )
 
         # get list of dependencies
-        dependencies = _get_dependencies_ids(
-            request.session["includedTypesCompose"], request=request
+        dependencies = save_utils.get_dependencies(
+            state.included_types, request=request
         )
 
         try:
-            # create template version manager
-            template_version_manager = TemplateVersionManager(
-                title=template_name, user=str(request.user.id)
-            )
-            # create template
-            template = Template(
-                filename=(
-                    template_name + ".xsd"
-                    if not template_name.endswith(".xsd")
-                    else template_name
-                ),
-                content=xsd_string,
-                user=str(request.user.id),
-            )
             # save template in database
-            template_version_manager_api.insert(
-                template_version_manager, template, request=request
+            save_utils.save_template(
+                template_name, xsd_string, dependencies, request
             )
-            template.dependencies.set(dependencies)
         except exceptions.NotUniqueError:
             return HttpResponseBadRequest(
                 "A template with the same name already exists. Please choose another name."
@@ -425,23 +445,16 @@ def save_type(request):
     try:
         type_name = request.POST["typeName"]
         template_id = request.POST["templateID"]
-        xsd_string = request.session["newXmlTemplateCompose"]
+        state = composer_state.get_composer_state(request)
+        xsd_string = state.xsd_string
 
         response_dict = {}
 
         # can save as type if new type or from existing type
-        if template_id != "new":
-            try:
-                # check if the type exists, raises exception otherwise
-                type_api.get(template_id, request=request)
-            except Exception as exception:
-                # the type does not exist
-                logger.warning(
-                    "save_type threw an exception: %s", str(exception)
-                )
-                return _error_response(
-                    "Unable to save an existing template as a type."
-                )
+        try:
+            save_utils.check_can_save_as_type(template_id, request)
+        except exceptions.ApiError as exception:
+            return _error_response(str(exception))
 
         try:
             # remove root from tree if present
@@ -451,43 +464,24 @@ def save_type(request):
             # build xsd tree
             xsd_tree = XSDTree.build_tree(xsd_string)
             # validate the schema
-            error = main_xml_utils.validate_xml_schema(
+            result = validation_utils.validate_schema(
                 xsd_tree, request=request
             )
 
-            if error is not None:
-                return _error_response(
-                    "This is not a valid XML schema. " + error
-                )
+            if not result.is_valid:
+                return _validation_error_response(result)
         except Exception as exception:
             return _error_response(
                 "This is not a valid XML schema. " + str(exception)
             )
 
-        dependencies = _get_dependencies_ids(
-            request.session["includedTypesCompose"], request=request
+        dependencies = save_utils.get_dependencies(
+            state.included_types, request=request
         )
 
         try:
-            # create type version manager
-            type_version_manager = TypeVersionManager(
-                title=type_name, user=str(request.user.id)
-            )
-            # create type
-            type_object = Type(
-                filename=(
-                    type_name + ".xsd"
-                    if not type_name.endswith(".xsd")
-                    else type_name
-                ),
-                content=xsd_string,
-                user=str(request.user.id),
-            )
             # save type in database
-            type_version_manager_api.insert(
-                type_version_manager, type_object, request=request
-            )
-            type_object.dependencies.set(dependencies)
+            save_utils.save_type(type_name, xsd_string, dependencies, request)
         except exceptions.NotUniqueError:
             return HttpResponseBadRequest(
                 "A type with the same name already exists. Please choose another name."
@@ -509,37 +503,71 @@ def save_type(request):
         )
 
 
-def _get_dependencies_ids(list_dependencies, request):
-    """Return list of type ids from list of dependencies.
+def _state_response(state):
+    """Return HttpResponse containing the revision of the composer state.
 
     Args:
-        list_dependencies:
+        state:
 
     Returns:
 
     """
-    # declare list of dependencies
-    dependencies = []
-    # get pattern to match a template download
-    pattern = get_template_download_pattern()
-    # get all type ids
-    for uri in list_dependencies:
-        # parse dependency url
-        url = urlparse(uri)
-        try:
-            # get object id from url
-            object_id = pattern.match(url.path).group("pk")
-            # get type by id, exception raised if not found
-            type_object = type_api.get(object_id, request=request)
-            # add id to list of internal dependencies
-            dependencies.append(type_object)
-        except Exception as exception:
-            # id not found, don't add it to list of dependencies
-            logger.warning(
-                "_get_dependencies_ids threw an exception: %s", str(exception)
-            )
+    return HttpResponse(
+        json.dumps(_get_state_dict(state)),
+        content_type="application/javascript",
+    )
+
 
-    return dependencies
+def _get_state_dict(state):
+    """Return the revision of the composer state, with the token of the state
+    when the composer is stateless.
+
+    Args:
+        state:
+
+    Returns:
+
+    """
+    state_dict = {"revision": state.revision}
+    if COMPOSER_STATELESS:
+        # no token: the state is stored in the session
+        state_dict["state"] = state.token
+    return state_dict
+
+
+def _conflict_response(exception):
+    """Return HttpResponse rejecting an edit of the composer state.
+
+    Args:
+        exception:
+
+    Returns:
+
+    """
+    return HttpResponse(
+        json.dumps(
+            {"message": exception.message, "revision": exception.revision}
+        ),
+        content_type="application/json",
+        status=409,
+    )
+
+
+def _validation_error_response(result):
+    """Return HttpResponse containing the error of a validation.
+
+    Args:
+        result: ValidationResult
+
+    Returns:
+
+    """
+    if result.is_complete:
+        return _error_response(
+            "This is not a valid XML schema. " + result.error
+        )
+    # timed out or failed: the schema may still be valid
+    return _error_response(result.error)
 
 
 def _error_response(error):
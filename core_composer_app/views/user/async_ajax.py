@@ -0,0 +1,329 @@
+"""Async AJAX user views of composer application
+
+Async variants of the composer edit views of `views.user.ajax`, served
+instead of them when COMPOSER_ASYNC_VIEWS is set, for deployments running
+under ASGI. The session, the cache and the database are accessed with their
+async APIs, and the XML processing runs in the XML executor, so a worker
+keeps serving other editors while schemas are processed.
+"""
+
+import json
+
+from django.http.response import HttpResponse, HttpResponseBadRequest
+from django.template import loader
+from django.utils.html import escape
+
+from core_main_app.commons.exceptions import XMLError
+from core_main_app.utils import xml as main_xml_utils
+
+from core_composer_app.components.type import api as type_api
+from core_composer_app.permissions import rights
+from core_composer_app.settings import COMPOSER_DEFERRED_VALIDATION
+from core_composer_app.utils import composer_state
+from core_composer_app.utils import xml as composer_xml_utils
+from core_composer_app.utils.decorators import async_permission_required
+from core_composer_app.utils.xml_executor import run_xml_task
+from core_composer_app.views.user.ajax import (
+    _conflict_response,
+    _error_response,
+    _get_state_dict,
+    _state_response,
+)
+
+
+@async_permission_required(
+    content_type=rights.COMPOSER_CONTENT_TYPE,
+    permission=rights.COMPOSER_ACCESS,
+    raise_exception=True,
+)
+async def insert_element_sequence(request):
+    """Insert the type in the original schema.
+
+    Args:
+        request:
+
+    Returns:
+
+    """
+    try:
+        type_id = request.POST["typeID"]
+        type_name = request.POST["typeName"]
+        xpath = request.POST["xpath"]
+        namespace = request.POST["namespace"]
+        path = request.POST["path"]
+
+        async with composer_state.aedit_composer_state(request) as state:
+            if type_id == "built_in_type":
+                # insert built-in type into xsd string
+                new_xsd_str = await run_xml_task(
+                    composer_xml_utils.insert_element_built_in_type,
+                    state.xsd_string,
+                    xpath,
+                    type_name,
+                    request=request,
+                    validate=not COMPOSER_DEFERRED_VALIDATION,
+                )
+            else:
+                # get type from database
+                type_object = await type_api.aget(type_id, request=request)
+                # generate include url
+                include_url = main_xml_utils._get_schema_location_uri(
+                    str(type_id)
+                )
+                # insert element in xsd string
+                new_xsd_str = await run_xml_task(
+                    composer_xml_utils.insert_element_type,
+                    state.xsd_string,
+                    xpath,
+                    type_object.content,
+                    type_name,
+                    include_url,
+                    request=request,
+                    validate=not COMPOSER_DEFERRED_VALIDATION,
+                )
+                # add the id of the type if not already present, with the
+                # types it defines to track their references
+                state.add_included_type(
+                    include_url,
+                    await run_xml_task(
+                        composer_xml_utils.get_type_names,
+                        type_object.content,
+                    ),
+                )
+
+            # save the tree in the session
+            state.xsd_string = new_xsd_str
+
+        template = loader.get_template(
+            "core_composer_app/user/builder/new_element.html"
+        )
+        context = {
+            "namespace": namespace,
+            "path": path,
+            "type_name": type_name,
+        }
+        new_element_html = template.render(context)
+        return HttpResponse(
+            json.dumps(
+                {"new_element": new_element_html, **_get_state_dict(state)}
+            ),
+            content_type="application/json",
+        )
+    except composer_state.RevisionConflictError as exception:
+        return _conflict_response(exception)
+    except Exception as exception:
+        return HttpResponseBadRequest(
+            escape(str(exception)), content_type="application/javascript"
+        )
+
+
+@async_permission_required(
+    content_type=rights.COMPOSER_CONTENT_TYPE,
+    permission=rights.COMPOSER_ACCESS,
+    raise_exception=True,
+)
+async def change_xsd_type(request):
+    """Change the type of the element.
+
+    Args:
+        request:
+
+    Returns:
+
+    """
+    return await _edit_xsd_string(
+        request,
+        composer_xml_utils.change_xsd_element_type,
+        "xpath",
+        "newType",
+    )
+
+
+@async_permission_required(
+    content_type=rights.COMPOSER_CONTENT_TYPE,
+    permission=rights.COMPOSER_ACCESS,
+    raise_exception=True,
+)
+async def change_root_type_name(request):
+    """Change the name of the root type.
+
+    Args:
+        request:
+
+    Returns:
+
+    """
+    return await _edit_xsd_string(
+        request, composer_xml_utils.rename_single_root_type, "typeName"
+    )
+
+
+@async_permission_required(
+    content_type=rights.COMPOSER_CONTENT_TYPE,
+    permission=rights.COMPOSER_ACCESS,
+    raise_exception=True,
+)
+async def rename_element(request):
+    """Replace the current name of the element by the new name.
+
+    Args:
+        request:
+
+    Returns:
+
+    """
+    try:
+        xpath = request.POST["xpath"]
+        new_name = request.POST["newName"]
+
+        async with composer_state.aedit_composer_state(request) as state:
+            try:
+                # rename element, checking the new name against the names of
+                # its content model: the schema is validated when saved
+                xsd_string = await run_xml_task(
+                    composer_xml_utils.rename_xsd_element,
+                    state.xsd_string,
+                    xpath,
+                    new_name,
+                    check=True,
+                )
+            except XMLError as exception:
+                return _error_response(escape(str(exception)))
+
+            # save the tree in the session
+            state.xsd_string = xsd_string
+
+        return _state_response(state)
+    except composer_state.RevisionConflictError as exception:
+        return _conflict_response(exception)
+    except Exception as exception:
+        return HttpResponseBadRequest(
+            escape(str(exception)), content_type="application/javascript"
+        )
+
+
+@async_permission_required(
+    content_type=rights.COMPOSER_CONTENT_TYPE,
+    permission=rights.COMPOSER_ACCESS,
+    raise_exception=True,
+)
+async def delete_element(request):
+    """Delete an element from the xsd string.
+
+    Args:
+        request:
+
+    Returns:
+
+    """
+    try:
+        xpath = request.POST["xpath"]
+
+        async with composer_state.aedit_composer_state(request) as state:
+            # delete element from string, with the dependencies it was the
+            # last to reference
+            (
+                state.xsd_string,
+                removed_types,
+            ) = await run_xml_task(
+                composer_xml_utils.delete_xsd_element_and_dependencies,
+                state.xsd_string,
+                xpath,
+                state.included_type_names,
+            )
+            state.remove_included_types(removed_types)
+
+        return _state_response(state)
+    except composer_state.RevisionConflictError as exception:
+        return _conflict_response(exception)
+    except Exception as exception:
+        return HttpResponseBadRequest(
+            escape(str(exception)), content_type="application/javascript"
+        )
+
+
+@async_permission_required(
+    content_type=rights.COMPOSER_CONTENT_TYPE,
+    permission=rights.COMPOSER_ACCESS,
+    raise_exception=True,
+)
+async def get_element_occurrences(request):
+    """Get the occurrences of the selected element.
+
+    Args:
+        request:
+
+    Returns:
+
+    """
+    try:
+        xpath = request.POST["xpath"]
+        state = await composer_state.aget_composer_state(request)
+
+        # get occurrences of xsd element
+        min_occurs, max_occurs = await run_xml_task(
+            composer_xml_utils.get_xsd_element_occurrences,
+            state.xsd_string,
+            xpath,
+        )
+
+        response_dict = {"minOccurs": min_occurs, "maxOccurs": max_occurs}
+        return HttpResponse(
+            json.dumps(response_dict), content_type="application/javascript"
+        )
+    except Exception as exception:
+        return HttpResponseBadRequest(
+            escape(str(exception)), content_type="application/javascript"
+        )
+
+
+@async_permission_required(
+    content_type=rights.COMPOSER_CONTENT_TYPE,
+    permission=rights.COMPOSER_ACCESS,
+    raise_exception=True,
+)
+async def set_element_occurrences(request):
+    """Set the occurrences of the selected element.
+
+    Args:
+        request:
+
+    Returns:
+
+    """
+    return await _edit_xsd_string(
+        request,
+        composer_xml_utils.set_xsd_element_occurrences,
+        "xpath",
+        "minOccurs",
+        "maxOccurs",
+    )
+
+
+async def _edit_xsd_string(request, edit, *parameters):
+    """Edit the schema of the composer state.
+
+    Args:
+        request:
+        edit: function returning the edited schema, from the schema and the
+            values of the parameters
+        *parameters: names of the POST parameters passed to the function
+
+    Returns:
+
+    """
+    try:
+        values = [request.POST[parameter] for parameter in parameters]
+
+        async with composer_state.aedit_composer_state(request) as state:
+            state.xsd_string = await run_xml_task(
+                edit, state.xsd_string, *values
+            )
+
+        return _state_response(state)
+    except composer_state.RevisionConflictError as exception:
+        return _conflict_response(exception)
+    except Exception as exception:
+        return HttpResponseBadRequest(
+            escape(str(exception)), content_type="application/javascript"
+        )
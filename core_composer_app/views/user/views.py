@@ -5,12 +5,24 @@ from os.path import join
 from django.conf import settings
 from django.contrib.auth.decorators import login_required
 from django.contrib.staticfiles import finders
+from django.http import StreamingHttpResponse
 
-from core_composer_app.components.bucket import api as bucket_api
+from core_composer_app.components.catalog import api as catalog_api
+from core_composer_app.components.type import api as type_api
 from core_composer_app.components.type_version_manager import (
     api as type_version_manager_api,
 )
 from core_composer_app.permissions import rights
+from core_composer_app.settings import (
+    COMPOSER_DEFERRED_VALIDATION,
+    COMPOSER_STATELESS,
+)
+from core_composer_app.utils import composer_state
+from core_composer_app.utils import validation as validation_utils
+from core_composer_app.utils.bundle import get_bundle_files, stream_zip
+from core_composer_app.utils.flatten import get_flattened_xsd
+from core_composer_app.utils.diff import has_changes
+from core_composer_app.utils.xml import transform_xsd_to_html
 from core_main_app.components.template import api as template_api
 from core_main_app.components.template.models import Template
 from core_main_app.components.template_version_manager import (
@@ -19,7 +31,6 @@ from core_main_app.components.template_version_manager import (
 from core_main_app.utils import decorators as decorators
 from core_main_app.utils.file import read_file_content, get_file_http_response
 from core_main_app.utils.rendering import render
-from core_main_app.utils.xml import xsl_transform
 from core_main_app.views.user.views import get_context_manage_template_versions
 from xml_utils.commons.constants import LXML_SCHEMA_NAMESPACE
 from xml_utils.xsd_tree.operations.annotation import remove_annotations
@@ -120,57 +131,54 @@ def build_template(request, template_id):
             )
         xsd_string = template.content
 
-    request.session["newXmlTemplateCompose"] = xsd_string
-    request.session["includedTypesCompose"] = []
-
     # store the current includes/imports
+    included_types = []
     xsd_tree = XSDTree.build_tree(xsd_string)
     includes = xsd_tree.findall(f"{LXML_SCHEMA_NAMESPACE}include")
     for el_include in includes:
         if "schemaLocation" in el_include.attrib:
-            request.session["includedTypesCompose"].append(
-                el_include.attrib["schemaLocation"]
-            )
+            included_types.append(el_include.attrib["schemaLocation"])
     imports = xsd_tree.findall(f"{LXML_SCHEMA_NAMESPACE}import")
     for el_import in imports:
         if "schemaLocation" in el_import.attrib:
-            request.session["includedTypesCompose"].append(
-                el_import.attrib["schemaLocation"]
-            )
+            included_types.append(el_import.attrib["schemaLocation"])
+
+    state_token = None
+    if COMPOSER_STATELESS:
+        # the state is carried by the page, unless too large
+        state = composer_state.init_state_token(
+            request, xsd_string, included_types
+        )
+        revision, state_token = state.revision, state.token
+    if state_token is None:
+        revision = composer_state.init_composer_state(
+            request, xsd_string, included_types
+        )
 
     # remove annotations from the tree
     remove_annotations(xsd_tree)
-    xsd_string = XSDTree.tostring(xsd_tree)
-
-    # loads XSLT
-    xslt_path = finders.find(
-        join("core_composer_app", "user", "xsl", "xsd2html.xsl")
-    )
-    # reads XSLT
-    xslt_string = read_file_content(xslt_path)
     # transform XML to HTML
-    xsd_to_html_string = xsl_transform(xsd_string, xslt_string)
+    xsd_to_html_string = transform_xsd_to_html(xsd_tree)
 
     # 1) Get user defined types.
     user_types = type_version_manager_api.get_version_managers_by_user(
         request=request
     ).filter(is_disabled=False)
 
-    # 2) Get buckets.
+    # 2) Get buckets, from the catalog snapshot.
+    catalog = catalog_api.get_catalog()
     buckets = [
         {
             "label": bucket.label,
             "color": bucket.color,
-            "types": bucket.types.filter(is_disabled=False),
+            "types": catalog.get_active_types(bucket.types),
         }
-        for bucket in bucket_api.get_all()
+        for bucket in catalog.buckets
     ]
 
     # 3) no_buckets_types: list of types that are not assigned to a specific
     #   bucket.
-    no_buckets_types = type_version_manager_api.get_no_buckets_types(
-        request=request
-    ).filter(is_disabled=False)
+    no_buckets_types = catalog.get_active_types(catalog.get_no_buckets_types())
 
     # 4) Build list of built-in types
     built_in_types = [
@@ -207,6 +215,10 @@ def build_template(request, template_id):
         "user_types": user_types,
         "xsd_form": xsd_to_html_string,
         "template_id": template_id,
+        "revision": revision,
+        "stateless": COMPOSER_STATELESS,
+        "state_token": state_token,
+        "deferred_validation": COMPOSER_DEFERRED_VALIDATION,
     }
 
     modals = [
@@ -249,7 +261,12 @@ def download_xsd(request):
     Returns:
 
     """
-    xsd_string = request.session["newXmlTemplateCompose"]
+    state = composer_state.get_composer_state(request)
+    error_response = _validate_composed_schema(request, state)
+    if error_response is not None:
+        return error_response
+
+    xsd_string = state.xsd_string
 
     # return the file
     return get_file_http_response(
@@ -260,6 +277,120 @@ def download_xsd(request):
     )
 
 
+@decorators.permission_required(
+    content_type=rights.COMPOSER_CONTENT_TYPE,
+    permission=rights.COMPOSER_ACCESS,
+)
+def download_xsd_bundle(request):
+    """Make the current XSD and all its local dependencies available for
+    download as a zip archive.
+
+    Args:
+        request:
+
+    Returns:
+
+    """
+    state = composer_state.get_composer_state(request)
+    error_response = _validate_composed_schema(request, state)
+    if error_response is not None:
+        return error_response
+
+    xsd_string = state.xsd_string
+
+    # read the dependencies before the response is sent, only the
+    # compression is streamed
+    bundle_files = get_bundle_files(
+        xsd_string,
+        lambda template_id: template_api.get_by_id(
+            template_id, request=request
+        ),
+    )
+    response = StreamingHttpResponse(
+        stream_zip(bundle_files), content_type="application/zip"
+    )
+    response["Content-Disposition"] = 'attachment; filename="schema.zip"'
+    return response
+
+
+@decorators.permission_required(
+    content_type=rights.COMPOSER_CONTENT_TYPE,
+    permission=rights.COMPOSER_ACCESS,
+)
+def download_xsd_flattened(request):
+    """Make the current XSD, with all its local dependencies inlined,
+    available for download.
+
+    Args:
+        request:
+
+    Returns:
+
+    """
+    state = composer_state.get_composer_state(request)
+    error_response = _validate_composed_schema(request, state)
+    if error_response is not None:
+        return error_response
+
+    xsd_string = state.xsd_string
+
+    flattened_xsd = get_flattened_xsd(
+        xsd_string,
+        lambda template_id: template_api.get_by_id(
+            template_id, request=request
+        ),
+    )
+    return get_file_http_response(
+        file_content=flattened_xsd,
+        file_name="schema.xsd",
+        content_type="application/xsd",
+        extension=".xsd",
+    )
+
+
+def _validate_composed_schema(request, state):
+    """Validate the schema being composed before it is downloaded, when
+    the validation is deferred and the schema was edited since the last
+    validation.
+
+    Args:
+        request:
+        state: composer state
+
+    Returns:
+        error page if the schema is not valid, None otherwise.
+
+    """
+    if (
+        not COMPOSER_DEFERRED_VALIDATION
+        or state.validated_revision == state.revision
+    ):
+        return None
+
+    result = validation_utils.validate_schema(
+        XSDTree.build_tree(state.xsd_string),
+        request=request,
+    )
+    if not result.is_valid:
+        return render(
+            request,
+            "core_main_app/common/commons/error.html",
+            context={
+                "error": (
+                    "This is not a valid XML schema. " + result.error
+                    if result.is_complete
+                    else result.error
+                ),
+                "page_title": "Error",
+            },
+        )
+    if state.token is None:
+        # the validation of a state carried by the client is not recorded:
+        # the download does not return the token of the validated state
+        composer_state.set_validated(request, state.revision)
+    return None
+
+
 @login_required
 def manage_type_versions(request, version_manager_id):
     """View that allows type versions management.
@@ -277,6 +408,7 @@ def manage_type_versions(request, version_manager_id):
             version_manager_id, request=request
         )
         context = get_context_manage_template_versions(version_manager, "Type")
+        set_versions_dependents_count(context, request=request)
         if "core_parser_app" in settings.INSTALLED_APPS:
             context.update({"module_url": "core_composer_app_type_modules"})
 
@@ -315,3 +447,79 @@ def manage_type_versions(request, version_manager_id):
             "core_main_app/common/commons/error.html",
             context={"error": str(exception), "page_title": "Error"},
         )
+
+
+@login_required
+def type_version_diff(request, version_id, other_version_id):
+    """View that shows the changes between two type versions.
+
+    Args:
+        request:
+        version_id:
+        other_version_id:
+
+    Returns:
+
+    """
+    try:
+        context = get_context_type_version_diff(
+            version_id, other_version_id, request=request
+        )
+
+        # Set page title
+        context.update({"page_title": "Type Version Changes"})
+
+        return render(
+            request,
+            "core_composer_app/user/types/diff.html",
+            context=context,
+        )
+    except Exception as exception:
+        return render(
+            request,
+            "core_main_app/common/commons/error.html",
+            context={"error": str(exception), "page_title": "Error"},
+        )
+
+
+def set_versions_dependents_count(context, request):
+    """Set the number of dependents of each version in the versions context.
+
+    Args:
+        context:
+        request:
+
+    Returns:
+
+    """
+    dependents_count = type_version_manager_api.count_dependents_by_version(
+        context["version_manager"], request=request
+    )
+    for versions in context["categorized_versions"].values():
+        for version in versions:
+            version["dependents_count"] = dependents_count.get(
+                version["object"], 0
+            )
+
+
+def get_context_type_version_diff(version_id, other_version_id, request):
+    """Get the context to display the changes between two type versions.
+
+    Args:
+        version_id:
+        other_version_id:
+        request:
+
+    Returns:
+
+    """
+    old_version = type_api.get(version_id, request=request)
+    new_version = type_api.get(other_version_id, request=request)
+    diff = type_api.get_versions_diff(old_version, new_version)
+    return {
+        "version_manager": new_version.version_manager,
+        "old_version": old_version,
+        "new_version": new_version,
+        "diff": diff,
+        "has_changes": has_changes(diff),
+    }
@@ -0,0 +1,173 @@
+"""Integration tests for cache generations"""
+
+from unittest.mock import Mock, patch
+
+from django.test import TestCase
+
+from core_composer_app.components.bucket.models import Bucket
+from core_composer_app.components.cache_generation import (
+    api as cache_generation_api,
+)
+from core_composer_app.components.cache_generation.models import (
+    CacheGeneration,
+)
+
+
+class TestCacheGenerationModel(TestCase):
+    """Test Cache Generation Model"""
+
+    def test_get_generation_creates_namespace(self):
+        """test_get_generation_creates_namespace"""
+
+        # Act
+        generation = CacheGeneration.get_generation("test")
+
+        # Assert
+        self.assertEqual(
+            CacheGeneration.objects.get(namespace="test").generation,
+            generation,
+        )
+
+    def test_bump_increments_generation(self):
+        """test_bump_increments_generation"""
+
+        # Arrange
+        generation = CacheGeneration.get_generation("test")
+
+        # Act
+        CacheGeneration.bump("test")
+
+        # Assert
+        self.assertEqual(
+            CacheGeneration.get_generation("test"), generation + 1
+        )
+
+    def test_bump_creates_namespace(self):
+        """test_bump_creates_namespace"""
+
+        # Act
+        CacheGeneration.bump("test")
+
+        # Assert
+        self.assertTrue(
+            CacheGeneration.objects.filter(namespace="test").exists()
+        )
+
+
+class TestInvalidate(TestCase):
+    """Test Invalidate"""
+
+    def setUp(self):
+        """setUp"""
+        cache_generation_api.register_namespace("test")
+        # forget the generations seen by previous tests
+        patcher = patch.dict(cache_generation_api._generations, clear=True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_generation_changes_after_commit(self):
+        """test_generation_changes_after_commit"""
+
+        # Arrange
+        generation = cache_generation_api.get_generation("test")
+
+        # Act
+        with self.captureOnCommitCallbacks(execute=True):
+            cache_generation_api.invalidate("test")
+
+        # Assert
+        self.assertNotEqual(
+            cache_generation_api.get_generation("test"), generation
+        )
+
+    def test_generation_is_unchanged_before_commit(self):
+        """test_generation_is_unchanged_before_commit"""
+
+        # Arrange
+        generation = cache_generation_api.get_generation("test")
+
+        # Act
+        cache_generation_api.invalidate("test")
+
+        # Assert
+        self.assertEqual(
+            cache_generation_api.get_generation("test"), generation
+        )
+
+    def test_on_change_is_called_with_new_generation(self):
+        """test_on_change_is_called_with_new_generation"""
+
+        # Arrange
+        mock_on_change = Mock()
+        cache_generation_api.register_namespace("test", mock_on_change)
+        cache_generation_api.get_generation("test")
+
+        # Act
+        with self.captureOnCommitCallbacks(execute=True):
+            cache_generation_api.invalidate("test")
+
+        # Assert
+        mock_on_change.assert_called_once_with(
+            "test", cache_generation_api.get_generation("test")
+        )
+
+    @patch.object(
+        cache_generation_api, "COMPOSER_CACHE_GENERATION_CHECK_INTERVAL", 60
+    )
+    def test_generation_bumped_by_other_process_is_seen_after_interval(self):
+        """test_generation_bumped_by_other_process_is_seen_after_interval"""
+
+        # Arrange
+        generation = cache_generation_api.get_generation("test")
+        CacheGeneration.bump("test")
+
+        # Act
+        before_interval = cache_generation_api.get_generation("test")
+        with patch.object(
+            cache_generation_api, "COMPOSER_CACHE_GENERATION_CHECK_INTERVAL", 0
+        ):
+            after_interval = cache_generation_api.get_generation("test")
+
+        # Assert
+        self.assertEqual(before_interval, generation)
+        self.assertEqual(after_interval, generation + 1)
+
+
+class TestInvalidateOnChange(TestCase):
+    """Test Invalidate On Change"""
+
+    def test_save_invalidates_namespace(self):
+        """test_save_invalidates_namespace"""
+
+        # Arrange
+        cache_generation_api.register_namespace("test_save")
+        cache_generation_api.invalidate_on_change("test_save", Bucket)
+        generation = cache_generation_api.get_generation("test_save")
+
+        # Act
+        with self.captureOnCommitCallbacks(execute=True):
+            Bucket(label="bucket", color="#000001").save()
+
+        # Assert
+        self.assertNotEqual(
+            cache_generation_api.get_generation("test_save"), generation
+        )
+
+    def test_filtered_change_does_not_invalidate_namespace(self):
+        """test_filtered_change_does_not_invalidate_namespace"""
+
+        # Arrange
+        cache_generation_api.register_namespace("test_filtered")
+        cache_generation_api.invalidate_on_change(
+            "test_filtered", Bucket, should_invalidate=lambda *args: False
+        )
+        generation = cache_generation_api.get_generation("test_filtered")
+
+        # Act
+        with self.captureOnCommitCallbacks(execute=True):
+            Bucket(label="bucket", color="#000001").save()
+
+        # Assert
+        self.assertEqual(
+            cache_generation_api.get_generation("test_filtered"), generation
+        )
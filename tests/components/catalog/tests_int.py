@@ -0,0 +1,204 @@
+"""Integration tests for the catalog snapshot"""
+
+from unittest.mock import patch
+
+from core_main_app.utils.integration_tests.integration_base_test_case import (
+    IntegrationBaseTestCase,
+)
+from core_composer_app.components.bucket.models import Bucket
+from core_composer_app.components.cache_generation import (
+    api as cache_generation_api,
+)
+from core_composer_app.components.catalog import api as catalog_api
+from core_composer_app.components.catalog.snapshot import build_snapshot
+from core_main_app.components.template.models import Template
+from core_main_app.components.template_version_manager.models import (
+    TemplateVersionManager,
+)
+
+from tests.components.bucket.fixtures.fixtures import BucketFixtures
+
+fixture_bucket = BucketFixtures()
+
+
+class TestBuildSnapshot(IntegrationBaseTestCase):
+    """Test Build Snapshot"""
+
+    fixture = fixture_bucket
+
+    def test_buckets_are_ordered_by_label(self):
+        """test_buckets_are_ordered_by_label"""
+
+        # Act
+        snapshot = build_snapshot(0)
+
+        # Assert
+        self.assertEqual(
+            [bucket.label for bucket in snapshot.buckets],
+            ["bucket1", "bucket2", "empty"],
+        )
+
+    def test_bucket_types_have_current_version(self):
+        """test_bucket_types_have_current_version"""
+
+        # Act
+        snapshot = build_snapshot(0)
+
+        # Assert
+        catalog_type = snapshot.buckets[0].types[0]
+        self.assertEqual(catalog_type.id, self.fixture.type_vm_1.id)
+        self.assertEqual(catalog_type.title, self.fixture.type_vm_1.title)
+        self.assertEqual(catalog_type.current, str(self.fixture.type_1_3.id))
+
+    def test_types_in_buckets_are_excluded_from_no_buckets_types(self):
+        """test_types_in_buckets_are_excluded_from_no_buckets_types"""
+
+        # Arrange
+        self.fixture.bucket_1.types.clear()
+        self.fixture.bucket_2.types.set([self.fixture.type_vm_2])
+
+        # Act
+        snapshot = build_snapshot(0)
+
+        # Assert
+        self.assertEqual(
+            [
+                catalog_type.id
+                for catalog_type in snapshot.get_no_buckets_types()
+            ],
+            [self.fixture.type_vm_1.id],
+        )
+
+
+class TestGetCatalog(IntegrationBaseTestCase):
+    """Test Get Catalog"""
+
+    fixture = fixture_bucket
+
+    def test_snapshot_is_reused_while_generation_is_unchanged(self):
+        """test_snapshot_is_reused_while_generation_is_unchanged"""
+
+        # Arrange
+        snapshot = catalog_api.get_catalog()
+
+        # Act
+        with self.assertNumQueries(1):
+            result = catalog_api.get_catalog()
+
+        # Assert
+        self.assertIs(result, snapshot)
+
+    @patch.object(
+        cache_generation_api, "COMPOSER_CACHE_GENERATION_CHECK_INTERVAL", 60
+    )
+    def test_snapshot_is_reused_without_database_access(self):
+        """test_snapshot_is_reused_without_database_access"""
+
+        # Arrange
+        snapshot = catalog_api.get_catalog()
+
+        # Act
+        with self.assertNumQueries(0):
+            result = catalog_api.get_catalog()
+
+        # Assert
+        self.assertIs(result, snapshot)
+
+    def test_snapshot_is_rebuilt_when_bucket_changes(self):
+        """test_snapshot_is_rebuilt_when_bucket_changes"""
+
+        # Arrange
+        catalog_api.get_catalog()
+
+        # Act
+        with self.captureOnCommitCallbacks(execute=True):
+            Bucket(label="new", color="#000003").save()
+
+        # Assert
+        self.assertIn(
+            "new",
+            [bucket.label for bucket in catalog_api.get_catalog().buckets],
+        )
+
+    def test_snapshot_is_rebuilt_when_bucket_types_change(self):
+        """test_snapshot_is_rebuilt_when_bucket_types_change"""
+
+        # Arrange
+        catalog_api.get_catalog()
+
+        # Act
+        with self.captureOnCommitCallbacks(execute=True):
+            self.fixture.bucket_empty.types.add(self.fixture.type_vm_2)
+
+        # Assert
+        self.assertEqual(len(catalog_api.get_catalog().buckets[2].types), 1)
+
+    def test_snapshot_is_rebuilt_when_global_type_is_disabled(self):
+        """test_snapshot_is_rebuilt_when_global_type_is_disabled"""
+
+        # Arrange
+        catalog_api.get_catalog()
+
+        # Act
+        with self.captureOnCommitCallbacks(execute=True):
+            self.fixture.type_vm_1.is_disabled = True
+            self.fixture.type_vm_1.save()
+
+        # Assert
+        self.assertTrue(
+            catalog_api.get_catalog()
+            .types_by_id[self.fixture.type_vm_1.id]
+            .is_disabled
+        )
+
+    def test_snapshot_is_kept_when_user_type_out_of_buckets_changes(self):
+        """test_snapshot_is_kept_when_user_type_out_of_buckets_changes"""
+
+        # Arrange
+        self.fixture.bucket_1.types.clear()
+        self.fixture.bucket_2.types.clear()
+        snapshot = catalog_api.get_catalog()
+
+        # Act
+        with self.captureOnCommitCallbacks(execute=True):
+            self.fixture.type_vm_2.is_disabled = True
+            self.fixture.type_vm_2.save()
+
+        # Assert
+        self.assertIs(catalog_api.get_catalog(), snapshot)
+
+    def test_snapshot_is_kept_when_global_template_changes(self):
+        """test_snapshot_is_kept_when_global_template_changes"""
+
+        # Arrange
+        snapshot = catalog_api.get_catalog()
+
+        # Act
+        with self.captureOnCommitCallbacks(execute=True):
+            version_manager = TemplateVersionManager(title="template")
+            version_manager.save()
+            Template(
+                filename="template.xsd",
+                _hash="hash",
+                version_manager=version_manager,
+            ).save()
+
+        # Assert
+        self.assertIs(catalog_api.get_catalog(), snapshot)
+
+    def test_snapshot_is_rebuilt_when_global_type_changes_as_template(self):
+        """test_snapshot_is_rebuilt_when_global_type_changes_as_template"""
+
+        # Arrange
+        snapshot = catalog_api.get_catalog()
+        version_manager = TemplateVersionManager.objects.get(
+            pk=self.fixture.type_vm_1.pk
+        )
+
+        # Act
+        with self.captureOnCommitCallbacks(execute=True):
+            version_manager.is_disabled = True
+            version_manager.save()
+
+        # Assert
+        self.assertIsNot(catalog_api.get_catalog(), snapshot)
@@ -0,0 +1,27 @@
+"""Fixtures files for jobs"""
+
+from core_main_app.utils.integration_tests.fixture_interface import (
+    FixtureInterface,
+)
+from core_composer_app.components.job.models import Job
+
+
+class JobFixtures(FixtureInterface):
+    """Job fixtures"""
+
+    finished_job = None
+
+    def insert_data(self):
+        """Insert a set of Jobs.
+
+        Returns:
+
+        """
+        self.finished_job = Job(
+            name="test_job",
+            user="1",
+            params={"value": "value"},
+            status=Job.SUCCESS,
+            result={"value": "value"},
+        )
+        self.finished_job.save()
@@ -0,0 +1,363 @@
+"""Integration tests for jobs"""
+
+from datetime import timedelta
+from io import StringIO
+from unittest.mock import Mock, patch
+
+from django.core.management import call_command
+from django.utils import timezone
+
+from core_main_app.access_control.exceptions import AccessControlError
+from core_main_app.commons.exceptions import ApiError
+from core_main_app.utils.integration_tests.integration_base_test_case import (
+    IntegrationBaseTestCase,
+)
+from core_main_app.utils.tests_tools.MockUser import create_mock_user
+from core_main_app.utils.tests_tools.RequestMock import create_mock_request
+from core_composer_app.components.job import api as job_api
+from core_composer_app.components.job import executor
+from core_composer_app.components.job.models import Job
+from core_composer_app.components.type.constants import (
+    REVALIDATE_DEPENDENTS_JOB,
+    REVALIDATE_DEPENDENTS_TASK,
+)
+
+from tests.components.job.fixtures.fixtures import JobFixtures
+
+TEST_JOB = "test_job"
+
+fixture_job = JobFixtures()
+
+
+def _test_job_task(job, value):
+    """Job task used in tests
+
+    Args:
+        job:
+        value:
+
+    Returns:
+
+    """
+    job.set_progress(1, 1)
+    job.check_canceled()
+    if value is None:
+        raise Exception("No value.")
+    return {"value": value}
+
+
+class TestJob(IntegrationBaseTestCase):
+    """Test Job"""
+
+    fixture = fixture_job
+
+    def setUp(self):
+        """setUp"""
+        super().setUp()
+        self.user1 = create_mock_user(user_id="1")
+        self.user2 = create_mock_user(user_id="2")
+        self.superuser = create_mock_user(user_id="3", is_superuser=True)
+        patcher = patch.dict(executor.JOB_TASKS, {TEST_JOB: _test_job_task})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _submit(self, value="value", user=None):
+        """Submit a test job
+
+        Args:
+            value:
+            user:
+
+        Returns:
+
+        """
+        return job_api.submit(
+            TEST_JOB,
+            {"value": value},
+            request=create_mock_request(user=user or self.user1),
+        )
+
+    def test_submit_creates_pending_job(self):
+        """test_submit_creates_pending_job"""
+
+        job = self._submit()
+
+        self.assertEqual(job.status, Job.PENDING)
+        self.assertEqual(job.user, "1")
+
+    def test_submit_unknown_job_raises_api_error(self):
+        """test_submit_unknown_job_raises_api_error"""
+
+        with self.assertRaises(ApiError):
+            job_api.submit(
+                "unknown", {}, request=create_mock_request(user=self.user1)
+            )
+
+    def test_run_job_stores_result(self):
+        """test_run_job_stores_result"""
+
+        job = self._submit()
+
+        executor.run_job(job.pk)
+
+        job.refresh_from_db()
+        self.assertEqual(job.status, Job.SUCCESS)
+        self.assertEqual((job.progress_current, job.progress_total), (1, 1))
+        self.assertEqual(
+            job_api.get_result(job, request=create_mock_request(self.user1)),
+            {"value": "value"},
+        )
+
+    def test_run_job_imports_task_registered_by_path(self):
+        """test_run_job_imports_task_registered_by_path"""
+
+        executor.register_job_task(
+            TEST_JOB, "tests.components.job.tests_int._test_job_task"
+        )
+        job = self._submit()
+
+        executor.run_job(job.pk)
+
+        job.refresh_from_db()
+        self.assertEqual(job.status, Job.SUCCESS)
+
+    def test_revalidate_dependents_task_is_registered_by_path(self):
+        """test_revalidate_dependents_task_is_registered_by_path"""
+
+        self.assertEqual(
+            executor.JOB_TASKS[REVALIDATE_DEPENDENTS_JOB],
+            REVALIDATE_DEPENDENTS_TASK,
+        )
+
+    def test_run_job_stores_error(self):
+        """test_run_job_stores_error"""
+
+        job = self._submit(value=None)
+
+        executor.run_job(job.pk)
+
+        job.refresh_from_db()
+        self.assertEqual(job.status, Job.FAILURE)
+        self.assertEqual(job.error, "No value.")
+
+    def test_run_job_gives_submitter_to_task(self):
+        """test_run_job_gives_submitter_to_task"""
+
+        job = self._submit()
+        mock_task = Mock(return_value=None)
+
+        with patch.dict(executor.JOB_TASKS, {TEST_JOB: mock_task}):
+            executor.run_job(job.pk)
+
+        self.assertEqual(mock_task.call_args.args[0].user_id, "1")
+
+    def test_run_job_twice_runs_task_once(self):
+        """test_run_job_twice_runs_task_once"""
+
+        job = self._submit()
+        mock_task = Mock(return_value=None)
+
+        with patch.dict(executor.JOB_TASKS, {TEST_JOB: mock_task}):
+            executor.run_job(job.pk)
+            executor.run_job(job.pk)
+
+        mock_task.assert_called_once()
+
+    def test_cancel_pending_job_cancels_job(self):
+        """test_cancel_pending_job_cancels_job"""
+
+        job = self._submit()
+
+        job = job_api.cancel(job, request=create_mock_request(self.user1))
+        executor.run_job(job.pk)
+
+        job.refresh_from_db()
+        self.assertEqual(job.status, Job.CANCELED)
+
+    def test_cancel_running_job_stops_job(self):
+        """test_cancel_running_job_stops_job"""
+
+        job = self._submit()
+        Job.objects.filter(pk=job.pk).update(cancel_requested=True)
+        Job.objects.filter(pk=job.pk).update(status=Job.PENDING)
+
+        executor.run_job(job.pk)
+
+        job.refresh_from_db()
+        self.assertEqual(job.status, Job.CANCELED)
+
+    def test_cancel_finished_job_raises_api_error(self):
+        """test_cancel_finished_job_raises_api_error"""
+
+        with self.assertRaises(ApiError):
+            job_api.cancel(
+                self.fixture.finished_job,
+                request=create_mock_request(self.user1),
+            )
+
+    def test_get_result_of_unfinished_job_raises_api_error(self):
+        """test_get_result_of_unfinished_job_raises_api_error"""
+
+        job = self._submit()
+
+        with self.assertRaises(ApiError):
+            job_api.get_result(job, request=create_mock_request(self.user1))
+
+    def test_get_job_of_other_user_raises_access_control_error(self):
+        """test_get_job_of_other_user_raises_access_control_error"""
+
+        job = self._submit()
+
+        with self.assertRaises(AccessControlError):
+            job_api.get_by_id(job.pk, request=create_mock_request(self.user2))
+
+    def test_cancel_job_given_as_keyword_checks_access(self):
+        """test_cancel_job_given_as_keyword_checks_access"""
+
+        job = self._submit()
+
+        with self.assertRaises(AccessControlError):
+            job_api.cancel(job=job, request=create_mock_request(self.user2))
+
+    def test_cancel_without_job_raises_access_control_error(self):
+        """test_cancel_without_job_raises_access_control_error"""
+
+        with self.assertRaises(AccessControlError):
+            job_api.cancel(None, request=create_mock_request(self.superuser))
+
+    def test_get_job_as_superuser_returns_job(self):
+        """test_get_job_as_superuser_returns_job"""
+
+        job = self._submit()
+
+        result = job_api.get_by_id(
+            job.pk, request=create_mock_request(self.superuser)
+        )
+
+        self.assertEqual(result.pk, job.pk)
+
+    def test_recover_jobs_fails_interrupted_and_resubmits_pending(self):
+        """test_recover_jobs_fails_interrupted_and_resubmits_pending"""
+
+        interrupted_job = self._submit()
+        Job.objects.filter(pk=interrupted_job.pk).update(
+            status=Job.RUNNING,
+            last_modification_date=timezone.now() - timedelta(days=1),
+        )
+        pending_job = self._submit()
+        mock_executor = Mock()
+
+        result = executor.recover_jobs(mock_executor)
+
+        interrupted_job.refresh_from_db()
+        self.assertEqual(interrupted_job.status, Job.FAILURE)
+        mock_executor.submit.assert_called_once_with(
+            executor._run_job_in_worker, pending_job.pk
+        )
+        self.assertEqual(result, (1, 1))
+
+    def test_recover_jobs_does_not_fail_jobs_of_current_worker(self):
+        """test_recover_jobs_does_not_fail_jobs_of_current_worker"""
+
+        job = self._submit()
+        Job.objects.filter(pk=job.pk).update(
+            status=Job.RUNNING,
+            worker=executor.get_worker_id(),
+            last_modification_date=timezone.now() - timedelta(days=1),
+        )
+
+        executor.recover_jobs(Mock())
+
+        job.refresh_from_db()
+        self.assertEqual(job.status, Job.RUNNING)
+
+    def test_run_job_sets_worker(self):
+        """test_run_job_sets_worker"""
+
+        job = self._submit()
+        mock_task = Mock(return_value=None)
+
+        with patch.dict(executor.JOB_TASKS, {TEST_JOB: mock_task}):
+            executor.run_job(job.pk)
+
+        job.refresh_from_db()
+        self.assertEqual(job.worker, executor.get_worker_id())
+
+    def test_send_heartbeat_updates_running_jobs_of_worker(self):
+        """test_send_heartbeat_updates_running_jobs_of_worker"""
+
+        old_date = timezone.now() - timedelta(days=1)
+        job = self._submit()
+        Job.objects.filter(pk=job.pk).update(
+            status=Job.RUNNING,
+            worker="worker",
+            last_modification_date=old_date,
+        )
+        other_job = self._submit()
+        Job.objects.filter(pk=other_job.pk).update(
+            status=Job.RUNNING, worker="other", last_modification_date=old_date
+        )
+
+        executor.send_heartbeat("worker")
+
+        job.refresh_from_db()
+        other_job.refresh_from_db()
+        self.assertGreater(job.last_modification_date, old_date)
+        self.assertEqual(other_job.last_modification_date, old_date)
+
+    @patch.object(executor, "ThreadPoolExecutor")
+    @patch.object(executor, "start_heartbeat")
+    def test_get_executor_starts_heartbeat(
+        self, mock_start_heartbeat, mock_thread_pool_executor
+    ):
+        """test_get_executor_starts_heartbeat"""
+
+        with patch.object(executor, "_executor", None):
+            result = executor.get_executor()
+
+        self.assertEqual(result, mock_thread_pool_executor.return_value)
+        mock_start_heartbeat.assert_called_once()
+
+    @patch.object(executor.threading, "Thread")
+    def test_start_heartbeat_starts_thread_once(self, mock_thread):
+        """test_start_heartbeat_starts_thread_once"""
+
+        with patch.object(executor, "_heartbeat_pid", None):
+            executor.start_heartbeat()
+            executor.start_heartbeat()
+
+        mock_thread.return_value.start.assert_called_once()
+
+    @patch.object(executor.time, "sleep")
+    @patch.object(executor, "send_heartbeat")
+    def test_run_heartbeat_continues_after_error(
+        self, mock_send_heartbeat, mock_sleep
+    ):
+        """test_run_heartbeat_continues_after_error"""
+
+        mock_send_heartbeat.side_effect = Exception("error")
+        # stop the loop at the second heartbeat
+        mock_sleep.side_effect = [None, KeyboardInterrupt()]
+
+        with self.assertRaises(KeyboardInterrupt):
+            executor._run_heartbeat("worker")
+
+        mock_send_heartbeat.assert_called_once_with("worker")
+
+    @patch.object(executor, "recover_jobs")
+    @patch.object(executor, "start_heartbeat")
+    def test_recover_composer_jobs_command_reports_recovered_jobs(
+        self, mock_start_heartbeat, mock_recover_jobs
+    ):
+        """test_recover_composer_jobs_command_reports_recovered_jobs"""
+
+        mock_recover_jobs.return_value = (1, 2)
+        out = StringIO()
+
+        call_command("recover_composer_jobs", stdout=out)
+
+        mock_start_heartbeat.assert_called_once()
+        self.assertIn(
+            "1 interrupted job(s) marked as failed, 2 pending job(s) run.",
+            out.getvalue(),
+        )
@@ -0,0 +1,215 @@
+"""Type access control testing"""
+
+from unittest.mock import AsyncMock
+
+from django.test import override_settings
+
+from core_main_app.access_control.exceptions import AccessControlError
+from core_main_app.commons.exceptions import DoesNotExist
+from core_main_app.utils.integration_tests.integration_base_test_case import (
+    IntegrationBaseTestCase,
+)
+from core_main_app.utils.tests_tools.MockUser import create_mock_user
+from core_main_app.utils.tests_tools.RequestMock import create_mock_request
+
+from core_composer_app.components.type import api as type_api
+from core_composer_app.components.type_version_manager import (
+    api as type_vm_api,
+)
+from tests.components.type_version_manager.fixtures.fixtures import (
+    TypeVersionManagerAccessControlFixtures,
+)
+
+fixture_type_vm = TypeVersionManagerAccessControlFixtures()
+
+
+class TestTypeGetAllAccessibleByIdList(IntegrationBaseTestCase):
+    """Test Type Get All Accessible By Id List"""
+
+    fixture = fixture_type_vm
+
+    def setUp(self):
+        """setUp
+
+        Returns:
+
+        """
+        self.anonymous_user = create_mock_user(user_id=None, is_anonymous=True)
+        self.user1 = create_mock_user(user_id="1")
+        self.superuser1 = create_mock_user(user_id="2", is_superuser=True)
+        self.fixture.insert_data()
+        self.type_ids = [
+            self.fixture.user1_type.id,
+            self.fixture.user2_type.id,
+            self.fixture.global_type.id,
+        ]
+
+    def test_get_all_accessible_by_id_list_as_user_returns_own_and_global_types(
+        self,
+    ):
+        """test get all accessible by id list as user returns own and global types
+
+        Returns:
+
+        """
+        mock_request = create_mock_request(user=self.user1)
+
+        result = type_api.get_all_accessible_by_id_list(
+            self.type_ids, request=mock_request
+        )
+
+        self.assertEqual(
+            set(result),
+            {self.fixture.user1_type, self.fixture.global_type},
+        )
+
+    def test_get_all_accessible_by_id_list_as_superuser_returns_all_types(
+        self,
+    ):
+        """test get all accessible by id list as superuser returns all types
+
+        Returns:
+
+        """
+        mock_request = create_mock_request(user=self.superuser1)
+
+        result = type_api.get_all_accessible_by_id_list(
+            self.type_ids, request=mock_request
+        )
+
+        self.assertEqual(len(result), 3)
+
+    @override_settings(CAN_ANONYMOUS_ACCESS_PUBLIC_DOCUMENT=True)
+    def test_get_all_accessible_by_id_list_as_anonymous_with_access_right_returns_global_types(
+        self,
+    ):
+        """test get all accessible by id list as anonymous with access right returns global types
+
+        Returns:
+
+        """
+        mock_request = create_mock_request(user=self.anonymous_user)
+
+        result = type_api.get_all_accessible_by_id_list(
+            self.type_ids, request=mock_request
+        )
+
+        self.assertEqual(list(result), [self.fixture.global_type])
+
+    def test_get_all_accessible_by_id_list_as_anonymous_returns_nothing(
+        self,
+    ):
+        """test get all accessible by id list as anonymous returns nothing
+
+        Returns:
+
+        """
+        mock_request = create_mock_request(user=self.anonymous_user)
+
+        result = type_api.get_all_accessible_by_id_list(
+            self.type_ids, request=mock_request
+        )
+
+        self.assertEqual(len(result), 0)
+
+    def test_get_all_accessible_by_id_list_runs_a_single_query(self):
+        """test get all accessible by id list runs a single query
+
+        Returns:
+
+        """
+        mock_request = create_mock_request(user=self.user1)
+
+        with self.assertNumQueries(1):
+            list(
+                type_api.get_all_accessible_by_id_list(
+                    self.type_ids, request=mock_request
+                )
+            )
+
+
+class TestTypeVersionManagerGetNoBucketsTypes(IntegrationBaseTestCase):
+    """Test Type Version Manager Get No Buckets Types"""
+
+    fixture = fixture_type_vm
+
+    def setUp(self):
+        """setUp
+
+        Returns:
+
+        """
+        self.anonymous_user = create_mock_user(user_id=None, is_anonymous=True)
+        self.fixture.insert_data()
+
+    def test_get_no_buckets_types_as_anonymous_raises_access_control_error(
+        self,
+    ):
+        """test get no buckets types as anonymous raises access control error
+
+        Returns:
+
+        """
+        mock_request = create_mock_request(user=self.anonymous_user)
+
+        with self.assertRaises(AccessControlError):
+            type_vm_api.get_no_buckets_types(request=mock_request)
+
+
+class TestTypeAget(IntegrationBaseTestCase):
+    """Test Type Aget"""
+
+    fixture = fixture_type_vm
+
+    def _create_request(self, user):
+        """Create a request, with the async API of the user.
+
+        Args:
+            user:
+
+        Returns:
+
+        """
+        mock_request = create_mock_request(user=user)
+        mock_request.auser = AsyncMock(return_value=user)
+        return mock_request
+
+    async def test_aget_own_type_returns_type(self):
+        """test aget own type returns type
+
+        Returns:
+
+        """
+        mock_request = self._create_request(create_mock_user(user_id="1"))
+
+        result = await type_api.aget(
+            self.fixture.user1_type.id, request=mock_request
+        )
+
+        self.assertEqual(result, self.fixture.user1_type)
+
+    async def test_aget_type_of_another_user_raises_access_control_error(
+        self,
+    ):
+        """test aget type of another user raises access control error
+
+        Returns:
+
+        """
+        mock_request = self._create_request(create_mock_user(user_id="1"))
+
+        with self.assertRaises(AccessControlError):
+            await type_api.aget(
+                self.fixture.user2_type.id, request=mock_request
+            )
+
+    async def test_aget_missing_type_raises_does_not_exist(self):
+        """test aget missing type raises does not exist
+
+        Returns:
+
+        """
+        mock_request = self._create_request(create_mock_user(user_id="1"))
+
+        with self.assertRaises(DoesNotExist):
+            await type_api.aget(-1, request=mock_request)
@@ -0,0 +1,177 @@
+"""Type API integration testing"""
+
+from unittest.mock import patch
+
+from django.test import override_settings
+
+from core_main_app.commons.exceptions import XSDError
+from core_main_app.utils.integration_tests.fixture_interface import (
+    FixtureInterface,
+)
+from core_main_app.utils.integration_tests.integration_base_test_case import (
+    IntegrationBaseTestCase,
+)
+from core_main_app.utils.tests_tools.MockUser import create_mock_user
+from core_main_app.utils.tests_tools.RequestMock import create_mock_request
+
+from core_composer_app.components.type import api as type_api
+from core_composer_app.components.type.models import Type
+
+TYPE_CONTENT = (
+    "<schema xmlns='http://www.w3.org/2001/XMLSchema'><simpleType name='type'>"
+    "<restriction base='string'><enumeration value='test'/></restriction>"
+    "</simpleType></schema>"
+)
+
+
+class EmptyFixtures(FixtureInterface):
+    """No data: the types are created by the tests"""
+
+    def insert_data(self):
+        """Insert nothing.
+
+        Returns:
+
+        """
+
+
+@override_settings(ROOT_URLCONF="core_main_app.urls")
+class TestTypeUpsertDeduplication(IntegrationBaseTestCase):
+    """Test Type Upsert Deduplication"""
+
+    fixture = EmptyFixtures()
+
+    def setUp(self):
+        """setUp
+
+        Returns:
+
+        """
+        patcher = patch.object(type_api, "COMPOSER_TYPE_DEDUPLICATION", True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.request = create_mock_request(user=create_mock_user("1"))
+        self.existing_type = type_api.upsert(
+            Type(filename="type.xsd", content=TYPE_CONTENT, user="1"),
+            request=self.request,
+        )
+
+    def test_upsert_identical_type_shares_file(self):
+        """test_upsert_identical_type_shares_file"""
+
+        # Act
+        type_object = type_api.upsert(
+            Type(filename="copy.xsd", content=TYPE_CONTENT, user="1"),
+            request=self.request,
+        )
+
+        # Assert
+        type_object = Type.get_by_id(type_object.id)
+        self.assertNotEqual(type_object.pk, self.existing_type.pk)
+        self.assertEqual(type_object.file.name, self.existing_type.file.name)
+        self.assertEqual(type_object.content, TYPE_CONTENT)
+        self.assertEqual(type_object.hash, self.existing_type.hash)
+
+    def test_upsert_equivalent_type_shares_file(self):
+        """test_upsert_equivalent_type_shares_file"""
+
+        # Arrange
+        content = TYPE_CONTENT.replace(
+            "<simpleType", "<!-- doc -->\n  <simpleType"
+        )
+
+        # Act
+        type_object = type_api.upsert(
+            Type(filename="copy.xsd", content=content, user="1"),
+            request=self.request,
+        )
+
+        # Assert
+        type_object = Type.get_by_id(type_object.id)
+        self.assertEqual(type_object.file.name, self.existing_type.file.name)
+        self.assertEqual(type_object.content, TYPE_CONTENT)
+
+    @patch.object(type_api, "check_type_core_support")
+    @patch("core_main_app.utils.xml.is_schema_valid")
+    def test_upsert_identical_type_is_not_validated_again(
+        self, mock_is_schema_valid, mock_check_type_core_support
+    ):
+        """test_upsert_identical_type_is_not_validated_again"""
+
+        # Act
+        type_object = type_api.upsert(
+            Type(filename="copy.xsd", content=TYPE_CONTENT, user="1"),
+            request=self.request,
+        )
+
+        # Assert
+        mock_is_schema_valid.assert_not_called()
+        mock_check_type_core_support.assert_not_called()
+        self.assertEqual(type_object.is_complex, self.existing_type.is_complex)
+
+    def test_upsert_identical_type_reuses_dependencies(self):
+        """test_upsert_identical_type_reuses_dependencies"""
+
+        # Arrange
+        dependency = type_api.upsert(
+            Type(
+                filename="dependency.xsd",
+                content=TYPE_CONTENT.replace("'test'", "'dependency'"),
+                user="1",
+            ),
+            request=self.request,
+        )
+        self.existing_type.dependencies.add(dependency)
+
+        # Act
+        type_object = type_api.upsert(
+            Type(filename="copy.xsd", content=TYPE_CONTENT, user="1"),
+            request=self.request,
+        )
+
+        # Assert
+        self.assertEqual(
+            [
+                template.pk
+                for template in Type.get_by_id(
+                    type_object.id
+                ).dependencies.all()
+            ],
+            [dependency.pk],
+        )
+
+    def test_upsert_identical_type_of_other_user_keeps_own_file(self):
+        """test_upsert_identical_type_of_other_user_keeps_own_file"""
+
+        # Act
+        type_object = type_api.upsert(
+            Type(filename="copy.xsd", content=TYPE_CONTENT, user="2"),
+            request=create_mock_request(user=create_mock_user("2")),
+        )
+
+        # Assert
+        type_object = Type.get_by_id(type_object.id)
+        self.assertNotEqual(
+            type_object.file.name, self.existing_type.file.name
+        )
+
+    def test_upsert_invalid_identical_content_is_validated(self):
+        """test_upsert_invalid_identical_content_is_validated"""
+
+        # Arrange
+        content = TYPE_CONTENT.replace("base='string'", "base='unknown'")
+        Type(
+            filename="invalid.xsd",
+            content=content,
+            user="1",
+            content_hash=type_api._get_type_content_hash(
+                Type(filename="invalid.xsd", content=content)
+            ),
+        ).save_template()
+
+        # Act # Assert
+        with self.assertRaises(XSDError):
+            type_api.upsert(
+                Type(filename="copy.xsd", content=content, user="1"),
+                request=self.request,
+            )
@@ -0,0 +1,311 @@
+"""Integration tests for type tasks"""
+
+from unittest.mock import Mock, patch
+
+from django.core.cache import cache
+from django.db.models import Q
+from django.test import override_settings
+
+from core_main_app.utils import xml as main_xml_utils
+from core_main_app.utils.tests_tools.MockUser import create_mock_user
+from core_main_app.utils.integration_tests.integration_base_test_case import (
+    IntegrationBaseTestCase,
+)
+from xml_utils.xsd_tree.xsd_tree import XSDTree
+
+from core_composer_app.components.type import tasks as type_tasks
+from core_composer_app.components.type.models import Type
+from core_composer_app.utils.validation import (
+    TIMED_OUT,
+    VALID,
+    ValidationResult,
+)
+
+from tests.components.type_version_manager.fixtures.fixtures import (
+    TypeVersionManagerAccessControlFixtures,
+)
+
+fixture_type_vm = TypeVersionManagerAccessControlFixtures()
+
+INVALID_XSD = (
+    '<xsd:schema xmlns:xsd="http://www.w3.org/2001/XMLSchema">'
+    '<xsd:element name="root" type="unknownType"/></xsd:schema>'
+)
+INCLUDING_XSD = (
+    '<xsd:schema xmlns:xsd="http://www.w3.org/2001/XMLSchema">'
+    '<xsd:include schemaLocation="{0}"/>'
+    '<xsd:element name="root" type="TimeUnitType"/></xsd:schema>'
+)
+
+
+@override_settings(ROOT_URLCONF="core_main_app.urls")
+class TestRevalidateDependents(IntegrationBaseTestCase):
+    """Test Revalidate Dependents"""
+
+    fixture = fixture_type_vm
+
+    def setUp(self):
+        """setUp"""
+        super().setUp()
+        cache.clear()
+        # store the content of the types
+        self.fixture.user1_type.save_template()
+        self.fixture.user1_type.dependencies.set([self.fixture.global_type])
+
+    def test_valid_dependent_is_reported_valid(self):
+        """test_valid_dependent_is_reported_valid"""
+
+        # Arrange
+        mock_on_progress = Mock()
+
+        # Act
+        result = type_tasks.revalidate_dependents(
+            str(self.fixture.global_tvm.id), on_progress=mock_on_progress
+        )
+
+        # Assert
+        self.assertEqual(
+            result,
+            {
+                str(self.fixture.user1_type.pk): {
+                    "status": type_tasks.VALID,
+                    "error": None,
+                }
+            },
+        )
+        mock_on_progress.assert_called_once_with(1, 1, result)
+
+    def test_invalid_dependent_is_reported_invalid(self):
+        """test_invalid_dependent_is_reported_invalid"""
+
+        # Arrange
+        invalid_type = Type(
+            filename="invalid.xsd",
+            content=INVALID_XSD,
+            _hash="invalid hash",
+            user="1",
+        )
+        invalid_type.save_template()
+        invalid_type.dependencies.set([self.fixture.global_type])
+
+        # Act
+        result = type_tasks.revalidate_dependents(
+            str(self.fixture.global_tvm.id)
+        )
+
+        # Assert
+        self.assertEqual(
+            result[str(invalid_type.pk)]["status"], type_tasks.INVALID
+        )
+        self.assertIsNotNone(result[str(invalid_type.pk)]["error"])
+
+    def _insert_including_type(self, included_type, user):
+        """Insert a type including another type, and depending on the global
+        type.
+
+        Args:
+            included_type:
+            user:
+
+        Returns:
+
+        """
+        included_type.save_template()
+        including_type = Type(
+            filename="including.xsd",
+            content=INCLUDING_XSD.format(
+                main_xml_utils._get_schema_location_uri(str(included_type.pk))
+            ),
+            _hash=f"including hash {included_type.pk}",
+            user=user,
+        )
+        including_type.save_template()
+        including_type.dependencies.set(
+            [included_type, self.fixture.global_type]
+        )
+        return including_type
+
+    @patch.object(type_tasks, "validate_schema")
+    def test_dependent_including_type_of_its_owner_is_validated_standalone(
+        self, mock_validate_schema
+    ):
+        """test_dependent_including_type_of_its_owner_is_validated_standalone"""
+
+        # Arrange
+        mock_validate_schema.return_value = ValidationResult(VALID)
+        including_type = self._insert_including_type(
+            self.fixture.user2_type, "2"
+        )
+
+        # Act
+        result = type_tasks.revalidate_dependents(
+            str(self.fixture.global_tvm.id)
+        )
+
+        # Assert
+        self.assertEqual(
+            result[str(including_type.pk)]["status"], type_tasks.VALID
+        )
+        validated_xsd = mock_validate_schema.call_args_list[-1].args[0]
+        self.assertNotIn("include", XSDTree.tostring(validated_xsd))
+        self.assertIn("TimeUnitType", XSDTree.tostring(validated_xsd))
+
+    @patch.object(type_tasks, "validate_schema")
+    def test_dependent_including_type_of_another_user_is_unresolved(
+        self, mock_validate_schema
+    ):
+        """test_dependent_including_type_of_another_user_is_unresolved"""
+
+        # Arrange
+        mock_validate_schema.return_value = ValidationResult(VALID)
+        including_type = self._insert_including_type(
+            self.fixture.user2_type, "1"
+        )
+
+        # Act
+        result = type_tasks.revalidate_dependents(
+            str(self.fixture.global_tvm.id)
+        )
+
+        # Assert
+        self.assertEqual(
+            result[str(including_type.pk)]["status"], type_tasks.UNRESOLVED
+        )
+        self.assertIsNone(
+            cache.get(type_tasks.get_validation_cache_key(including_type))
+        )
+        # only the other dependent is validated
+        mock_validate_schema.assert_called_once()
+
+    def test_get_dependency_as_owner_of_missing_dependency_raises_error(
+        self,
+    ):
+        """test_get_dependency_as_owner_of_missing_dependency_raises_error"""
+
+        # Act # Assert
+        with self.assertRaises(type_tasks.UnresolvedDependencyError):
+            type_tasks.get_dependency_as_owner(self.fixture.user1_type, "-1")
+
+    def test_revalidate_dependents_reports_readable_dependents_only(self):
+        """test_revalidate_dependents_reports_readable_dependents_only"""
+
+        # Act
+        result = type_tasks.revalidate_dependents(
+            str(self.fixture.global_tvm.id), users=Q(user="2")
+        )
+
+        # Assert
+        self.assertEqual(result, {})
+
+    @patch.object(type_tasks, "revalidate_dependents")
+    def test_revalidate_dependents_job_filters_by_submitter(
+        self, mock_revalidate_dependents
+    ):
+        """test_revalidate_dependents_job_filters_by_submitter"""
+
+        # Arrange
+        job = Mock(user_id=None)
+
+        # Act
+        type_tasks.revalidate_dependents_job(job, "1")
+
+        # Assert
+        self.assertIsNone(mock_revalidate_dependents.call_args.kwargs["users"])
+
+    def test_get_accessible_owners_of_unknown_user_is_empty(self):
+        """test_get_accessible_owners_of_unknown_user_is_empty"""
+
+        # Act
+        result = type_tasks._get_accessible_owners("-1")
+
+        # Assert
+        self.assertEqual(result, Q(user__in=[]))
+
+    @patch.object(type_tasks.user_api, "get_user_by_id")
+    def test_get_accessible_owners_of_user_are_global_and_owned(
+        self, mock_get_user_by_id
+    ):
+        """test_get_accessible_owners_of_user_are_global_and_owned"""
+
+        # Arrange
+        mock_get_user_by_id.return_value = create_mock_user(user_id="1")
+
+        # Act
+        result = type_tasks._get_accessible_owners("1")
+
+        # Assert
+        self.assertEqual(result, Q() | Q(user__isnull=True) | Q(user="1"))
+
+    def test_get_all_dependents_returns_indirect_dependents(self):
+        """test_get_all_dependents_returns_indirect_dependents"""
+
+        # Arrange
+        self.fixture.user2_type.dependencies.set([self.fixture.user1_type])
+
+        # Act
+        result = type_tasks.get_all_dependents([self.fixture.global_type.pk])
+
+        # Assert
+        self.assertEqual(
+            [dependent.pk for dependent in result],
+            [self.fixture.user1_type.pk, self.fixture.user2_type.pk],
+        )
+
+    def test_get_all_dependents_with_cycle_returns_each_dependent_once(self):
+        """test_get_all_dependents_with_cycle_returns_each_dependent_once"""
+
+        # Arrange
+        self.fixture.global_type.dependencies.set([self.fixture.user1_type])
+
+        # Act
+        result = type_tasks.get_all_dependents([self.fixture.global_type.pk])
+
+        # Assert
+        self.assertEqual(
+            [dependent.pk for dependent in result],
+            [self.fixture.user1_type.pk],
+        )
+
+    @patch.object(type_tasks, "validate_schema")
+    def test_validate_schema_with_cache_validates_once(
+        self, mock_validate_schema
+    ):
+        """test_validate_schema_with_cache_validates_once"""
+
+        # Arrange
+        mock_validate_schema.return_value = ValidationResult(VALID)
+
+        # Act
+        type_tasks.validate_schema_with_cache(
+            self.fixture.global_type.content, "key"
+        )
+        result = type_tasks.validate_schema_with_cache(
+            self.fixture.global_type.content, "key"
+        )
+
+        # Assert
+        self.assertIsNone(result)
+        mock_validate_schema.assert_called_once()
+
+    @patch.object(type_tasks, "validate_schema")
+    def test_validate_schema_with_cache_does_not_cache_timeout(
+        self, mock_validate_schema
+    ):
+        """test_validate_schema_with_cache_does_not_cache_timeout"""
+
+        # Arrange
+        mock_validate_schema.return_value = ValidationResult(
+            TIMED_OUT, "timed out"
+        )
+
+        # Act
+        type_tasks.validate_schema_with_cache(
+            self.fixture.global_type.content, "key"
+        )
+        result = type_tasks.validate_schema_with_cache(
+            self.fixture.global_type.content, "key"
+        )
+
+        # Assert
+        self.assertEqual(result, "timed out")
+        self.assertEqual(mock_validate_schema.call_count, 2)
@@ -2,6 +2,7 @@
 
 from unittest.case import TestCase
 
+from django.core.cache import cache
 from django.test import override_settings
 from unittest.mock import Mock, patch
 
@@ -137,6 +138,114 @@ class TestTypeUpsert(TestCase):
         with self.assertRaises(exceptions.CoreError):
             type_api.upsert(type_object, request=mock_request)
 
+    @patch.object(type_api, "_save_identical_type")
+    @patch.object(type_api, "check_type_core_support")
+    @patch.object(type_api, "template_api")
+    @patch.object(Type, "get_by_content_hash")
+    def test_type_upsert_identical_type_is_not_validated_again(
+        self,
+        mock_get_by_content_hash,
+        mock_template_api,
+        mock_check_type_core_support,
+        mock_save_identical_type,
+    ):
+        """test_type_upsert_identical_type_is_not_validated_again"""
+
+        mock_user = create_mock_user("1", is_superuser=True)
+        mock_request = create_mock_request(user=mock_user)
+        type_object = _create_type()
+        existing_type = _create_mock_type()
+        mock_get_by_content_hash.return_value = existing_type
+        mock_save_identical_type.return_value = type_object
+
+        with patch.object(type_api, "COMPOSER_TYPE_DEDUPLICATION", True):
+            result = type_api.upsert(type_object, request=mock_request)
+
+        self.assertEqual(result, type_object)
+        mock_save_identical_type.assert_called_with(type_object, existing_type)
+        mock_check_type_core_support.assert_not_called()
+        mock_template_api.upsert.assert_not_called()
+
+    @patch.object(type_api, "template_api")
+    @patch.object(Type, "get_by_content_hash")
+    def test_type_upsert_saved_type_is_not_deduplicated(
+        self, mock_get_by_content_hash, mock_template_api
+    ):
+        """test_type_upsert_saved_type_is_not_deduplicated"""
+
+        mock_user = create_mock_user("1", is_superuser=True)
+        mock_request = create_mock_request(user=mock_user)
+        type_object = _create_type()
+        type_object.pk = 1
+
+        with patch.object(type_api, "COMPOSER_TYPE_DEDUPLICATION", True):
+            type_api.upsert(type_object, request=mock_request)
+
+        mock_get_by_content_hash.assert_not_called()
+        mock_template_api.upsert.assert_called_with(
+            type_object, request=mock_request
+        )
+
+    @patch.object(type_api, "template_api")
+    @patch.object(Type, "get_by_content_hash")
+    def test_type_upsert_new_type_sets_content_hash(
+        self, mock_get_by_content_hash, mock_template_api
+    ):
+        """test_type_upsert_new_type_sets_content_hash"""
+
+        mock_user = create_mock_user("1", is_superuser=True)
+        mock_request = create_mock_request(user=mock_user)
+        type_object = _create_type()
+        mock_get_by_content_hash.return_value = None
+
+        type_api.upsert(type_object, request=mock_request)
+
+        self.assertNotEqual(type_object.content_hash, "")
+        mock_template_api.upsert.assert_called_with(
+            type_object, request=mock_request
+        )
+
+    @patch.object(Type, "get_by_content_hash")
+    def test_type_upsert_not_well_formed_type_raises_xml_error(
+        self, mock_get_by_content_hash
+    ):
+        """test_type_upsert_not_well_formed_type_raises_xml_error"""
+
+        mock_user = create_mock_user("1", is_superuser=True)
+        mock_request = create_mock_request(user=mock_user)
+        type_object = _create_type(content="<schema>")
+
+        with self.assertRaises(exceptions.XMLError):
+            type_api.upsert(type_object, request=mock_request)
+        mock_get_by_content_hash.assert_not_called()
+
+
+class TestTypeGetVersionsDiff(TestCase):
+    """Test Type Get Versions Diff"""
+
+    def setUp(self):
+        """setUp"""
+        cache.clear()
+
+    @patch.object(type_api, "diff_xsd")
+    def test_get_versions_diff_is_computed_once(self, mock_diff_xsd):
+        """test_get_versions_diff_is_computed_once"""
+
+        # Arrange
+        old_type = _create_mock_type(content="<old/>")
+        old_type.pk = 1
+        new_type = _create_mock_type(content="<new/>")
+        new_type.pk = 2
+        mock_diff_xsd.return_value = {"added": [], "removed": []}
+
+        # Act
+        type_api.get_versions_diff(old_type, new_type)
+        result = type_api.get_versions_diff(old_type, new_type)
+
+        # Assert
+        self.assertEqual(result, {"added": [], "removed": []})
+        mock_diff_xsd.assert_called_once_with("<old/>", "<new/>")
+
 
 def _create_mock_type(filename="schema.xsd", content=""):
     """Returns a mock type
@@ -639,3 +639,81 @@ class TestTypeVersionManagerGetAllVersionManager(IntegrationBaseTestCase):
         list_tvm = type_vm_api.get_all_version_manager(request=mock_request)
 
         self.assertEqual(len(list_tvm), 3)
+
+
+class TestTypeVersionManagerGetDependents(IntegrationBaseTestCase):
+    """Test Type Version Manager Get Dependents"""
+
+    fixture = fixture_type_vm2
+
+    def setUp(self):
+        """setUp
+
+        Returns:
+
+        """
+        self.user1 = create_mock_user(user_id="1")
+        self.superuser1 = create_mock_user(user_id="1", is_superuser=True)
+        self.fixture.insert_data()
+        # user types include the global type
+        self.fixture.user1_type.dependencies.set([self.fixture.global_type])
+        self.fixture.user2_type.dependencies.set([self.fixture.global_type])
+
+    def test_get_dependents_as_user_returns_readable_dependents(self):
+        """test get dependents as user returns readable dependents
+
+        Returns:
+
+        """
+        mock_request = create_mock_request(user=self.user1)
+
+        result = type_vm_api.get_dependents(
+            self.fixture.global_tvm, request=mock_request
+        )
+
+        self.assertEqual(
+            [dependent.pk for dependent in result],
+            [self.fixture.user1_type.pk],
+        )
+
+    def test_get_dependents_as_superuser_returns_all_dependents(self):
+        """test get dependents as superuser returns all dependents
+
+        Returns:
+
+        """
+        mock_request = create_mock_request(user=self.superuser1)
+
+        result = type_vm_api.get_dependents(
+            self.fixture.global_tvm, request=mock_request
+        )
+
+        self.assertEqual(len(result), 2)
+
+    def test_get_dependents_without_dependents_returns_empty_list(self):
+        """test get dependents without dependents returns empty list
+
+        Returns:
+
+        """
+        mock_request = create_mock_request(user=self.superuser1)
+
+        result = type_vm_api.get_dependents(
+            self.fixture.user1_tvm, request=mock_request
+        )
+
+        self.assertEqual(len(result), 0)
+
+    def test_count_dependents_by_version_as_superuser_returns_counts(self):
+        """test count dependents by version as superuser returns counts
+
+        Returns:
+
+        """
+        mock_request = create_mock_request(user=self.superuser1)
+
+        result = type_vm_api.count_dependents_by_version(
+            self.fixture.global_tvm, request=mock_request
+        )
+
+        self.assertEqual(result, {str(self.fixture.global_type.pk): 2})
@@ -0,0 +1,69 @@
+"""Integration tests for composer permissions initialization"""
+
+from unittest.mock import patch
+
+from django.apps import apps as django_apps
+from django.contrib.auth.models import Group
+from django.test import TestCase
+
+from core_composer_app.apps import ComposerAppConfig
+from core_composer_app.permissions import discover
+from core_composer_app.permissions import rights as composer_rights
+from core_main_app.permissions import rights as main_rights
+
+
+class TestInitPermissions(TestCase):
+    """Test Init Permissions"""
+
+    def test_default_group_has_composer_permissions(self):
+        """test_default_group_has_composer_permissions"""
+
+        # Arrange
+        Group.objects.filter(name=main_rights.DEFAULT_GROUP).delete()
+
+        # Act
+        discover.init_permissions(django_apps)
+
+        # Assert
+        self.assertEqual(
+            set(
+                Group.objects.get(
+                    name=main_rights.DEFAULT_GROUP
+                ).permissions.values_list("codename", flat=True)
+            ),
+            {
+                composer_rights.COMPOSER_ACCESS,
+                composer_rights.COMPOSER_SAVE_TEMPLATE,
+                composer_rights.COMPOSER_SAVE_TYPE,
+            },
+        )
+
+    def test_init_permissions_is_idempotent(self):
+        """test_init_permissions_is_idempotent"""
+
+        # Act
+        discover.init_permissions(django_apps)
+        discover.init_permissions(django_apps)
+
+        # Assert
+        self.assertEqual(
+            Group.objects.filter(name=main_rights.DEFAULT_GROUP).count(), 1
+        )
+
+
+class TestAppReady(TestCase):
+    """Test App Ready"""
+
+    @patch.object(discover, "init_permissions")
+    def test_ready_does_not_access_database(self, mock_init_permissions):
+        """test_ready_does_not_access_database"""
+
+        # Arrange
+        app_config = django_apps.get_app_config("core_composer_app")
+
+        # Act
+        with self.assertNumQueries(0):
+            ComposerAppConfig.ready(app_config)
+
+        # Assert
+        mock_init_permissions.assert_not_called()
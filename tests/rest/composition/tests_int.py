@@ -0,0 +1,338 @@
+"""Integration Test for Composition Rest API"""
+
+from unittest.mock import MagicMock, patch
+
+from django.test import override_settings
+from rest_framework import status
+
+from core_main_app.components.template.models import Template
+from core_main_app.components.template_version_manager.models import (
+    TemplateVersionManager,
+)
+from core_main_app.utils.integration_tests.fixture_interface import (
+    FixtureInterface,
+)
+from core_main_app.utils.integration_tests.integration_base_test_case import (
+    IntegrationBaseTestCase,
+)
+from core_main_app.utils.tests_tools.MockUser import create_mock_user
+from core_main_app.utils.tests_tools.RequestMock import RequestMock
+from core_composer_app.components.type.models import Type
+from core_composer_app.components.type_version_manager.models import (
+    TypeVersionManager,
+)
+from core_composer_app.rest.composition import views
+from core_composer_app.utils import save as save_utils
+from core_composer_app.utils import xml as composer_xml_utils
+
+SEQUENCE_XPATH = "xsd:complexType/xsd:sequence"
+TYPE_XSD = (
+    '<xsd:schema xmlns:xsd="http://www.w3.org/2001/XMLSchema">'
+    '<xsd:simpleType name="Code">'
+    '<xsd:restriction base="xsd:string"/></xsd:simpleType>'
+    "</xsd:schema>"
+)
+
+
+class CompositionFixtures(FixtureInterface):
+    """Composition fixtures"""
+
+    type_vm = None
+    type_object = None
+    template = None
+
+    def insert_data(self):
+        """Insert a type.
+
+        Returns:
+
+        """
+        self.type_vm = TypeVersionManager(
+            title="code", user="1", is_disabled=False
+        )
+        self.type_vm.save_version_manager()
+        self.type_object = Type(
+            filename="code.xsd",
+            content=TYPE_XSD,
+            _hash="hash_code",
+            is_complex=False,
+            version_manager=self.type_vm,
+            user="1",
+            is_current=True,
+        )
+        self.type_object.save_template()
+        template_vm = TemplateVersionManager(
+            title="template", user="1", is_disabled=False
+        )
+        template_vm.save_version_manager()
+        self.template = Template(
+            filename="template.xsd",
+            content=TYPE_XSD,
+            _hash="hash_template",
+            version_manager=template_vm,
+            user="1",
+            is_current=True,
+        )
+        self.template.save_template()
+
+
+fixture_composition = CompositionFixtures()
+
+
+class TestCompose(IntegrationBaseTestCase):
+    """Test Compose"""
+
+    fixture = fixture_composition
+
+    def test_post_returns_composed_schema(self):
+        """test_post_returns_composed_schema"""
+
+        # Arrange
+        user = create_mock_user("1", has_perm=True)
+        data = {
+            "operations": [
+                {
+                    "operation": "insert_element",
+                    "xpath": SEQUENCE_XPATH,
+                    "type": "string",
+                    "name": "title",
+                }
+            ]
+        }
+
+        # Act
+        response = RequestMock.do_request_post(
+            views.Compose.as_view(), user, data=data
+        )
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn(
+            '<xsd:element type="xsd:string" name="title"/>',
+            response.data["content"],
+        )
+
+    @override_settings(ROOT_URLCONF="core_main_app.urls")
+    @patch.object(composer_xml_utils, "validate_schema")
+    def test_post_inserts_current_type(self, mock_validate_schema):
+        """test_post_inserts_current_type"""
+
+        # Arrange
+        # the includes are not served during the tests
+        mock_validate_schema.return_value = MagicMock(is_valid=True)
+        user = create_mock_user("1", has_perm=True)
+        data = {
+            "operations": [
+                {
+                    "operation": "insert_element",
+                    "xpath": SEQUENCE_XPATH,
+                    "type_version_manager": str(self.fixture.type_vm.id),
+                    "name": "code",
+                }
+            ]
+        }
+
+        # Act
+        response = RequestMock.do_request_post(
+            views.Compose.as_view(), user, data=data
+        )
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn("<xsd:include", response.data["content"])
+
+    @override_settings(ROOT_URLCONF="core_main_app.urls")
+    @patch.object(save_utils, "Template")
+    @patch.object(save_utils.template_version_manager_api, "insert")
+    @patch.object(composer_xml_utils, "validate_schema")
+    def test_post_save_as_template_returns_http_201(
+        self, mock_validate_schema, mock_insert, mock_template
+    ):
+        """test_post_save_as_template_returns_http_201"""
+
+        # Arrange
+        # the includes are not served during the tests
+        mock_validate_schema.return_value = MagicMock(is_valid=True)
+        user = create_mock_user("1", has_perm=True)
+        data = {
+            "operations": [
+                {
+                    "operation": "insert_element",
+                    "xpath": SEQUENCE_XPATH,
+                    "type_version_manager": str(self.fixture.type_vm.id),
+                    "name": "code",
+                }
+            ],
+            "save_as": "template",
+            "title": "composed",
+        }
+
+        # Act
+        response = RequestMock.do_request_post(
+            views.Compose.as_view(), user, data=data
+        )
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(
+            mock_template.call_args.kwargs["filename"], "composed.xsd"
+        )
+        mock_insert.assert_called_once()
+        mock_template.return_value.dependencies.set.assert_called_with(
+            [self.fixture.type_object]
+        )
+
+    def test_post_save_as_template_without_permission_returns_http_403(
+        self,
+    ):
+        """test_post_save_as_template_without_permission_returns_http_403"""
+
+        # Arrange
+        user = create_mock_user("1")
+        user.has_perm.side_effect = lambda permission: (
+            permission == "core_composer_app.access_composer"
+        )
+        data = {
+            "operations": [],
+            "save_as": "template",
+            "title": "composed",
+        }
+
+        # Act
+        response = RequestMock.do_request_post(
+            views.Compose.as_view(), user, data=data
+        )
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_post_save_as_type_from_existing_template_returns_http_400(
+        self,
+    ):
+        """test_post_save_as_type_from_existing_template_returns_http_400"""
+
+        # Arrange
+        user = create_mock_user("1", has_perm=True)
+        data = {
+            "template_id": str(self.fixture.template.id),
+            "operations": [],
+            "save_as": "type",
+            "title": "composed",
+        }
+
+        # Act
+        response = RequestMock.do_request_post(
+            views.Compose.as_view(), user, data=data
+        )
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(
+            response.data["message"],
+            "Unable to save an existing template as a type.",
+        )
+
+    @override_settings(ROOT_URLCONF="core_main_app.urls")
+    @patch.object(save_utils, "Type")
+    @patch.object(save_utils.type_version_manager_api, "insert")
+    @patch.object(composer_xml_utils, "validate_schema")
+    def test_post_save_as_type_from_existing_type_returns_http_201(
+        self, mock_validate_schema, mock_insert, mock_type
+    ):
+        """test_post_save_as_type_from_existing_type_returns_http_201"""
+
+        # Arrange
+        mock_validate_schema.return_value = MagicMock(is_valid=True)
+        user = create_mock_user("1", has_perm=True)
+        data = {
+            "template_id": str(self.fixture.type_object.id),
+            "operations": [],
+            "save_as": "type",
+            "title": "composed",
+        }
+
+        # Act
+        response = RequestMock.do_request_post(
+            views.Compose.as_view(), user, data=data
+        )
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        mock_insert.assert_called_once()
+        mock_type.return_value.dependencies.set.assert_called_with([])
+
+    def test_post_invalid_operation_returns_http_400(self):
+        """test_post_invalid_operation_returns_http_400"""
+
+        # Arrange
+        user = create_mock_user("1", has_perm=True)
+        data = {"operations": [{"operation": "rename_element"}]}
+
+        # Act
+        response = RequestMock.do_request_post(
+            views.Compose.as_view(), user, data=data
+        )
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_post_invalid_schema_returns_http_400(self):
+        """test_post_invalid_schema_returns_http_400"""
+
+        # Arrange
+        user = create_mock_user("1", has_perm=True)
+        data = {
+            "operations": [
+                {
+                    "operation": "change_element_type",
+                    "xpath": SEQUENCE_XPATH,
+                    "type": "unknown",
+                }
+            ]
+        }
+
+        # Act
+        response = RequestMock.do_request_post(
+            views.Compose.as_view(), user, data=data
+        )
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_post_unknown_type_returns_http_404(self):
+        """test_post_unknown_type_returns_http_404"""
+
+        # Arrange
+        user = create_mock_user("1", has_perm=True)
+        data = {
+            "operations": [
+                {
+                    "operation": "insert_element",
+                    "xpath": SEQUENCE_XPATH,
+                    "type_version_manager": "-1",
+                }
+            ]
+        }
+
+        # Act
+        response = RequestMock.do_request_post(
+            views.Compose.as_view(), user, data=data
+        )
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_post_without_permission_returns_http_403(self):
+        """test_post_without_permission_returns_http_403"""
+
+        # Arrange
+        user = create_mock_user("1")
+        data = {"operations": []}
+
+        # Act
+        response = RequestMock.do_request_post(
+            views.Compose.as_view(), user, data=data
+        )
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
@@ -0,0 +1,112 @@
+"""Integration Test for Job Rest API"""
+
+from rest_framework import status
+
+from core_main_app.utils.integration_tests.integration_base_test_case import (
+    IntegrationBaseTestCase,
+)
+from core_main_app.utils.tests_tools.MockUser import create_mock_user
+from core_main_app.utils.tests_tools.RequestMock import RequestMock
+from core_composer_app.rest.job import views
+
+from tests.components.job.fixtures.fixtures import JobFixtures
+
+fixture_job = JobFixtures()
+
+
+class TestJobDetail(IntegrationBaseTestCase):
+    """Test Job Detail"""
+
+    fixture = fixture_job
+
+    def test_get_returns_job(self):
+        """test_get_returns_job"""
+
+        # Arrange
+        user = create_mock_user("1")
+
+        # Act
+        response = RequestMock.do_request_get(
+            views.JobDetail.as_view(),
+            user,
+            param={"pk": str(self.fixture.finished_job.id)},
+        )
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["status"], "SUCCESS")
+
+    def test_get_job_of_other_user_returns_http_403(self):
+        """test_get_job_of_other_user_returns_http_403"""
+
+        # Arrange
+        user = create_mock_user("2")
+
+        # Act
+        response = RequestMock.do_request_get(
+            views.JobDetail.as_view(),
+            user,
+            param={"pk": str(self.fixture.finished_job.id)},
+        )
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_get_unknown_job_returns_http_404(self):
+        """test_get_unknown_job_returns_http_404"""
+
+        # Arrange
+        user = create_mock_user("1")
+
+        # Act
+        response = RequestMock.do_request_get(
+            views.JobDetail.as_view(), user, param={"pk": "-1"}
+        )
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+
+class TestJobResult(IntegrationBaseTestCase):
+    """Test Job Result"""
+
+    fixture = fixture_job
+
+    def test_get_returns_result(self):
+        """test_get_returns_result"""
+
+        # Arrange
+        user = create_mock_user("1")
+
+        # Act
+        response = RequestMock.do_request_get(
+            views.JobResult.as_view(),
+            user,
+            param={"pk": str(self.fixture.finished_job.id)},
+        )
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data, {"value": "value"})
+
+
+class TestJobCancel(IntegrationBaseTestCase):
+    """Test Job Cancel"""
+
+    fixture = fixture_job
+
+    def test_cancel_finished_job_returns_http_400(self):
+        """test_cancel_finished_job_returns_http_400"""
+
+        # Arrange
+        user = create_mock_user("1")
+
+        # Act
+        response = RequestMock.do_request_post(
+            views.JobCancel.as_view(),
+            user,
+            param={"pk": str(self.fixture.finished_job.id)},
+        )
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
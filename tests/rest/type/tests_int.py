@@ -0,0 +1,153 @@
+"""Integration Test for Type Rest API"""
+
+from unittest.mock import patch
+
+from rest_framework import status
+from rest_framework.test import APIRequestFactory
+
+from core_main_app.components.template.models import Template
+
+from core_main_app.utils.integration_tests.integration_base_test_case import (
+    IntegrationBaseTestCase,
+)
+from core_main_app.utils.tests_tools.MockUser import create_mock_user
+from core_main_app.utils.tests_tools.RequestMock import RequestMock
+from core_composer_app.rest.type import views
+from core_composer_app.utils.storage import CompressedFileSystemStorage
+
+from tests.components.type_version_manager.fixtures.fixtures import (
+    TypeVersionManagerFixtures,
+)
+
+fixture_type = TypeVersionManagerFixtures()
+
+
+class TestTypeDownload(IntegrationBaseTestCase):
+    """Test Type Download"""
+
+    fixture = fixture_type
+
+    def test_get_streams_type_content(self):
+        """test_get_streams_type_content"""
+
+        # Arrange
+        user = create_mock_user("1")
+
+        # Act
+        response = RequestMock.do_request_get(
+            views.TypeDownload.as_view(),
+            user,
+            param={"pk": str(self.fixture.type_1_1.id)},
+        )
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(b"".join(response.streaming_content), b"content1_1")
+        self.assertEqual(response["Content-Length"], "10")
+        self.assertEqual(response["ETag"], '"hash1_1"')
+
+    def test_get_pretty_print_returns_type_content(self):
+        """test_get_pretty_print_returns_type_content"""
+
+        # Arrange
+        user = create_mock_user("1")
+
+        # Act
+        response = RequestMock.do_request_get(
+            views.TypeDownload.as_view(),
+            user,
+            data={"pretty_print": "false"},
+            param={"pk": str(self.fixture.type_1_1.id)},
+        )
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_get_unknown_type_returns_http_404(self):
+        """test_get_unknown_type_returns_http_404"""
+
+        # Arrange
+        user = create_mock_user("1")
+
+        # Act
+        response = RequestMock.do_request_get(
+            views.TypeDownload.as_view(), user, param={"pk": "-1"}
+        )
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+
+class TestCompressedTypeDownload(IntegrationBaseTestCase):
+    """Test Type Download from the compressed storage"""
+
+    fixture = fixture_type
+
+    def setUp(self):
+        """setUp
+
+        Returns:
+
+        """
+        super().setUp()
+        file_field = Template._meta.get_field("file")
+        storage = CompressedFileSystemStorage(
+            location=file_field.storage.location
+        )
+        storage.compress(self.fixture.type_1_1.file.name)
+        patcher = patch.object(file_field, "storage", storage)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_get_streams_decompressed_type_content(self):
+        """test_get_streams_decompressed_type_content"""
+
+        # Arrange
+        user = create_mock_user("1")
+
+        # Act
+        response = RequestMock.do_request_get(
+            views.TypeDownload.as_view(),
+            user,
+            param={"pk": str(self.fixture.type_1_1.id)},
+        )
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(b"".join(response.streaming_content), b"content1_1")
+        self.assertEqual(response["Content-Length"], "10")
+
+    def test_get_range_of_decompressed_type_content(self):
+        """test_get_range_of_decompressed_type_content"""
+
+        # Arrange
+        user = create_mock_user("1")
+
+        # Act
+        response = views.TypeDownload.as_view()(
+            _get_request_with_range(user, "bytes=3-5"),
+            pk=str(self.fixture.type_1_1.id),
+        )
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_206_PARTIAL_CONTENT)
+        self.assertEqual(b"".join(response.streaming_content), b"ten")
+        self.assertEqual(response["Content-Length"], "3")
+        self.assertEqual(response["Content-Range"], "bytes 3-5/10")
+
+
+def _get_request_with_range(user, range_header):
+    """Return a GET request of a byte range
+
+    Args:
+        user:
+        range_header:
+
+    Returns:
+
+    """
+    request = APIRequestFactory().get(
+        "/dummy_url", headers={"Range": range_header}
+    )
+    request.user = user
+    return request
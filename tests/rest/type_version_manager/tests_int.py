@@ -500,3 +500,46 @@ class TestGlobalTypeList(IntegrationBaseTestCase):
         type_object = type_api.get(type_id, request=mock_request)
         # Assert
         self.assertEqual(type_object.user, None)
+
+
+class TestTypeVersionManagerDependents(IntegrationBaseTestCase):
+    """Test Type Version Manager Dependents"""
+
+    fixture = fixture_type
+
+    def test_get_returns_dependents(self):
+        """test_get_returns_dependents"""
+
+        # Arrange
+        user = create_mock_user("1", is_superuser=True)
+        self.fixture.type_2_1.dependencies.set([self.fixture.type_1_1])
+
+        # Act
+        response = RequestMock.do_request_get(
+            views.TypeVersionManagerDependents.as_view(),
+            user,
+            param={"pk": str(self.fixture.type_vm_1.id)},
+        )
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [dependent["id"] for dependent in response.data],
+            [self.fixture.type_2_1.id],
+        )
+
+    def test_get_unknown_type_returns_http_404(self):
+        """test_get_unknown_type_returns_http_404"""
+
+        # Arrange
+        user = create_mock_user("1", is_superuser=True)
+
+        # Act
+        response = RequestMock.do_request_get(
+            views.TypeVersionManagerDependents.as_view(),
+            user,
+            param={"pk": "-1"},
+        )
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
@@ -60,3 +60,5 @@ MONGODB_INDEXING = False
 MONGODB_ASYNC_SAVE = False
 ENABLE_ALLAUTH = False
 ENABLE_SAML2_SSO_AUTH = False
+
+COMPOSER_CACHE_GENERATION_CHECK_INTERVAL = 0
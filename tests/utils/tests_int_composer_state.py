@@ -0,0 +1,914 @@
+"""Integration tests for composer state utils"""
+
+import json
+from unittest import skipIf
+from unittest.mock import patch
+
+from django.conf import settings
+from django.contrib.sessions.backends.db import SessionStore
+from django.contrib.sessions.middleware import SessionMiddleware
+from django.core.cache import cache
+from django.http import HttpResponse
+from django.test import RequestFactory, override_settings
+
+from core_main_app.utils.integration_tests.integration_base_test_case import (
+    IntegrationBaseTestCase,
+)
+from core_main_app.utils.tests_tools.MockUser import create_mock_user
+
+from core_composer_app.utils import composer_state
+from core_composer_app.views.user import ajax
+from core_composer_app.views.user import views as user_views
+
+XSD_STRING = (
+    '<xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema">'
+    '<xs:element name="root"/></xs:schema>'
+)
+
+
+def _create_request(session_key, data=None):
+    """Create a request, with the session of the given key.
+
+    Args:
+        session_key:
+        data:
+
+    Returns:
+
+    """
+    request = RequestFactory().post("/", data or {})
+    request.session = SessionStore(session_key=session_key)
+    request.user = create_mock_user("1", has_perm=True)
+    return request
+
+
+class TestComposerState(IntegrationBaseTestCase):
+    """Test composer state"""
+
+    def setUp(self):
+        """setUp
+
+        Returns:
+
+        """
+        session = SessionStore()
+        session.create()
+        self.session_key = session.session_key
+        self.revision = composer_state.init_composer_state(
+            _create_request(self.session_key), XSD_STRING, ["type.xsd"]
+        )
+
+    def tearDown(self):
+        """tearDown
+
+        Returns:
+
+        """
+        cache.clear()
+
+    def test_init_composer_state_saves_state(self):
+        """test init composer state saves state
+
+        Returns:
+
+        """
+        session = SessionStore(session_key=self.session_key)
+
+        self.assertEqual(session[composer_state.XSD_SESSION_KEY], XSD_STRING)
+        self.assertEqual(
+            session[composer_state.INCLUDED_TYPES_SESSION_KEY], ["type.xsd"]
+        )
+        self.assertEqual(
+            session[composer_state.REVISION_SESSION_KEY], self.revision
+        )
+
+    def test_init_composer_state_increases_revision(self):
+        """test init composer state increases revision
+
+        Returns:
+
+        """
+        revision = composer_state.init_composer_state(
+            _create_request(self.session_key), XSD_STRING, []
+        )
+
+        self.assertEqual(revision, self.revision + 1)
+
+    def test_edit_increases_revision(self):
+        """test edit increases revision
+
+        Returns:
+
+        """
+        request = _create_request(self.session_key)
+
+        with composer_state.edit_composer_state(request) as state:
+            state.xsd_string = "new"
+
+        self.assertEqual(state.revision, self.revision + 1)
+        self.assertEqual(
+            composer_state.get_revision(_create_request(self.session_key)),
+            self.revision + 1,
+        )
+
+    def test_edit_without_change_keeps_revision(self):
+        """test edit without change keeps revision
+
+        Returns:
+
+        """
+        request = _create_request(self.session_key)
+
+        with composer_state.edit_composer_state(request) as state:
+            state.add_included_type("type.xsd")
+
+        self.assertEqual(state.revision, self.revision)
+
+    def test_removed_included_types_are_saved(self):
+        """test removed included types are saved
+
+        Returns:
+
+        """
+        request = _create_request(self.session_key)
+        with composer_state.edit_composer_state(request) as state:
+            state.add_included_type("type.xsd", ["new"])
+
+        request = _create_request(self.session_key)
+        with composer_state.edit_composer_state(request) as state:
+            self.assertEqual(state.included_type_names, {"type.xsd": ["new"]})
+            state.remove_included_types(["type.xsd"])
+
+        request = _create_request(self.session_key)
+        with composer_state.edit_composer_state(request) as state:
+            self.assertNotIn("type.xsd", state.included_types)
+            self.assertEqual(state.included_type_names, {})
+
+    def test_edit_with_expected_revision_applies_change(self):
+        """test edit with expected revision applies change
+
+        Returns:
+
+        """
+        request = _create_request(
+            self.session_key, {"revision": self.revision}
+        )
+
+        with composer_state.edit_composer_state(request) as state:
+            state.xsd_string = "new"
+
+        self.assertEqual(
+            SessionStore(session_key=self.session_key)[
+                composer_state.XSD_SESSION_KEY
+            ],
+            "new",
+        )
+
+    def test_edit_with_previous_revision_raises_conflict(self):
+        """test edit with previous revision raises conflict
+
+        Returns:
+
+        """
+        request = _create_request(
+            self.session_key, {"revision": self.revision - 1}
+        )
+
+        with self.assertRaises(composer_state.RevisionConflictError) as error:
+            with composer_state.edit_composer_state(request) as state:
+                state.xsd_string = "new"
+
+        self.assertEqual(error.exception.revision, self.revision)
+        self.assertEqual(
+            SessionStore(session_key=self.session_key)[
+                composer_state.XSD_SESSION_KEY
+            ],
+            XSD_STRING,
+        )
+
+    def test_concurrent_edits_are_not_lost(self):
+        """test concurrent edits are not lost
+
+        Returns:
+
+        """
+        # both requests load the session before any edit
+        first_request = _create_request(self.session_key)
+        second_request = _create_request(self.session_key)
+        first_request.session.load()
+        second_request.session.load()
+
+        with composer_state.edit_composer_state(first_request) as state:
+            state.add_included_type("first.xsd")
+        with composer_state.edit_composer_state(second_request) as state:
+            state.add_included_type("second.xsd")
+
+        session = SessionStore(session_key=self.session_key)
+        self.assertEqual(
+            session[composer_state.INCLUDED_TYPES_SESSION_KEY],
+            ["type.xsd", "first.xsd", "second.xsd"],
+        )
+        self.assertEqual(
+            session[composer_state.REVISION_SESSION_KEY], self.revision + 2
+        )
+
+    @patch.object(composer_state, "COMPOSER_STATE_WAIT_TIMEOUT", 0)
+    def test_edit_of_locked_state_raises_conflict_after_timeout(self):
+        """test edit of locked state raises conflict after timeout
+
+        Returns:
+
+        """
+        request = _create_request(self.session_key)
+
+        with composer_state.edit_composer_state(request):
+            with self.assertRaises(composer_state.RevisionConflictError):
+                with composer_state.edit_composer_state(
+                    _create_request(self.session_key)
+                ):
+                    pass
+
+    def test_edit_waits_for_lock(self):
+        """test edit waits for lock
+
+        Returns:
+
+        """
+        lock_key = composer_state._get_lock_key(
+            SessionStore(session_key=self.session_key)
+        )
+        cache.add(lock_key, "other request")
+
+        # the other request releases the lock while the edit waits
+        with patch.object(
+            composer_state.time,
+            "sleep",
+            side_effect=lambda delay: cache.delete(lock_key),
+        ) as mock_sleep:
+            with composer_state.edit_composer_state(
+                _create_request(self.session_key)
+            ) as state:
+                state.xsd_string = "new"
+
+        mock_sleep.assert_called_once()
+        self.assertEqual(state.revision, self.revision + 1)
+
+    def test_pipelined_edits_are_applied_in_order(self):
+        """test pipelined edits are applied in order
+
+        Returns:
+
+        """
+
+        def apply_first_edit(delay):
+            with composer_state.edit_composer_state(
+                _create_request(self.session_key, {"revision": self.revision})
+            ) as state:
+                state.add_included_type("first.xsd")
+
+        # the second edit is served before the first one
+        with patch.object(
+            composer_state.time, "sleep", side_effect=apply_first_edit
+        ):
+            with composer_state.edit_composer_state(
+                _create_request(
+                    self.session_key, {"revision": self.revision + 1}
+                )
+            ) as state:
+                state.add_included_type("second.xsd")
+
+        session = SessionStore(session_key=self.session_key)
+        self.assertEqual(
+            session[composer_state.INCLUDED_TYPES_SESSION_KEY],
+            ["type.xsd", "first.xsd", "second.xsd"],
+        )
+        self.assertEqual(
+            session[composer_state.REVISION_SESSION_KEY], self.revision + 2
+        )
+
+    @patch.object(composer_state, "COMPOSER_STATE_WAIT_TIMEOUT", 0)
+    def test_edit_of_missing_revision_raises_conflict_after_timeout(self):
+        """test edit of missing revision raises conflict after timeout
+
+        Returns:
+
+        """
+        request = _create_request(
+            self.session_key, {"revision": self.revision + 1}
+        )
+
+        with self.assertRaises(composer_state.RevisionConflictError) as error:
+            with composer_state.edit_composer_state(request):
+                pass
+
+        self.assertEqual(error.exception.revision, self.revision)
+
+    def test_failed_numbered_edit_creates_revision(self):
+        """test failed numbered edit creates revision
+
+        Returns:
+
+        """
+        with self.assertRaises(ValueError):
+            with composer_state.edit_composer_state(
+                _create_request(self.session_key, {"revision": self.revision})
+            ) as state:
+                state.xsd_string = "new"
+                raise ValueError()
+
+        session = SessionStore(session_key=self.session_key)
+        self.assertEqual(session[composer_state.XSD_SESSION_KEY], XSD_STRING)
+        self.assertEqual(
+            session[composer_state.REVISION_SESSION_KEY], self.revision + 1
+        )
+        # the schema is still the validated one
+        self.assertTrue(
+            composer_state.is_validated(_create_request(self.session_key))
+        )
+
+    def test_unchanged_numbered_edit_creates_revision(self):
+        """test unchanged numbered edit creates revision
+
+        Returns:
+
+        """
+        with composer_state.edit_composer_state(
+            _create_request(self.session_key, {"revision": self.revision})
+        ) as state:
+            state.add_included_type("type.xsd")
+
+        self.assertEqual(state.revision, self.revision + 1)
+        self.assertEqual(
+            composer_state.get_revision(_create_request(self.session_key)),
+            self.revision + 1,
+        )
+
+    def test_set_validated_of_locked_state_is_ignored(self):
+        """test set validated of locked state is ignored
+
+        Returns:
+
+        """
+        request = _create_request(self.session_key)
+
+        with composer_state.edit_composer_state(request):
+            is_validated = composer_state.set_validated(
+                _create_request(self.session_key), self.revision
+            )
+
+        self.assertFalse(is_validated)
+
+    def test_edit_does_not_modify_session_of_request(self):
+        """test edit does not modify session of request
+
+        Returns:
+
+        """
+        request = _create_request(self.session_key)
+
+        with composer_state.edit_composer_state(request) as state:
+            state.xsd_string = "new"
+
+        # saved to the store, not by the session middleware
+        self.assertFalse(request.session.modified)
+        self.assertEqual(
+            SessionStore(session_key=self.session_key)[
+                composer_state.XSD_SESSION_KEY
+            ],
+            "new",
+        )
+
+    @override_settings(SESSION_SAVE_EVERY_REQUEST=True)
+    def test_edit_is_not_overwritten_by_session_middleware(self):
+        """test edit is not overwritten by session middleware
+
+        Returns:
+
+        """
+
+        def edit_view(request):
+            # the session is loaded before the edit, as by the
+            # authentication middleware
+            request.session.get(composer_state.XSD_SESSION_KEY)
+            with composer_state.edit_composer_state(request) as state:
+                state.xsd_string = "new"
+            return HttpResponse()
+
+        request = RequestFactory().post("/")
+        request.COOKIES[settings.SESSION_COOKIE_NAME] = self.session_key
+        request.user = create_mock_user("1", has_perm=True)
+
+        SessionMiddleware(edit_view)(request)
+
+        self.assertEqual(
+            request.session[composer_state.XSD_SESSION_KEY], "new"
+        )
+        self.assertEqual(
+            SessionStore(session_key=self.session_key)[
+                composer_state.XSD_SESSION_KEY
+            ],
+            "new",
+        )
+
+    def test_failed_edit_releases_lock(self):
+        """test failed edit releases lock
+
+        Returns:
+
+        """
+        with self.assertRaises(ValueError):
+            with composer_state.edit_composer_state(
+                _create_request(self.session_key)
+            ) as state:
+                state.xsd_string = "new"
+                raise ValueError()
+
+        with composer_state.edit_composer_state(
+            _create_request(self.session_key)
+        ) as state:
+            self.assertEqual(state.revision, self.revision)
+
+    def test_edit_view_with_previous_revision_returns_conflict(self):
+        """test edit view with previous revision returns conflict
+
+        Returns:
+
+        """
+        request = _create_request(
+            self.session_key,
+            {"typeName": "rootType", "revision": self.revision - 1},
+        )
+
+        response = ajax.change_root_type_name(request)
+
+        self.assertEqual(response.status_code, 409)
+        self.assertEqual(
+            json.loads(response.content)["revision"], self.revision
+        )
+
+    def test_edit_view_returns_new_revision(self):
+        """test edit view returns new revision
+
+        Returns:
+
+        """
+        request = _create_request(
+            self.session_key,
+            {"xpath": "xs:element", "revision": self.revision},
+        )
+
+        with patch.object(
+            ajax.composer_xml_utils,
+            "delete_xsd_element_and_dependencies",
+            return_value=(XSD_STRING, []),
+        ):
+            response = ajax.delete_element(request)
+
+        self.assertEqual(
+            json.loads(response.content)["revision"], self.revision + 1
+        )
+
+    def test_init_composer_state_is_validated(self):
+        """test init composer state is validated
+
+        Returns:
+
+        """
+        self.assertTrue(
+            composer_state.is_validated(_create_request(self.session_key))
+        )
+
+    def test_edit_is_not_validated(self):
+        """test edit is not validated
+
+        Returns:
+
+        """
+        with composer_state.edit_composer_state(
+            _create_request(self.session_key)
+        ) as state:
+            state.xsd_string = "new"
+
+        self.assertFalse(
+            composer_state.is_validated(_create_request(self.session_key))
+        )
+
+    def test_set_validated_of_previous_revision_is_ignored(self):
+        """test set validated of previous revision is ignored
+
+        Returns:
+
+        """
+        with composer_state.edit_composer_state(
+            _create_request(self.session_key)
+        ) as state:
+            state.xsd_string = "new"
+
+        is_validated = composer_state.set_validated(
+            _create_request(self.session_key), self.revision
+        )
+
+        self.assertFalse(is_validated)
+        self.assertFalse(
+            composer_state.is_validated(_create_request(self.session_key))
+        )
+
+    def test_validate_template_view_sets_validated(self):
+        """test validate template view sets validated
+
+        Returns:
+
+        """
+        with composer_state.edit_composer_state(
+            _create_request(self.session_key)
+        ) as state:
+            state.xsd_string = XSD_STRING
+
+        response = ajax.validate_template(_create_request(self.session_key))
+
+        self.assertEqual(
+            json.loads(response.content),
+            {"revision": self.revision + 1, "validated": True},
+        )
+        self.assertTrue(
+            composer_state.is_validated(_create_request(self.session_key))
+        )
+
+    def test_validate_template_view_with_invalid_schema_returns_error(self):
+        """test validate template view with invalid schema returns error
+
+        Returns:
+
+        """
+        with composer_state.edit_composer_state(
+            _create_request(self.session_key)
+        ) as state:
+            state.xsd_string = XSD_STRING.replace(
+                'name="root"', 'name="root" type="unknown"'
+            )
+
+        response = ajax.validate_template(_create_request(self.session_key))
+
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(
+            composer_state.is_validated(_create_request(self.session_key))
+        )
+
+    def test_deferred_rename_only_checks_element(self):
+        """test deferred rename only checks element
+
+        Returns:
+
+        """
+        request = _create_request(
+            self.session_key, {"xpath": "xs:element", "newName": "other"}
+        )
+
+        with patch.object(ajax, "COMPOSER_DEFERRED_VALIDATION", True):
+            with patch.object(
+                ajax.validation_utils, "validate_schema"
+            ) as mock_validate_schema:
+                response = ajax.rename_element(request)
+
+        mock_validate_schema.assert_not_called()
+        self.assertEqual(
+            json.loads(response.content)["revision"], self.revision + 1
+        )
+        self.assertFalse(
+            composer_state.is_validated(_create_request(self.session_key))
+        )
+
+    def test_rename_does_not_validate_schema(self):
+        """test rename does not validate schema
+
+        Returns:
+
+        """
+        request = _create_request(
+            self.session_key, {"xpath": "xs:element", "newName": "other"}
+        )
+
+        with patch.object(
+            ajax.validation_utils, "validate_schema"
+        ) as mock_validate_schema:
+            response = ajax.rename_element(request)
+
+        mock_validate_schema.assert_not_called()
+        self.assertEqual(response.status_code, 200)
+
+    def test_rename_with_reserved_name_returns_error(self):
+        """test rename with reserved name returns error
+
+        Returns:
+
+        """
+        request = _create_request(
+            self.session_key, {"xpath": "xs:element", "newName": "xmlRoot"}
+        )
+
+        response = ajax.rename_element(request)
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(
+            composer_state.get_revision(_create_request(self.session_key)),
+            self.revision,
+        )
+
+    def test_deferred_rename_with_invalid_name_returns_error(self):
+        """test deferred rename with invalid name returns error
+
+        Returns:
+
+        """
+        request = _create_request(
+            self.session_key, {"xpath": "xs:element", "newName": "1 root"}
+        )
+
+        with patch.object(ajax, "COMPOSER_DEFERRED_VALIDATION", True):
+            response = ajax.rename_element(request)
+
+        self.assertEqual(response.status_code, 400)
+        self.assertTrue(
+            composer_state.is_validated(_create_request(self.session_key))
+        )
+
+    def test_deferred_download_of_invalid_schema_returns_error(self):
+        """test deferred download of invalid schema returns error
+
+        Returns:
+
+        """
+        with composer_state.edit_composer_state(
+            _create_request(self.session_key)
+        ) as state:
+            state.xsd_string = XSD_STRING.replace(
+                'name="root"', 'name="root" type="unknown"'
+            )
+
+        with patch.object(user_views, "COMPOSER_DEFERRED_VALIDATION", True):
+            with patch.object(user_views, "render") as mock_render:
+                user_views.download_xsd(_create_request(self.session_key))
+
+        self.assertIn(
+            "This is not a valid XML schema.",
+            mock_render.call_args.kwargs["context"]["error"],
+        )
+
+
+class TestStatelessComposerState(IntegrationBaseTestCase):
+    """Test composer state carried by the client"""
+
+    def setUp(self):
+        """setUp
+
+        Returns:
+
+        """
+        session = SessionStore()
+        session.create()
+        self.session_key = session.session_key
+        patcher = patch.object(composer_state, "COMPOSER_STATELESS", True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.state = composer_state.init_state_token(
+            _create_request(self.session_key), XSD_STRING, ["type.xsd"]
+        )
+
+    def tearDown(self):
+        """tearDown
+
+        Returns:
+
+        """
+        cache.clear()
+
+    def _create_token_request(self, data=None, token=None):
+        """Create a request sending the state token.
+
+        Args:
+            data:
+            token:
+
+        Returns:
+
+        """
+        return _create_request(
+            self.session_key,
+            {
+                composer_state.STATE_PARAMETER: token or self.state.token,
+                **(data or {}),
+            },
+        )
+
+    def test_init_state_token_returns_token(self):
+        """test init state token returns token
+
+        Returns:
+
+        """
+        self.assertIsNotNone(self.state.token)
+        self.assertNotIn(XSD_STRING, self.state.token)
+
+    def test_get_composer_state_reads_token(self):
+        """test get composer state reads token
+
+        Returns:
+
+        """
+        state = composer_state.get_composer_state(self._create_token_request())
+
+        self.assertEqual(state.xsd_string, XSD_STRING)
+        self.assertEqual(state.included_types, ["type.xsd"])
+        self.assertEqual(state.revision, self.state.revision)
+
+    def test_edit_with_token_returns_new_token(self):
+        """test edit with token returns new token
+
+        Returns:
+
+        """
+        with composer_state.edit_composer_state(
+            self._create_token_request(
+                {composer_state.REVISION_PARAMETER: self.state.revision}
+            )
+        ) as state:
+            state.xsd_string = XSD_STRING.replace("root", "renamed")
+
+        new_state = composer_state.get_composer_state(
+            self._create_token_request(token=state.token)
+        )
+        self.assertEqual(new_state.revision, self.state.revision + 1)
+        self.assertIn("renamed", new_state.xsd_string)
+
+    def test_edit_with_token_does_not_use_session(self):
+        """test edit with token does not use session
+
+        Returns:
+
+        """
+        with composer_state.edit_composer_state(
+            self._create_token_request()
+        ) as state:
+            state.xsd_string = XSD_STRING.replace("root", "renamed")
+
+        self.assertNotIn(
+            composer_state.XSD_SESSION_KEY,
+            SessionStore(session_key=self.session_key).load(),
+        )
+
+    def test_edit_with_token_of_previous_revision_raises_conflict(self):
+        """test edit with token of previous revision raises conflict
+
+        Returns:
+
+        """
+        with self.assertRaises(composer_state.RevisionConflictError):
+            with composer_state.edit_composer_state(
+                self._create_token_request(
+                    {composer_state.REVISION_PARAMETER: 0}
+                )
+            ):
+                pass
+
+    def test_tampered_token_raises_error(self):
+        """test tampered token raises error
+
+        Returns:
+
+        """
+        with self.assertRaises(composer_state.StateTokenError):
+            composer_state.get_composer_state(
+                self._create_token_request(token=self.state.token[:-2] + "xx")
+            )
+
+    def test_token_of_another_user_raises_error(self):
+        """test token of another user raises error
+
+        Returns:
+
+        """
+        request = self._create_token_request()
+        request.user = create_mock_user("2", has_perm=True)
+
+        with self.assertRaises(composer_state.StateTokenError):
+            composer_state.get_composer_state(request)
+
+    def test_init_state_token_of_anonymous_user_returns_no_token(self):
+        """test init state token of anonymous user returns no token
+
+        Returns:
+
+        """
+        request = _create_request(self.session_key)
+        request.user = create_mock_user(None, is_anonymous=True)
+
+        state = composer_state.init_state_token(
+            request, XSD_STRING, ["type.xsd"]
+        )
+
+        self.assertIsNone(state.token)
+
+    def test_token_sent_by_anonymous_user_raises_error(self):
+        """test token sent by anonymous user raises error
+
+        Returns:
+
+        """
+        request = self._create_token_request()
+        request.user = create_mock_user(None, is_anonymous=True)
+
+        with self.assertRaises(composer_state.StateTokenError):
+            composer_state.get_composer_state(request)
+
+    def test_expired_token_raises_error(self):
+        """test expired token raises error
+
+        Returns:
+
+        """
+        with patch.object(composer_state, "COMPOSER_STATE_TOKEN_MAX_AGE", -1):
+            with self.assertRaises(composer_state.StateTokenError):
+                composer_state.get_composer_state(self._create_token_request())
+
+    def test_oversized_state_is_stored_in_session(self):
+        """test oversized state is stored in session
+
+        Returns:
+
+        """
+        with patch.object(composer_state, "COMPOSER_STATE_TOKEN_MAX_SIZE", 10):
+            with composer_state.edit_composer_state(
+                self._create_token_request()
+            ) as state:
+                state.xsd_string = XSD_STRING.replace("root", "renamed")
+
+        self.assertIsNone(state.token)
+        session_state = composer_state.get_composer_state(
+            _create_request(self.session_key)
+        )
+        self.assertIn("renamed", session_state.xsd_string)
+        self.assertEqual(session_state.revision, self.state.revision + 1)
+
+    def test_set_validated_with_token_returns_validated_token(self):
+        """test set validated with token returns validated token
+
+        Returns:
+
+        """
+        with composer_state.edit_composer_state(
+            self._create_token_request()
+        ) as state:
+            state.xsd_string = XSD_STRING.replace("root", "renamed")
+        request = self._create_token_request(token=state.token)
+        self.assertFalse(composer_state.is_validated(request))
+
+        state = composer_state.get_composer_state(request)
+        self.assertTrue(
+            composer_state.set_validated(request, state.revision, state)
+        )
+        self.assertTrue(
+            composer_state.is_validated(
+                self._create_token_request(token=state.token)
+            )
+        )
+
+    def test_edit_view_returns_token(self):
+        """test edit view returns token
+
+        Returns:
+
+        """
+        request = self._create_token_request(
+            {"xpath": "xs:element", "newName": "renamed"}
+        )
+
+        with patch.object(ajax, "COMPOSER_STATELESS", True):
+            response = ajax.rename_element(request)
+
+        self.assertEqual(response.status_code, 200)
+        token = json.loads(response.content)["state"]
+        self.assertIn(
+            'name="renamed"',
+            composer_state.get_composer_state(
+                self._create_token_request(token=token)
+            ).xsd_string,
+        )
+
+    @skipIf(composer_state.Fernet is None, "cryptography is not installed")
+    def test_encrypted_token_round_trip(self):
+        """test encrypted token round trip
+
+        Returns:
+
+        """
+        with patch.object(
+            composer_state, "COMPOSER_STATE_TOKEN_ENCRYPTION", True
+        ):
+            state = composer_state.init_state_token(
+                _create_request(self.session_key), XSD_STRING, []
+            )
+            read_state = composer_state.get_composer_state(
+                self._create_token_request(token=state.token)
+            )
+
+        self.assertEqual(read_state.xsd_string, XSD_STRING)
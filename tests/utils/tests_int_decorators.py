@@ -0,0 +1,100 @@
+"""Integration tests for composer decorators"""
+
+from unittest.mock import AsyncMock, Mock
+
+from django.core.exceptions import PermissionDenied
+from django.http import HttpResponse
+from django.test import AsyncRequestFactory, TestCase, override_settings
+
+from core_composer_app.utils.decorators import async_permission_required
+
+
+async def _view(request):
+    """View used in tests
+
+    Args:
+        request:
+
+    Returns:
+
+    """
+    return HttpResponse("view")
+
+
+def _create_request(has_perm=True, is_anonymous=False):
+    """Create an async request.
+
+    Args:
+        has_perm:
+        is_anonymous:
+
+    Returns:
+
+    """
+    request = AsyncRequestFactory().get("/composer/")
+    user = Mock(
+        is_anonymous=is_anonymous, ahas_perm=AsyncMock(return_value=has_perm)
+    )
+    request.auser = AsyncMock(return_value=user)
+    return request
+
+
+@override_settings(LOGIN_URL="/login", ROOT_URLCONF="core_main_app.urls")
+class TestAsyncPermissionRequired(TestCase):
+    """Test Async Permission Required"""
+
+    async def test_user_with_permission_gets_view(self):
+        """test_user_with_permission_gets_view"""
+
+        # Arrange
+        view = async_permission_required("app", "permission")(_view)
+
+        # Act
+        response = await view(_create_request())
+
+        # Assert
+        self.assertEqual(response.content, b"view")
+
+    async def test_user_without_permission_is_redirected_to_login(self):
+        """test_user_without_permission_is_redirected_to_login"""
+
+        # Arrange
+        view = async_permission_required("app", "permission")(_view)
+
+        # Act
+        response = await view(_create_request(has_perm=False))
+
+        # Assert
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(response.url, "/login?next=/composer/")
+
+    async def test_user_without_permission_raises_permission_denied(self):
+        """test_user_without_permission_raises_permission_denied"""
+
+        # Arrange
+        view = async_permission_required(
+            "app", "permission", raise_exception=True
+        )(_view)
+
+        # Act # Assert
+        with self.assertRaises(PermissionDenied):
+            await view(_create_request(has_perm=False))
+
+    async def test_anonymous_user_without_group_permission_is_redirected(
+        self,
+    ):
+        """test_anonymous_user_without_group_permission_is_redirected"""
+
+        # Arrange
+        view = async_permission_required(
+            "app", "permission", login_url="http://login.example.com/"
+        )(_view)
+
+        # Act
+        response = await view(_create_request(is_anonymous=True))
+
+        # Assert
+        self.assertEqual(
+            response.url,
+            "http://login.example.com/?next=http%3A//testserver/composer/",
+        )
@@ -0,0 +1,118 @@
+"""Integration tests for the compress_template_content command"""
+
+from io import StringIO
+from unittest.mock import patch
+
+from django.core.management import CommandError, call_command
+
+from core_main_app.components.template.models import Template
+from core_main_app.utils.integration_tests.integration_base_test_case import (
+    IntegrationBaseTestCase,
+)
+
+from core_composer_app.components.type.models import Type
+from core_composer_app.utils.storage import CompressedFileSystemStorage
+from tests.components.type_version_manager.fixtures.fixtures import (
+    TypeVersionManagerFixtures,
+)
+
+
+class TestCompressTemplateContentCommand(IntegrationBaseTestCase):
+    """Test compress_template_content command"""
+
+    fixture = TypeVersionManagerFixtures()
+
+    def setUp(self):
+        """setUp
+
+        Returns:
+
+        """
+        super().setUp()
+        file_field = Template._meta.get_field("file")
+        # compressed storage reading the files of the fixtures
+        self.storage = CompressedFileSystemStorage(
+            location=file_field.storage.location
+        )
+        patcher = patch.object(file_field, "storage", self.storage)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _call_command(self, *args):
+        """Call the command, return its output.
+
+        Args:
+            *args:
+
+        Returns:
+
+        """
+        stdout = StringIO()
+        call_command(
+            "compress_template_content", *args, stdout=stdout, stderr=stdout
+        )
+        return stdout.getvalue()
+
+    def test_command_compresses_content(self):
+        """test_command_compresses_content"""
+
+        output = self._call_command("--batch-size", "2")
+
+        self.assertIn("Done: 4 compressed, 0 skipped, 0 errors.", output)
+        type_object = Type.get_by_id(self.fixture.type_1_1.id)
+        self.assertTrue(self.storage.is_compressed(type_object.file.name))
+        self.assertEqual(type_object.content, "content1_1")
+
+    def test_command_skips_compressed_content(self):
+        """test_command_skips_compressed_content"""
+
+        self._call_command()
+        output = self._call_command()
+
+        self.assertIn("Done: 0 compressed, 4 skipped, 0 errors.", output)
+
+    def test_command_skips_templates_without_file(self):
+        """test_command_skips_templates_without_file"""
+
+        Type.objects.filter(pk=self.fixture.type_1_1.pk).update(file="")
+
+        output = self._call_command()
+
+        self.assertIn("Done: 3 compressed, 1 skipped, 0 errors.", output)
+
+    def test_command_reports_errors(self):
+        """test_command_reports_errors"""
+
+        Type.objects.filter(pk=self.fixture.type_1_1.pk).update(
+            file="missing.xsd"
+        )
+
+        output = self._call_command()
+
+        self.assertIn("ERROR: Unable to compress", output)
+        self.assertIn("Done: 3 compressed, 0 skipped, 1 errors.", output)
+
+    def test_dry_run_does_not_compress_content(self):
+        """test_dry_run_does_not_compress_content"""
+
+        output = self._call_command("--dry-run", "--types-only")
+
+        self.assertIn("Dry run", output)
+        self.assertIn("Done: 4 compressed, 0 skipped, 0 errors.", output)
+        type_object = Type.get_by_id(self.fixture.type_1_1.id)
+        self.assertFalse(self.storage.is_compressed(type_object.file.name))
+
+    def test_invalid_batch_size_raises_command_error(self):
+        """test_invalid_batch_size_raises_command_error"""
+
+        with self.assertRaises(CommandError):
+            self._call_command("--batch-size", "0")
+
+    def test_uncompressed_storage_raises_command_error(self):
+        """test_uncompressed_storage_raises_command_error"""
+
+        with patch.object(
+            Template._meta.get_field("file"), "storage", object()
+        ):
+            with self.assertRaises(CommandError):
+                self._call_command()
@@ -0,0 +1,209 @@
+"""Integration tests for composer cache warm-up"""
+
+from unittest.mock import Mock, patch
+
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import override_settings
+
+from core_main_app.components.template.models import Template
+from core_main_app.utils import xml as main_xml_utils
+from core_main_app.utils.integration_tests.integration_base_test_case import (
+    IntegrationBaseTestCase,
+)
+from core_composer_app.components.catalog import api as catalog_api
+from core_composer_app.components.type.models import Type
+from core_composer_app.utils import warm_up as warm_up_utils
+
+from tests.components.type_version_manager.fixtures.fixtures import (
+    TypeVersionManagerAccessControlFixtures,
+)
+
+fixture_type_vm = TypeVersionManagerAccessControlFixtures()
+
+INCLUDING_XSD = (
+    '<xsd:schema xmlns:xsd="http://www.w3.org/2001/XMLSchema">'
+    '<xsd:include schemaLocation="{0}"/>'
+    '<xsd:element name="root" type="TimeUnitType"/></xsd:schema>'
+)
+
+
+class TestGetMostUsedTypes(IntegrationBaseTestCase):
+    """Test Get Most Used Types"""
+
+    fixture = fixture_type_vm
+
+    def setUp(self):
+        """setUp"""
+        super().setUp()
+        self.fixture.user1_type.dependencies.set([self.fixture.global_type])
+        self.fixture.user2_type.dependencies.set(
+            [self.fixture.global_type, self.fixture.user1_type]
+        )
+
+    def test_types_are_ordered_by_number_of_dependents(self):
+        """test_types_are_ordered_by_number_of_dependents"""
+
+        # Act
+        result = warm_up_utils.get_most_used_types(10)
+
+        # Assert
+        self.assertEqual(
+            result, [self.fixture.global_type, self.fixture.user1_type]
+        )
+
+    def test_types_are_limited(self):
+        """test_types_are_limited"""
+
+        # Act
+        result = warm_up_utils.get_most_used_types(1)
+
+        # Assert
+        self.assertEqual(result, [self.fixture.global_type])
+
+
+@override_settings(ROOT_URLCONF="core_main_app.urls")
+class TestWarmUpCache(IntegrationBaseTestCase):
+    """Test Warm Up Cache"""
+
+    fixture = fixture_type_vm
+
+    def setUp(self):
+        """setUp"""
+        super().setUp()
+        cache.clear()
+        self.fixture.global_type.save_template()
+        self.fixture.user1_type.dependencies.set([self.fixture.global_type])
+
+    @patch.object(warm_up_utils, "validate_schema_with_cache")
+    def test_most_used_types_are_validated(
+        self, mock_validate_schema_with_cache
+    ):
+        """test_most_used_types_are_validated"""
+
+        # Act
+        reports = warm_up_utils.warm_up_cache()
+
+        # Assert
+        self.assertEqual(
+            [(report["name"], report["count"]) for report in reports],
+            [("xslt", 1), ("catalog", 1), ("types", 1), ("templates", 0)],
+        )
+        mock_validate_schema_with_cache.assert_called_once()
+
+    @patch.object(warm_up_utils, "validate_schema_with_cache")
+    def test_failing_type_is_reported_as_error(
+        self, mock_validate_schema_with_cache
+    ):
+        """test_failing_type_is_reported_as_error"""
+
+        # Arrange
+        mock_validate_schema_with_cache.side_effect = Exception("error")
+
+        # Act
+        reports = warm_up_utils.warm_up_cache()
+
+        # Assert
+        self.assertEqual(reports[2]["errors"], 1)
+
+    @patch.object(warm_up_utils, "validate_schema_with_cache")
+    def test_template_is_flattened_with_access_of_its_owner(
+        self, mock_validate_schema_with_cache
+    ):
+        """test_template_is_flattened_with_access_of_its_owner"""
+
+        # Arrange
+        self.fixture.user2_type.save_template()
+        template = Template(
+            filename="template.xsd",
+            content=INCLUDING_XSD.format(
+                main_xml_utils._get_schema_location_uri(
+                    str(self.fixture.user2_type.pk)
+                )
+            ),
+            _hash="template hash",
+            user="1",
+        )
+        template.save_template()
+
+        # Act
+        result = warm_up_utils._warm_up_templates([template])
+
+        # Assert
+        self.assertEqual(result, (0, 1))
+        mock_validate_schema_with_cache.assert_not_called()
+
+    @patch.object(warm_up_utils, "validate_schema_with_cache")
+    def test_template_is_flattened_and_cached(
+        self, mock_validate_schema_with_cache
+    ):
+        """test_template_is_flattened_and_cached"""
+
+        # Arrange
+        template = Template(
+            filename="template.xsd",
+            content=INCLUDING_XSD.format(
+                main_xml_utils._get_schema_location_uri(
+                    str(self.fixture.global_type.pk)
+                )
+            ),
+            _hash="template hash",
+            user="1",
+        )
+        template.save_template()
+
+        # Act
+        result = warm_up_utils._warm_up_templates([template])
+
+        # Assert
+        self.assertEqual(result, (1, 0))
+        self.assertNotIn(
+            "include", mock_validate_schema_with_cache.call_args.args[0]
+        )
+
+    def test_shared_cache_can_be_skipped(self):
+        """test_shared_cache_can_be_skipped"""
+
+        # Arrange
+        mock_on_phase = Mock()
+
+        # Act
+        reports = warm_up_utils.warm_up_cache(
+            include_shared=False, on_phase=mock_on_phase
+        )
+
+        # Assert
+        self.assertEqual(
+            [report["name"] for report in reports], ["xslt", "catalog"]
+        )
+        self.assertEqual(
+            [call.args[0] for call in mock_on_phase.call_args_list], reports
+        )
+
+    @patch.object(catalog_api, "_snapshot", None)
+    def test_catalog_snapshot_is_built(self):
+        """test_catalog_snapshot_is_built"""
+
+        # Act
+        reports = warm_up_utils.warm_up_cache(include_shared=False)
+
+        # Assert
+        self.assertIsNotNone(catalog_api._snapshot)
+        self.assertEqual(
+            reports[1]["count"], len(catalog_api._snapshot.types_by_id)
+        )
+
+    @patch.object(Type, "content", "invalid")
+    def test_command_reports_phases(self):
+        """test_command_reports_phases"""
+
+        # Arrange
+        stdout = Mock()
+
+        # Act
+        call_command("warm_composer_cache", stdout=stdout)
+
+        # Assert
+        output = "".join(call.args[0] for call in stdout.write.call_args_list)
+        self.assertIn("types: 0 loaded, 1 errors", output)
+        self.assertIn("Done in", output)
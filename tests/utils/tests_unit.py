@@ -4,12 +4,24 @@
 
 from os.path import join, dirname, abspath
 from unittest.case import TestCase
+from unittest.mock import patch
 
-from core_main_app.commons.exceptions import CoreError
+from core_main_app.commons.exceptions import XMLError
 from core_main_app.utils.xml import validate_xml_schema
+from xml_utils.xsd_tree.xsd_tree import XSDTree
+
+from core_composer_app.utils import xml as composer_xml_utils
 from core_composer_app.utils.xml import (
     _insert_element_type,
+    ComposerDocument,
     check_type_core_support,
+    check_xsd_element,
+    delete_xsd_element_and_dependencies,
+    get_content_hash,
+    get_type_names,
+    insert_element_built_in_type,
+    insert_element_type,
+    rename_xsd_element,
     COMPLEX_TYPE,
     SIMPLE_TYPE,
 )
@@ -59,14 +71,17 @@ class TestInsertElementType(TestCase):
         with open(join(RESOURCES_PATH, type_filename), "r") as type_file:
             type_content = type_file.read()
 
-        with self.assertRaises(CoreError):
-            _insert_element_type(
-                base_content,
-                self.root_xpath,
-                type_content,
-                self.type_name,
-                join(RESOURCES_PATH, type_filename),
-            )
+        result_tree = _insert_element_type(
+            base_content,
+            self.root_xpath,
+            type_content,
+            self.type_name,
+            join(RESOURCES_PATH, type_filename),
+        )
+
+        errors = validate_xml_schema(result_tree, request=None)
+        self.assertTrue(errors is None)
+        self.assertEqual(result_tree.getroot().nsmap["ns1"], "inc-namespace")
 
     def test_add_type_to_base_with_target_namespace(self):
         """test_add_type_to_base_with_target_namespace"""
@@ -127,14 +142,17 @@ class TestInsertElementType(TestCase):
         with open(join(RESOURCES_PATH, type_filename), "r") as type_file:
             type_content = type_file.read()
 
-        with self.assertRaises(CoreError):
-            _insert_element_type(
-                base_content,
-                self.root_xpath,
-                type_content,
-                self.type_name,
-                join(RESOURCES_PATH, type_filename),
-            )
+        result_tree = _insert_element_type(
+            base_content,
+            self.root_xpath,
+            type_content,
+            self.type_name,
+            join(RESOURCES_PATH, type_filename),
+        )
+
+        errors = validate_xml_schema(result_tree, request=None)
+        self.assertTrue(errors is None)
+        self.assertEqual(result_tree.getroot().nsmap["ns1"], "inc-namespace")
 
     def test_add_type_with_target_namespace_prefix_to_base(self):
         """test_add_type_with_target_namespace_prefix_to_base"""
@@ -233,3 +251,499 @@ class TestTypeDefinition(TestCase):
         type_content = check_type_core_support(type_content)
 
         self.assertEqual(type_content, COMPLEX_TYPE)
+
+
+class TestGetContentHash(TestCase):
+    """Test Get Content Hash"""
+
+    def test_whitespace_and_comments_do_not_change_hash(self):
+        """test_whitespace_and_comments_do_not_change_hash"""
+
+        xsd_string = (
+            "<xs:schema xmlns:xs='http://www.w3.org/2001/XMLSchema'>"
+            "<xs:simpleType name='type'><xs:restriction base='xs:string'/>"
+            "</xs:simpleType></xs:schema>"
+        )
+        formatted_xsd_string = (
+            "<xs:schema xmlns:xs='http://www.w3.org/2001/XMLSchema'>\n"
+            "  <!-- comment -->\n"
+            "  <xs:simpleType name='type'>\n"
+            "    <xs:restriction base='xs:string'/>\n"
+            "  </xs:simpleType>\n"
+            "</xs:schema>"
+        )
+
+        self.assertEqual(
+            get_content_hash(xsd_string),
+            get_content_hash(formatted_xsd_string),
+        )
+
+    def test_different_content_changes_hash(self):
+        """test_different_content_changes_hash"""
+
+        xsd_string = (
+            "<xs:schema xmlns:xs='http://www.w3.org/2001/XMLSchema'>"
+            "<xs:simpleType name='type'><xs:restriction base='xs:string'/>"
+            "</xs:simpleType></xs:schema>"
+        )
+
+        self.assertNotEqual(
+            get_content_hash(xsd_string),
+            get_content_hash(xsd_string.replace("type", "other")),
+        )
+
+
+def _read_resource(filename):
+    """Return the content of a test resource.
+
+    Args:
+        filename:
+
+    Returns:
+
+    """
+    with open(join(RESOURCES_PATH, filename), "r") as resource_file:
+        return resource_file.read()
+
+
+class TestInsertElementWithoutValidation(TestCase):
+    """Test Insert Element Without Validation"""
+
+    def setUp(self):
+        """setUp"""
+
+        self.root_xpath = "xsd:complexType/xsd:sequence"
+        self.base_content = _read_resource("base.xsd")
+
+    @patch.object(composer_xml_utils, "validate_schema")
+    def test_insert_type_only_checks_element(self, mock_validate_schema):
+        """test_insert_type_only_checks_element"""
+
+        xsd_string = insert_element_type(
+            self.base_content,
+            self.root_xpath,
+            _read_resource("type.xsd"),
+            "new",
+            join(RESOURCES_PATH, "type.xsd"),
+            request=None,
+            validate=False,
+        )
+
+        mock_validate_schema.assert_not_called()
+        self.assertIsNone(validate_xml_schema(XSDTree.build_tree(xsd_string)))
+
+    def test_insert_type_with_target_namespace_prefix(self):
+        """test_insert_type_with_target_namespace_prefix"""
+
+        xsd_string = insert_element_type(
+            self.base_content,
+            self.root_xpath,
+            _read_resource("type_target_ns_prefix.xsd"),
+            "new",
+            "type.xsd",
+            request=None,
+            validate=False,
+        )
+
+        self.assertIn('type="incns:new"', xsd_string)
+
+    def test_insert_built_in_type(self):
+        """test_insert_built_in_type"""
+
+        xsd_string = insert_element_built_in_type(
+            self.base_content,
+            self.root_xpath,
+            "string",
+            request=None,
+            validate=False,
+        )
+
+        self.assertIn('type="xsd:string"', xsd_string)
+
+    def test_insert_unknown_built_in_type_raises_error(self):
+        """test_insert_unknown_built_in_type_raises_error"""
+
+        with self.assertRaises(XMLError):
+            insert_element_built_in_type(
+                self.base_content,
+                self.root_xpath,
+                "unknown",
+                request=None,
+                validate=False,
+            )
+
+    def test_rename_with_invalid_name_raises_error(self):
+        """test_rename_with_invalid_name_raises_error"""
+
+        with self.assertRaises(XMLError):
+            rename_xsd_element(
+                self.base_content, "xsd:element", "1 root", check=True
+            )
+
+
+class TestComposerDocument(TestCase):
+    """Test Composer Document"""
+
+    def setUp(self):
+        """setUp"""
+
+        self.root_xpath = "xsd:complexType/xsd:sequence"
+        self.document = ComposerDocument.from_string(
+            _read_resource("base.xsd")
+        )
+
+    def test_namespaces_are_computed(self):
+        """test_namespaces_are_computed"""
+
+        self.assertEqual(self.document.default_prefix, "xsd")
+        self.assertIsNone(self.document.target_namespace)
+
+    def test_chained_edits_are_serialized_once(self):
+        """test_chained_edits_are_serialized_once"""
+
+        with patch.object(
+            composer_xml_utils.XSDTree, "tostring"
+        ) as mock_tostring:
+            self.document.insert_element_built_in_type(
+                self.root_xpath, "string"
+            )
+            self.document.rename_element(
+                self.root_xpath + "/xsd:element", "value"
+            )
+            self.document.set_element_occurrences(
+                self.root_xpath + "/xsd:element", "0", "unbounded"
+            )
+            self.document.tostring()
+
+        mock_tostring.assert_called_once()
+        self.assertEqual(
+            self.document.get_element_occurrences(
+                self.root_xpath + "/xsd:element"
+            ),
+            ("0", "unbounded"),
+        )
+
+    def test_insert_type_returns_inserted_element(self):
+        """test_insert_type_returns_inserted_element"""
+
+        element = self.document.insert_element_type(
+            self.root_xpath,
+            XSDTree.build_tree(_read_resource("type.xsd")),
+            "new",
+            "type.xsd",
+        )
+
+        self.assertIs(self.document.find(self.root_xpath)[-1], element)
+        self.assertEqual(element.attrib["type"], "new")
+
+    def test_insert_type_with_target_namespace_updates_namespaces(self):
+        """test_insert_type_with_target_namespace_updates_namespaces"""
+
+        element = self.document.insert_element_type(
+            self.root_xpath,
+            XSDTree.build_tree(_read_resource("type_target_ns_prefix.xsd")),
+            "new",
+            "type.xsd",
+        )
+
+        self.assertIn("incns", self.document.namespaces)
+        self.assertIs(self.document.find(self.root_xpath)[-1], element)
+
+    def test_insert_type_with_prefix_declared_allocates_prefix(self):
+        """test_insert_type_with_prefix_declared_allocates_prefix"""
+
+        document = ComposerDocument.from_string(
+            "<xsd:schema xmlns:xsd='http://www.w3.org/2001/XMLSchema' "
+            "xmlns:incns='urn:other'>"
+            "<xsd:complexType name='Root'><xsd:sequence/></xsd:complexType>"
+            "</xsd:schema>"
+        )
+        root = document.xsd_tree.getroot()
+
+        element = document.insert_element_type(
+            self.root_xpath,
+            XSDTree.build_tree(_read_resource("type_target_ns_prefix.xsd")),
+            "new",
+            "type.xsd",
+        )
+
+        self.assertEqual(element.attrib["type"], "ns1:new")
+        self.assertEqual(document.namespaces["ns1"], "inc-namespace")
+        self.assertEqual(document.namespaces["incns"], "urn:other")
+        # the namespace is declared without copying the tree
+        self.assertIs(document.xsd_tree.getroot(), root)
+
+    def test_remove_single_root_element(self):
+        """test_remove_single_root_element"""
+
+        self.document.remove_single_root_element()
+
+        self.assertIsNone(self.document.find("xsd:element"))
+
+
+class TestRemoveUnusedDependencies(TestCase):
+    """Test Remove Unused Dependencies"""
+
+    def setUp(self):
+        """setUp"""
+
+        self.root_xpath = "xsd:complexType/xsd:sequence"
+        self.document = ComposerDocument.from_string(
+            _read_resource("base.xsd")
+        )
+        self.included_type_names = {
+            "type.xsd": get_type_names(_read_resource("type.xsd")),
+            "type_ns.xsd": ["new"],
+        }
+
+    def _insert(self, type_filename, include_url):
+        """Insert an element of the type of a resource.
+
+        Args:
+            type_filename:
+            include_url:
+
+        Returns:
+
+        """
+        self.document.insert_element_type(
+            self.root_xpath,
+            XSDTree.build_tree(_read_resource(type_filename)),
+            "new",
+            include_url,
+        )
+
+    def test_dependencies_are_counted(self):
+        """test_dependencies_are_counted"""
+
+        self._insert("type.xsd", "type.xsd")
+        self._insert("type.xsd", "type.xsd")
+        self._insert("type_target_ns_prefix.xsd", "type_ns.xsd")
+
+        self.assertEqual(
+            self.document.get_dependency_references(self.included_type_names),
+            {"type.xsd": 2, "type_ns.xsd": 1},
+        )
+
+    def test_referenced_dependency_is_kept(self):
+        """test_referenced_dependency_is_kept"""
+
+        self._insert("type.xsd", "type.xsd")
+        self._insert("type.xsd", "type.xsd")
+        self.document.delete_element(self.root_xpath + "/xsd:element")
+
+        removed_locations = self.document.remove_unused_dependencies(
+            self.included_type_names
+        )
+
+        self.assertEqual(removed_locations, [])
+        self.assertIsNotNone(self.document.find("xsd:include"))
+
+    def test_unused_include_is_removed(self):
+        """test_unused_include_is_removed"""
+
+        self._insert("type.xsd", "type.xsd")
+        self.document.delete_element(self.root_xpath + "/xsd:element")
+
+        removed_locations = self.document.remove_unused_dependencies(
+            self.included_type_names
+        )
+
+        self.assertEqual(removed_locations, ["type.xsd"])
+        self.assertIsNone(self.document.find("xsd:include"))
+
+    def test_include_of_unknown_types_is_kept(self):
+        """test_include_of_unknown_types_is_kept"""
+
+        self._insert("type.xsd", "type.xsd")
+        self.document.delete_element(self.root_xpath + "/xsd:element")
+
+        removed_locations = self.document.remove_unused_dependencies({})
+
+        self.assertEqual(removed_locations, [])
+        self.assertIsNotNone(self.document.find("xsd:include"))
+
+    def test_unused_import_and_namespace_are_removed(self):
+        """test_unused_import_and_namespace_are_removed"""
+
+        self._insert("type_target_ns_prefix.xsd", "type_ns.xsd")
+        self.document.delete_element(self.root_xpath + "/xsd:element")
+
+        removed_locations = self.document.remove_unused_dependencies(
+            self.included_type_names
+        )
+
+        self.assertEqual(removed_locations, ["type_ns.xsd"])
+        self.assertIsNone(self.document.find("xsd:import"))
+        self.assertNotIn("incns", self.document.namespaces)
+        self.assertNotIn("incns", self.document.tostring())
+
+    def test_import_of_unknown_types_is_kept(self):
+        """test_import_of_unknown_types_is_kept"""
+
+        self._insert("type_target_ns_prefix.xsd", "type_ns.xsd")
+        self.document.delete_element(self.root_xpath + "/xsd:element")
+
+        removed_locations = self.document.remove_unused_dependencies({})
+
+        self.assertEqual(removed_locations, [])
+        self.assertIsNotNone(self.document.find("xsd:import"))
+        self.assertIn("incns", self.document.namespaces)
+
+    def test_import_without_location_is_kept(self):
+        """test_import_without_location_is_kept"""
+
+        document = ComposerDocument.from_string(
+            "<xsd:schema xmlns:xsd='http://www.w3.org/2001/XMLSchema' "
+            "xmlns:o='urn:other'>"
+            "<xsd:import namespace='http://www.w3.org/XML/1998/namespace'/>"
+            "<xsd:import namespace='urn:other'/>"
+            "<xsd:complexType name='Root'><xsd:sequence/></xsd:complexType>"
+            "</xsd:schema>"
+        )
+
+        removed_locations = document.remove_unused_dependencies(
+            {None: [], "": []}
+        )
+
+        self.assertEqual(removed_locations, [])
+        self.assertEqual(len(document.xsd_tree.getroot()), 3)
+        self.assertIn("xmlns:o", document.tostring())
+
+    def test_import_referenced_by_ref_is_kept(self):
+        """test_import_referenced_by_ref_is_kept"""
+
+        self._insert("type_target_ns_prefix.xsd", "type_ns.xsd")
+        element = self.document.find(self.root_xpath + "/xsd:element")
+        del element.attrib["name"]
+        del element.attrib["type"]
+        element.attrib["ref"] = "incns:other"
+
+        self.assertEqual(
+            self.document.get_dependency_references(self.included_type_names),
+            {"type_ns.xsd": 1},
+        )
+
+    def test_include_referenced_by_ref_is_kept(self):
+        """test_include_referenced_by_ref_is_kept"""
+
+        self._insert("type.xsd", "type.xsd")
+        element = self.document.find(self.root_xpath + "/xsd:element")
+        del element.attrib["name"]
+        element.attrib["type"] = "xsd:string"
+        element.attrib["ref"] = "other"
+
+        removed_locations = self.document.remove_unused_dependencies(
+            self.included_type_names
+        )
+
+        self.assertEqual(removed_locations, [])
+        self.assertIsNotNone(self.document.find("xsd:include"))
+
+    def test_ref_to_declared_component_is_not_counted(self):
+        """test_ref_to_declared_component_is_not_counted"""
+
+        self._insert("type.xsd", "type.xsd")
+        element = self.document.find(self.root_xpath + "/xsd:element")
+        del element.attrib["name"]
+        del element.attrib["type"]
+        element.attrib["ref"] = "root"
+
+        removed_locations = self.document.remove_unused_dependencies(
+            self.included_type_names
+        )
+
+        self.assertEqual(removed_locations, ["type.xsd"])
+
+    def test_delete_xsd_element_and_dependencies(self):
+        """test_delete_xsd_element_and_dependencies"""
+
+        self._insert("type.xsd", "type.xsd")
+
+        xsd_string, removed_locations = delete_xsd_element_and_dependencies(
+            self.document.tostring(),
+            self.root_xpath + "/xsd:element",
+            self.included_type_names,
+        )
+
+        self.assertEqual(removed_locations, ["type.xsd"])
+        self.assertNotIn("include", xsd_string)
+        self.assertIsNone(validate_xml_schema(XSDTree.build_tree(xsd_string)))
+
+
+class TestCheckXsdElement(TestCase):
+    """Test Check Xsd Element"""
+
+    def _get_last_element(self, elements):
+        """Return the last element declared in a sequence.
+
+        Args:
+            elements: element declarations
+
+        Returns:
+
+        """
+        xsd_tree = XSDTree.build_tree(
+            "<xs:schema xmlns:xs='http://www.w3.org/2001/XMLSchema'>"
+            "<xs:complexType name='Root'><xs:sequence>"
+            + elements
+            + "</xs:sequence></xs:complexType></xs:schema>"
+        )
+        return xsd_tree.getroot()[0][0][-1]
+
+    def test_valid_element(self):
+        """test_valid_element"""
+
+        check_xsd_element(
+            self._get_last_element(
+                "<xs:element name='a' type='xs:string'/>"
+                "<xs:element name='b' type='Root'/>"
+            ),
+            type_trees=[],
+        )
+
+    def test_invalid_name_raises_error(self):
+        """test_invalid_name_raises_error"""
+
+        with self.assertRaises(XMLError):
+            check_xsd_element(
+                self._get_last_element("<xs:element name='a:b'/>")
+            )
+
+    def test_sibling_with_same_name_and_type(self):
+        """test_sibling_with_same_name_and_type"""
+
+        check_xsd_element(
+            self._get_last_element(
+                "<xs:element name='a' type='xs:string'/>"
+                "<xs:element name='a' type='xs:string'/>"
+            )
+        )
+
+    def test_sibling_with_same_name_and_other_type_raises_error(self):
+        """test_sibling_with_same_name_and_other_type_raises_error"""
+
+        with self.assertRaises(XMLError):
+            check_xsd_element(
+                self._get_last_element(
+                    "<xs:element name='a' type='xs:string'/>"
+                    "<xs:element name='a' type='xs:int'/>"
+                )
+            )
+
+    def test_undefined_type_raises_error(self):
+        """test_undefined_type_raises_error"""
+
+        with self.assertRaises(XMLError):
+            check_xsd_element(
+                self._get_last_element("<xs:element name='a' type='Other'/>"),
+                type_trees=[],
+            )
+
+    def test_type_defined_in_included_schema(self):
+        """test_type_defined_in_included_schema"""
+
+        check_xsd_element(
+            self._get_last_element("<xs:element name='a' type='new'/>"),
+            type_trees=[XSDTree.build_tree(_read_resource("type.xsd"))],
+        )
@@ -0,0 +1,182 @@
+"""Unit tests for composer bundle export"""
+
+import io
+import re
+import zipfile
+from unittest.case import TestCase
+from unittest.mock import Mock, patch
+
+from core_composer_app.utils import bundle as bundle_utils
+from core_composer_app.utils.bundle import get_bundle_files, stream_zip
+
+DOWNLOAD_PATTERN = re.compile(r"/rest/template/(?P<pk>\w+)/download/")
+
+
+def _get_schema_location(template_id):
+    """Return the download url of a template
+
+    Args:
+        template_id:
+
+    Returns:
+
+    """
+    return f"http://localhost/rest/template/{template_id}/download/"
+
+
+def _get_xsd(*schema_locations):
+    """Return a schema including the given schema locations
+
+    Args:
+        schema_locations:
+
+    Returns:
+
+    """
+    includes = "".join(
+        f"<xs:include schemaLocation='{schema_location}'/>"
+        for schema_location in schema_locations
+    )
+    return (
+        "<xs:schema xmlns:xs='http://www.w3.org/2001/XMLSchema'>"
+        f"{includes}"
+        "<xs:element name='root'/>"
+        "</xs:schema>"
+    )
+
+
+def _get_template(filename, content):
+    """Return a mocked template
+
+    Args:
+        filename:
+        content:
+
+    Returns:
+
+    """
+    template = Mock()
+    template.filename = filename
+    template.content = content
+    return template
+
+
+class TestGetBundleFiles(TestCase):
+    """Test Get Bundle Files"""
+
+    def setUp(self):
+        """setUp"""
+
+        patcher = patch.object(
+            bundle_utils,
+            "get_template_download_pattern",
+            return_value=DOWNLOAD_PATTERN,
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_local_include_is_rewritten_to_relative_filename(self):
+        """test_local_include_is_rewritten_to_relative_filename"""
+
+        templates = {"1": _get_template("unit.xsd", _get_xsd())}
+        xsd_string = _get_xsd(_get_schema_location("1"))
+
+        files = dict(get_bundle_files(xsd_string, templates.get))
+
+        self.assertEqual(list(files), ["schema.xsd", "unit.xsd"])
+        self.assertIn(b'schemaLocation="unit.xsd"', files["schema.xsd"])
+
+    def test_transitive_dependencies_are_bundled_once(self):
+        """test_transitive_dependencies_are_bundled_once"""
+
+        unit_location = _get_schema_location("1")
+        templates = {
+            "1": _get_template("unit.xsd", _get_xsd()),
+            "2": _get_template("mass.xsd", _get_xsd(unit_location)),
+        }
+        get_template = Mock(side_effect=templates.get)
+        xsd_string = _get_xsd(_get_schema_location("2"), unit_location)
+
+        files = dict(get_bundle_files(xsd_string, get_template))
+
+        self.assertEqual(sorted(files), ["mass.xsd", "schema.xsd", "unit.xsd"])
+        self.assertIn(b'schemaLocation="unit.xsd"', files["mass.xsd"])
+        self.assertEqual(get_template.call_count, 2)
+
+    def test_external_location_is_kept(self):
+        """test_external_location_is_kept"""
+
+        xsd_string = _get_xsd("http://example.com/external.xsd")
+
+        files = dict(get_bundle_files(xsd_string, Mock()))
+
+        self.assertEqual(list(files), ["schema.xsd"])
+        self.assertIn(
+            b'schemaLocation="http://example.com/external.xsd"',
+            files["schema.xsd"],
+        )
+
+    def test_filename_collision_is_suffixed_with_id(self):
+        """test_filename_collision_is_suffixed_with_id"""
+
+        templates = {
+            "1": _get_template("unit.xsd", _get_xsd()),
+            "2": _get_template("unit.xsd", _get_xsd()),
+        }
+        xsd_string = _get_xsd(
+            _get_schema_location("1"),
+            _get_schema_location("2"),
+        )
+
+        files = dict(get_bundle_files(xsd_string, templates.get))
+
+        self.assertEqual(
+            sorted(files), ["schema.xsd", "unit.xsd", "unit_2.xsd"]
+        )
+
+    def test_unsafe_filename_is_sanitized(self):
+        """test_unsafe_filename_is_sanitized"""
+
+        templates = {"1": _get_template("../my unit.xsd", _get_xsd())}
+        xsd_string = _get_xsd(_get_schema_location("1"))
+
+        files = dict(get_bundle_files(xsd_string, templates.get))
+
+        self.assertIn("my_unit.xsd", files)
+
+    def test_unreadable_dependency_raises_before_files_are_used(self):
+        """test_unreadable_dependency_raises_before_files_are_used"""
+
+        templates = {"1": _get_template("unit.xsd", _get_xsd())}
+        get_template = Mock(side_effect=templates.__getitem__)
+        xsd_string = _get_xsd(
+            _get_schema_location("1"), _get_schema_location("2")
+        )
+
+        with self.assertRaises(KeyError):
+            get_bundle_files(xsd_string, get_template)
+
+
+class TestStreamZip(TestCase):
+    """Test Stream Zip"""
+
+    def test_stream_zip_returns_readable_archive(self):
+        """test_stream_zip_returns_readable_archive"""
+
+        files = [("schema.xsd", b"<schema/>"), ("unit.xsd", b"<unit/>")]
+
+        archive = zipfile.ZipFile(io.BytesIO(b"".join(stream_zip(files))))
+
+        self.assertEqual(archive.namelist(), ["schema.xsd", "unit.xsd"])
+        self.assertEqual(archive.read("unit.xsd"), b"<unit/>")
+
+    def test_stream_zip_yields_each_file_before_reading_next(self):
+        """test_stream_zip_yields_each_file_before_reading_next"""
+
+        def files():
+            yield "schema.xsd", b"<schema/>"
+            raise AssertionError("read too early")
+
+        chunk = next(stream_zip(files()))
+
+        self.assertTrue(chunk.startswith(b"PK"))
@@ -0,0 +1,231 @@
+"""Unit tests for composition utils"""
+
+from unittest import TestCase
+from unittest.mock import MagicMock, patch
+
+from core_main_app.commons.exceptions import DoesNotExist, XMLError
+
+from core_composer_app.utils import composition
+
+BASE_XSD = (
+    '<xsd:schema xmlns:xsd="http://www.w3.org/2001/XMLSchema">'
+    '<xsd:element name="root" type="Root"/>'
+    '<xsd:complexType name="Root"><xsd:sequence/></xsd:complexType>'
+    "</xsd:schema>"
+)
+TYPE_XSD = (
+    '<xsd:schema xmlns:xsd="http://www.w3.org/2001/XMLSchema">'
+    '<xsd:simpleType name="Code">'
+    '<xsd:restriction base="xsd:string"/></xsd:simpleType>'
+    "</xsd:schema>"
+)
+SEQUENCE_XPATH = "xsd:complexType/xsd:sequence"
+
+
+def _get_type(version_manager_id):
+    """Return a type, whatever the version manager.
+
+    Args:
+        version_manager_id:
+
+    Returns:
+
+    """
+    return MagicMock(id=1, content=TYPE_XSD)
+
+
+class TestComposeSchema(TestCase):
+    """Test compose schema"""
+
+    def test_insert_built_in_type(self):
+        """test insert built in type
+
+        Returns:
+
+        """
+        document = composition.compose_schema(
+            BASE_XSD,
+            [
+                {
+                    "operation": composition.INSERT_ELEMENT,
+                    "xpath": SEQUENCE_XPATH,
+                    "type": "string",
+                    "name": "title",
+                }
+            ],
+            _get_type,
+        )
+
+        element = document.find(SEQUENCE_XPATH + "/xsd:element")
+        self.assertEqual(element.attrib["name"], "title")
+        self.assertEqual(element.attrib["type"], "xsd:string")
+
+    @patch.object(composition.main_xml_utils, "_get_schema_location_uri")
+    def test_insert_type_includes_type(self, mock_get_schema_location_uri):
+        """test insert type includes type
+
+        Args:
+            mock_get_schema_location_uri:
+
+        Returns:
+
+        """
+        mock_get_schema_location_uri.return_value = "type.xsd"
+        document = composition.compose_schema(
+            BASE_XSD,
+            [
+                {
+                    "operation": composition.INSERT_ELEMENT,
+                    "xpath": SEQUENCE_XPATH,
+                    "type_version_manager": "1",
+                }
+            ],
+            _get_type,
+        )
+
+        element = document.find(SEQUENCE_XPATH + "/xsd:element")
+        self.assertEqual(element.attrib["name"], "Code")
+        self.assertEqual(element.attrib["type"], "Code")
+        self.assertEqual(len(document.get_dependency_locations()), 1)
+
+    @patch.object(composition.main_xml_utils, "_get_schema_location_uri")
+    def test_delete_inserted_type_removes_include(
+        self, mock_get_schema_location_uri
+    ):
+        """test delete inserted type removes include
+
+        Args:
+            mock_get_schema_location_uri:
+
+        Returns:
+
+        """
+        mock_get_schema_location_uri.return_value = "type.xsd"
+        document = composition.compose_schema(
+            BASE_XSD,
+            [
+                {
+                    "operation": composition.INSERT_ELEMENT,
+                    "xpath": SEQUENCE_XPATH,
+                    "type_version_manager": "1",
+                },
+                {
+                    "operation": composition.DELETE_ELEMENT,
+                    "xpath": SEQUENCE_XPATH + "/xsd:element",
+                },
+            ],
+            _get_type,
+        )
+
+        self.assertEqual(document.get_dependency_locations(), [])
+
+    def test_operations_are_chained(self):
+        """test operations are chained
+
+        Returns:
+
+        """
+        document = composition.compose_schema(
+            BASE_XSD,
+            [
+                {
+                    "operation": composition.RENAME_ROOT_TYPE,
+                    "name": "Book",
+                },
+                {
+                    "operation": composition.INSERT_ELEMENT,
+                    "xpath": SEQUENCE_XPATH,
+                    "type": "string",
+                },
+                {
+                    "operation": composition.RENAME_ELEMENT,
+                    "xpath": SEQUENCE_XPATH + "/xsd:element",
+                    "name": "title",
+                },
+                {
+                    "operation": composition.SET_ELEMENT_OCCURRENCES,
+                    "xpath": SEQUENCE_XPATH + "/xsd:element",
+                    "min_occurs": "0",
+                    "max_occurs": "unbounded",
+                },
+                {
+                    "operation": composition.CHANGE_ELEMENT_TYPE,
+                    "xpath": SEQUENCE_XPATH,
+                    "type": "choice",
+                },
+            ],
+            _get_type,
+        )
+
+        self.assertEqual(
+            document.tostring(),
+            '<xsd:schema xmlns:xsd="http://www.w3.org/2001/XMLSchema">'
+            '<xsd:element name="root" type="Book"/>'
+            '<xsd:complexType name="Book"><xsd:choice>'
+            '<xsd:element type="xsd:string" name="title" minOccurs="0" '
+            'maxOccurs="unbounded"/>'
+            "</xsd:choice></xsd:complexType></xsd:schema>",
+        )
+
+    def test_invalid_name_raises_xml_error_with_operation_index(self):
+        """test invalid name raises xml error with operation index
+
+        Returns:
+
+        """
+        with self.assertRaisesRegex(XMLError, "Operation 1"):
+            composition.compose_schema(
+                BASE_XSD,
+                [
+                    {
+                        "operation": composition.INSERT_ELEMENT,
+                        "xpath": SEQUENCE_XPATH,
+                        "type": "string",
+                    },
+                    {
+                        "operation": composition.RENAME_ELEMENT,
+                        "xpath": SEQUENCE_XPATH + "/xsd:element",
+                        "name": "1 title",
+                    },
+                ],
+                _get_type,
+            )
+
+    def test_unknown_xpath_raises_xml_error(self):
+        """test unknown xpath raises xml error
+
+        Returns:
+
+        """
+        with self.assertRaises(XMLError):
+            composition.compose_schema(
+                BASE_XSD,
+                [
+                    {
+                        "operation": composition.DELETE_ELEMENT,
+                        "xpath": "xsd:unknown",
+                    }
+                ],
+                _get_type,
+            )
+
+    def test_type_not_found_is_raised(self):
+        """test type not found is raised
+
+        Returns:
+
+        """
+        get_type = MagicMock(side_effect=DoesNotExist("not found"))
+
+        with self.assertRaises(DoesNotExist):
+            composition.compose_schema(
+                BASE_XSD,
+                [
+                    {
+                        "operation": composition.INSERT_ELEMENT,
+                        "xpath": SEQUENCE_XPATH,
+                        "type_version_manager": "1",
+                    }
+                ],
+                get_type,
+            )
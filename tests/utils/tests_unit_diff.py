@@ -0,0 +1,146 @@
+"""Unit tests for composer schema diff"""
+
+from unittest.case import TestCase
+
+from core_composer_app.utils.diff import diff_xsd, has_changes
+
+OLD_XSD = (
+    "<xs:schema xmlns:xs='http://www.w3.org/2001/XMLSchema'>"
+    "<xs:complexType name='Sample'><xs:sequence>"
+    "<xs:element name='name' type='xs:string'/>"
+    "<xs:element name='mass' type='xs:float'/>"
+    "<xs:element name='comment' type='xs:string' minOccurs='0'/>"
+    "</xs:sequence></xs:complexType>"
+    "<xs:simpleType name='unit'><xs:restriction base='xs:string'/>"
+    "</xs:simpleType>"
+    "</xs:schema>"
+)
+
+
+class TestDiffXsd(TestCase):
+    """Test Diff Xsd"""
+
+    def test_same_schema_has_no_changes(self):
+        """test_same_schema_has_no_changes"""
+
+        diff = diff_xsd(OLD_XSD, OLD_XSD)
+
+        self.assertFalse(has_changes(diff))
+
+    def test_added_element_is_reported(self):
+        """test_added_element_is_reported"""
+
+        new_xsd = OLD_XSD.replace(
+            "<xs:element name='mass' type='xs:float'/>",
+            "<xs:element name='mass' type='xs:float'/>"
+            "<xs:element name='volume' type='xs:double'/>",
+        )
+
+        diff = diff_xsd(OLD_XSD, new_xsd)
+
+        self.assertEqual(
+            diff["added"],
+            [
+                {
+                    "path": "/complexType[Sample]/element[volume]",
+                    "type": "xs:double",
+                }
+            ],
+        )
+        self.assertEqual(diff["removed"], [])
+
+    def test_removed_element_is_reported(self):
+        """test_removed_element_is_reported"""
+
+        new_xsd = OLD_XSD.replace(
+            "<xs:element name='mass' type='xs:float'/>", ""
+        )
+
+        diff = diff_xsd(OLD_XSD, new_xsd)
+
+        self.assertEqual(
+            diff["removed"],
+            [
+                {
+                    "path": "/complexType[Sample]/element[mass]",
+                    "type": "xs:float",
+                }
+            ],
+        )
+        self.assertEqual(diff["added"], [])
+
+    def test_renamed_element_is_reported(self):
+        """test_renamed_element_is_reported"""
+
+        new_xsd = OLD_XSD.replace("name='mass'", "name='weight'")
+
+        diff = diff_xsd(OLD_XSD, new_xsd)
+
+        self.assertEqual(
+            diff["renamed"],
+            [
+                {
+                    "from": "/complexType[Sample]/element[mass]",
+                    "to": "/complexType[Sample]/element[weight]",
+                }
+            ],
+        )
+        self.assertEqual(diff["added"], [])
+        self.assertEqual(diff["removed"], [])
+
+    def test_renamed_type_does_not_report_children(self):
+        """test_renamed_type_does_not_report_children"""
+
+        new_xsd = OLD_XSD.replace("name='Sample'", "name='Specimen'")
+
+        diff = diff_xsd(OLD_XSD, new_xsd)
+
+        self.assertEqual(
+            diff["renamed"],
+            [{"from": "/complexType[Sample]", "to": "/complexType[Specimen]"}],
+        )
+        self.assertEqual(diff["added"], [])
+        self.assertEqual(diff["removed"], [])
+
+    def test_occurrences_change_is_reported(self):
+        """test_occurrences_change_is_reported"""
+
+        new_xsd = OLD_XSD.replace(
+            "name='comment' type='xs:string' minOccurs='0'",
+            "name='comment' type='xs:string' minOccurs='0' "
+            "maxOccurs='unbounded'",
+        )
+
+        diff = diff_xsd(OLD_XSD, new_xsd)
+
+        self.assertEqual(
+            diff["occurrences"],
+            [
+                {
+                    "path": "/complexType[Sample]/element[comment]",
+                    "old": ["0", "1"],
+                    "new": ["0", "unbounded"],
+                }
+            ],
+        )
+
+    def test_type_change_is_reported(self):
+        """test_type_change_is_reported"""
+
+        new_xsd = OLD_XSD.replace(
+            "<xs:restriction base='xs:string'/>",
+            "<xs:restriction base='xs:token'/>",
+        )
+
+        diff = diff_xsd(OLD_XSD, new_xsd)
+
+        self.assertEqual(
+            diff["types"],
+            [
+                {
+                    "path": "/simpleType[unit]",
+                    "old": "xs:string",
+                    "new": "xs:token",
+                }
+            ],
+        )
@@ -0,0 +1,121 @@
+"""Unit tests for composer streaming downloads"""
+
+from unittest.case import TestCase
+from unittest.mock import Mock, patch
+
+from django.core.files.base import ContentFile
+from django.test import RequestFactory
+
+from core_composer_app.utils import download as download_utils
+from core_composer_app.utils.download import (
+    get_streaming_file_response,
+    parse_range,
+)
+
+CONTENT = b"0123456789"
+
+
+def _get_response(**headers):
+    """Return the streaming response of the test content
+
+    Args:
+        headers:
+
+    Returns:
+
+    """
+    request = RequestFactory().get("/", headers=headers)
+    return get_streaming_file_response(
+        request,
+        ContentFile(CONTENT),
+        "type.xsd",
+        "application/xsd",
+        etag="hash",
+    )
+
+
+class TestGetStreamingFileResponse(TestCase):
+    """Test Get Streaming File Response"""
+
+    @patch.object(download_utils, "COMPOSER_DOWNLOAD_CHUNK_SIZE", 3)
+    def test_content_is_streamed_in_chunks(self):
+        """test_content_is_streamed_in_chunks"""
+
+        response = _get_response()
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            list(response.streaming_content),
+            [b"012", b"345", b"678", b"9"],
+        )
+        self.assertEqual(response["Content-Length"], "10")
+        self.assertEqual(response["ETag"], '"hash"')
+
+    def test_range_returns_partial_content(self):
+        """test_range_returns_partial_content"""
+
+        response = _get_response(Range="bytes=2-4")
+
+        self.assertEqual(response.status_code, 206)
+        self.assertEqual(b"".join(response.streaming_content), b"234")
+        self.assertEqual(response["Content-Range"], "bytes 2-4/10")
+        self.assertEqual(response["Content-Length"], "3")
+
+    def test_unsatisfiable_range_returns_416(self):
+        """test_unsatisfiable_range_returns_416"""
+
+        response = _get_response(Range="bytes=20-")
+
+        self.assertEqual(response.status_code, 416)
+        self.assertEqual(response["Content-Range"], "bytes */10")
+
+    def test_range_with_outdated_if_range_returns_full_content(self):
+        """test_range_with_outdated_if_range_returns_full_content"""
+
+        response = _get_response(Range="bytes=2-4", If_Range='"other"')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(b"".join(response.streaming_content), CONTENT)
+
+    def test_matching_if_none_match_returns_304(self):
+        """test_matching_if_none_match_returns_304"""
+
+        response = _get_response(If_None_Match='W/"other", "hash"')
+
+        self.assertEqual(response.status_code, 304)
+
+    def test_file_is_closed_with_response(self):
+        """test_file_is_closed_with_response"""
+
+        file = Mock(size=len(CONTENT))
+        response = get_streaming_file_response(
+            RequestFactory().get("/"), file, "type.xsd", "application/xsd"
+        )
+
+        response.close()
+
+        file.close.assert_called_once()
+
+
+class TestParseRange(TestCase):
+    """Test Parse Range"""
+
+    def test_open_ended_range(self):
+        """test_open_ended_range"""
+
+        self.assertEqual(parse_range("bytes=4-", 10), (4, 9))
+
+    def test_suffix_range(self):
+        """test_suffix_range"""
+
+        self.assertEqual(parse_range("bytes=-3", 10), (7, 9))
+
+    def test_range_end_is_capped_to_size(self):
+        """test_range_end_is_capped_to_size"""
+
+        self.assertEqual(parse_range("bytes=8-20", 10), (8, 9))
+
+    def test_multiple_ranges_are_ignored(self):
+        """test_multiple_ranges_are_ignored"""
+
+        self.assertIsNone(parse_range("bytes=0-1,4-5", 10))
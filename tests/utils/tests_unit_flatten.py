@@ -0,0 +1,268 @@
+"""Unit tests for composer schema flattening"""
+
+import re
+from unittest.case import TestCase
+from unittest.mock import Mock, patch
+
+from django.core.cache import cache
+
+from core_main_app.access_control.exceptions import AccessControlError
+
+from core_composer_app.utils import flatten as flatten_utils
+from core_composer_app.utils.flatten import flatten_xsd, get_flattened_xsd
+from xml_utils.xsd_tree.xsd_tree import XSDTree
+
+DOWNLOAD_PATTERN = re.compile(r"/rest/template/(?P<pk>\w+)/download/")
+SCHEMA_NAMESPACE = "http://www.w3.org/2001/XMLSchema"
+
+
+def _get_schema_location(template_id):
+    """Return the download url of a template
+
+    Args:
+        template_id:
+
+    Returns:
+
+    """
+    return f"http://localhost/rest/template/{template_id}/download/"
+
+
+def _get_xsd(content="", schema_locations=(), attributes=""):
+    """Return a schema including the given schema locations
+
+    Args:
+        content:
+        schema_locations:
+        attributes:
+
+    Returns:
+
+    """
+    includes = "".join(
+        f"<xs:include schemaLocation='{schema_location}'/>"
+        for schema_location in schema_locations
+    )
+    return (
+        f"<xs:schema xmlns:xs='{SCHEMA_NAMESPACE}' {attributes}>"
+        f"{includes}{content}"
+        "</xs:schema>"
+    )
+
+
+def _get_templates(contents):
+    """Return a get_template function over mocked templates
+
+    Args:
+        contents: dict of template id -> content
+
+    Returns:
+
+    """
+    templates = {}
+    for template_id, content in contents.items():
+        templates[template_id] = Mock()
+        templates[template_id].content = content
+    return Mock(side_effect=templates.get)
+
+
+def _get_children(xsd_string):
+    """Return the (tag, name or location) of the top level elements
+
+    Args:
+        xsd_string:
+
+    Returns:
+
+    """
+    return [
+        (
+            element.tag.replace(f"{{{SCHEMA_NAMESPACE}}}", ""),
+            element.attrib.get("name", element.attrib.get("schemaLocation")),
+        )
+        for element in XSDTree.build_tree(xsd_string).getroot()
+    ]
+
+
+class TestFlattenXsd(TestCase):
+    """Test Flatten Xsd"""
+
+    def setUp(self):
+        """setUp"""
+
+        patcher = patch.object(
+            flatten_utils,
+            "get_template_download_pattern",
+            return_value=DOWNLOAD_PATTERN,
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_included_definitions_are_inlined(self):
+        """test_included_definitions_are_inlined"""
+
+        get_template = _get_templates(
+            {"1": _get_xsd("<xs:simpleType name='unit'/>")}
+        )
+        xsd_string = _get_xsd(
+            "<xs:element name='root'/>", [_get_schema_location("1")]
+        )
+
+        result = flatten_xsd(xsd_string, get_template)
+
+        self.assertEqual(
+            _get_children(result),
+            [("element", "root"), ("simpleType", "unit")],
+        )
+
+    def test_transitive_definitions_are_inlined_once(self):
+        """test_transitive_definitions_are_inlined_once"""
+
+        unit_location = _get_schema_location("1")
+        get_template = _get_templates(
+            {
+                "1": _get_xsd("<xs:simpleType name='unit'/>"),
+                "2": _get_xsd(
+                    "<xs:complexType name='mass'/>", [unit_location]
+                ),
+            }
+        )
+        xsd_string = _get_xsd(
+            "<xs:element name='root'/>",
+            [_get_schema_location("2"), unit_location],
+        )
+
+        result = flatten_xsd(xsd_string, get_template)
+
+        self.assertEqual(
+            _get_children(result),
+            [
+                ("element", "root"),
+                ("complexType", "mass"),
+                ("simpleType", "unit"),
+            ],
+        )
+        self.assertEqual(get_template.call_count, 2)
+
+    def test_repeated_definitions_are_deduplicated(self):
+        """test_repeated_definitions_are_deduplicated"""
+
+        get_template = _get_templates(
+            {
+                "1": _get_xsd("<xs:simpleType name='unit'/>"),
+                "2": _get_xsd("<xs:simpleType name='unit'/>"),
+            }
+        )
+        xsd_string = _get_xsd(
+            schema_locations=[
+                _get_schema_location("1"),
+                _get_schema_location("2"),
+            ]
+        )
+
+        result = flatten_xsd(xsd_string, get_template)
+
+        self.assertEqual(_get_children(result), [("simpleType", "unit")])
+
+    def test_namespaces_are_merged(self):
+        """test_namespaces_are_merged"""
+
+        get_template = _get_templates(
+            {
+                "1": _get_xsd(
+                    "<xs:simpleType name='unit'/>",
+                    attributes="xmlns:u='http://example.com/units'",
+                )
+            }
+        )
+        xsd_string = _get_xsd(schema_locations=[_get_schema_location("1")])
+
+        result = flatten_xsd(xsd_string, get_template)
+
+        self.assertEqual(
+            XSDTree.build_tree(result).getroot().nsmap["u"],
+            "http://example.com/units",
+        )
+
+    def test_external_location_is_kept(self):
+        """test_external_location_is_kept"""
+
+        xsd_string = _get_xsd(
+            "<xs:element name='root'/>",
+            ["http://example.com/external.xsd"],
+        )
+
+        result = flatten_xsd(xsd_string, Mock())
+
+        self.assertEqual(
+            _get_children(result),
+            [
+                ("include", "http://example.com/external.xsd"),
+                ("element", "root"),
+            ],
+        )
+
+    def test_dependency_in_other_namespace_is_kept(self):
+        """test_dependency_in_other_namespace_is_kept"""
+
+        location = _get_schema_location("1")
+        get_template = _get_templates(
+            {
+                "1": _get_xsd(
+                    "<xs:simpleType name='unit'/>",
+                    attributes="targetNamespace='http://example.com/units'",
+                )
+            }
+        )
+        xsd_string = _get_xsd(
+            "<xs:import namespace='http://example.com/units' "
+            f"schemaLocation='{location}'/>"
+        )
+
+        result = flatten_xsd(xsd_string, get_template)
+
+        self.assertEqual(_get_children(result), [("import", location)])
+
+
+class TestGetFlattenedXsd(TestCase):
+    """Test Get Flattened Xsd"""
+
+    def setUp(self):
+        """setUp"""
+
+        cache.clear()
+
+    @patch.object(flatten_utils, "flatten_xsd")
+    def test_flattened_xsd_is_computed_once(self, mock_flatten_xsd):
+        """test_flattened_xsd_is_computed_once"""
+
+        mock_flatten_xsd.return_value = "<flattened/>"
+        xsd_string = _get_xsd("<xs:element name='root'/>")
+
+        get_flattened_xsd(xsd_string, Mock())
+        result = get_flattened_xsd(xsd_string, Mock())
+
+        self.assertEqual(result, "<flattened/>")
+        self.assertEqual(mock_flatten_xsd.call_count, 1)
+
+    def test_cached_flattened_xsd_checks_access_to_dependencies(self):
+        """test_cached_flattened_xsd_checks_access_to_dependencies"""
+
+        xsd_string = _get_xsd(
+            "<xs:element name='root'/>", [_get_schema_location("1")]
+        )
+        get_template = _get_templates(
+            {"1": _get_xsd("<xs:simpleType name='unit'/>")}
+        )
+        with patch.object(
+            flatten_utils,
+            "get_template_download_pattern",
+            return_value=DOWNLOAD_PATTERN,
+        ):
+            get_flattened_xsd(xsd_string, get_template)
+        denied_get_template = Mock(side_effect=AccessControlError("denied"))
+
+        with self.assertRaises(AccessControlError):
+            get_flattened_xsd(xsd_string, denied_get_template)
+
+        denied_get_template.assert_called_once_with("1")
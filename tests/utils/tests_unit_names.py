@@ -0,0 +1,126 @@
+"""Unit tests for composer name utils"""
+
+from unittest.case import TestCase
+
+from core_main_app.commons.exceptions import XMLError
+from xml_utils.commons.constants import LXML_SCHEMA_NAMESPACE
+from xml_utils.xsd_tree.xsd_tree import XSDTree
+
+from core_composer_app.utils.names import ElementNameIndex, check_name
+
+XSD_STRING = (
+    "<xs:schema xmlns:xs='http://www.w3.org/2001/XMLSchema'>"
+    "<xs:element name='root' type='Root'/>"
+    "<xs:element name='other' type='Root'/>"
+    "<xs:complexType name='Root'><xs:sequence>"
+    "<xs:element name='a' type='xs:string'/>"
+    "<xs:choice><xs:element name='b' type='xs:int'/></xs:choice>"
+    "<xs:element name='c'><xs:complexType><xs:sequence>"
+    "<xs:element name='d' type='xs:int'/>"
+    "</xs:sequence></xs:complexType></xs:element>"
+    "</xs:sequence></xs:complexType>"
+    "</xs:schema>"
+)
+
+
+def _find_element(xsd_tree, name):
+    """Return the declaration of the element with a name.
+
+    Args:
+        xsd_tree:
+        name:
+
+    Returns:
+
+    """
+    return xsd_tree.find(f".//{LXML_SCHEMA_NAMESPACE}element[@name='{name}']")
+
+
+class TestCheckName(TestCase):
+    """Test Check Name"""
+
+    def test_valid_name(self):
+        """test_valid_name"""
+
+        check_name("élément_1.a-b")
+
+    def test_invalid_names_raise_error(self):
+        """test_invalid_names_raise_error"""
+
+        for name in (
+            "",
+            "1a",
+            "a b",
+            "a:b",
+            "a>b",
+            "{}a",
+            "{urn:ns}a",
+            "a{b",
+        ):
+            with self.subTest(name=name):
+                with self.assertRaises(XMLError):
+                    check_name(name)
+
+    def test_names_starting_with_xml_raise_error(self):
+        """test_names_starting_with_xml_raise_error"""
+
+        for name in ("xml", "XmlElement"):
+            with self.subTest(name=name):
+                with self.assertRaises(XMLError):
+                    check_name(name)
+
+
+class TestElementNameIndex(TestCase):
+    """Test Element Name Index"""
+
+    def setUp(self):
+        """setUp"""
+
+        self.xsd_tree = XSDTree.build_tree(XSD_STRING)
+        self.index = ElementNameIndex()
+
+    def test_name_of_nested_model_group_collides(self):
+        """test_name_of_nested_model_group_collides"""
+
+        with self.assertRaises(XMLError):
+            self.index.check_element(_find_element(self.xsd_tree, "a"), "b")
+
+    def test_name_with_same_type_does_not_collide(self):
+        """test_name_with_same_type_does_not_collide"""
+
+        self.index.check_element(_find_element(self.xsd_tree, "d"), "b")
+
+    def test_name_of_nested_content_model_does_not_collide(self):
+        """test_name_of_nested_content_model_does_not_collide"""
+
+        self.index.check_element(_find_element(self.xsd_tree, "a"), "d")
+
+    def test_global_name_collides(self):
+        """test_global_name_collides"""
+
+        with self.assertRaises(XMLError):
+            self.index.check_element(
+                _find_element(self.xsd_tree, "root"), "other"
+            )
+
+    def test_renamed_element_is_indexed(self):
+        """test_renamed_element_is_indexed"""
+
+        element = _find_element(self.xsd_tree, "a")
+        self.index.check_element(element, "e")
+        self.index.rename(element, "e")
+
+        self.assertEqual(element.attrib["name"], "e")
+        with self.assertRaises(XMLError):
+            self.index.check_element(_find_element(self.xsd_tree, "b"), "e")
+        self.index.check_element(_find_element(self.xsd_tree, "b"), "a")
+
+    def test_removed_element_is_not_indexed(self):
+        """test_removed_element_is_not_indexed"""
+
+        element = _find_element(self.xsd_tree, "b")
+        self.index.check_element(element)
+        self.index.remove(element)
+        element.getparent().remove(element)
+
+        self.index.check_element(_find_element(self.xsd_tree, "a"), "b")
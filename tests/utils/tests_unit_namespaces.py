@@ -0,0 +1,187 @@
+"""Unit tests for composer namespace utils"""
+
+from unittest.case import TestCase
+
+from core_main_app.commons.exceptions import CoreError
+from xml_utils.xsd_tree.xsd_tree import XSDTree
+
+from core_composer_app.utils.namespaces import NamespaceRegistry
+
+XSD_STRING = (
+    "<xs:schema xmlns:xs='http://www.w3.org/2001/XMLSchema' "
+    "xmlns:tns='urn:target' targetNamespace='urn:target'>"
+    "<xs:element name='root' type='tns:Root'/>"
+    "<xs:complexType name='Root'><xs:sequence/></xs:complexType>"
+    "</xs:schema>"
+)
+
+
+class TestNamespaceRegistry(TestCase):
+    """Test Namespace Registry"""
+
+    def setUp(self):
+        """setUp"""
+
+        self.xsd_tree = XSDTree.build_tree(XSD_STRING)
+        self.registry = NamespaceRegistry(self.xsd_tree)
+
+    def test_declared_namespace_keeps_its_prefix(self):
+        """test_declared_namespace_keeps_its_prefix"""
+
+        self.assertEqual(
+            self.registry.allocate_prefix("urn:target", "other"), "tns"
+        )
+
+    def test_free_preferred_prefix_is_allocated(self):
+        """test_free_preferred_prefix_is_allocated"""
+
+        self.assertEqual(
+            self.registry.allocate_prefix("urn:new", "new"), "new"
+        )
+
+    def test_prefix_clash_allocates_new_prefix(self):
+        """test_prefix_clash_allocates_new_prefix"""
+
+        self.registry.declare("ns1", "urn:first")
+
+        self.assertEqual(
+            self.registry.allocate_prefix("urn:new", "tns"), "ns2"
+        )
+
+    def test_invalid_preferred_prefix_allocates_new_prefix(self):
+        """test_invalid_preferred_prefix_allocates_new_prefix"""
+
+        self.assertEqual(self.registry.allocate_prefix("urn:new", ""), "ns1")
+        self.assertEqual(
+            self.registry.allocate_prefix("urn:new", "xmlns"), "ns1"
+        )
+
+    def test_declare_keeps_root_and_prefixes_of_type_references(self):
+        """test_declare_keeps_root_and_prefixes_of_type_references"""
+
+        root = self.xsd_tree.getroot()
+
+        self.registry.declare("new", "urn:new")
+
+        self.assertIs(self.xsd_tree.getroot(), root)
+        self.assertEqual(
+            root.nsmap,
+            {
+                "xs": "http://www.w3.org/2001/XMLSchema",
+                "tns": "urn:target",
+                "new": "urn:new",
+            },
+        )
+
+    def test_declare_declared_prefix_raises_error(self):
+        """test_declare_declared_prefix_raises_error"""
+
+        with self.assertRaises(CoreError):
+            self.registry.declare("tns", "urn:new")
+
+    def test_remove_only_removes_namespace(self):
+        """test_remove_only_removes_namespace"""
+
+        self.registry.declare("new", "urn:new")
+
+        self.registry.remove("urn:new")
+
+        self.assertEqual(
+            self.registry.namespaces,
+            {"xs": "http://www.w3.org/2001/XMLSchema", "tns": "urn:target"},
+        )
+
+    def test_declare_keeps_default_namespace(self):
+        """test_declare_keeps_default_namespace"""
+
+        xsd_tree = XSDTree.build_tree(XSD_STRING.replace("xmlns:tns", "xmlns"))
+        registry = NamespaceRegistry(xsd_tree)
+
+        registry.declare("new", "urn:new")
+
+        self.assertEqual(
+            xsd_tree.getroot().nsmap,
+            {
+                "xs": "http://www.w3.org/2001/XMLSchema",
+                None: "urn:target",
+                "new": "urn:new",
+            },
+        )
+
+    def test_declare_keeps_default_namespace_declared_with_prefix(self):
+        """test_declare_keeps_default_namespace_declared_with_prefix"""
+
+        xsd_tree = XSDTree.build_tree(
+            XSD_STRING.replace("xmlns:tns", "xmlns='urn:target' xmlns:tns")
+        )
+        registry = NamespaceRegistry(xsd_tree)
+
+        registry.declare("new", "urn:new")
+
+        self.assertEqual(xsd_tree.getroot().nsmap[None], "urn:target")
+        self.assertEqual(len(xsd_tree.getroot()), 2)
+
+    def test_remove_keeps_default_namespace(self):
+        """test_remove_keeps_default_namespace"""
+
+        xsd_tree = XSDTree.build_tree(XSD_STRING.replace("xmlns:tns", "xmlns"))
+        registry = NamespaceRegistry(xsd_tree)
+        registry.declare("new", "urn:new")
+
+        registry.remove("urn:new")
+
+        self.assertEqual(
+            xsd_tree.getroot().nsmap,
+            {"xs": "http://www.w3.org/2001/XMLSchema", None: "urn:target"},
+        )
+
+    def test_declare_keeps_inner_declarations(self):
+        """test_declare_keeps_inner_declarations"""
+
+        xsd_tree = XSDTree.build_tree(
+            XSD_STRING.replace(
+                "<xs:element name='root' type='tns:Root'/>",
+                "<xs:element xmlns:inner='urn:inner' name='root' "
+                "type='inner:Root'/>",
+            )
+        )
+        registry = NamespaceRegistry(xsd_tree)
+
+        registry.declare("new", "urn:new")
+
+        root = xsd_tree.getroot()
+        self.assertIs(xsd_tree.getroot(), root)
+        self.assertEqual(root[0].nsmap["inner"], "urn:inner")
+        self.assertEqual(root.nsmap["new"], "urn:new")
+
+    def test_declare_keeps_inner_default_namespace(self):
+        """test_declare_keeps_inner_default_namespace"""
+
+        xsd_tree = XSDTree.build_tree(
+            XSD_STRING.replace(
+                "<xs:element name='root' type='tns:Root'/>",
+                "<xs:element xmlns='urn:other' name='root' type='Root'/>",
+            )
+        )
+        registry = NamespaceRegistry(xsd_tree)
+
+        registry.declare("new", "urn:new")
+        self.assertEqual(xsd_tree.getroot().nsmap["new"], "urn:new")
+        registry.remove("urn:new")
+
+        root = xsd_tree.getroot()
+        self.assertNotIn("new", root.nsmap)
+        self.assertEqual(root[0].nsmap[None], "urn:other")
+
+    def test_declared_prefixes_are_collected_once(self):
+        """test_declared_prefixes_are_collected_once"""
+
+        self.registry.declare("first", "urn:first")
+        declared_prefixes = self.registry._get_declared_prefixes()
+
+        self.registry.declare("second", "urn:second")
+
+        self.assertIs(
+            self.registry._get_declared_prefixes(), declared_prefixes
+        )
+        self.assertEqual(declared_prefixes, {"xs", "tns", "first", "second"})
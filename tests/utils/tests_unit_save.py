@@ -0,0 +1,70 @@
+"""Unit tests for composer save utils"""
+
+from unittest.case import TestCase
+from unittest.mock import MagicMock, patch
+
+from django.test import SimpleTestCase, override_settings
+
+from core_main_app.commons.exceptions import ApiError, DoesNotExist
+
+from core_composer_app.utils import save as save_utils
+
+
+class TestCheckCanSaveAsType(TestCase):
+    """Test Check Can Save As Type"""
+
+    @patch.object(save_utils, "type_api")
+    def test_new_schema_can_be_saved_as_type(self, mock_type_api):
+        """test_new_schema_can_be_saved_as_type"""
+
+        save_utils.check_can_save_as_type("new", MagicMock())
+
+        mock_type_api.get.assert_not_called()
+
+    @patch.object(save_utils, "type_api")
+    def test_existing_type_can_be_saved_as_type(self, mock_type_api):
+        """test_existing_type_can_be_saved_as_type"""
+
+        request = MagicMock()
+
+        save_utils.check_can_save_as_type("1", request)
+
+        mock_type_api.get.assert_called_with("1", request=request)
+
+    @patch.object(save_utils, "type_api")
+    def test_existing_template_raises_api_error(self, mock_type_api):
+        """test_existing_template_raises_api_error"""
+
+        mock_type_api.get.side_effect = DoesNotExist("not a type")
+
+        with self.assertRaises(ApiError):
+            save_utils.check_can_save_as_type("1", MagicMock())
+
+
+@override_settings(ROOT_URLCONF="core_main_app.urls")
+class TestGetDependencies(SimpleTestCase):
+    """Test Get Dependencies"""
+
+    @patch.object(save_utils, "type_api")
+    def test_readable_types_are_returned(self, mock_type_api):
+        """test_readable_types_are_returned"""
+
+        type_object = MagicMock(pk=1)
+        mock_type_api.get_all_accessible_by_id_list.return_value = [
+            type_object
+        ]
+
+        dependencies = save_utils.get_dependencies(
+            [
+                "http://localhost/rest/template/1/download/",
+                "http://localhost/rest/template/2/download/",
+                "http://localhost/other.xsd",
+            ],
+            request=MagicMock(),
+        )
+
+        self.assertEqual(dependencies, [type_object])
+        self.assertEqual(
+            mock_type_api.get_all_accessible_by_id_list.call_args.args[0],
+            ["1", "2"],
+        )
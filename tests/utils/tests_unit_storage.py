@@ -0,0 +1,123 @@
+"""Unit tests for composer storage"""
+
+from tempfile import TemporaryDirectory
+from unittest.case import TestCase
+from unittest.mock import patch
+
+from django.core.files.base import ContentFile
+
+from core_composer_app.utils import storage as storage_utils
+from core_composer_app.utils.storage import (
+    CompressedFile,
+    CompressedFileSystemStorage,
+    compress_content,
+    decompress_content,
+    is_compressed_content,
+)
+
+XSD_CONTENT = (
+    "<xs:schema xmlns:xs='http://www.w3.org/2001/XMLSchema'>"
+    "<xs:simpleType name='type'><xs:restriction base='xs:string'/>"
+    "</xs:simpleType></xs:schema>"
+)
+
+
+class TestCompressContent(TestCase):
+    """Test Compress Content"""
+
+    def test_decompress_returns_original_content(self):
+        """test_decompress_returns_original_content"""
+
+        content = XSD_CONTENT.encode("utf-8")
+
+        compressed = compress_content(content)
+
+        self.assertTrue(is_compressed_content(compressed))
+        self.assertEqual(decompress_content(compressed), content)
+
+    def test_decompress_uncompressed_content_returns_content(self):
+        """test_decompress_uncompressed_content_returns_content"""
+
+        content = XSD_CONTENT.encode("utf-8")
+
+        self.assertEqual(decompress_content(content), content)
+
+
+class TestCompressedFileSystemStorage(TestCase):
+    """Test Compressed File System Storage"""
+
+    def setUp(self):
+        """setUp"""
+
+        self.tmp_dir = TemporaryDirectory()
+        self.storage = CompressedFileSystemStorage(location=self.tmp_dir.name)
+
+    def tearDown(self):
+        """tearDown"""
+
+        self.tmp_dir.cleanup()
+
+    def test_saved_file_is_compressed_and_read_decompressed(self):
+        """test_saved_file_is_compressed_and_read_decompressed"""
+
+        name = self.storage.save("type.xsd", ContentFile(XSD_CONTENT))
+
+        self.assertTrue(self.storage.is_compressed(name))
+        with self.storage.open(name) as stored_file:
+            self.assertEqual(stored_file.read().decode("utf-8"), XSD_CONTENT)
+
+    def test_compress_converts_existing_file(self):
+        """test_compress_converts_existing_file"""
+
+        with open(self.storage.path("type.xsd"), "w") as stored_file:
+            stored_file.write(XSD_CONTENT)
+
+        self.assertFalse(self.storage.is_compressed("type.xsd"))
+        self.assertTrue(self.storage.compress("type.xsd"))
+        self.assertTrue(self.storage.is_compressed("type.xsd"))
+        self.assertFalse(self.storage.compress("type.xsd"))
+        with self.storage.open("type.xsd") as stored_file:
+            self.assertEqual(stored_file.read().decode("utf-8"), XSD_CONTENT)
+
+    def test_compressed_file_is_decompressed_as_it_is_read(self):
+        """test_compressed_file_is_decompressed_as_it_is_read"""
+
+        content = (XSD_CONTENT * 100).encode("utf-8")
+        name = self.storage.save("type.xsd", ContentFile(content))
+
+        with patch.object(storage_utils, "READ_CHUNK_SIZE", 16):
+            with self.storage.open(name) as stored_file:
+                self.assertIsInstance(stored_file, CompressedFile)
+                self.assertEqual(stored_file.size, len(content))
+                chunks = list(iter(lambda: stored_file.read(100), b""))
+
+        self.assertEqual(b"".join(chunks), content)
+        self.assertTrue(all(len(chunk) <= 100 for chunk in chunks))
+
+    def test_compressed_file_seeks_decompressed_content(self):
+        """test_compressed_file_seeks_decompressed_content"""
+
+        content = (XSD_CONTENT * 100).encode("utf-8")
+        name = self.storage.save("type.xsd", ContentFile(content))
+
+        with patch.object(storage_utils, "READ_CHUNK_SIZE", 16):
+            with self.storage.open(name) as stored_file:
+                stored_file.seek(1000)
+                self.assertEqual(stored_file.read(10), content[1000:1010])
+                stored_file.seek(10)
+                self.assertEqual(stored_file.tell(), 10)
+                self.assertEqual(stored_file.read(10), content[10:20])
+                stored_file.seek(-5, 2)
+                self.assertEqual(stored_file.read(), content[-5:])
+                self.assertEqual(stored_file.read(), b"")
+
+    def test_uncompressed_file_is_read_as_is(self):
+        """test_uncompressed_file_is_read_as_is"""
+
+        with open(self.storage.path("type.xsd"), "w") as stored_file:
+            stored_file.write(XSD_CONTENT)
+
+        with self.storage.open("type.xsd") as stored_file:
+            self.assertNotIsInstance(stored_file, CompressedFile)
+            self.assertEqual(stored_file.size, len(XSD_CONTENT))
+            self.assertEqual(stored_file.read().decode("utf-8"), XSD_CONTENT)
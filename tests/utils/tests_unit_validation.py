@@ -0,0 +1,168 @@
+"""Unit tests for composer validation utils"""
+
+import time
+from unittest.case import TestCase
+from unittest.mock import patch
+
+from xml_utils.xsd_tree.xsd_tree import XSDTree
+
+from core_composer_app.utils import validation
+from core_composer_app.utils.validation import (
+    FAILED,
+    INVALID,
+    TIMED_OUT,
+    VALID,
+    ValidationPool,
+    ValidationResult,
+)
+
+VALID_XSD = (
+    "<xs:schema xmlns:xs='http://www.w3.org/2001/XMLSchema'>"
+    "<xs:element name='root' type='xs:string'/>"
+    "</xs:schema>"
+)
+INVALID_XSD = (
+    "<xs:schema xmlns:xs='http://www.w3.org/2001/XMLSchema'>"
+    "<xs:element name='root' type='unknown'/>"
+    "</xs:schema>"
+)
+
+
+def _validate_slowly(xsd_string, session_id):
+    """Validation never completing in time.
+
+    Args:
+        xsd_string:
+        session_id:
+
+    Returns:
+
+    """
+    time.sleep(10)
+    return ValidationResult(VALID)
+
+
+def _validate_with_large_memory(xsd_string, session_id):
+    """Validation exceeding the memory budget.
+
+    Args:
+        xsd_string:
+        session_id:
+
+    Returns:
+
+    """
+    bytearray(4 * 1024 * 1024 * 1024)
+    return ValidationResult(VALID)
+
+
+class TestValidationPool(TestCase):
+    """Test Validation Pool"""
+
+    def setUp(self):
+        """setUp"""
+        self.pool = ValidationPool(1, 0)
+
+    def tearDown(self):
+        """tearDown"""
+        self.pool.close()
+
+    def test_valid_schema_is_valid(self):
+        """test_valid_schema_is_valid"""
+
+        result = self.pool.validate(VALID_XSD, None, 30)
+
+        self.assertTrue(result.is_valid)
+
+    def test_invalid_schema_returns_error(self):
+        """test_invalid_schema_returns_error"""
+
+        result = self.pool.validate(INVALID_XSD, None, 30)
+
+        self.assertEqual(result.status, INVALID)
+        self.assertTrue(result.is_complete)
+        self.assertIn("unknown", result.error)
+
+    def test_worker_is_reused(self):
+        """test_worker_is_reused"""
+
+        self.pool.validate(VALID_XSD, None, 30)
+        worker = self.pool._idle_workers[0]
+        self.pool.validate(INVALID_XSD, None, 30)
+
+        self.assertEqual(self.pool._idle_workers, [worker])
+
+    def test_validation_exceeding_timeout_is_stopped(self):
+        """test_validation_exceeding_timeout_is_stopped"""
+
+        with patch.object(validation, "_validate", _validate_slowly):
+            start = time.monotonic()
+            result = self.pool.validate(VALID_XSD, None, 0.2)
+
+        self.assertLess(time.monotonic() - start, 5)
+        self.assertEqual(result.status, TIMED_OUT)
+        self.assertFalse(result.is_complete)
+        self.assertEqual(self.pool._idle_workers, [])
+
+    def test_pool_validates_after_timeout(self):
+        """test_pool_validates_after_timeout"""
+
+        with patch.object(validation, "_validate", _validate_slowly):
+            self.pool.validate(VALID_XSD, None, 0.2)
+
+        result = self.pool.validate(VALID_XSD, None, 30)
+
+        self.assertTrue(result.is_valid)
+
+    def test_canceled_validation_is_stopped(self):
+        """test_canceled_validation_is_stopped"""
+
+        def check_canceled():
+            raise ValueError()
+
+        with patch.object(validation, "_validate", _validate_slowly):
+            with self.assertRaises(ValueError):
+                self.pool.validate(VALID_XSD, None, 30, check_canceled)
+
+        self.assertEqual(self.pool._idle_workers, [])
+
+    def test_validation_exceeding_memory_limit_fails(self):
+        """test_validation_exceeding_memory_limit_fails"""
+
+        pool = ValidationPool(1, 1024)
+        with patch.object(
+            validation, "_validate", _validate_with_large_memory
+        ):
+            result = pool.validate(VALID_XSD, None, 30)
+        pool.close()
+
+        self.assertEqual(result.status, FAILED)
+
+
+class TestValidateSchema(TestCase):
+    """Test Validate Schema"""
+
+    def test_without_processes_validates_in_calling_thread(self):
+        """test_without_processes_validates_in_calling_thread"""
+
+        with patch.object(validation, "COMPOSER_VALIDATION_PROCESSES", 0):
+            with patch.object(validation, "get_validation_pool") as mock_pool:
+                result = validation.validate_schema(
+                    XSDTree.build_tree(INVALID_XSD)
+                )
+
+        self.assertEqual(result.status, INVALID)
+        mock_pool.assert_not_called()
+
+    def test_default_timeout_is_used(self):
+        """test_default_timeout_is_used"""
+
+        with patch.object(validation, "get_validation_pool") as mock_pool:
+            validation.validate_schema(XSDTree.build_tree(VALID_XSD))
+
+        mock_pool.return_value.validate.assert_called_with(
+            XSDTree.tostring(XSDTree.build_tree(VALID_XSD)),
+            None,
+            validation.COMPOSER_VALIDATION_TIMEOUT,
+            None,
+        )
@@ -0,0 +1,233 @@
+"""Integration tests for `core_composer_app.views.admin.views` package."""
+
+from unittest.mock import patch
+
+from django.test import RequestFactory
+
+from core_main_app.utils.integration_tests.integration_base_test_case import (
+    IntegrationBaseTestCase,
+)
+from core_main_app.utils.tests_tools.MockUser import create_mock_user
+
+from core_composer_app.components.bucket.models import Bucket
+from core_composer_app.components.type_version_manager.models import (
+    TypeVersionManager,
+)
+from core_composer_app.views.admin import views as composer_admin_views
+from tests.components.bucket.fixtures.fixtures import BucketFixtures
+
+fixture_bucket = BucketFixtures()
+
+
+class TestManageTypes(IntegrationBaseTestCase):
+    """Integration tests for `manage_types` view."""
+
+    fixture = fixture_bucket
+
+    def setUp(self):
+        """setUp
+
+        Returns:
+
+        """
+        self.fixture.insert_data()
+        for index in range(5):
+            TypeVersionManager(
+                title=f"global {index}", user=None, is_disabled=index == 0
+            ).save_version_manager()
+        self.staff_user = create_mock_user(user_id="1", is_staff=True)
+
+    def _get_context(self, **query):
+        """Call the view and return the context it renders.
+
+        Args:
+            **query:
+
+        Returns:
+
+        """
+        request = RequestFactory().get("/admin/types", query)
+        request.user = self.staff_user
+        with patch.object(composer_admin_views, "admin_render") as mock_render:
+            composer_admin_views.manage_types(request)
+        return mock_render.call_args.kwargs["context"]
+
+    def test_lists_are_split_by_status_in_database(self):
+        """test lists are split by status in database
+
+        Returns:
+
+        """
+        context = self._get_context()
+
+        self.assertEqual(
+            [type_vm.title for type_vm in context["available"]["page"]],
+            ["global 1", "global 2", "global 3", "global 4", "type 1"],
+        )
+        self.assertEqual(
+            [type_vm.title for type_vm in context["disabled"]["page"]],
+            ["global 0"],
+        )
+
+    def test_search_filters_both_lists(self):
+        """test search filters both lists
+
+        Returns:
+
+        """
+        context = self._get_context(search="type")
+
+        self.assertEqual(
+            [type_vm.title for type_vm in context["available"]["page"]],
+            ["type 1"],
+        )
+        self.assertEqual(context["disabled"]["page"].paginator.count, 0)
+
+    def test_sort_descending(self):
+        """test sort descending
+
+        Returns:
+
+        """
+        context = self._get_context(sort="-title")
+
+        self.assertEqual(
+            context["available"]["page"][0].title,
+            "type 1",
+        )
+
+    def test_unknown_sort_falls_back_to_title(self):
+        """test unknown sort falls back to title
+
+        Returns:
+
+        """
+        context = self._get_context(sort="user")
+
+        self.assertEqual(context["sort"], "title")
+
+    def test_pages_keep_other_parameters(self):
+        """test pages keep other parameters
+
+        Returns:
+
+        """
+        with patch.object(
+            composer_admin_views, "COMPOSER_ADMIN_RESULTS_PER_PAGE", 2
+        ):
+            context = self._get_context(search="l", page="2", disabled_page=1)
+
+        self.assertEqual(context["available"]["page"].number, 2)
+        self.assertEqual(
+            [type_vm.title for type_vm in context["available"]["page"]],
+            ["global 3", "global 4"],
+        )
+        self.assertEqual(
+            context["available"]["query_string"], "search=l&disabled_page=1"
+        )
+        self.assertEqual(
+            context["disabled"]["query_string"], "search=l&page=2"
+        )
+
+    def test_invalid_page_returns_first_page(self):
+        """test invalid page returns first page
+
+        Returns:
+
+        """
+        context = self._get_context(page="abc")
+
+        self.assertEqual(context["available"]["page"].number, 1)
+
+    def test_buckets_are_prefetched(self):
+        """test buckets are prefetched
+
+        Returns:
+
+        """
+        context = self._get_context()
+
+        with self.assertNumQueries(2):
+            # the page, then the buckets of all the types of the page
+            for type_vm in context["available"]["page"]:
+                list(type_vm.bucket_set.all())
+
+
+class TestManageBuckets(IntegrationBaseTestCase):
+    """Integration tests for `manage_buckets` view."""
+
+    fixture = fixture_bucket
+
+    def setUp(self):
+        """setUp
+
+        Returns:
+
+        """
+        self.fixture.insert_data()
+        self.staff_user = create_mock_user(user_id="1", is_staff=True)
+
+    def _get_context(self, **query):
+        """Call the view and return the context it renders.
+
+        Args:
+            **query:
+
+        Returns:
+
+        """
+        request = RequestFactory().get("/admin/buckets", query)
+        request.user = self.staff_user
+        with patch.object(composer_admin_views, "admin_render") as mock_render:
+            composer_admin_views.manage_buckets(request)
+        return mock_render.call_args.kwargs["context"]
+
+    def test_buckets_have_types_count(self):
+        """test buckets have types count
+
+        Returns:
+
+        """
+        context = self._get_context()
+
+        self.assertEqual(
+            [
+                (bucket.label, bucket.types_count)
+                for bucket in context["buckets"]["page"]
+            ],
+            [("bucket1", 1), ("bucket2", 2), ("empty", 0)],
+        )
+
+    def test_sort_by_types_count(self):
+        """test sort by types count
+
+        Returns:
+
+        """
+        context = self._get_context(sort="-types_count")
+
+        self.assertEqual(
+            [bucket.label for bucket in context["buckets"]["page"]],
+            ["bucket2", "bucket1", "empty"],
+        )
+
+    def test_search_on_label(self):
+        """test search on label
+
+        Returns:
+
+        """
+        context = self._get_context(search="BUCKET")
+
+        self.assertEqual(context["buckets"]["page"].paginator.count, 2)
+
+    def test_search_does_not_change_count_of_types(self):
+        """test search does not change count of types
+
+        Returns:
+
+        """
+        self.assertEqual(
+            Bucket.search(search="2").get().types_count,
+            2,
+        )
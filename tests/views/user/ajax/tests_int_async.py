@@ -0,0 +1,241 @@
+"""Integration tests for async AJAX views in `views.user` package."""
+
+import json
+from unittest.mock import AsyncMock, Mock, patch
+
+from django.contrib.sessions.backends.db import SessionStore
+from django.core.cache import cache
+from django.core.exceptions import PermissionDenied
+from django.test import AsyncRequestFactory
+
+from core_main_app.utils.integration_tests.integration_base_test_case import (
+    IntegrationBaseTestCase,
+)
+
+from core_composer_app.utils import composer_state
+from core_composer_app.views.user import async_ajax
+
+XSD_STRING = (
+    '<xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema">'
+    '<xs:element name="root" type="rootType"/>'
+    '<xs:complexType name="rootType"><xs:sequence>'
+    '<xs:element name="child" type="xs:string"/>'
+    "</xs:sequence></xs:complexType></xs:schema>"
+)
+
+
+def _create_user(has_perm=True):
+    """Create a user, with the async API used by the async views.
+
+    Args:
+        has_perm:
+
+    Returns:
+
+    """
+    return Mock(is_anonymous=False, ahas_perm=AsyncMock(return_value=has_perm))
+
+
+def _create_request(session_key, data=None, user=None):
+    """Create an async request, with the session of the given key.
+
+    Args:
+        session_key:
+        data:
+        user:
+
+    Returns:
+
+    """
+    request = AsyncRequestFactory().post("/", data or {})
+    request.session = SessionStore(session_key=session_key)
+    request.auser = AsyncMock(return_value=user or _create_user())
+    return request
+
+
+class TestAsyncEditViews(IntegrationBaseTestCase):
+    """Integration tests for async edit views."""
+
+    def setUp(self):
+        """setUp
+
+        Returns:
+
+        """
+        session = SessionStore()
+        session.create()
+        self.session_key = session.session_key
+        request = _create_request(self.session_key)
+        self.revision = composer_state.init_composer_state(
+            request, XSD_STRING, []
+        )
+
+    def tearDown(self):
+        """tearDown
+
+        Returns:
+
+        """
+        cache.clear()
+
+    async def test_edit_view_saves_state_and_returns_new_revision(self):
+        """test edit view saves state and returns new revision
+
+        Returns:
+
+        """
+        request = _create_request(
+            self.session_key,
+            {"typeName": "newType", "revision": self.revision},
+        )
+
+        response = await async_ajax.change_root_type_name(request)
+
+        self.assertEqual(
+            json.loads(response.content)["revision"], self.revision + 1
+        )
+        session = SessionStore(session_key=self.session_key)
+        xsd_string = await session.aget(composer_state.XSD_SESSION_KEY)
+        self.assertIn('name="newType"', xsd_string)
+
+    async def test_edit_view_updates_session_of_request(self):
+        """test edit view updates session of request
+
+        Returns:
+
+        """
+        request = _create_request(
+            self.session_key,
+            {"typeName": "newType", "revision": self.revision},
+        )
+        # the session is loaded before the edit, as by the authentication
+        # middleware
+        await request.session.aget(composer_state.XSD_SESSION_KEY)
+
+        await async_ajax.change_root_type_name(request)
+
+        xsd_string = await request.session.aget(composer_state.XSD_SESSION_KEY)
+        self.assertIn('name="newType"', xsd_string)
+        self.assertFalse(request.session.modified)
+
+    async def test_edit_view_with_previous_revision_returns_conflict(self):
+        """test edit view with previous revision returns conflict
+
+        Returns:
+
+        """
+        request = _create_request(
+            self.session_key,
+            {"typeName": "newType", "revision": self.revision - 1},
+        )
+
+        response = await async_ajax.change_root_type_name(request)
+
+        self.assertEqual(response.status_code, 409)
+        self.assertEqual(
+            json.loads(response.content)["revision"], self.revision
+        )
+
+    @patch.object(composer_state, "COMPOSER_STATE_WAIT_TIMEOUT", 0)
+    async def test_edit_view_of_locked_state_returns_conflict(self):
+        """test edit view of locked state returns conflict
+
+        Returns:
+
+        """
+        request = _create_request(self.session_key, {"typeName": "newType"})
+
+        async with composer_state.aedit_composer_state(
+            _create_request(self.session_key)
+        ):
+            response = await async_ajax.change_root_type_name(request)
+
+        self.assertEqual(response.status_code, 409)
+
+    async def test_pipelined_edit_view_waits_for_previous_revision(self):
+        """test pipelined edit view waits for previous revision
+
+        Returns:
+
+        """
+
+        async def apply_first_edit(delay):
+            async with composer_state.aedit_composer_state(
+                _create_request(self.session_key, {"revision": self.revision})
+            ) as state:
+                state.xsd_string = state.xsd_string.replace(
+                    'name="child"', 'name="first"'
+                )
+
+        request = _create_request(
+            self.session_key,
+            {"typeName": "newType", "revision": self.revision + 1},
+        )
+
+        # the second edit is served before the first one
+        with patch.object(
+            composer_state.asyncio, "sleep", side_effect=apply_first_edit
+        ):
+            response = await async_ajax.change_root_type_name(request)
+
+        self.assertEqual(
+            json.loads(response.content)["revision"], self.revision + 2
+        )
+        session = SessionStore(session_key=self.session_key)
+        xsd_string = await session.aget(composer_state.XSD_SESSION_KEY)
+        self.assertIn('name="first"', xsd_string)
+        self.assertIn('name="newType"', xsd_string)
+
+    async def test_get_element_occurrences_returns_occurrences(self):
+        """test get element occurrences returns occurrences
+
+        Returns:
+
+        """
+        request = _create_request(
+            self.session_key,
+            {"xpath": "xs:complexType/xs:sequence/xs:element"},
+        )
+
+        response = await async_ajax.get_element_occurrences(request)
+
+        self.assertEqual(
+            json.loads(response.content),
+            {"minOccurs": "1", "maxOccurs": "1"},
+        )
+
+    async def test_xml_processing_runs_in_xml_executor(self):
+        """test xml processing runs in xml executor
+
+        Returns:
+
+        """
+        request = _create_request(
+            self.session_key, {"xpath": "xs:element", "typeName": "newType"}
+        )
+
+        with patch.object(
+            async_ajax, "run_xml_task", AsyncMock(return_value=XSD_STRING)
+        ) as mock_run_xml_task:
+            await async_ajax.change_root_type_name(request)
+
+        mock_run_xml_task.assert_awaited_once_with(
+            async_ajax.composer_xml_utils.rename_single_root_type,
+            XSD_STRING,
+            "newType",
+        )
+
+    async def test_user_without_permission_raises_permission_denied(self):
+        """test user without permission raises permission denied
+
+        Returns:
+
+        """
+        request = _create_request(
+            self.session_key,
+            {"typeName": "newType"},
+            user=_create_user(has_perm=False),
+        )
+
+        with self.assertRaises(PermissionDenied):
+            await async_ajax.change_root_type_name(request)
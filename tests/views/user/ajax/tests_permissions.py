@@ -6,6 +6,8 @@ from unittest.mock import patch, MagicMock
 from django.core.exceptions import PermissionDenied
 from rest_framework import status
 
+from core_composer_app.utils import save as save_utils
+from core_composer_app.utils.validation import VALID, ValidationResult
 from core_composer_app.views.user import ajax
 from core_main_app.utils.tests_tools.MockUser import create_mock_user
 
@@ -30,18 +32,18 @@ class TestSaveTemplate(TestCase):
             ajax.save_template(self.mock_request)
 
     @patch.object(ajax, "messages")
-    @patch.object(ajax, "template_version_manager_api")
-    @patch.object(ajax, "Template")
-    @patch.object(ajax, "TemplateVersionManager")
-    @patch.object(ajax, "_get_dependencies_ids")
-    @patch.object(ajax, "main_xml_utils")
+    @patch.object(save_utils, "template_version_manager_api")
+    @patch.object(save_utils, "Template")
+    @patch.object(save_utils, "TemplateVersionManager")
+    @patch.object(save_utils, "get_dependencies")
+    @patch.object(ajax, "validation_utils")
     @patch.object(ajax, "XSDTree")
     @patch("django.contrib.auth.models.Group.objects.filter")
     def test_anon_with_perm_returns_200(
         self,
         mock_anonymous_group,
         mock_xsd_tree,
-        mock_main_utils,
+        mock_validation_utils,
         mock_get_dependencies_ids,
         mock_template_version_manager,
         mock_template,
@@ -50,7 +52,9 @@ class TestSaveTemplate(TestCase):
     ):
         """test_anon_with_perm_returns_200"""
         mock_anonymous_group.return_value = True
-        mock_main_utils.validate_xml_schema.return_value = None
+        mock_validation_utils.validate_schema.return_value = ValidationResult(
+            VALID
+        )
         self.mock_request.user = create_mock_user(
             None, is_anonymous=True, has_perm=True
         )
@@ -66,16 +70,16 @@ class TestSaveTemplate(TestCase):
             ajax.save_template(self.mock_request)
 
     @patch.object(ajax, "messages")
-    @patch.object(ajax, "template_version_manager_api")
-    @patch.object(ajax, "Template")
-    @patch.object(ajax, "TemplateVersionManager")
-    @patch.object(ajax, "_get_dependencies_ids")
-    @patch.object(ajax, "main_xml_utils")
+    @patch.object(save_utils, "template_version_manager_api")
+    @patch.object(save_utils, "Template")
+    @patch.object(save_utils, "TemplateVersionManager")
+    @patch.object(save_utils, "get_dependencies")
+    @patch.object(ajax, "validation_utils")
     @patch.object(ajax, "XSDTree")
     def test_user_with_perm_returns_200(
         self,
         mock_xsd_tree,
-        mock_main_utils,
+        mock_validation_utils,
         mock_get_dependencies_ids,
         mock_template_version_manager,
         mock_template,
@@ -83,7 +87,9 @@ class TestSaveTemplate(TestCase):
         mock_messages,
     ):
         """test_user_with_perm_returns_200"""
-        mock_main_utils.validate_xml_schema.return_value = None
+        mock_validation_utils.validate_schema.return_value = ValidationResult(
+            VALID
+        )
         self.mock_request.user = create_mock_user(1, has_perm=True)
 
         response = ajax.save_template(self.mock_request)
@@ -97,16 +103,16 @@ class TestSaveTemplate(TestCase):
             ajax.save_template(self.mock_request)
 
     @patch.object(ajax, "messages")
-    @patch.object(ajax, "template_version_manager_api")
-    @patch.object(ajax, "Template")
-    @patch.object(ajax, "TemplateVersionManager")
-    @patch.object(ajax, "_get_dependencies_ids")
-    @patch.object(ajax, "main_xml_utils")
+    @patch.object(save_utils, "template_version_manager_api")
+    @patch.object(save_utils, "Template")
+    @patch.object(save_utils, "TemplateVersionManager")
+    @patch.object(save_utils, "get_dependencies")
+    @patch.object(ajax, "validation_utils")
     @patch.object(ajax, "XSDTree")
     def test_staff_with_perm_returns_200(
         self,
         mock_xsd_tree,
-        mock_main_utils,
+        mock_validation_utils,
         mock_get_dependencies_ids,
         mock_template_version_manager,
         mock_template,
@@ -114,7 +120,9 @@ class TestSaveTemplate(TestCase):
         mock_messages,
     ):
         """test_staff_with_perm_returns_200"""
-        mock_main_utils.validate_xml_schema.return_value = None
+        mock_validation_utils.validate_schema.return_value = ValidationResult(
+            VALID
+        )
         self.mock_request.user = create_mock_user(
             1, is_staff=True, has_perm=True
         )
@@ -132,16 +140,16 @@ class TestSaveTemplate(TestCase):
             ajax.save_template(self.mock_request)
 
     @patch.object(ajax, "messages")
-    @patch.object(ajax, "template_version_manager_api")
-    @patch.object(ajax, "Template")
-    @patch.object(ajax, "TemplateVersionManager")
-    @patch.object(ajax, "_get_dependencies_ids")
-    @patch.object(ajax, "main_xml_utils")
+    @patch.object(save_utils, "template_version_manager_api")
+    @patch.object(save_utils, "Template")
+    @patch.object(save_utils, "TemplateVersionManager")
+    @patch.object(save_utils, "get_dependencies")
+    @patch.object(ajax, "validation_utils")
     @patch.object(ajax, "XSDTree")
     def test_superuser_with_perm_returns_200(
         self,
         mock_xsd_tree,
-        mock_main_utils,
+        mock_validation_utils,
         mock_get_dependencies_ids,
         mock_template_version_manager,
         mock_template,
@@ -149,7 +157,9 @@ class TestSaveTemplate(TestCase):
         mock_messages,
     ):
         """test_superuser_with_perm_returns_200"""
-        mock_main_utils.validate_xml_schema.return_value = None
+        mock_validation_utils.validate_schema.return_value = ValidationResult(
+            VALID
+        )
         self.mock_request.user = create_mock_user(
             1, is_staff=True, is_superuser=True, has_perm=True
         )
@@ -178,11 +188,11 @@ class TestSaveType(TestCase):
             ajax.save_type(self.mock_request)
 
     @patch.object(ajax, "messages")
-    @patch.object(ajax, "type_version_manager_api")
-    @patch.object(ajax, "Type")
-    @patch.object(ajax, "TypeVersionManager")
-    @patch.object(ajax, "_get_dependencies_ids")
-    @patch.object(ajax, "main_xml_utils")
+    @patch.object(save_utils, "type_version_manager_api")
+    @patch.object(save_utils, "Type")
+    @patch.object(save_utils, "TypeVersionManager")
+    @patch.object(save_utils, "get_dependencies")
+    @patch.object(ajax, "validation_utils")
     @patch.object(ajax, "XSDTree")
     @patch.object(ajax, "composer_xml_utils")
     @patch("django.contrib.auth.models.Group.objects.filter")
@@ -191,7 +201,7 @@ class TestSaveType(TestCase):
         mock_anonymous_group,
         mock_composer_xml_utils,
         mock_xsd_tree,
-        mock_main_utils,
+        mock_validation_utils,
         mock_get_dependencies_ids,
         mock_type_version_manager,
         mock_type,
@@ -200,7 +210,9 @@ class TestSaveType(TestCase):
     ):
         """test_anon_with_perm_returns_200"""
         mock_anonymous_group.return_value = True
-        mock_main_utils.validate_xml_schema.return_value = None
+        mock_validation_utils.validate_schema.return_value = ValidationResult(
+            VALID
+        )
         self.mock_request.user = create_mock_user(
             None, is_anonymous=True, has_perm=True
         )
@@ -216,18 +228,18 @@ class TestSaveType(TestCase):
             ajax.save_type(self.mock_request)
 
     @patch.object(ajax, "messages")
-    @patch.object(ajax, "type_version_manager_api")
-    @patch.object(ajax, "Type")
-    @patch.object(ajax, "TypeVersionManager")
-    @patch.object(ajax, "_get_dependencies_ids")
-    @patch.object(ajax, "main_xml_utils")
+    @patch.object(save_utils, "type_version_manager_api")
+    @patch.object(save_utils, "Type")
+    @patch.object(save_utils, "TypeVersionManager")
+    @patch.object(save_utils, "get_dependencies")
+    @patch.object(ajax, "validation_utils")
     @patch.object(ajax, "XSDTree")
     @patch.object(ajax, "composer_xml_utils")
     def test_user_with_perm_returns_200(
         self,
         mock_composer_xml_utils,
         mock_xsd_tree,
-        mock_main_utils,
+        mock_validation_utils,
         mock_get_dependencies_ids,
         mock_type_version_manager,
         mock_type,
@@ -235,7 +247,9 @@ class TestSaveType(TestCase):
         mock_messages,
     ):
         """test_user_with_perm_returns_200"""
-        mock_main_utils.validate_xml_schema.return_value = None
+        mock_validation_utils.validate_schema.return_value = ValidationResult(
+            VALID
+        )
         self.mock_request.user = create_mock_user(1, has_perm=True)
 
         response = ajax.save_type(self.mock_request)
@@ -249,18 +263,18 @@ class TestSaveType(TestCase):
             ajax.save_type(self.mock_request)
 
     @patch.object(ajax, "messages")
-    @patch.object(ajax, "type_version_manager_api")
-    @patch.object(ajax, "Type")
-    @patch.object(ajax, "TypeVersionManager")
-    @patch.object(ajax, "_get_dependencies_ids")
-    @patch.object(ajax, "main_xml_utils")
+    @patch.object(save_utils, "type_version_manager_api")
+    @patch.object(save_utils, "Type")
+    @patch.object(save_utils, "TypeVersionManager")
+    @patch.object(save_utils, "get_dependencies")
+    @patch.object(ajax, "validation_utils")
     @patch.object(ajax, "XSDTree")
     @patch.object(ajax, "composer_xml_utils")
     def test_staff_with_perm_returns_200(
         self,
         mock_composer_xml_utils,
         mock_xsd_tree,
-        mock_main_utils,
+        mock_validation_utils,
         mock_get_dependencies_ids,
         mock_type_version_manager,
         mock_type,
@@ -268,7 +282,9 @@ class TestSaveType(TestCase):
         mock_messages,
     ):
         """test_staff_with_perm_returns_200"""
-        mock_main_utils.validate_xml_schema.return_value = None
+        mock_validation_utils.validate_schema.return_value = ValidationResult(
+            VALID
+        )
         self.mock_request.user = create_mock_user(
             1, is_staff=True, has_perm=True
         )
@@ -286,18 +302,18 @@ class TestSaveType(TestCase):
             ajax.save_type(self.mock_request)
 
     @patch.object(ajax, "messages")
-    @patch.object(ajax, "type_version_manager_api")
-    @patch.object(ajax, "Type")
-    @patch.object(ajax, "TypeVersionManager")
-    @patch.object(ajax, "_get_dependencies_ids")
-    @patch.object(ajax, "main_xml_utils")
+    @patch.object(save_utils, "type_version_manager_api")
+    @patch.object(save_utils, "Type")
+    @patch.object(save_utils, "TypeVersionManager")
+    @patch.object(save_utils, "get_dependencies")
+    @patch.object(ajax, "validation_utils")
     @patch.object(ajax, "XSDTree")
     @patch.object(ajax, "composer_xml_utils")
     def test_superuser_with_perm_returns_200(
         self,
         mock_composer_xml_utils,
         mock_xsd_tree,
-        mock_main_utils,
+        mock_validation_utils,
         mock_get_dependencies_ids,
         mock_type_version_manager,
         mock_type,
@@ -305,7 +321,9 @@ class TestSaveType(TestCase):
         mock_messages,
     ):
         """test_superuser_with_perm_returns_200"""
-        mock_main_utils.validate_xml_schema.return_value = None
+        mock_validation_utils.validate_schema.return_value = ValidationResult(
+            VALID
+        )
         self.mock_request.user = create_mock_user(
             1, is_staff=True, is_superuser=True, has_perm=True
         )
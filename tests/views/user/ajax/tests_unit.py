@@ -6,6 +6,12 @@ from unittest.mock import patch, MagicMock
 from django.core.exceptions import ValidationError
 from django.http import HttpResponseBadRequest, HttpResponse
 
+from core_composer_app.utils import save as save_utils
+from core_composer_app.utils.validation import (
+    INVALID,
+    VALID,
+    ValidationResult,
+)
 from core_composer_app.views.user import ajax
 from core_main_app.commons.exceptions import NotUniqueError
 from core_main_app.utils.tests_tools.MockUser import create_mock_user
@@ -52,13 +58,13 @@ class TestSaveTemplate(TestCase):
         mock_error_response.assert_called()
 
     @patch.object(ajax, "_error_response")
-    @patch.object(ajax, "main_xml_utils")
+    @patch.object(ajax, "validation_utils")
     @patch.object(ajax, "XSDTree")
     def test_validate_xml_schema_exception_returns_error_response(
-        self, mock_xsd_tree, mock_main_xml_utils, mock_error_response
+        self, mock_xsd_tree, mock_validation_utils, mock_error_response
     ):
         """test_validate_xml_schema_exception_returns_error_response"""
-        mock_main_xml_utils.validate_xml_schema.side_effect = Exception(
+        mock_validation_utils.validate_schema.side_effect = Exception(
             "mock_validate_xml_schema_exception"
         )
 
@@ -66,25 +72,29 @@ class TestSaveTemplate(TestCase):
         mock_error_response.assert_called()
 
     @patch.object(ajax, "_error_response")
-    @patch.object(ajax, "main_xml_utils")
+    @patch.object(ajax, "validation_utils")
     @patch.object(ajax, "XSDTree")
     def test_validate_xml_schema_returns_not_none_returns_error_response(
-        self, mock_xsd_tree, mock_main_xml_utils, mock_error_response
+        self, mock_xsd_tree, mock_validation_utils, mock_error_response
     ):
         """test_validate_xml_schema_returns_not_none_returns_error_response"""
-        mock_main_xml_utils.validate_xml_schema.return_value = "mock_error"
+        mock_validation_utils.validate_schema.return_value = ValidationResult(
+            INVALID, "mock_error"
+        )
 
         ajax.save_template(self.mock_request)
         mock_error_response.assert_called()
 
-    @patch.object(ajax, "_get_dependencies_ids")
-    @patch.object(ajax, "main_xml_utils")
+    @patch.object(save_utils, "get_dependencies")
+    @patch.object(ajax, "validation_utils")
     @patch.object(ajax, "XSDTree")
     def test_get_dependencies_id_exception_returns_http_bad_request(
-        self, mock_xsd_tree, mock_main_xml_utils, mock_get_dependencies_ids
+        self, mock_xsd_tree, mock_validation_utils, mock_get_dependencies_ids
     ):
         """test_get_dependencies_id_exception_returns_http_bad_request"""
-        mock_main_xml_utils.validate_xml_schema.return_value = None
+        mock_validation_utils.validate_schema.return_value = ValidationResult(
+            VALID
+        )
         mock_get_dependencies_ids.side_effect = Exception(
             "mock_get_dependencies_ids_exception"
         )
@@ -93,20 +103,22 @@ class TestSaveTemplate(TestCase):
         self.assertIsInstance(response, HttpResponseBadRequest)
 
     @patch.object(ajax, "_error_response")
-    @patch.object(ajax, "TemplateVersionManager")
-    @patch.object(ajax, "_get_dependencies_ids")
-    @patch.object(ajax, "main_xml_utils")
+    @patch.object(save_utils, "TemplateVersionManager")
+    @patch.object(save_utils, "get_dependencies")
+    @patch.object(ajax, "validation_utils")
     @patch.object(ajax, "XSDTree")
     def test_template_version_manager_exception_returns_error_response(
         self,
         mock_xsd_tree,
-        mock_main_xml_utils,
+        mock_validation_utils,
         mock_get_dependencies_ids,
         mock_template_version_manager,
         mock_error_response,
     ):
         """test_template_version_manager_exception_returns_error_response"""
-        mock_main_xml_utils.validate_xml_schema.return_value = None
+        mock_validation_utils.validate_schema.return_value = ValidationResult(
+            VALID
+        )
         mock_template_version_manager.side_effect = Exception(
             "mock_template_version_manager_exception"
         )
@@ -114,19 +126,21 @@ class TestSaveTemplate(TestCase):
         ajax.save_template(self.mock_request)
         mock_error_response.assert_called()
 
-    @patch.object(ajax, "TemplateVersionManager")
-    @patch.object(ajax, "_get_dependencies_ids")
-    @patch.object(ajax, "main_xml_utils")
+    @patch.object(save_utils, "TemplateVersionManager")
+    @patch.object(save_utils, "get_dependencies")
+    @patch.object(ajax, "validation_utils")
     @patch.object(ajax, "XSDTree")
     def test_template_version_manager_validation_error_returns_http_bad_request(
         self,
         mock_xsd_tree,
-        mock_main_xml_utils,
+        mock_validation_utils,
         mock_get_dependencies_ids,
         mock_template_version_manager,
     ):
         """test_template_version_manager_validation_error_returns_http_bad_request"""
-        mock_main_xml_utils.validate_xml_schema.return_value = None
+        mock_validation_utils.validate_schema.return_value = ValidationResult(
+            VALID
+        )
         mock_template_version_manager.side_effect = ValidationError(
             "mock_template_version_manager_validation_error"
         )
@@ -135,38 +149,40 @@ class TestSaveTemplate(TestCase):
         self.assertIsInstance(response, HttpResponseBadRequest)
 
     @patch.object(ajax, "_error_response")
-    @patch.object(ajax, "Template")
-    @patch.object(ajax, "TemplateVersionManager")
-    @patch.object(ajax, "_get_dependencies_ids")
-    @patch.object(ajax, "main_xml_utils")
+    @patch.object(save_utils, "Template")
+    @patch.object(save_utils, "TemplateVersionManager")
+    @patch.object(save_utils, "get_dependencies")
+    @patch.object(ajax, "validation_utils")
     @patch.object(ajax, "XSDTree")
     def test_template_exception_returns_error_response(
         self,
         mock_xsd_tree,
-        mock_main_xml_utils,
+        mock_validation_utils,
         mock_get_dependencies_ids,
         mock_template_version_manager,
         mock_template,
         mock_error_response,
     ):
         """test_template_exception_returns_error_response"""
-        mock_main_xml_utils.validate_xml_schema.return_value = None
+        mock_validation_utils.validate_schema.return_value = ValidationResult(
+            VALID
+        )
         mock_template.side_effect = Exception("mock_template_exception")
 
         ajax.save_template(self.mock_request)
         mock_error_response.assert_called()
 
     @patch.object(ajax, "_error_response")
-    @patch.object(ajax, "template_version_manager_api")
-    @patch.object(ajax, "Template")
-    @patch.object(ajax, "TemplateVersionManager")
-    @patch.object(ajax, "_get_dependencies_ids")
-    @patch.object(ajax, "main_xml_utils")
+    @patch.object(save_utils, "template_version_manager_api")
+    @patch.object(save_utils, "Template")
+    @patch.object(save_utils, "TemplateVersionManager")
+    @patch.object(save_utils, "get_dependencies")
+    @patch.object(ajax, "validation_utils")
     @patch.object(ajax, "XSDTree")
     def test_template_version_manager_api_insert_exception_returns_error_response(
         self,
         mock_xsd_tree,
-        mock_main_xml_utils,
+        mock_validation_utils,
         mock_get_dependencies_ids,
         mock_template_version_manager,
         mock_template,
@@ -174,7 +190,9 @@ class TestSaveTemplate(TestCase):
         mock_error_response,
     ):
         """test_template_version_manager_api_insert_exception_returns_error_response"""
-        mock_main_xml_utils.validate_xml_schema.return_value = None
+        mock_validation_utils.validate_schema.return_value = ValidationResult(
+            VALID
+        )
         mock_template_version_manager_api.insert.side_effect = Exception(
             "mock_template_version_manager_api_exception"
         )
@@ -183,16 +201,16 @@ class TestSaveTemplate(TestCase):
         mock_error_response.assert_called()
 
     @patch.object(ajax, "_error_response")
-    @patch.object(ajax, "template_version_manager_api")
-    @patch.object(ajax, "Template")
-    @patch.object(ajax, "TemplateVersionManager")
-    @patch.object(ajax, "_get_dependencies_ids")
-    @patch.object(ajax, "main_xml_utils")
+    @patch.object(save_utils, "template_version_manager_api")
+    @patch.object(save_utils, "Template")
+    @patch.object(save_utils, "TemplateVersionManager")
+    @patch.object(save_utils, "get_dependencies")
+    @patch.object(ajax, "validation_utils")
     @patch.object(ajax, "XSDTree")
     def test_template_version_manager_api_insert_not_unique_error_returns_http_bad_request(
         self,
         mock_xsd_tree,
-        mock_main_xml_utils,
+        mock_validation_utils,
         mock_get_dependencies_ids,
         mock_template_version_manager,
         mock_template,
@@ -200,7 +218,9 @@ class TestSaveTemplate(TestCase):
         mock_error_response,
     ):
         """test_template_version_manager_api_insert_not_unique_error_returns_http_bad_request"""
-        mock_main_xml_utils.validate_xml_schema.return_value = None
+        mock_validation_utils.validate_schema.return_value = ValidationResult(
+            VALID
+        )
         mock_template_version_manager_api.insert.side_effect = NotUniqueError(
             "mock_template_version_manager_api_exception"
         )
@@ -209,16 +229,16 @@ class TestSaveTemplate(TestCase):
         self.assertIsInstance(response, HttpResponseBadRequest)
 
     @patch.object(ajax, "messages")
-    @patch.object(ajax, "template_version_manager_api")
-    @patch.object(ajax, "Template")
-    @patch.object(ajax, "TemplateVersionManager")
-    @patch.object(ajax, "_get_dependencies_ids")
-    @patch.object(ajax, "main_xml_utils")
+    @patch.object(save_utils, "template_version_manager_api")
+    @patch.object(save_utils, "Template")
+    @patch.object(save_utils, "TemplateVersionManager")
+    @patch.object(save_utils, "get_dependencies")
+    @patch.object(ajax, "validation_utils")
     @patch.object(ajax, "XSDTree")
     def test_success_calls_messages_api(
         self,
         mock_xsd_tree,
-        mock_main_xml_utils,
+        mock_validation_utils,
         mock_get_dependencies_ids,
         mock_template_version_manager,
         mock_template,
@@ -226,22 +246,24 @@ class TestSaveTemplate(TestCase):
         mock_messages,
     ):
         """test_success_calls_messages_api"""
-        mock_main_xml_utils.validate_xml_schema.return_value = None
+        mock_validation_utils.validate_schema.return_value = ValidationResult(
+            VALID
+        )
 
         ajax.save_template(self.mock_request)
         mock_messages.add_message.assert_called()
 
     @patch.object(ajax, "messages")
-    @patch.object(ajax, "template_version_manager_api")
-    @patch.object(ajax, "Template")
-    @patch.object(ajax, "TemplateVersionManager")
-    @patch.object(ajax, "_get_dependencies_ids")
-    @patch.object(ajax, "main_xml_utils")
+    @patch.object(save_utils, "template_version_manager_api")
+    @patch.object(save_utils, "Template")
+    @patch.object(save_utils, "TemplateVersionManager")
+    @patch.object(save_utils, "get_dependencies")
+    @patch.object(ajax, "validation_utils")
     @patch.object(ajax, "XSDTree")
     def test_success_returns_http_response(
         self,
         mock_xsd_tree,
-        mock_main_xml_utils,
+        mock_validation_utils,
         mock_get_dependencies_ids,
         mock_template_version_manager,
         mock_template,
@@ -249,7 +271,9 @@ class TestSaveTemplate(TestCase):
         mock_messages,
     ):
         """test_success_returns_http_response"""
-        mock_main_xml_utils.validate_xml_schema.return_value = None
+        mock_validation_utils.validate_schema.return_value = ValidationResult(
+            VALID
+        )
 
         response = ajax.save_template(self.mock_request)
         self.assertIsInstance(response, HttpResponse)
@@ -290,7 +314,7 @@ class TestSaveType(TestCase):
         self.assertIsInstance(response, HttpResponseBadRequest)
 
     @patch.object(ajax, "_error_response")
-    @patch.object(ajax, "type_api")
+    @patch.object(save_utils, "type_api")
     def test_no_type_api_get_exception_returns_error_response(
         self, mock_type_api, mock_error_response
     ):
@@ -329,18 +353,18 @@ class TestSaveType(TestCase):
         mock_error_response.assert_called()
 
     @patch.object(ajax, "_error_response")
-    @patch.object(ajax, "main_xml_utils")
+    @patch.object(ajax, "validation_utils")
     @patch.object(ajax, "XSDTree")
     @patch.object(ajax, "composer_xml_utils")
     def test_validate_xml_schema_exception_returns_error_response(
         self,
         mock_composer_xml_utils,
         mock_xsd_tree,
-        mock_main_xml_utils,
+        mock_validation_utils,
         mock_error_response,
     ):
         """test_validate_xml_schema_exception_returns_error_response"""
-        mock_main_xml_utils.validate_xml_schema.side_effect = Exception(
+        mock_validation_utils.validate_schema.side_effect = Exception(
             "mock_validate_xml_schema_exception"
         )
 
@@ -348,35 +372,39 @@ class TestSaveType(TestCase):
         mock_error_response.assert_called()
 
     @patch.object(ajax, "_error_response")
-    @patch.object(ajax, "main_xml_utils")
+    @patch.object(ajax, "validation_utils")
     @patch.object(ajax, "XSDTree")
     @patch.object(ajax, "composer_xml_utils")
     def test_validate_xml_schema_returns_not_none_returns_error_response(
         self,
         mock_composer_xml_utils,
         mock_xsd_tree,
-        mock_main_xml_utils,
+        mock_validation_utils,
         mock_error_response,
     ):
         """test_validate_xml_schema_returns_not_none_returns_error_response"""
-        mock_main_xml_utils.validate_xml_schema.return_value = "mock_error"
+        mock_validation_utils.validate_schema.return_value = ValidationResult(
+            INVALID, "mock_error"
+        )
 
         ajax.save_type(self.mock_request)
         mock_error_response.assert_called()
 
-    @patch.object(ajax, "_get_dependencies_ids")
-    @patch.object(ajax, "main_xml_utils")
+    @patch.object(save_utils, "get_dependencies")
+    @patch.object(ajax, "validation_utils")
     @patch.object(ajax, "XSDTree")
     @patch.object(ajax, "composer_xml_utils")
     def test_get_dependencies_id_exception_returns_http_bad_request(
         self,
         mock_composer_xml_utils,
         mock_xsd_tree,
-        mock_main_xml_utils,
+        mock_validation_utils,
         mock_get_dependencies_ids,
     ):
         """test_get_dependencies_id_exception_returns_http_bad_request"""
-        mock_main_xml_utils.validate_xml_schema.return_value = None
+        mock_validation_utils.validate_schema.return_value = ValidationResult(
+            VALID
+        )
         mock_get_dependencies_ids.side_effect = Exception(
             "mock_get_dependencies_ids_exception"
         )
@@ -385,22 +413,24 @@ class TestSaveType(TestCase):
         self.assertIsInstance(response, HttpResponseBadRequest)
 
     @patch.object(ajax, "_error_response")
-    @patch.object(ajax, "TypeVersionManager")
-    @patch.object(ajax, "_get_dependencies_ids")
-    @patch.object(ajax, "main_xml_utils")
+    @patch.object(save_utils, "TypeVersionManager")
+    @patch.object(save_utils, "get_dependencies")
+    @patch.object(ajax, "validation_utils")
     @patch.object(ajax, "XSDTree")
     @patch.object(ajax, "composer_xml_utils")
     def test_type_version_manager_exception_returns_error_response(
         self,
         mock_composer_xml_utils,
         mock_xsd_tree,
-        mock_main_xml_utils,
+        mock_validation_utils,
         mock_get_dependencies_ids,
         mock_type_version_manager,
         mock_error_response,
     ):
         """test_type_version_manager_exception_returns_error_response"""
-        mock_main_xml_utils.validate_xml_schema.return_value = None
+        mock_validation_utils.validate_schema.return_value = ValidationResult(
+            VALID
+        )
         mock_type_version_manager.side_effect = Exception(
             "mock_type_version_manager_exception"
         )
@@ -408,21 +438,23 @@ class TestSaveType(TestCase):
         ajax.save_type(self.mock_request)
         mock_error_response.assert_called()
 
-    @patch.object(ajax, "TypeVersionManager")
-    @patch.object(ajax, "_get_dependencies_ids")
-    @patch.object(ajax, "main_xml_utils")
+    @patch.object(save_utils, "TypeVersionManager")
+    @patch.object(save_utils, "get_dependencies")
+    @patch.object(ajax, "validation_utils")
     @patch.object(ajax, "XSDTree")
     @patch.object(ajax, "composer_xml_utils")
     def test_type_version_manager_validation_error_returns_http_bad_request(
         self,
         mock_composer_xml_utils,
         mock_xsd_tree,
-        mock_main_xml_utils,
+        mock_validation_utils,
         mock_get_dependencies_ids,
         mock_type_version_manager,
     ):
         """test_type_version_manager_validation_error_returns_http_bad_request"""
-        mock_main_xml_utils.validate_xml_schema.return_value = None
+        mock_validation_utils.validate_schema.return_value = ValidationResult(
+            VALID
+        )
         mock_type_version_manager.side_effect = ValidationError(
             "mock_type_version_manager_validation_error"
         )
@@ -431,42 +463,44 @@ class TestSaveType(TestCase):
         self.assertIsInstance(response, HttpResponseBadRequest)
 
     @patch.object(ajax, "_error_response")
-    @patch.object(ajax, "Type")
-    @patch.object(ajax, "TypeVersionManager")
-    @patch.object(ajax, "_get_dependencies_ids")
-    @patch.object(ajax, "main_xml_utils")
+    @patch.object(save_utils, "Type")
+    @patch.object(save_utils, "TypeVersionManager")
+    @patch.object(save_utils, "get_dependencies")
+    @patch.object(ajax, "validation_utils")
     @patch.object(ajax, "XSDTree")
     @patch.object(ajax, "composer_xml_utils")
     def test_type_exception_returns_error_response(
         self,
         mock_composer_xml_utils,
         mock_xsd_tree,
-        mock_main_xml_utils,
+        mock_validation_utils,
         mock_get_dependencies_ids,
         mock_type_version_manager,
         mock_type,
         mock_error_response,
     ):
         """test_type_exception_returns_error_response"""
-        mock_main_xml_utils.validate_xml_schema.return_value = None
+        mock_validation_utils.validate_schema.return_value = ValidationResult(
+            VALID
+        )
         mock_type.side_effect = Exception("mock_type_exception")
 
         ajax.save_type(self.mock_request)
         mock_error_response.assert_called()
 
     @patch.object(ajax, "_error_response")
-    @patch.object(ajax, "type_version_manager_api")
-    @patch.object(ajax, "Type")
-    @patch.object(ajax, "TypeVersionManager")
-    @patch.object(ajax, "_get_dependencies_ids")
-    @patch.object(ajax, "main_xml_utils")
+    @patch.object(save_utils, "type_version_manager_api")
+    @patch.object(save_utils, "Type")
+    @patch.object(save_utils, "TypeVersionManager")
+    @patch.object(save_utils, "get_dependencies")
+    @patch.object(ajax, "validation_utils")
     @patch.object(ajax, "XSDTree")
     @patch.object(ajax, "composer_xml_utils")
     def test_type_version_manager_api_insert_exception_returns_error_response(
         self,
         mock_composer_xml_utils,
         mock_xsd_tree,
-        mock_main_xml_utils,
+        mock_validation_utils,
         mock_get_dependencies_ids,
         mock_type_version_manager,
         mock_type,
@@ -474,7 +508,9 @@ class TestSaveType(TestCase):
         mock_error_response,
     ):
         """test_type_version_manager_api_insert_exception_returns_error_response"""
-        mock_main_xml_utils.validate_xml_schema.return_value = None
+        mock_validation_utils.validate_schema.return_value = ValidationResult(
+            VALID
+        )
         mock_type_version_manager_api.insert.side_effect = Exception(
             "type_version_manager_api_exception"
         )
@@ -483,18 +519,18 @@ class TestSaveType(TestCase):
         mock_error_response.assert_called()
 
     @patch.object(ajax, "_error_response")
-    @patch.object(ajax, "type_version_manager_api")
-    @patch.object(ajax, "Type")
-    @patch.object(ajax, "TypeVersionManager")
-    @patch.object(ajax, "_get_dependencies_ids")
-    @patch.object(ajax, "main_xml_utils")
+    @patch.object(save_utils, "type_version_manager_api")
+    @patch.object(save_utils, "Type")
+    @patch.object(save_utils, "TypeVersionManager")
+    @patch.object(save_utils, "get_dependencies")
+    @patch.object(ajax, "validation_utils")
     @patch.object(ajax, "XSDTree")
     @patch.object(ajax, "composer_xml_utils")
     def test_type_version_manager_api_insert_not_unique_error_returns_http_bad_request(
         self,
         mock_composer_xml_utils,
         mock_xsd_tree,
-        mock_main_xml_utils,
+        mock_validation_utils,
         mock_get_dependencies_ids,
         mock_type_version_manager,
         mock_type,
@@ -502,7 +538,9 @@ class TestSaveType(TestCase):
         mock_error_response,
     ):
         """test_type_version_manager_api_insert_not_unique_error_returns_http_bad_request"""
-        mock_main_xml_utils.validate_xml_schema.return_value = None
+        mock_validation_utils.validate_schema.return_value = ValidationResult(
+            VALID
+        )
         mock_type_version_manager_api.insert.side_effect = NotUniqueError(
             "type_version_manager_api_exception"
         )
@@ -511,18 +549,18 @@ class TestSaveType(TestCase):
         self.assertIsInstance(response, HttpResponseBadRequest)
 
     @patch.object(ajax, "messages")
-    @patch.object(ajax, "type_version_manager_api")
-    @patch.object(ajax, "Type")
-    @patch.object(ajax, "TypeVersionManager")
-    @patch.object(ajax, "_get_dependencies_ids")
-    @patch.object(ajax, "main_xml_utils")
+    @patch.object(save_utils, "type_version_manager_api")
+    @patch.object(save_utils, "Type")
+    @patch.object(save_utils, "TypeVersionManager")
+    @patch.object(save_utils, "get_dependencies")
+    @patch.object(ajax, "validation_utils")
     @patch.object(ajax, "XSDTree")
     @patch.object(ajax, "composer_xml_utils")
     def test_success_calls_messages_api(
         self,
         mock_composer_xml_utils,
         mock_xsd_tree,
-        mock_main_xml_utils,
+        mock_validation_utils,
         mock_get_dependencies_ids,
         mock_type_version_manager,
         mock_type,
@@ -530,24 +568,26 @@ class TestSaveType(TestCase):
         mock_messages,
     ):
         """test_success_calls_messages_api"""
-        mock_main_xml_utils.validate_xml_schema.return_value = None
+        mock_validation_utils.validate_schema.return_value = ValidationResult(
+            VALID
+        )
 
         ajax.save_type(self.mock_request)
         mock_messages.add_message.assert_called()
 
     @patch.object(ajax, "messages")
-    @patch.object(ajax, "type_version_manager_api")
-    @patch.object(ajax, "Type")
-    @patch.object(ajax, "TypeVersionManager")
-    @patch.object(ajax, "_get_dependencies_ids")
-    @patch.object(ajax, "main_xml_utils")
+    @patch.object(save_utils, "type_version_manager_api")
+    @patch.object(save_utils, "Type")
+    @patch.object(save_utils, "TypeVersionManager")
+    @patch.object(save_utils, "get_dependencies")
+    @patch.object(ajax, "validation_utils")
     @patch.object(ajax, "XSDTree")
     @patch.object(ajax, "composer_xml_utils")
     def test_success_returns_http_response(
         self,
         mock_composer_xml_utils,
         mock_xsd_tree,
-        mock_main_xml_utils,
+        mock_validation_utils,
         mock_get_dependencies_ids,
         mock_type_version_manager,
         mock_type,
@@ -555,26 +595,28 @@ class TestSaveType(TestCase):
         mock_messages,
     ):
         """test_success_returns_http_response"""
-        mock_main_xml_utils.validate_xml_schema.return_value = None
+        mock_validation_utils.validate_schema.return_value = ValidationResult(
+            VALID
+        )
 
         response = ajax.save_type(self.mock_request)
         self.assertIsInstance(response, HttpResponse)
 
     @patch.object(ajax, "messages")
-    @patch.object(ajax, "type_version_manager_api")
-    @patch.object(ajax, "Type")
-    @patch.object(ajax, "TypeVersionManager")
-    @patch.object(ajax, "_get_dependencies_ids")
-    @patch.object(ajax, "main_xml_utils")
+    @patch.object(save_utils, "type_version_manager_api")
+    @patch.object(save_utils, "Type")
+    @patch.object(save_utils, "TypeVersionManager")
+    @patch.object(save_utils, "get_dependencies")
+    @patch.object(ajax, "validation_utils")
     @patch.object(ajax, "XSDTree")
     @patch.object(ajax, "composer_xml_utils")
-    @patch.object(ajax, "type_api")
+    @patch.object(save_utils, "type_api")
     def test_success_with_editing_existing_type_returns_http_response(
         self,
         mock_type_api,
         mock_composer_xml_utils,
         mock_xsd_tree,
-        mock_main_xml_utils,
+        mock_validation_utils,
         mock_get_dependencies_ids,
         mock_type_version_manager,
         mock_type,
@@ -584,7 +626,9 @@ class TestSaveType(TestCase):
         """test_success_returns_http_response"""
         self.mock_request.POST["templateID"] = 1
         mock_type_api.get.side_effect = Exception("mock_type_api_exception")
-        mock_main_xml_utils.validate_xml_schema.return_value = None
+        mock_validation_utils.validate_schema.return_value = ValidationResult(
+            VALID
+        )
 
         response = ajax.save_type(self.mock_request)
         self.assertIsInstance(response, HttpResponse)
@@ -4,6 +4,11 @@ from unittest import TestCase
 from unittest.mock import MagicMock, patch
 
 from core_main_app.utils.tests_tools.MockUser import create_mock_user
+from core_composer_app.components.catalog.snapshot import (
+    CatalogBucket,
+    CatalogSnapshot,
+    CatalogType,
+)
 from core_composer_app.views.user import views as user_views
 
 
@@ -16,10 +21,11 @@ class TestBuildTemplate(TestCase):
         self.mock_request.user = create_mock_user(1, has_perm=True)
 
     @patch.object(user_views, "render")
+    @patch.object(user_views, "composer_state")
     @patch.object(user_views, "get_xsd_types")
-    @patch.object(user_views, "bucket_api")
+    @patch.object(user_views, "catalog_api")
     @patch.object(user_views, "type_version_manager_api")
-    @patch.object(user_views, "xsl_transform")
+    @patch.object(user_views, "transform_xsd_to_html")
     @patch.object(user_views, "read_file_content")
     @patch.object(user_views, "finders")
     @patch.object(user_views, "remove_annotations")
@@ -32,10 +38,11 @@ class TestBuildTemplate(TestCase):
         mock_remove_annotations,
         mock_finders,
         mock_read_file_content,
-        mock_xsl_transform,
+        mock_transform_xsd_to_html,
         mock_type_version_manager_api,
-        mock_bucket_api,
+        mock_catalog_api,
         mock_get_xsd_types,
+        mock_composer_state,
         mock_render,
     ):
         """test_context_correctly_built"""
@@ -43,65 +50,49 @@ class TestBuildTemplate(TestCase):
         mock_xsd_form = "mock_xsd_form"
         mock_user_types = ["mock_user_type_1", "mock_user_type_2"]
 
-        mock_bucket_1_types = MagicMock()
-        mock_bucket_1_types_filtered = ["mock_type_11", "mock_type_12"]
-        mock_bucket_1_types.filter.return_value = mock_bucket_1_types_filtered
-        mock_bucket_1 = MagicMock()
-        mock_bucket_1.label = "mock_bucket_1"
-        mock_bucket_1.color = "mock_bucket_1_color"
-        mock_bucket_1.types = mock_bucket_1_types
-
-        mock_bucket_2_types = MagicMock()
-        mock_bucket_2_types_filtered = ["mock_type_21"]
-        mock_bucket_2_types.filter.return_value = mock_bucket_2_types_filtered
-        mock_bucket_2 = MagicMock()
-        mock_bucket_2.label = "mock_bucket_2"
-        mock_bucket_2.color = "mock_bucket_2_color"
-        mock_bucket_2.types = mock_bucket_2_types
-
-        mock_buckets = [mock_bucket_1, mock_bucket_2]
-
-        mock_no_bucket_types = [
-            "mock_no_bucket_type_1",
-            "mock_no_bucket_type_2",
-        ]
+        type_11 = CatalogType(1, "type_11", None, False, "11")
+        type_12 = CatalogType(2, "type_12", None, True, "12")
+        type_21 = CatalogType(3, "type_21", None, False, "21")
+        no_bucket_type = CatalogType(4, "no_bucket_type", None, False, "41")
+        mock_catalog_api.get_catalog.return_value = CatalogSnapshot(
+            0,
+            (
+                CatalogBucket(1, "bucket_1", "#000001", (type_11, type_12)),
+                CatalogBucket(2, "bucket_2", "#000002", (type_21,)),
+            ),
+            (type_11, type_12, type_21, no_bucket_type),
+        )
+
         mock_built_in_types = [
             "mock_no_bucket_type_1",
             "mock_no_bucket_type_2",
         ]
 
-        mock_xsl_transform.return_value = mock_xsd_form
+        mock_transform_xsd_to_html.return_value = mock_xsd_form
         mock_type_version_manager_api.get_version_managers_by_user.filter.return_value = (
             mock_user_types
         )
-        mock_bucket_api.get_all.return_value = mock_buckets
-        mock_type_version_manager_api.get_no_buckets_types.filter.return_value = (
-            mock_no_bucket_types
-        )
         mock_get_xsd_types.return_value = mock_built_in_types
         mock_template_api.get_by_id.return_value = MagicMock(format="XSD")
+        mock_composer_state.init_composer_state.return_value = 3
 
         expected_context = {
             "buckets": [
-                {
-                    "label": mock_bucket_1.label,
-                    "color": mock_bucket_1.color,
-                    "types": mock_bucket_1_types_filtered,
-                },
-                {
-                    "label": mock_bucket_2.label,
-                    "color": mock_bucket_2.color,
-                    "types": mock_bucket_2_types_filtered,
-                },
+                {"label": "bucket_1", "color": "#000001", "types": (type_11,)},
+                {"label": "bucket_2", "color": "#000002", "types": (type_21,)},
             ],
             "built_in_types": [
                 {"current": "built_in_type", "title": built_in_type}
                 for built_in_type in mock_built_in_types
             ],
-            "no_buckets_types": mock_type_version_manager_api.get_no_buckets_types().filter(),
+            "no_buckets_types": (no_bucket_type,),
             "user_types": mock_type_version_manager_api.get_version_managers_by_user().filter(),
             "xsd_form": mock_xsd_form,
             "template_id": mock_template_id,
+            "revision": 3,
+            "stateless": False,
+            "state_token": None,
+            "deferred_validation": False,
             "page_title": "Build Template",
         }
 
@@ -174,3 +165,32 @@ class TestBuildTemplate(TestCase):
         self.assertTrue(
             "Template format not supported." in response.content.decode()
         )
+
+
+class TestGetContextTypeVersionDiff(TestCase):
+    """Unit tests for `get_context_type_version_diff`."""
+
+    @patch.object(user_views, "type_api")
+    def test_versions_are_read_once(self, mock_type_api):
+        """test_versions_are_read_once"""
+
+        # Arrange
+        mock_request = MagicMock()
+        old_version = MagicMock()
+        new_version = MagicMock()
+        mock_type_api.get.side_effect = lambda version_id, request: (
+            old_version if version_id == "1" else new_version
+        )
+        mock_type_api.get_versions_diff.return_value = {"added": ["a"]}
+
+        # Act
+        context = user_views.get_context_type_version_diff(
+            "1", "2", mock_request
+        )
+
+        # Assert
+        self.assertEqual(mock_type_api.get.call_count, 2)
+        mock_type_api.get_versions_diff.assert_called_with(
+            old_version, new_version
+        )
+        self.assertTrue(context["has_changes"])